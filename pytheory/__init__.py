@@ -15,11 +15,12 @@ from .chords import (Chord, Fretboard, analyze_progression,
 from .charts import CHARTS, Fingering, charts_for_fretboard
 from .serialism import ToneRow
 
-from .rhythm import Duration, TimeSignature, Rest, Score, Part, Section, DrumSound, Pattern, Hit, INSTRUMENTS
+from .rhythm import Duration, TimeSignature, Rest, Score, Part, Bus, Section, DrumSound, Pattern, Hit, INSTRUMENTS
 from .rhythm import Note as RhythmNote  # rhythm.Note (tone + duration pairing)
 
 from .play import (play, save, save_midi, play_progression, play_pattern,
-                   play_score, render_score, render_scores, Synth, Envelope)
+                   play_score, render_score, render_score_iter, render_scores,
+                   Synth, Envelope, DrumKit, EffectChain)
 
 # Aliases for discoverability.
 Note = Tone
@@ -33,7 +34,7 @@ __all__ = [
     "avoid_notes", "reharmonize", "reharmonize_progression", "ToneRow",
     "System", "SYSTEMS", "TET", "CHARTS", "charts_for_fretboard",
     "play", "save", "save_midi", "play_progression", "play_pattern",
-    "play_score", "render_score", "render_scores", "Synth", "Envelope",
-    "Duration", "TimeSignature", "RhythmNote", "Rest", "Score", "Part",
+    "play_score", "render_score", "render_score_iter", "render_scores", "Synth", "Envelope", "DrumKit", "EffectChain",
+    "Duration", "TimeSignature", "RhythmNote", "Rest", "Score", "Part", "Bus",
     "DrumSound", "Pattern", "Hit", "Section", "INSTRUMENTS",
 ]
@@ -44,8 +44,11 @@ except ImportError:
 
 from .play import (
     _SYNTH_FUNCTIONS, _resolve_synth, _resolve_envelope,
-    _apply_envelope, _apply_lowpass, _render_drum_hit_cached,
-    SAMPLE_RATE, SAMPLE_PEAK,
+    _adsr_envelope, _apply_envelope, _apply_lowpass, _at_rate, _drum_hit,
+    DrumKit,
+    _Oscillator, _oscillator_for, _synth_render, _synth_stack, _StreamReverb,
+    _sustain_loop, _LOOP_START_SECS, _LOOP_END_SECS,
+    EffectChain, SAMPLE_RATE, SAMPLE_PEAK,
 )
 from .rhythm import INSTRUMENTS, DrumSound
 
@@ -60,89 +63,63 @@ NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F",
 # channel bus and updates instantly.
 _BAKED_PARAMS = frozenset({'detune', 'sub_osc', 'noise_mix'})
 
+# Channel attributes that are bus effect settings, and the effects params
+# key each one sets on the channel's chain.
+_CHANNEL_EFFECTS = {
+    'saturation': 'saturation', 'tremolo_depth': 'tremolo_depth',
+    'distortion': 'distortion_mix', 'chorus': 'chorus_mix',
+    'phaser': 'phaser_mix', 'lowpass': 'lowpass', 'lowpass_q': 'lowpass_q',
+    'delay': 'delay_mix', 'reverb': 'reverb_mix',
+}
+
+# Bus effect settings read from the channel's kwargs, with their defaults.
+# kwargs can be edited in place, so these are re-read every block.
+_CHANNEL_KWARG_EFFECTS = {
+    'tremolo_rate': 5.0, 'distortion_drive': 3.0, 'phaser_rate': 0.5,
+    'delay_time': 0.375, 'delay_feedback': 0.4, 'reverb_decay': 1.0,
+    'reverb_type': 'algorithmic',
+}
+
 
 # ── Voice ────────────────────────────────────────────────────────────────
 
 class _Voice:
     """A single sounding note - holds a pre-rendered wavetable and
-    tracks playback position + envelope state."""
-    __slots__ = ('active', 'loop_end', 'loop_start', 'note', 'pitch_ratio',
-                 'pos', 'release_len', 'release_pos', 'releasing',
-                 'velocity', 'wave')
+    tracks playback position + envelope state.
+
+    Oscillator voices (classic synths) carry their oscillators in
+    ``osc`` instead: ``wave`` is then the channel's envelope gain curve
+    and the audio is generated block by block at ``hz``."""
+    __slots__ = ('active', 'hz', 'loop_end', 'loop_start', 'note', 'osc',
+                 'pitch_ratio', 'pos', 'release_len', 'release_pos',
+                 'releasing', 'velocity', 'wave')
 
-    def __init__(self, wave, velocity, note, loop_start=None, loop_end=None):
+    def __init__(self, wave, velocity, note, loop_start=None, loop_end=None,
+                 osc=None, hz=0.0, sample_rate=SAMPLE_RATE):
         self.wave = wave           # float32 array
+        self.osc = osc             # [main, up, down, sub] oscillators or None
+        self.hz = hz
         self.pos = 0.0             # current read position (float for pitch bend)
         self.velocity = velocity
         self.active = True
         self.releasing = False
         self.release_pos = 0
-        self.release_len = int(SAMPLE_RATE * 0.05)  # 50ms release
+        self.release_len = int(sample_rate * 0.05)  # 50ms release
         self.note = note           # MIDI note number
         self.pitch_ratio = 1.0     # 1.0 = normal, >1 = up, <1 = down
         self.loop_start = loop_start  # sustain loop region (None = one-shot)
         self.loop_end = loop_end
 
 
-class _StreamReverb:
-    """Streaming Schroeder reverb — state persists across audio blocks.
-
-    Same topology and tuning as the offline reverb in play.py (4
-    parallel feedback combs + 2 series allpasses), but processable
-    one buffer at a time. Comb feedback never recurses within a
-    block (delays exceed typical block sizes; longer blocks are
-    chunked), so each block is pure vectorized ring-buffer reads.
-    """
-    COMB_DELAY_SECS = (0.0297, 0.0371, 0.0411, 0.0437)
-    ALLPASS_DELAY_SECS = (0.005, 0.0017)
-
-    def __init__(self, decay=1.0, sample_rate=SAMPLE_RATE):
-        self.combs = []
-        for d_sec in self.COMB_DELAY_SECS:
-            d = int(d_sec * sample_rate)
-            gain = 0.001 ** (d / sample_rate / decay)
-            # [ring buffer of u where u[t] = x[t] + g*u[t-D], write pos, gain]
-            self.combs.append([numpy.zeros(d, dtype=numpy.float32), 0, gain])
-        self.allpasses = []
-        for d_sec in self.ALLPASS_DELAY_SECS:
-            d = int(d_sec * sample_rate)
-            b = numpy.zeros(d + 1); b[0] = -0.7; b[d] = 1.0
-            a = numpy.zeros(d + 1); a[0] = 1.0; a[d] = -0.7
-            self.allpasses.append([b, a, numpy.zeros(d)])
-
-    def process(self, x):
-        """Process one block; returns the wet signal."""
-        from scipy.signal import lfilter
-        wet = numpy.zeros(len(x), dtype=numpy.float32)
-        for state in self.combs:
-            ring, pos, gain = state
-            d = len(ring)
-            out = numpy.empty(len(x), dtype=numpy.float32)
-            i = 0
-            while i < len(x):
-                m = min(d, len(x) - i)
-                idx = (pos + numpy.arange(m)) % d
-                u_old = ring[idx]              # u[t-D], which is y[t]
-                ring[idx] = x[i:i + m] + gain * u_old
-                out[i:i + m] = u_old
-                pos = (pos + m) % d
-                i += m
-            state[1] = pos
-            wet += out
-        wet /= len(self.combs)
-        for state in self.allpasses:
-            b, a, zi = state
-            wet, state[2] = lfilter(b, a, wet, zi=zi)
-        return wet.astype(numpy.float32)
-
-
 # ── Channel ──────────────────────────────────────────────────────────────
 
 class _Channel:
     """One MIDI channel - has a synth, effects, and a voice pool."""
 
     def __init__(self, synth_name="sine", envelope_name="piano",
-                 is_drums=False, max_voices=12, **kwargs):
+                 is_drums=False, max_voices=12, sample_rate=SAMPLE_RATE,
+                 **kwargs):
+        self.sample_rate = sample_rate
         self.synth_fn = _resolve_synth(synth_name)
         self.synth_name = synth_name
         self.envelope_name = envelope_name
@@ -172,33 +149,102 @@ class _Channel:
         self._lock = threading.Lock()
         self.level = 0.0           # current output level (for VU meter)
 
-        # Streaming effect state — effects run on the channel bus per
-        # audio block, so parameter changes (MIDI CC, TUI fx commands)
-        # take effect instantly without re-rendering wavetables.
-        self._lp_zi = numpy.zeros(2)
-        self._lp_coeffs = None              # (cutoff, q, b, a)
-        self._trem_phase = 0.0
-        self._chorus_ring = numpy.zeros(int(SAMPLE_RATE * 0.08),
-                                        dtype=numpy.float32)
-        self._chorus_pos = 0
-        self._chorus_phase = 0.0
-        self._delay_ring = numpy.zeros(int(SAMPLE_RATE * 1.0),
-                                       dtype=numpy.float32)
-        self._delay_pos = 0
-        self._reverb_state = None           # lazy _StreamReverb
+        # Bus effects run per audio block through a stateful chain, so
+        # parameter changes (MIDI CC, TUI fx commands) take effect on
+        # the next block without re-rendering wavetables.
+        self.effects = EffectChain(self._effect_params(),
+                                   sample_rate=sample_rate)
+        self._loop_start = int(sample_rate * self._LOOP_START_SECS)
+        self._loop_end = int(sample_rate * self._LOOP_END_SECS)
 
     # Loop region inside the 3s wavetable for sustaining instruments.
     # Starts after attack+decay have settled, ends with margin to spare;
     # the region is crossfaded so the wrap is click-free.
-    _LOOP_START = int(SAMPLE_RATE * 1.5)
-    _LOOP_END = int(SAMPLE_RATE * 2.75)
-    _LOOP_XFADE = 2048
+    _LOOP_START_SECS = _LOOP_START_SECS
+    _LOOP_END_SECS = _LOOP_END_SECS
+
+    def _synth_kwargs(self):
+        skw = {}
+        if self.synth_name in ("fm",):
+            skw["mod_ratio"] = self.kwargs.get("fm_ratio", 2.0)
+            skw["mod_index"] = self.kwargs.get("fm_index", 3.0)
+        return skw
+
+    def _get_envelope(self, n_samples):
+        """The channel's ADSR gain curve, shared by its oscillator voices."""
+        return _adsr_envelope(*self.env_tuple, n_samples, self.sample_rate)
+
+    def _oscillator_voice(self, midi_note, vel_scale, n_samples):
+        """A voice that runs the wavetable oscillator live, or ``None``
+        when the channel's synth has no wavetable form."""
+        if self.is_drums:
+            return None
+        main = _oscillator_for(self.synth_fn, self._synth_kwargs())
+        if main is None:
+            return None
+        # Detune and sub layers are oscillators too — read at note_on,
+        # so CC changes apply from the next note without a cache flush.
+        up = down = sub = None
+        if self.detune > 0:
+            up = _oscillator_for(self.synth_fn)
+            down = _oscillator_for(self.synth_fn)
+        if self.sub_osc > 0:
+            sub = _Oscillator("sine")
+        # The oscillator never decays, so any envelope with a real
+        # sustain level holds: the gain parks at loop_start.
+        loop_start = loop_end = None
+        if self.env_tuple[2] >= 0.7:
+            loop_start, loop_end = self._loop_start, self._loop_end
+        hz = 440.0 * (2 ** ((midi_note - 69) / 12.0))
+        return _Voice(self._get_envelope(n_samples), vel_scale, midi_note,
+                      loop_start, loop_end, osc=[main, up, down, sub], hz=hz,
+                      sample_rate=self.sample_rate)
+
+    def _render_oscillator(self, v, n_frames):
+        """Generate one block of an oscillator voice; returns
+        ``(samples, chunk)`` with ``chunk == 0`` once the voice is done."""
+        if v.loop_end is not None:
+            chunk = n_frames
+            hold = v.loop_start
+            pos = int(v.pos)
+            gain = v.wave[numpy.minimum(numpy.arange(pos, pos + chunk), hold)]
+            v.pos = min(pos + chunk, hold)
+        else:
+            pos = int(v.pos)
+            chunk = min(n_frames, len(v.wave) - pos)
+            if chunk <= 0:
+                return None, 0
+            gain = v.wave[pos:pos + chunk]
+            v.pos = pos + chunk
+
+        main, up, down, sub = v.osc
+        hz = v.hz * v.pitch_ratio
+        sr = self.sample_rate
+        samples = main.render(hz, chunk, sr)
+        if up is not None:
+            samples += up.render(hz * 2 ** (self.detune / 1200), chunk, sr)
+            samples += down.render(hz * 2 ** (-self.detune / 1200), chunk, sr)
+            samples /= 3.0
+        if sub is not None:
+            samples = (samples * (1.0 - self.sub_osc * 0.3)
+                       + sub.render(hz / 2, chunk, sr) * self.sub_osc * 0.3)
+        if self.noise_mix > 0:
+            noise = numpy.random.uniform(-1, 1, chunk).astype(numpy.float32)
+            samples = (samples * (1.0 - self.noise_mix * 0.5)
+                       + noise * self.noise_mix * 0.5)
+        samples *= gain * (v.velocity * self.volume)
+        return samples, chunk
 
     def _get_wave(self, midi_note, n_samples):
         """Get or render a wavetable. Returns (wave, loop_start, loop_end);
         loop points are None for one-shot (percussive/drum) sounds."""
+        with _at_rate(self.sample_rate):
+            return self._render_wave(midi_note, n_samples)
+
+    def _render_wave(self, midi_note, n_samples):
+        """:meth:`_get_wave` at the channel's sample rate."""
         if self.is_drums:
-            return _render_drum_hit_cached(midi_note, n_samples), None, None
+            return _drum_hit(midi_note, n_samples), None, None
 
         if midi_note in self._cache:
             wave_f, ls, le = self._cache[midi_note]
@@ -207,27 +253,21 @@ class _Channel:
 
         hz = 440.0 * (2 ** ((midi_note - 69) / 12.0))
 
-        # Synth kwargs
-        skw = {}
-        if self.synth_name in ("fm",):
-            skw["mod_ratio"] = self.kwargs.get("fm_ratio", 2.0)
-            skw["mod_index"] = self.kwargs.get("fm_index", 3.0)
-
-        wave = self.synth_fn(hz, n_samples=n_samples, **skw)
-        wave_f = wave.astype(numpy.float32) / SAMPLE_PEAK
+        skw = self._synth_kwargs()
+        wave_f = _synth_render(self.synth_fn, hz, n_samples, skw)
+        wave_f /= SAMPLE_PEAK
 
         # Detuned oscillator layers (oscillator-level, baked into the table)
         if self.detune > 0:
-            up = self.synth_fn(hz * 2 ** (self.detune / 1200),
-                               n_samples=n_samples, **skw)
-            down = self.synth_fn(hz * 2 ** (-self.detune / 1200),
-                                 n_samples=n_samples, **skw)
-            wave_f = (wave_f + up.astype(numpy.float32) / SAMPLE_PEAK
-                      + down.astype(numpy.float32) / SAMPLE_PEAK) / 3.0
+            pair = _synth_stack(self.synth_fn,
+                                [hz * 2 ** (self.detune / 1200),
+                                 hz * 2 ** (-self.detune / 1200)],
+                                n_samples, skw=skw)
+            wave_f = (wave_f + pair / SAMPLE_PEAK) / 3.0
 
         # Sub-oscillator (octave-below sine)
         if self.sub_osc > 0:
-            t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+            t = numpy.arange(n_samples, dtype=numpy.float32) / self.sample_rate
             sub = numpy.sin(2 * numpy.pi * (hz / 2) * t).astype(numpy.float32)
             wave_f = wave_f * (1.0 - self.sub_osc * 0.3) + sub * self.sub_osc * 0.3
 
@@ -240,27 +280,12 @@ class _Channel:
         # Apply envelope
         a, d, s, r = self.env_tuple
         if a > 0 or d > 0 or s < 1.0 or r > 0:
-            wave_f = _apply_envelope(wave_f, a, d, s, r)
+            wave_f = _apply_envelope(wave_f, a, d, s, r, out=wave_f)
 
         # Sustain loop — held notes ring indefinitely, but only for
-        # genuinely sustaining instruments: the envelope must hold a
-        # real level (organ/pad/strings) AND the source must still be
-        # ringing at the loop region. Struck/plucked sources (piano,
-        # guitar, mallets) decay on their own and stay one-shot.
-        loop_start = loop_end = None
-        if s >= 0.7 and n_samples > self._LOOP_END:
-            early = numpy.sqrt(numpy.mean(
-                wave_f[int(SAMPLE_RATE * 0.2):int(SAMPLE_RATE * 0.5)] ** 2))
-            late = numpy.sqrt(numpy.mean(
-                wave_f[self._LOOP_START:self._LOOP_START
-                       + SAMPLE_RATE // 4] ** 2))
-            if early > 0 and late > 0.3 * early:
-                loop_start, loop_end = self._LOOP_START, self._LOOP_END
-                xf = self._LOOP_XFADE
-                fade = numpy.linspace(0.0, 1.0, xf, dtype=numpy.float32)
-                wave_f[loop_end - xf:loop_end] = (
-                    wave_f[loop_end - xf:loop_end] * (1 - fade)
-                    + wave_f[loop_start - xf:loop_start] * fade)
+        # genuinely sustaining instruments.
+        loop_start, loop_end = _sustain_loop(
+            wave_f, s, self._loop_start, self._loop_end, self.sample_rate)
 
         self._cache[midi_note] = (wave_f, loop_start, loop_end)
         return wave_f, loop_start, loop_end
@@ -268,15 +293,18 @@ class _Channel:
     def note_on(self, midi_note, velocity):
         """Start a new voice."""
         vel_scale = velocity / 127.0
-        n_samples = SAMPLE_RATE * 3
-        wave, loop_start, loop_end = self._get_wave(midi_note, n_samples)
+        n_samples = self.sample_rate * 3
+        voice = self._oscillator_voice(midi_note, vel_scale, n_samples)
+        if voice is None:
+            wave, loop_start, loop_end = self._get_wave(midi_note, n_samples)
+            voice = _Voice(wave, vel_scale, midi_note, loop_start, loop_end,
+                           sample_rate=self.sample_rate)
 
         with self._lock:
             # Voice stealing - kill oldest if at max
             if len(self.voices) >= self.max_voices:
                 self.voices.pop(0)
-            self.voices.append(_Voice(wave, vel_scale, midi_note,
-                                      loop_start, loop_end))
+            self.voices.append(voice)
 
     def note_off(self, midi_note):
         """Trigger release on voices playing this note."""
@@ -297,7 +325,13 @@ class _Channel:
                     dead.append(i)
                     continue
 
-                if v.loop_end is not None:
+                if v.osc is not None:
+                    samples, chunk = self._render_oscillator(v, n_frames)
+                    if chunk <= 0:
+                        v.active = False
+                        dead.append(i)
+                        continue
+                elif v.loop_end is not None:
                     # Sustaining voice: read through the wavetable's
                     # crossfaded loop region — never runs out.
                     chunk = n_frames
@@ -362,9 +396,8 @@ class _Channel:
                 if i < len(self.voices):
                     self.voices.pop(i)
 
-        # Channel bus effects — streamed per block with persistent
-        # state, so CC/TUI parameter changes apply instantly.
-        mono = self._process_bus(mono)
+        # Channel bus effects — the same chain offline renders use
+        mono = self.effects.set(**self._kwarg_effects()).process(mono)
 
         # VU meter
         peak = numpy.abs(mono).max() if len(mono) > 0 else 0
@@ -381,89 +414,26 @@ class _Channel:
 
         return stereo
 
-    def _process_bus(self, mono):
-        """Run the channel's effect chain on one audio block.
+    def __setattr__(self, name, value):
+        # Bus effect settings go straight to the chain, so the audio
+        # callback never rebuilds its params.
+        object.__setattr__(self, name, value)
+        key = _CHANNEL_EFFECTS.get(name)
+        if key is not None and "effects" in self.__dict__:
+            self.effects.set(**{key: value})
 
-        Mirrors the offline signal chain (distortion → chorus →
-        lowpass → delay → reverb) with tremolo/saturation alongside.
-        All state (filter memory, delay lines, LFO phases) persists
-        across blocks.
-        """
-        n = len(mono)
-        if n == 0:
-            return mono
-
-        if self.distortion > 0:
-            drive = 3.0
-            mono = numpy.tanh(mono * drive * (1 + self.distortion * 3)) / drive
-        if self.saturation > 0:
-            mono = numpy.tanh(mono * (1 + self.saturation * 2))
-
-        if self.tremolo_depth > 0:
-            ph = (self._trem_phase
-                  + 2 * numpy.pi * 5.0 * numpy.arange(n) / SAMPLE_RATE)
-            mono = mono * (1.0 - self.tremolo_depth * 0.5
-                           * (1 + numpy.sin(ph))).astype(numpy.float32)
-            self._trem_phase = (ph[-1] + 2 * numpy.pi * 5.0 / SAMPLE_RATE) \
-                % (2 * numpy.pi)
-
-        if self.chorus > 0:
-            ring = self._chorus_ring
-            L = len(ring)
-            t_idx = numpy.arange(n)
-            w_idx = (self._chorus_pos + t_idx) % L
-            ring[w_idx] = mono
-            ph = (self._chorus_phase
-                  + 2 * numpy.pi * 1.5 * t_idx / SAMPLE_RATE)
-            delay = (0.007 + 0.003 * numpy.sin(ph)) * SAMPLE_RATE
-            read = (self._chorus_pos + t_idx - delay) % L
-            ri = read.astype(numpy.int64)
-            frac = (read - ri).astype(numpy.float32)
-            wet = ring[ri] * (1 - frac) + ring[(ri + 1) % L] * frac
-            mono = mono * (1 - self.chorus * 0.5) + wet * self.chorus * 0.5
-            self._chorus_phase = (ph[-1]
-                                  + 2 * numpy.pi * 1.5 / SAMPLE_RATE) \
-                % (2 * numpy.pi)
-            self._chorus_pos = (self._chorus_pos + n) % L
-
-        if self.lowpass > 0 and self.lowpass < SAMPLE_RATE / 2:
-            from scipy.signal import lfilter
-            key = (self.lowpass, self.lowpass_q)
-            if self._lp_coeffs is None or self._lp_coeffs[0] != key:
-                w0 = 2 * numpy.pi * self.lowpass / SAMPLE_RATE
-                alpha = numpy.sin(w0) / (2 * self.lowpass_q)
-                cos_w0 = numpy.cos(w0)
-                a0 = 1 + alpha
-                b = numpy.array([(1 - cos_w0) / 2, 1 - cos_w0,
-                                 (1 - cos_w0) / 2]) / a0
-                a = numpy.array([1.0, -2 * cos_w0 / a0, (1 - alpha) / a0])
-                self._lp_coeffs = (key, b, a)
-            _, b, a = self._lp_coeffs
-            mono, self._lp_zi = lfilter(b, a, mono, zi=self._lp_zi)
-            mono = mono.astype(numpy.float32)
-
-        if self.delay > 0:
-            ring = self._delay_ring
-            L = len(ring)
-            d = int(self.kwargs.get('delay_time', 0.375) * SAMPLE_RATE)
-            d = max(n, min(d, L - 1))
-            t_idx = numpy.arange(n)
-            r_idx = (self._delay_pos + t_idx - d) % L
-            wet = ring[r_idx].copy()
-            feedback = self.kwargs.get('delay_feedback', 0.4)
-            w_idx = (self._delay_pos + t_idx) % L
-            ring[w_idx] = mono + wet * feedback
-            mono = mono * (1 - self.delay) + wet * self.delay
-            self._delay_pos = (self._delay_pos + n) % L
-
-        if self.reverb > 0:
-            if self._reverb_state is None:
-                self._reverb_state = _StreamReverb(
-                    decay=self.kwargs.get('reverb_decay', 1.0))
-            wet = self._reverb_state.process(mono)
-            mono = mono * (1 - self.reverb) + wet * self.reverb
-
-        return mono.astype(numpy.float32)
+    def _kwarg_effects(self):
+        """The bus effect settings that come from ``self.kwargs``."""
+        kw = self.kwargs
+        return {key: kw.get(key, default)
+                for key, default in _CHANNEL_KWARG_EFFECTS.items()}
+
+    def _effect_params(self):
+        """The channel's bus effect settings as an effects params dict."""
+        params = {key: getattr(self, name)
+                  for name, key in _CHANNEL_EFFECTS.items()}
+        params.update(self._kwarg_effects())
+        return params
 
 
 # ── LiveEngine ───────────────────────────────────────────────────────────
@@ -546,6 +516,7 @@ class LiveEngine:
             synth_name=synth_name,
             envelope_name=env_name,
             is_drums=drums or ch == 10,
+            sample_rate=self.sample_rate,
             **params,
         )
         return self
@@ -563,7 +534,8 @@ class LiveEngine:
         from .rhythm import Pattern
         self._drum_pattern = Pattern.preset(pattern_name)
         self._drum_channel = _Channel(synth_name="sine", is_drums=True,
-                                      volume=volume)
+                                      volume=volume,
+                                      sample_rate=self.sample_rate)
         return self
 
     def cc(self, cc_number, param, *, min_val=0.0, max_val=1.0, ch=None):
@@ -820,6 +792,22 @@ class LiveEngine:
         midi_in.delete()
         return ports
 
+    def _prerender_drums(self, n_samples):
+        """Synthesize the drum hits this engine will play, ahead of time.
+
+        Only the sounds in use: the drum pattern's, plus the General MIDI
+        kit that drum channels map their notes to. Anything else a drum
+        channel is sent synthesizes on its first hit.
+        """
+        sounds = set()
+        if self._drum_pattern is not None:
+            sounds.update(hit.sound.value for hit in self._drum_pattern.hits)
+        if any(c.is_drums for c in self.channels.values()):
+            sounds.update(DrumKit("standard").sounds)
+        with _at_rate(self.sample_rate):
+            for sound in sorted(sounds):
+                _drum_hit(sound, n_samples)
+
     def start(self, port=None):
         """Start the engine - opens MIDI input and audio output.
 
@@ -839,9 +827,11 @@ class LiveEngine:
 
         # Pre-compute wavetables
         print("  Pre-rendering wavetables...")
-        n_samples = SAMPLE_RATE * 3
+        n_samples = self.sample_rate * 3
+        self._prerender_drums(n_samples)
         for _, channel in self.channels.items():
-            if channel.is_drums:
+            if channel.is_drums or _oscillator_for(channel.synth_fn,
+                                                   channel._synth_kwargs()):
                 continue
             for midi_note in range(36, 97):
                 channel._get_wave(midi_note, n_samples)
@@ -120,7 +120,7 @@ class LiveTUI:
         stdscr.addstr(2, 2, "Pre-rendering wavetables...", curses.color_pair(3))
         stdscr.refresh()
 
-        n_samples = 44100 * 3
+        n_samples = self.engine.sample_rate * 3
         count = 0
         for _, channel in self.engine.channels.items():
             if channel.is_drums:
@@ -291,7 +291,7 @@ class LiveTUI:
                 pairs = [
                     ("Drums", self.current_drum, 5),
                     ("BPM", str(self.bpm), 0),
-                    ("Latency", f"{self.engine.buffer_size / 44100 * 1000:.1f}ms", 0),
+                    ("Latency", f"{self.engine.buffer_size / self.engine.sample_rate * 1000:.1f}ms", 0),
                     ("MIDI", self.port, 0),
                     ("Seed", str(self.seed), 2),
                 ]
@@ -745,7 +745,7 @@ class LiveTUI:
                 if not channel._cache:
                     self.log("Rendering wavetables...", 3)
                     for midi_note in range(36, 97):
-                        channel._get_wave(midi_note, 44100 * 3)
+                        channel._get_wave(midi_note, self.engine.sample_rate * 3)
             self.log(f"♪ Keyboard ON ch{ch_num} oct{self.engine._keyboard_octave} (Esc=exit, ↑↓=octave)", 1)
         elif verb == "rec":
             self.engine.start_recording()
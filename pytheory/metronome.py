@@ -32,13 +32,14 @@ _BEAT_HZ = 988.0      # B5 — the other beats
 _SUB_HZ = 784.0       # G5 — subdivisions ("and"s)
 
 
-def _click(freq: float, *, length: float = 0.045, volume: float = 0.7):
+def _click(freq: float, *, length: float = 0.045, volume: float = 0.7,
+           sample_rate: int = SAMPLE_RATE):
     """Synthesize a single metronome tick as a float32 mono buffer."""
-    n = int(SAMPLE_RATE * length)
-    t = numpy.arange(n, dtype=numpy.float64) / SAMPLE_RATE
+    n = int(sample_rate * length)
+    t = numpy.arange(n, dtype=numpy.float64) / sample_rate
     # A fast-decaying sine, with a tiny noise transient for the "tick".
     body = numpy.sin(2 * numpy.pi * freq * t) * numpy.exp(-t * 55.0)
-    attack = int(SAMPLE_RATE * 0.002)
+    attack = int(sample_rate * 0.002)
     transient = numpy.zeros(n)
     if attack:
         transient[:attack] = (numpy.random.uniform(-1.0, 1.0, attack)
@@ -70,6 +71,7 @@ class Metronome:
             of 4/4).
         hold: When the trainer reaches ``end_bpm``, keep clicking at that
             tempo if True, otherwise stop (default True).
+        sample_rate: Output sample rate in Hz (default 44100).
     """
 
     def __init__(self, bpm: float = 120, beats: int = 4, *,
@@ -77,7 +79,8 @@ class Metronome:
                  progression=None, chord_synth: str = "triangle",
                  chord_volume: float = 0.35,
                  end_bpm: float | None = None, step: float = 5,
-                 every: int = 8, hold: bool = True) -> None:
+                 every: int = 8, hold: bool = True,
+                 sample_rate: int = SAMPLE_RATE) -> None:
         if bpm <= 0:
             raise ValueError("bpm must be positive")
         if beats < 1:
@@ -99,11 +102,13 @@ class Metronome:
         self.step = abs(step)
         self.every = max(1, every)
         self.hold = hold
+        self.sample_rate = int(sample_rate)
 
         # Pre-rendered clicks (tempo-independent).
-        self._accent = _click(_ACCENT_HZ, volume=0.85)
-        self._beat = _click(_BEAT_HZ, volume=0.6)
-        self._sub = _click(_SUB_HZ, length=0.03, volume=0.3)
+        sr = self.sample_rate
+        self._accent = _click(_ACCENT_HZ, volume=0.85, sample_rate=sr)
+        self._beat = _click(_BEAT_HZ, volume=0.6, sample_rate=sr)
+        self._sub = _click(_SUB_HZ, length=0.03, volume=0.3, sample_rate=sr)
         self._chord_cache: dict[str, numpy.ndarray] = {}
 
     # ── buffer construction ──────────────────────────────────────────
@@ -111,7 +116,7 @@ class Metronome:
     def _chord_stab(self, symbol: str, length: int) -> numpy.ndarray:
         """Render a chord to a soft, decaying stab of ``length`` samples."""
         from .chords import Chord
-        from .play import _render, Synth, Envelope
+        from .play import _at_rate, _render, Synth, Envelope
 
         key = f"{symbol}@{length}"
         if key in self._chord_cache:
@@ -123,8 +128,9 @@ class Metronome:
             self._chord_cache[key] = stab
             return stab
         synth = Synth[self.chord_synth.upper()]
-        ms = int(length / SAMPLE_RATE * 1000)
-        raw = _render(chord, synth=synth, t=ms, envelope=Envelope.PLUCK)
+        ms = int(length / self.sample_rate * 1000)
+        with _at_rate(self.sample_rate):
+            raw = _render(chord, synth=synth, t=ms, envelope=Envelope.PLUCK)
         stab = raw.astype(numpy.float32) / SAMPLE_PEAK * self.chord_volume
         if len(stab) < length:
             stab = numpy.pad(stab, (0, length - len(stab)))
@@ -135,7 +141,7 @@ class Metronome:
 
     def _bar(self, symbol: str | None) -> numpy.ndarray:
         """Build one bar of audio at the current tempo."""
-        beat_len = int(SAMPLE_RATE * 60.0 / self.bpm)
+        beat_len = int(self.sample_rate * 60.0 / self.bpm)
         bar = numpy.zeros(beat_len * self.beats, dtype=numpy.float32)
 
         sub_len = beat_len / self.subdivide
@@ -180,7 +186,7 @@ class Metronome:
         direction = 1.0 if (ramping and self.end_bpm > origin) else -1.0
 
         reached = False  # played a bar at the target yet?
-        with sd.OutputStream(samplerate=SAMPLE_RATE, channels=1,
+        with sd.OutputStream(samplerate=self.sample_rate, channels=1,
                              dtype="float32") as stream:
             try:
                 while True:
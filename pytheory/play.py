@@ -1,4 +1,9 @@
+from collections import OrderedDict
+import contextlib
+import contextvars
 from enum import Enum
+import os
+import threading
 import time
 
 import numpy
@@ -17,7 +22,8 @@ class _LazyModule:
             self._mod = importlib.import_module(self._name)
         return getattr(self._mod, attr)
 
-scipy = type('scipy', (), {'signal': _LazyModule('scipy.signal')})()
+scipy = type('scipy', (), {'signal': _LazyModule('scipy.signal'),
+                           'fft': _LazyModule('scipy.fft')})()
 
 
 def _get_sd():
@@ -26,8 +32,46 @@ def _get_sd():
     return sd
 
 SAMPLE_RATE = 44_100   # CD-quality sample rate (Hz)
+PREVIEW_RATE = 22_050  # Half rate for quick previews — about half the cost
 SAMPLE_PEAK = 4_096    # Peak amplitude for 16-bit integer samples
 
+# The rate the current render runs at. Synths, envelopes, effects and
+# impulse responses read it through _rate(), so a render at 48 kHz (or a
+# cheap 22.05 kHz preview) is generated natively at that rate rather
+# than rendered at 44.1 kHz and resampled afterwards.
+_RENDER_RATE = contextvars.ContextVar("pytheory_render_rate",
+                                      default=SAMPLE_RATE)
+
+
+def _rate():
+    """Sample rate of the render in progress (``SAMPLE_RATE`` outside one)."""
+    return _RENDER_RATE.get()
+
+
+def _check_rate(sample_rate):
+    """Validate a ``sample_rate=`` argument; ``None`` means the current
+    render rate. Raises ValueError below 8 kHz."""
+    if sample_rate is None:
+        return _rate()
+    if isinstance(sample_rate, bool) or int(sample_rate) != sample_rate:
+        raise ValueError(
+            f"sample_rate must be a whole number of Hz, got {sample_rate!r}")
+    if sample_rate < 8_000:
+        raise ValueError(
+            f"sample_rate must be at least 8000 Hz, got {sample_rate}")
+    return int(sample_rate)
+
+
+@contextlib.contextmanager
+def _at_rate(sample_rate):
+    """Render everything inside the block at ``sample_rate`` Hz."""
+    sample_rate = _check_rate(sample_rate)
+    token = _RENDER_RATE.set(sample_rate)
+    try:
+        yield sample_rate
+    finally:
+        _RENDER_RATE.reset(token)
+
 
 def _feedback_comb(x, delay, gain):
     """Feedback comb filter: y[n] = x[n-delay] + gain*y[n-delay].
@@ -97,55 +141,76 @@ def _one_pole_lowpass(x, alpha, y0=None):
     return out
 
 
-def sine_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def _tile_add(out, cycle):
+    """Add *cycle* repeated end to end into *out*, in place.
+
+    Same samples as ``out += numpy.resize(cycle, len(out))`` without the
+    tiled temporary: whole periods are added through a 2-D view.
+    """
+    size = len(cycle)
+    full = len(out) // size
+    if full:
+        periods = out[:full * size].reshape(full, size)
+        periods += cycle
+    rest = len(out) - full * size
+    if rest:
+        out[full * size:] += cycle[:rest]
+    return out
+
+
+def sine_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Compute N samples of a sine wave with given frequency and peak amplitude.
     Defaults to one second.
     """
-    length = SAMPLE_RATE / float(hz)
+    length = _rate() / float(hz)
     omega = numpy.pi * 2 / length
     xvalues = numpy.arange(int(length)) * omega
     onecycle = peak * numpy.sin(xvalues)
-    return numpy.resize(onecycle, (n_samples,)).astype(numpy.int16)
+    return numpy.resize(onecycle, (n_samples,)).astype(dtype)
 
 
-def sawtooth_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def sawtooth_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Compute N samples of a sawtooth wave with given frequency and peak amplitude.
     Defaults to one second.
     """
-    length = SAMPLE_RATE / float(hz)
+    length = _rate() / float(hz)
     omega = numpy.pi * 2 / length
     xvalues = numpy.arange(int(length)) * omega
     onecycle = scipy.signal.sawtooth(xvalues, width=1)
-    onecycle = (peak * onecycle).astype(numpy.int16)
+    onecycle = (peak * onecycle).astype(dtype)
     return numpy.resize(onecycle, (n_samples,))
 
 
-def triangle_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def triangle_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Compute N samples of a triangle wave with given frequency and peak amplitude.
     Defaults to one second.
     """
-    length = SAMPLE_RATE / float(hz)
+    length = _rate() / float(hz)
     omega = numpy.pi * 2 / length
     xvalues = numpy.arange(int(length)) * omega
     onecycle = scipy.signal.sawtooth(xvalues, width=0.5)
-    onecycle = (peak * onecycle).astype(numpy.int16)
+    onecycle = (peak * onecycle).astype(dtype)
     return numpy.resize(onecycle, (n_samples,))
 
 
-def square_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def square_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                dtype=numpy.int16):
     """Compute N samples of a square wave — classic chiptune / 8-bit sound.
 
     Hollow and buzzy, containing only odd harmonics (1, 3, 5, 7...) each
     at amplitude 1/n. The building block of NES and Game Boy music.
     """
-    length = SAMPLE_RATE / float(hz)
+    length = _rate() / float(hz)
     omega = numpy.pi * 2 / length
     xvalues = numpy.arange(int(length)) * omega
     onecycle = peak * numpy.sign(numpy.sin(xvalues))
-    return numpy.resize(onecycle, (n_samples,)).astype(numpy.int16)
+    return numpy.resize(onecycle, (n_samples,)).astype(dtype)
 
 
-def pulse_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, duty=0.25):
+def pulse_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, duty=0.25,
+               dtype=numpy.int16):
     """Compute N samples of a pulse wave with variable duty cycle.
 
     A generalized square wave. Duty cycle controls the timbre:
@@ -158,16 +223,16 @@ def pulse_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, duty=0.25):
     pulses emphasize higher harmonics, producing a brighter, more
     cutting sound.
     """
-    length = SAMPLE_RATE / float(hz)
+    length = _rate() / float(hz)
     omega = numpy.pi * 2 / length
     xvalues = numpy.arange(int(length)) * omega
     onecycle = scipy.signal.square(xvalues, duty=duty)
-    onecycle = (peak * onecycle).astype(numpy.int16)
+    onecycle = (peak * onecycle).astype(dtype)
     return numpy.resize(onecycle, (n_samples,))
 
 
 def fm_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-            mod_ratio=2.0, mod_index=3.0):
+            mod_ratio=2.0, mod_index=3.0, dtype=numpy.int16):
     """Compute N samples of an FM synthesis wave.
 
     One sine wave (the carrier) has its frequency modulated by another
@@ -189,14 +254,15 @@ def fm_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
         - Brass: ratio=1, index=3
         - Metallic: ratio=1.41, index=8
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     mod_freq = hz * mod_ratio
     modulator = mod_index * numpy.sin(2 * numpy.pi * mod_freq * t)
     carrier = numpy.sin(2 * numpy.pi * hz * t + modulator)
-    return (peak * carrier).astype(numpy.int16)
+    return (peak * carrier).astype(dtype)
 
 
-def noise_wave(hz=0, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def noise_wave(hz=0, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+               dtype=numpy.int16):
     """Compute N samples of white noise.
 
     Unpitched — the ``hz`` parameter only seeds the noise so a given note
@@ -205,11 +271,11 @@ def noise_wave(hz=0, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     sounds in melodic parts.
     """
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
-    return (peak * rng.uniform(-1, 1, n_samples)).astype(numpy.int16)
+    return (peak * rng.uniform(-1, 1, n_samples)).astype(dtype)
 
 
 def supersaw_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-                  voices=7, detune_cents=15):
+                  voices=7, detune_cents=15, dtype=numpy.int16):
     """Compute N samples of a supersaw — multiple detuned saws summed.
 
     The signature sound of trance and EDM. Multiple sawtooth oscillators
@@ -226,17 +292,16 @@ def supersaw_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     mixed = numpy.zeros(n_samples, dtype=numpy.float64)
     for offset in spread:
         detuned_hz = hz * (2 ** (offset / 1200))
-        length = SAMPLE_RATE / float(detuned_hz)
+        length = _rate() / float(detuned_hz)
         omega = numpy.pi * 2 / length
         xvalues = numpy.arange(int(length)) * omega
-        onecycle = scipy.signal.sawtooth(xvalues, width=1)
-        wave = numpy.resize(onecycle, (n_samples,))
-        mixed += wave
+        _tile_add(mixed, scipy.signal.sawtooth(xvalues, width=1))
     mixed /= voices  # normalize
-    return (peak * mixed).astype(numpy.int16)
+    return (peak * mixed).astype(dtype)
 
 
-def pwm_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lfo_rate=0.3):
+def pwm_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lfo_rate=0.3,
+             dtype=numpy.int16):
     """Compute N samples of a pulse-width modulated wave.
 
     A pulse wave whose duty cycle sweeps back and forth via an LFO,
@@ -254,27 +319,29 @@ def pwm_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lfo_rate=0.3):
             0.1–0.5 = slow, lush pads.
             1–5 = faster, more vibrato/chorus-like.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # LFO sweeps duty cycle between 0.15 and 0.85
     duty = 0.5 + 0.35 * numpy.sin(2 * numpy.pi * lfo_rate * t)
     # Generate pulse wave sample-by-sample with varying duty
     phase = (t * hz) % 1.0
     wave = numpy.where(phase < duty, 1.0, -1.0)
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def pwm_slow_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def pwm_slow_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """PWM with slow LFO (0.3 Hz) — lush Juno-style pads."""
-    return pwm_wave(hz, peak, n_samples, lfo_rate=0.3)
+    return pwm_wave(hz, peak, n_samples, dtype=dtype, lfo_rate=0.3)
 
 
-def pwm_fast_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def pwm_fast_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """PWM with fast LFO (3 Hz) — chorused, vibrato-like texture."""
-    return pwm_wave(hz, peak, n_samples, lfo_rate=3.0)
+    return pwm_wave(hz, peak, n_samples, dtype=dtype, lfo_rate=3.0)
 
 
 def hard_sync_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-                   slave_ratio=1.5):
+                   slave_ratio=1.5, dtype=numpy.int16):
     """Hard-sync oscillator — slave saw reset by master clock.
 
     The quintessential analog lead sound. A "slave" oscillator runs at
@@ -291,7 +358,7 @@ def hard_sync_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
             1.0 = unison (plain saw). 1.5–3.0 = sweet spot for leads.
             Higher = more metallic, ring-mod-like.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # Master phase ramps 0→1 at hz
     master_phase = (t * hz) % 1.0
     # Detect master zero-crossings (phase resets)
@@ -300,17 +367,17 @@ def hard_sync_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     # Phase at sample i is just (samples since last reset) * freq * dt,
     # so find each sample's most recent reset with a running maximum.
     slave_freq = hz * slave_ratio
-    dt = 1.0 / SAMPLE_RATE
+    dt = 1.0 / _rate()
     idx = numpy.arange(n_samples, dtype=numpy.int64)
     last_reset = numpy.maximum.accumulate(numpy.where(resets, idx, 0))
     slave_phase = ((idx - last_reset) * slave_freq * dt) % 1.0
     # Slave is a sawtooth: 2*phase - 1
     wave = 2.0 * slave_phase - 1.0
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
 def ring_mod_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-                  mod_ratio=1.5):
+                  mod_ratio=1.5, dtype=numpy.int16):
     """Ring modulation — two oscillators multiplied together.
 
     Multiplying two signals produces sum and difference frequencies,
@@ -325,15 +392,15 @@ def ring_mod_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
             Integer ratios (2, 3) = harmonic (bell-like).
             Non-integer (1.5, 2.1) = inharmonic (metallic, alien).
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     carrier = numpy.sin(2 * numpy.pi * hz * t)
     modulator = numpy.sin(2 * numpy.pi * hz * mod_ratio * t)
     wave = carrier * modulator
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
 def wavefold_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-                  folds=3.0):
+                  folds=3.0, dtype=numpy.int16):
     """Wavefolding — signal folded back on itself for complex harmonics.
 
     The heart of west coast synthesis (Buchla, Make Noise, Verbos).
@@ -350,16 +417,16 @@ def wavefold_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
         folds: Drive amount. 1.0 = clean sine. 2–4 = sweet spot.
             6+ = harsh, buzzy territory.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     wave = numpy.sin(2 * numpy.pi * hz * t) * folds
     # Triangle-fold: repeatedly reflect at ±1
     # Uses the mathematical identity for folding
     wave = 4.0 * numpy.abs((wave / 4.0 + 0.25) % 1.0 - 0.5) - 1.0
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
 def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-               shape="saw", drift_amount=0.15):
+               shape="saw", drift_amount=0.15, dtype=numpy.int16):
     """Analog VCO with pitch drift, instability, and soft noise floor.
 
     Real analog oscillators are never perfectly stable. Capacitor
@@ -381,7 +448,7 @@ def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
             0.15 = classic vintage (Minimoog, ARP).
             0.3 = barely-holding-it-together (old SH-101).
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Slow pitch drift — 2 LFOs at sub-Hz rates with random phase
@@ -392,7 +459,7 @@ def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     # Fast jitter — per-sample noise filtered to ~50 Hz bandwidth
     jitter_raw = rng.normal(0, drift_amount * 0.08, n_samples)
     # Simple one-pole lowpass for jitter smoothing
-    alpha = 2 * numpy.pi * 50.0 / SAMPLE_RATE
+    alpha = 2 * numpy.pi * 50.0 / _rate()
     jitter = _one_pole_lowpass(jitter_raw, alpha,
                                y0=jitter_raw[0] if n_samples else None)
 
@@ -401,7 +468,7 @@ def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     freq_ratio = 2.0 ** (cents_offset / 1200.0)
 
     # Accumulate phase with varying frequency
-    phase = numpy.cumsum(hz * freq_ratio / SAMPLE_RATE)
+    phase = numpy.cumsum(hz * freq_ratio / _rate())
     phase %= 1.0
 
     # Generate waveform from phase
@@ -416,7 +483,7 @@ def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
 
     # Soft edges — gentle lowpass to round off transitions
     cutoff = min(16000, hz * 12)
-    bl, al = scipy.signal.butter(1, cutoff, btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(1, cutoff, btype='low', fs=_rate())
     wave = scipy.signal.lfilter(bl, al, wave)
 
     # Subtle analog noise floor
@@ -427,10 +494,10 @@ def drift_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def pluck_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def pluck_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Karplus-Strong plucked string synthesis.
 
     A burst of noise is fed into a short delay line with feedback —
@@ -444,7 +511,7 @@ def pluck_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     acts as a lowpass filter, gradually removing high harmonics —
     exactly what a real vibrating string does as energy dissipates.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     # Initial noise burst — the "pluck" (seeded by pitch so a note is
@@ -452,10 +519,10 @@ def pluck_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     buf = rng.uniform(-1.0, 1.0, period).astype(numpy.float64)
     out = _karplus_strong(buf, n_samples, 0.5, 0.5, 0.998)
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Hammond organ — additive synthesis with drawbar harmonics.
 
     A real Hammond B3 has 9 drawbars that mix sine waves at different
@@ -467,7 +534,7 @@ def organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     between a sine wave and a square wave, with that characteristic
     hollow roundness.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # Drawbar levels (inspired by 888800000 — full even harmonics)
     wave = (numpy.sin(2 * numpy.pi * hz * t) * 1.0 +           # 16' fundamental
             numpy.sin(2 * numpy.pi * hz * 2 * t) * 0.8 +       # 8'
@@ -477,10 +544,11 @@ def organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
             numpy.sin(2 * numpy.pi * hz * 6 * t) * 0.25 +      # 2'
             numpy.sin(2 * numpy.pi * hz * 8 * t) * 0.15)       # 1 3/5'
     wave /= 3.5  # normalize
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def strings_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def strings_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Bowed string — additive synthesis with natural harmonic rolloff.
 
     Models bowed string physics:
@@ -490,7 +558,7 @@ def strings_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     - Per-harmonic phase randomization for natural timbre
     - Gentle spectral tilt to avoid synthetic brightness
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Delayed vibrato: ramps in over ~200ms, like a real bow
@@ -500,7 +568,7 @@ def strings_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     vibrato = vib_depth * vib_onset * numpy.sin(2 * numpy.pi * vib_rate * t)
 
     # Additive synthesis — build harmonics with natural rolloff
-    nyquist = SAMPLE_RATE / 2.0
+    nyquist = _rate() / 2.0
     n_harmonics = min(40, int(nyquist / hz))
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
 
@@ -542,13 +610,13 @@ def strings_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Gentle lowpass — real instruments don't have infinite bandwidth
     cutoff = min(10000, hz * 10)
-    bl, al = scipy.signal.butter(2, cutoff, btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, cutoff, btype='low', fs=_rate())
     wave = scipy.signal.lfilter(bl, al, wave)
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Piano — modal synthesis of stiff steel strings struck by a felt hammer.
 
     What makes a piano sound like a piano, in order of importance:
@@ -570,7 +638,7 @@ def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
        milliseconds, low ones ring for seconds, so every note darkens
        as it decays. Treble notes are short; bass notes bloom.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Stiffness coefficient B by register: modest for long wound bass
@@ -579,7 +647,7 @@ def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Partial count: deep bass notes have audible partials into the kHz;
     # treble notes only fit a handful under Nyquist.
-    n_partials = min(56, int((SAMPLE_RATE / 2) / hz))
+    n_partials = min(56, int((_rate() / 2) / hz))
     if n_partials < 1:
         n_partials = 1
     n_idx = numpy.arange(1, n_partials + 1, dtype=numpy.float64)
@@ -620,12 +688,12 @@ def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     else:
         detunes = [-1.2, 0.0, 1.2]
 
-    valid = partial_freqs < SAMPLE_RATE / 2
+    valid = partial_freqs < _rate() / 2
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
     for cents in detunes:
         string_freqs = partial_freqs * (2 ** (cents / 1200))
         phases = rng.uniform(0, 2 * numpy.pi, n_partials)
-        v = valid & (string_freqs < SAMPLE_RATE / 2)
+        v = valid & (string_freqs < _rate() / 2)
         if not v.any():
             continue
         phase_matrix = (2 * numpy.pi * string_freqs[v, numpy.newaxis]
@@ -636,10 +704,10 @@ def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Hammer impact — felt-on-string knock plus key-bed thump.
     # Brighter and punchier on high notes, warmer on low notes.
-    hammer_len = min(int(SAMPLE_RATE * (0.015 - 0.007 * brightness)), n_samples)
+    hammer_len = min(int(_rate() * (0.015 - 0.007 * brightness)), n_samples)
     if hammer_len < 4:
         hammer_len = 4
-    hammer_t = numpy.arange(hammer_len, dtype=numpy.float64) / SAMPLE_RATE
+    hammer_t = numpy.arange(hammer_len, dtype=numpy.float64) / _rate()
     hammer_freq = 300 + 400 * brightness  # 300Hz low register, 700Hz high
     hammer = (numpy.sin(2 * numpy.pi * hammer_freq * hammer_t) * (0.4 + 0.3 * brightness) +
               numpy.sin(2 * numpy.pi * hz * 1.5 * hammer_t) * 0.3)
@@ -650,10 +718,11 @@ def piano_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                dtype=numpy.int16):
     """Rhodes electric piano — tine struck by hammer, electromagnetic pickup.
 
     The Rhodes sound comes from a rubber-tipped hammer hitting a thin
@@ -664,7 +733,7 @@ def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     3. Bell-like inharmonic partials on soft hits, bark on hard hits
     4. Asymmetric waveform from the pickup's nonlinear response
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Two-stage decay: quick initial drop, then long sustain
@@ -689,7 +758,7 @@ def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for n, amp in tine_harmonics:
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Higher harmonics decay faster
         h_decay = decay * numpy.exp(-(0.8 + 0.3 * brightness) * (n - 1) * t)
@@ -697,8 +766,8 @@ def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
         wave += amp * numpy.sin(2 * numpy.pi * f_n * t + phase) * h_decay
 
     # Hammer-on-tine transient — bright metallic click
-    click_len = min(int(SAMPLE_RATE * 0.008), n_samples)
-    click_t = numpy.arange(click_len, dtype=numpy.float64) / SAMPLE_RATE
+    click_len = min(int(_rate() * 0.008), n_samples)
+    click_t = numpy.arange(click_len, dtype=numpy.float64) / _rate()
     # Inharmonic tine ring at attack (bell partials)
     click = (numpy.sin(2 * numpy.pi * hz * 5.3 * click_t) * 0.15 +
              numpy.sin(2 * numpy.pi * hz * 7.1 * click_t) * 0.08)
@@ -712,10 +781,11 @@ def rhodes_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                   dtype=numpy.int16):
     """Wurlitzer electric piano — vibrating steel reed over a pickup.
 
     Unlike the Rhodes (tine + tonebar), the Wurlitzer uses a flat
@@ -724,7 +794,7 @@ def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     Think Supertramp, Ray Charles, early Billy Joel. It barks and
     growls in a way the Rhodes never does.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Faster decay than Rhodes — reeds don't sustain like tines
@@ -748,7 +818,7 @@ def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for n, amp in reed_harmonics:
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         h_decay = decay * numpy.exp(-(1.0 + 0.4 * brightness) * (n - 1) * t)
         phase = rng.uniform(0, 2 * numpy.pi)
@@ -756,7 +826,7 @@ def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Reed buzz — slight asymmetric distortion at attack
     # This is the "bark" when you hit hard
-    attack_len = min(int(SAMPLE_RATE * 0.03), n_samples)
+    attack_len = min(int(_rate() * 0.03), n_samples)
     attack_env = numpy.zeros(n_samples, dtype=numpy.float64)
     attack_env[:attack_len] = numpy.exp(-numpy.linspace(0, 6, attack_len))
     wave += numpy.tanh(wave * 3.0 * attack_env) * 0.15
@@ -768,11 +838,11 @@ def wurlitzer_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
 def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
-                   tape="strings"):
+                   tape="strings", dtype=numpy.int16):
     """Mellotron — tape-replay keyboard from the 1960s.
 
     Each key triggers a strip of magnetic tape with a pre-recorded
@@ -794,7 +864,7 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
             "flute" — breathy, haunting solo flute
             "choir" — ghostly vocal pad
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # --- Tape flutter: slow wow + faster flutter ---
@@ -807,10 +877,10 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
 
     # Accumulate phase with flutter
     inst_freq = hz * freq_ratio
-    phase = numpy.cumsum(inst_freq / SAMPLE_RATE)
+    phase = numpy.cumsum(inst_freq / _rate())
 
     # --- Generate the "tape" source ---
-    nyquist = SAMPLE_RATE / 2.0
+    nyquist = _rate() / 2.0
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
 
     if tape == "flute":
@@ -825,7 +895,7 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
         bw = max(100, hz * 0.3)
         lo = max(20, hz - bw)
         hi = min(nyquist * 0.95, hz + bw)
-        bb, ab = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        bb, ab = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
         breath = scipy.signal.lfilter(bb, ab, breath)
         wave += breath
     elif tape == "choir":
@@ -849,7 +919,7 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
         # Slow ensemble drift between "voices"
         drift = 0.005 * numpy.sin(2 * numpy.pi * 0.15 * t + rng.uniform(0, 6.28))
         wave2 = numpy.zeros(n_samples, dtype=numpy.float64)
-        phase2 = numpy.cumsum(hz * (1.0 + drift) * freq_ratio / SAMPLE_RATE)
+        phase2 = numpy.cumsum(hz * (1.0 + drift) * freq_ratio / _rate())
         for n in range(1, min(8, int(nyquist / hz)) + 1):
             f_n = hz * n
             if f_n >= nyquist:
@@ -865,7 +935,7 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
         # Two "sections" slightly detuned for ensemble width
         for section_detune in [-1.5, 0, 1.5]:
             section_hz = hz * (2 ** (section_detune / 1200.0))
-            section_phase = numpy.cumsum(section_hz * freq_ratio / SAMPLE_RATE)
+            section_phase = numpy.cumsum(section_hz * freq_ratio / _rate())
             for n in range(1, n_harmonics + 1):
                 f_n = section_hz * n
                 if f_n >= nyquist:
@@ -886,15 +956,15 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     lo_cut = min(300, hz * 0.9)  # don't cut fundamental
     hi_cut = min(6000, nyquist * 0.95)
     if lo_cut < hi_cut and lo_cut > 0:
-        bb, ab = scipy.signal.butter(2, [lo_cut, hi_cut], btype='band', fs=SAMPLE_RATE)
+        bb, ab = scipy.signal.butter(2, [lo_cut, hi_cut], btype='band', fs=_rate())
         wave = scipy.signal.lfilter(bb, ab, wave)
 
     # --- Tape saturation: soft compression ---
     wave = numpy.tanh(wave * 1.4) / 1.2
 
     # --- Tape run-out: gentle fadeout after ~7 seconds ---
-    if n_samples > int(SAMPLE_RATE * 7):
-        fadeout_start = int(SAMPLE_RATE * 7)
+    if n_samples > int(_rate() * 7):
+        fadeout_start = int(_rate() * 7)
         fadeout_len = n_samples - fadeout_start
         fade = numpy.linspace(1.0, 0.0, fadeout_len)
         wave[fadeout_start:] *= fade
@@ -907,17 +977,18 @@ def mellotron_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def vibraphone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def vibraphone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                    dtype=numpy.int16):
     """Vibraphone — struck aluminum bars with motor-driven tremolo.
 
     Metal bars hit with soft mallets, resonator tubes underneath,
     and a spinning disc (motor) that modulates the sound creating
     the signature vibraphone shimmer/tremolo.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Long sustain — bars ring for seconds
@@ -935,7 +1006,7 @@ def vibraphone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for ratio, amp in bar_modes:
         f = hz * ratio
-        if f >= SAMPLE_RATE / 2:
+        if f >= _rate() / 2:
             break
         mode_decay = decay * numpy.exp(-0.5 * (ratio - 1) * t)
         phase = rng.uniform(0, 2 * numpy.pi)
@@ -950,7 +1021,7 @@ def vibraphone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave *= tremolo
 
     # Soft mallet attack
-    mallet_len = min(int(SAMPLE_RATE * 0.005), n_samples)
+    mallet_len = min(int(_rate() * 0.005), n_samples)
     mallet = rng.uniform(-0.15, 0.15, mallet_len).astype(numpy.float64)
     mallet *= numpy.exp(-numpy.linspace(0, 12, mallet_len))
     wave[:mallet_len] += mallet
@@ -959,10 +1030,11 @@ def vibraphone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                    dtype=numpy.int16):
     """Pipe organ — air through ranks of pipes, multiple stops.
 
     The pipe organ is additive synthesis incarnate — each stop adds
@@ -970,7 +1042,7 @@ def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     registration: principal 8', octave 4', fifteenth 2', mixture.
     Constant air pressure means no dynamics — always full and sustained.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
 
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
 
@@ -978,7 +1050,7 @@ def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Pipe harmonics with subtle wind noise
     for n in range(1, 12):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Pipe spectral shape — principalish
         if n == 1:
@@ -996,7 +1068,7 @@ def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Octave 4' stop — one octave up
     for n in range(1, 8):
         f_n = hz * 2 * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         amp = (0.4 if n == 1 else 0.15 / n)
         wave += amp * numpy.sin(2 * numpy.pi * f_n * t)
@@ -1006,21 +1078,21 @@ def pipe_organ_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave += 0.08 * numpy.sin(2 * numpy.pi * hz * 5 * t)
 
     # Subtle wind/chiff noise at attack
-    chiff_len = min(int(SAMPLE_RATE * 0.04), n_samples)
+    chiff_len = min(int(_rate() * 0.04), n_samples)
     chiff = _noise(chiff_len).astype(numpy.float64) * 0.08
     chiff *= numpy.exp(-numpy.linspace(0, 10, chiff_len))
     wave[:chiff_len] += chiff
 
     # Constant amplitude — organ doesn't decay
     # Just a tiny fade-in to avoid click
-    fadein = min(int(SAMPLE_RATE * 0.01), n_samples)
+    fadein = min(int(_rate() * 0.01), n_samples)
     wave[:fadein] *= numpy.linspace(0, 1, fadein)
 
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
 # Vowel formant frequencies + bandwidths (Hz) — F1, F2, F3, F4
@@ -1033,7 +1105,7 @@ _CHOIR_FORMANTS = {
 }
 
 
-def _morph_formant_filter(source, formant_chain, sample_rate=SAMPLE_RATE):
+def _morph_formant_filter(source, formant_chain, sample_rate=None):
     """Filter through formant bands that glide along a vowel chain.
 
     This is how a sung diphthong works: the vocal tract reshapes
@@ -1043,6 +1115,8 @@ def _morph_formant_filter(source, formant_chain, sample_rate=SAMPLE_RATE):
     filtering with interpolated centers and filter state carried
     across blocks.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     n = len(source)
     k = len(formant_chain)
     n_bands = len(formant_chain[0])
@@ -1076,7 +1150,8 @@ def _morph_formant_filter(source, formant_chain, sample_rate=SAMPLE_RATE):
     return out
 
 
-def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
+def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah",
+               dtype=numpy.int16):
     """Choir — voices singing vowels shaped by strong formant filters.
 
     The key to vocal sound is FORMANTS — resonant peaks from the
@@ -1093,7 +1168,7 @@ def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
 
         choir.add("C4", 2, lyric="ah>oo")
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
 
     vowels = [v.strip() for v in lyric.split(">")] if ">" in lyric else [lyric]
     formant_chain = [_CHOIR_FORMANTS.get(v, _CHOIR_FORMANTS["ah"])
@@ -1101,7 +1176,7 @@ def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     formants = formant_chain[0]
 
     # Glottal source — rich buzz with all harmonics
-    n_harmonics = min(25, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(25, int((_rate() / 2) / hz))
 
     # No per-harmonic vibrato — it causes amplitude wobble through formants.
     # Choir vibrato comes from the ensemble= parameter instead (natural
@@ -1109,7 +1184,7 @@ def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     source = numpy.zeros(n_samples, dtype=numpy.float64)
     for n in range(1, n_harmonics + 1):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Glottal slope: -12dB/octave
         amp = 1.0 / (n * n) * 4.0
@@ -1122,39 +1197,40 @@ def choir_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
         wave = numpy.zeros(n_samples, dtype=numpy.float64)
         for fc, bw in formants:
             lo = max(20, fc - bw)
-            hi = min(SAMPLE_RATE // 2 - 1, fc + bw)
+            hi = min(_rate() // 2 - 1, fc + bw)
             if lo < hi:
-                bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+                bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
                 filtered = scipy.signal.lfilter(bp, ap, source)
                 # Boost formants proportionally
                 gain = 1.0 if fc < 1000 else 0.7
                 wave += filtered * gain
 
     # Breathy onset — air before phonation
-    breath_len = min(int(SAMPLE_RATE * 0.08), n_samples)
+    breath_len = min(int(_rate() * 0.08), n_samples)
     breath = _noise(breath_len).astype(numpy.float64) * 0.04
     # Filter breath through formants too
     for fc, bw in formants[:2]:
         lo = max(20, fc - bw * 2)
-        hi = min(SAMPLE_RATE // 2 - 1, fc + bw * 2)
+        hi = min(_rate() // 2 - 1, fc + bw * 2)
         if lo < hi:
-            bp, ap = scipy.signal.butter(1, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = scipy.signal.butter(1, [lo, hi], btype='band', fs=_rate())
             breath = scipy.signal.lfilter(bp, ap, numpy.pad(breath, (0, max(0, n_samples - breath_len))))[:breath_len]
     breath *= numpy.exp(-numpy.linspace(0, 5, breath_len))
     wave[:breath_len] += breath
 
     # Gentle attack
-    attack_len = min(int(SAMPLE_RATE * 0.06), n_samples)
+    attack_len = min(int(_rate() * 0.06), n_samples)
     wave[:attack_len] *= numpy.linspace(0, 1, attack_len)
 
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def bass_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def bass_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                     dtype=numpy.int16):
     """Bass guitar — plucked thick string with magnetic pickup.
 
     Heavier Karplus-Strong with:
@@ -1162,7 +1238,7 @@ def bass_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     2. More fundamental, less high harmonics
     3. Pickup emphasizes low-mids
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
 
@@ -1179,17 +1255,17 @@ def bass_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     out = _karplus_strong(buf, n_samples, 0.45, 0.55, 0.9992)
 
     # Low-mid emphasis (pickup position)
-    bl, al = scipy.signal.butter(2, 1200, btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, 1200, btype='low', fs=_rate())
     out = scipy.signal.lfilter(bl, al, out)
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def flute_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def flute_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Flute — breath noise through a resonant tube.
 
     Models an air jet exciting a cylindrical tube:
@@ -1198,7 +1274,7 @@ def flute_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     3. Vibrato that develops over time
     4. Breathy attack
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Vibrato — develops after ~200ms
@@ -1214,9 +1290,9 @@ def flute_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     breath = rng.normal(0, 0.15, n_samples)
     bw = max(100, hz * 0.3)
     lo = max(20, hz - bw)
-    hi = min(SAMPLE_RATE // 2 - 1, hz + bw)
+    hi = min(_rate() // 2 - 1, hz + bw)
     if lo < hi:
-        bn, an = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        bn, an = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
         breath = scipy.signal.lfilter(bn, an, breath)
 
     wave = wave + breath
@@ -1225,10 +1301,11 @@ def flute_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Trumpet — lip buzz through a brass bell.
 
     Models the key trumpet characteristics:
@@ -1237,7 +1314,7 @@ def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     3. Brass warmth — even harmonics stronger than clarinet
     4. Slight vibrato
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Vibrato
@@ -1247,10 +1324,10 @@ def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Lip buzz — additive with brass spectral shape
     # Trumpet has strong even AND odd harmonics (unlike clarinet)
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
-    n_harmonics = min(20, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(20, int((_rate() / 2) / hz))
     for n in range(1, n_harmonics + 1):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Brass spectral envelope: peaks around harmonics 3-6
         amp = (1.0 / n) * numpy.exp(-0.08 * (n - 4) ** 2)
@@ -1258,12 +1335,12 @@ def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
         wave += amp * numpy.sin(2 * numpy.pi * (f_n + vib * n) * t + phase)
 
     # Bell resonance — boost around 1.5-3kHz
-    bl, al = scipy.signal.butter(2, [1500, 3000], btype='band', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, [1500, 3000], btype='band', fs=_rate())
     bell = scipy.signal.lfilter(bl, al, wave) * 0.4
     wave = wave + bell
 
     # Gentle attack buzz
-    attack_len = min(int(SAMPLE_RATE * 0.02), n_samples)
+    attack_len = min(int(_rate() * 0.02), n_samples)
     buzz = rng.uniform(-0.1, 0.1, attack_len) * numpy.exp(-numpy.linspace(0, 5, attack_len))
     wave[:attack_len] += buzz
 
@@ -1271,16 +1348,17 @@ def trumpet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def clarinet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def clarinet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Clarinet — reed vibration in a cylindrical bore.
 
     A cylindrical bore produces mostly odd harmonics (like a square wave
     but with a specific spectral envelope). The reed adds a nasal quality.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     vib_onset = numpy.clip(t / 0.3, 0.0, 1.0)
@@ -1288,10 +1366,10 @@ def clarinet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Cylindrical bore: odd harmonics dominate
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
-    n_harmonics = min(15, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(15, int((_rate() / 2) / hz))
     for n in range(1, n_harmonics + 1, 2):  # odd harmonics only
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         amp = 1.0 / n
         phase = rng.uniform(0, 2 * numpy.pi)
@@ -1302,24 +1380,25 @@ def clarinet_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave += reed
 
     # Bore resonance — slight lowpass
-    bl, al = scipy.signal.butter(2, min(4000, hz * 8), btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, min(4000, hz * 8), btype='low', fs=_rate())
     wave = scipy.signal.lfilter(bl, al, wave)
 
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def marimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def marimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Marimba — struck wooden bar with resonator tube.
 
     The bar produces a fundamental plus inharmonic partials (the bar
     modes are NOT integer multiples). The tubular resonator under
     each bar amplifies the fundamental.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
 
     # Bar modes: fundamental, then 4x, 9.2x (not harmonic!)
     wave = numpy.sin(2 * numpy.pi * hz * t) * 0.8
@@ -1330,7 +1409,7 @@ def marimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave *= (1.0 + 0.3 * numpy.exp(-3 * t))
 
     # Mallet impact
-    impact_len = min(int(SAMPLE_RATE * 0.005), n_samples)
+    impact_len = min(int(_rate() * 0.005), n_samples)
     impact = numpy.random.default_rng(int(hz * 100) % 2**31).uniform(-0.2, 0.2, impact_len)
     impact *= numpy.exp(-numpy.linspace(0, 10, impact_len))
     wave[:impact_len] += impact
@@ -1339,27 +1418,27 @@ def marimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def oboe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def oboe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Oboe — double reed through a conical bore.
 
     The conical bore (unlike clarinet's cylinder) produces both odd
     AND even harmonics, but with a nasal, reedy quality from the
     double reed. Brighter and more piercing than clarinet.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     vib_onset = numpy.clip(t / 0.2, 0.0, 1.0)
     vib = hz * 0.001 * vib_onset * numpy.sin(2 * numpy.pi * 5.0 * t)
 
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
-    n_harmonics = min(18, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(18, int((_rate() / 2) / hz))
     for n in range(1, n_harmonics + 1):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Conical bore: all harmonics, peaked around 3-5
         amp = (1.0 / n) * numpy.exp(-0.05 * (n - 3) ** 2)
@@ -1369,26 +1448,27 @@ def oboe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Double reed buzz — nasal character
     reed = rng.normal(0, 0.06, n_samples)
     bw = max(100, hz * 0.4)
-    lo, hi = max(20, int(hz * 2 - bw)), min(SAMPLE_RATE // 2 - 1, int(hz * 2 + bw))
+    lo, hi = max(20, int(hz * 2 - bw)), min(_rate() // 2 - 1, int(hz * 2 + bw))
     if lo < hi:
-        br, ar = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        br, ar = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
         reed = scipy.signal.lfilter(br, ar, reed)
     wave += reed
 
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def harpsichord_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def harpsichord_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                     dtype=numpy.int16):
     """Harpsichord — quill plucking a metal string.
 
     Distinctive bright, metallic pluck with no sustain control
     (unlike piano, you can't play soft). Rich in harmonics with
     a sharp attack and moderate decay.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
@@ -1403,24 +1483,24 @@ def harpsichord_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     out = _karplus_strong(buf, n_samples, 0.5, 0.5, 0.999)
 
     # Harpsichord has a distinctive "chiff" — the quill release
-    chiff_len = min(int(SAMPLE_RATE * 0.003), n_samples)
+    chiff_len = min(int(_rate() * 0.003), n_samples)
     chiff = rng.uniform(-0.5, 0.5, chiff_len) * numpy.exp(-numpy.linspace(0, 15, chiff_len))
     out[:chiff_len] += chiff
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def cello_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def cello_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Cello — deep bowed string with large body resonance.
 
     Like strings_wave but with stronger low-frequency body resonance
     (the cello body is much larger than violin) and a darker, warmer
     harmonic profile.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Delayed vibrato
@@ -1429,7 +1509,7 @@ def cello_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     vib_onset = numpy.clip(t / 0.25, 0.0, 1.0)
     vibrato = vib_depth * vib_onset * numpy.sin(2 * numpy.pi * vib_rate * t)
 
-    nyquist = SAMPLE_RATE / 2.0
+    nyquist = _rate() / 2.0
     n_harmonics = min(25, int(nyquist / hz))
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
 
@@ -1458,17 +1538,17 @@ def cello_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Bow pressure variation
     wave *= 1.0 + 0.04 * numpy.sin(2 * numpy.pi * 3.5 * t)
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def harp_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def harp_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Harp — pure, singing tone with gentle pluck and long sustain.
 
     Nylon/gut strings on a large resonant frame. The tone is warm
     and clean — mostly fundamental with gentle upper harmonics that
     decay faster, leaving a pure singing sustain.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Long, gentle decay
@@ -1477,10 +1557,10 @@ def harp_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
 
     # Clean harmonics — strong fundamental, gentle upper partials
-    n_harmonics = min(10, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(10, int((_rate() / 2) / hz))
     for n in range(1, n_harmonics + 1):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Fundamental dominates, upper partials gentle and fast-decaying
         if n == 1:
@@ -1497,14 +1577,14 @@ def harp_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Karplus-Strong pluck transient — just the first ~50ms
     # Gives the finger-on-string attack, then the pure tone takes over
-    period = max(2, int(SAMPLE_RATE / hz))
+    period = max(2, int(_rate() / hz))
     ks_rng = numpy.random.default_rng(int(hz * 77) % 2**31)
     ks_buf = ks_rng.uniform(-0.3, 0.3, period).astype(numpy.float64)
     # Pre-filter for soft finger pluck
     for _ in range(4):
         for k in range(period - 1):
             ks_buf[k] = 0.6 * ks_buf[k] + 0.4 * ks_buf[k + 1]
-    pluck_len = min(int(SAMPLE_RATE * 0.05), n_samples)
+    pluck_len = min(int(_rate() * 0.05), n_samples)
     pluck = numpy.zeros(pluck_len, dtype=numpy.float64)
     for i in range(pluck_len):
         pluck[i] = ks_buf[i % period]
@@ -1517,16 +1597,17 @@ def harp_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def upright_bass_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def upright_bass_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                      dtype=numpy.int16):
     """Upright bass — thick gut/steel string pizzicato with wooden body.
 
     Deep, round, woody. The large hollow body gives a warm resonance
     that electric bass can't match. Pizzicato (plucked) by default.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
@@ -1542,22 +1623,23 @@ def upright_bass_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Wooden body resonance — big, round
     for center, bw, gain in [(80, 40, 0.4), (200, 60, 0.3), (400, 100, 0.15)]:
         lo = max(20, center - bw)
-        hi = min(SAMPLE_RATE // 2 - 1, center + bw)
+        hi = min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
             out += scipy.signal.lfilter(bp, ap, out) * gain
 
     # Dark rolloff — upright bass is not bright
-    bl, al = scipy.signal.butter(2, min(1500, hz * 6), btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, min(1500, hz * 6), btype='low', fs=_rate())
     out = scipy.signal.lfilter(bl, al, out)
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def timpani_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def timpani_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Timpani — large kettle drum with definite pitch.
 
     The copper kettle creates a tuned resonance with inharmonic
@@ -1565,7 +1647,7 @@ def timpani_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     (not integer multiples like strings). The felt mallet gives a
     soft attack with a deep, booming body.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
 
     # Timpani head modes — inharmonic but definite pitch
     # Mode ratios from vibrating circular membrane physics
@@ -1589,16 +1671,16 @@ def timpani_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave = fund + upper
 
     # Felt mallet impact — warm, not sharp
-    mallet_len = min(int(SAMPLE_RATE * 0.02), n_samples)
+    mallet_len = min(int(_rate() * 0.02), n_samples)
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     mallet = rng.uniform(-0.3, 0.3, mallet_len)
     mallet *= numpy.exp(-numpy.linspace(0, 8, mallet_len))
     wave[:mallet_len] += mallet
 
     # Copper kettle resonance — boosts the fundamental ring
-    lo, hi = max(20, int(hz * 0.7)), min(SAMPLE_RATE // 2 - 1, int(hz * 1.3))
+    lo, hi = max(20, int(hz * 0.7)), min(_rate() // 2 - 1, int(hz * 1.3))
     if lo < hi:
-        bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
         kettle = scipy.signal.lfilter(bp, ap, wave) * 0.4
         wave += kettle
 
@@ -1606,10 +1688,11 @@ def timpani_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                   dtype=numpy.int16):
     """Saxophone — single reed driving a conical brass bore.
 
     Models the key acoustic properties of a saxophone:
@@ -1626,7 +1709,7 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     """
     import scipy.signal as _sig
 
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # --- Vibrato: delayed onset, subtle depth ---
@@ -1638,11 +1721,11 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Real sax reed creates a quasi-sawtooth pressure wave, not pure sines.
     # Build from harmonics with sax-specific spectral envelope, then clip.
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
-    n_harmonics = min(25, int((SAMPLE_RATE / 2) / hz))
+    n_harmonics = min(25, int((_rate() / 2) / hz))
 
     for n in range(1, n_harmonics + 1):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Saxophone spectral envelope from acoustic measurements:
         # Strong fundamental, nearly-as-strong 2nd and 3rd harmonics,
@@ -1690,9 +1773,9 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     formant_sum = numpy.zeros(n_samples, dtype=numpy.float64)
     for fc, bw, gain in zip(formant_freqs, formant_bws, formant_gains):
         lo = max(20, int(fc - bw))
-        hi = min(SAMPLE_RATE // 2 - 1, int(fc + bw))
+        hi = min(_rate() // 2 - 1, int(fc + bw))
         if lo < hi:
-            bf, af = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bf, af = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             formant_sum += _sig.lfilter(bf, af, wave) * gain
     wave = wave * 0.7 + formant_sum
 
@@ -1702,9 +1785,9 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     breath = rng.normal(0, 1.0, n_samples)
     # Shape breath noise into the sax's "hiss" band (2-6 kHz)
     breath_lo = max(20, 2000)
-    breath_hi = min(SAMPLE_RATE // 2 - 1, 6000)
+    breath_hi = min(_rate() // 2 - 1, 6000)
     if breath_lo < breath_hi:
-        bb, ab = _sig.butter(2, [breath_lo, breath_hi], btype='band', fs=SAMPLE_RATE)
+        bb, ab = _sig.butter(2, [breath_lo, breath_hi], btype='band', fs=_rate())
         breath = _sig.lfilter(bb, ab, breath)
     # Attack envelope for breath — strong at onset, then quiet
     breath_env = 0.15 * numpy.exp(-8.0 * t) + 0.03
@@ -1715,14 +1798,14 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # against the mouthpiece, centered around the playing frequency.
     reed_noise = rng.normal(0, 1.0, n_samples)
     reed_lo = max(20, int(hz * 0.8))
-    reed_hi = min(SAMPLE_RATE // 2 - 1, int(hz * 4))
+    reed_hi = min(_rate() // 2 - 1, int(hz * 4))
     if reed_lo < reed_hi:
-        br, ar = _sig.butter(2, [reed_lo, reed_hi], btype='band', fs=SAMPLE_RATE)
+        br, ar = _sig.butter(2, [reed_lo, reed_hi], btype='band', fs=_rate())
         reed_noise = _sig.lfilter(br, ar, reed_noise) * 0.06
     wave += reed_noise
 
     # --- Attack transient: key click + breath burst ---
-    attack_len = min(int(SAMPLE_RATE * 0.015), n_samples)
+    attack_len = min(int(_rate() * 0.015), n_samples)
     if attack_len > 0:
         click = rng.uniform(-1.0, 1.0, attack_len)
         click *= numpy.exp(-numpy.linspace(0, 8, attack_len))
@@ -1740,10 +1823,11 @@ def saxophone_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
+def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah",
+               dtype=numpy.int16):
     """Vocal/formant synthesis — sings vowel sounds at a given pitch.
 
     Models the human voice with:
@@ -1768,7 +1852,7 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     FGAINS = [1.0, 0.8, 0.5, 0.25, 0.15]
 
     rng = numpy.random.default_rng(int(hz * 100 + len(lyric) * 7) % 2**31)
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
 
     # Parse vowels from lyric
     vowels_in_lyric = [c.lower() for c in lyric if c.lower() in FORMANTS]
@@ -1784,7 +1868,7 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     # Vibrato
     vib = hz * 0.001 * numpy.sin(2 * numpy.pi * 5.5 * t)
     inst_freq = hz + vib + jitter
-    phase = numpy.cumsum(2 * numpy.pi * inst_freq / SAMPLE_RATE)
+    phase = numpy.cumsum(2 * numpy.pi * inst_freq / _rate())
     # LF glottal shape: sharper falling edge via phase shaping
     saw = (phase / (2 * numpy.pi)) % 1.0  # 0 to 1 sawtooth
     # Asymmetric: slow rise (60%), fast fall (40%)
@@ -1806,9 +1890,9 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
         formants = FORMANTS[vowels_in_lyric[0]]
         for (fc, bw), gain in zip(formants, FGAINS):
             lo = max(20, fc - bw)
-            hi = min(SAMPLE_RATE // 2 - 1, fc + bw)
+            hi = min(_rate() // 2 - 1, fc + bw)
             if lo < hi:
-                bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+                bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
                 out += _sig.lfilter(bp, ap, source).astype(numpy.float64) * gain
     else:
         # Multiple vowels — crossfade formants
@@ -1821,12 +1905,12 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
             seg_out = numpy.zeros_like(seg)
             for (fc, bw), gain in zip(formants, FGAINS):
                 lo = max(20, fc - bw)
-                hi = min(SAMPLE_RATE // 2 - 1, fc + bw)
+                hi = min(_rate() // 2 - 1, fc + bw)
                 if lo < hi:
-                    bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+                    bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
                     seg_out += _sig.lfilter(bp, ap, seg).astype(numpy.float64) * gain
             # Crossfade
-            fade = min(int(SAMPLE_RATE * 0.02), len(seg_out) // 4)
+            fade = min(int(_rate() * 0.02), len(seg_out) // 4)
             if vi > 0 and fade > 0:
                 seg_out[:fade] *= numpy.linspace(0, 1, fade)
             if vi < n_vowels - 1 and fade > 0:
@@ -1837,44 +1921,44 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     lyric_lower = lyric.lower()
     if lyric_lower and lyric_lower[0] not in 'aeiou':
         c = lyric_lower[0]
-        cl = min(int(SAMPLE_RATE * 0.035), n_samples)
+        cl = min(int(_rate() * 0.035), n_samples)
         if c in 'tdkpb':
             burst = rng.uniform(-0.5, 0.5, cl) * numpy.exp(-numpy.linspace(0, 18, cl))
             out[:cl] = burst + out[:cl] * 0.2
         elif c in 'sz':
             sib = rng.uniform(-0.4, 0.4, cl)
             if cl > 20:
-                bl, al = _sig.butter(2, [3000, min(8000, SAMPLE_RATE//2-1)], btype='band', fs=SAMPLE_RATE)
+                bl, al = _sig.butter(2, [3000, min(8000, _rate()//2-1)], btype='band', fs=_rate())
                 sib = _sig.lfilter(bl, al, numpy.pad(sib, (0, max(0, n_samples-cl))))[:cl]
             sib *= numpy.exp(-numpy.linspace(0, 10, cl))
             out[:cl] = sib * 0.6 + out[:cl] * 0.4
         elif c in 'mn':
-            nl = min(int(SAMPLE_RATE * 0.06), n_samples)
+            nl = min(int(_rate() * 0.06), n_samples)
             nasal = numpy.sin(2*numpy.pi*250*t[:nl]) * 0.4 * numpy.exp(-numpy.linspace(0, 4, nl))
             out[:nl] = nasal + out[:nl] * 0.4
         elif c in 'fv':
             fric = rng.uniform(-0.25, 0.25, cl) * numpy.exp(-numpy.linspace(0, 12, cl))
             out[:cl] = fric * 0.5 + out[:cl] * 0.5
         elif c in 'lr':
-            gl = min(int(SAMPLE_RATE * 0.05), n_samples)
+            gl = min(int(_rate() * 0.05), n_samples)
             ghz = hz * 0.7 + hz * 0.3 * numpy.linspace(0, 1, gl)
-            glide = numpy.sin(numpy.cumsum(2*numpy.pi*ghz/SAMPLE_RATE)) * 0.35
+            glide = numpy.sin(numpy.cumsum(2*numpy.pi*ghz/_rate())) * 0.35
             out[:gl] = glide + out[:gl] * 0.65
         elif c == 'h':
-            hl = min(int(SAMPLE_RATE * 0.05), n_samples)
+            hl = min(int(_rate() * 0.05), n_samples)
             asp = rng.uniform(-0.4, 0.4, hl) * numpy.exp(-numpy.linspace(0, 5, hl))
             out[:hl] = asp * 0.6 + out[:hl] * 0.4
         elif c == 'w':
-            wl = min(int(SAMPLE_RATE * 0.06), n_samples)
-            ws = numpy.sin(numpy.cumsum(2*numpy.pi*hz/SAMPLE_RATE*numpy.ones(wl)))
+            wl = min(int(_rate() * 0.06), n_samples)
+            ws = numpy.sin(numpy.cumsum(2*numpy.pi*hz/_rate()*numpy.ones(wl)))
             if wl > 20:
-                bp, ap = _sig.butter(2, [max(20,300), min(800, SAMPLE_RATE//2-1)], btype='band', fs=SAMPLE_RATE)
+                bp, ap = _sig.butter(2, [max(20,300), min(800, _rate()//2-1)], btype='band', fs=_rate())
                 ws = _sig.lfilter(bp, ap, ws)
             ws *= numpy.linspace(0.5, 0, wl)
             out[:wl] = ws * 0.4 + out[:wl] * 0.6
 
     # Soft edges — prevent clicks at note boundaries
-    fade_samples = min(int(SAMPLE_RATE * 0.01), n_samples // 4)
+    fade_samples = min(int(_rate() * 0.01), n_samples // 4)
     if fade_samples > 0:
         out[:fade_samples] *= numpy.linspace(0, 1, fade_samples)
         out[-fade_samples:] *= numpy.linspace(1, 0, fade_samples)
@@ -1883,12 +1967,12 @@ def vocal_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, lyric="ah"):
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
 def granular_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
                   grain_size=0.04, density=50, scatter=0.5,
-                  pitch_var=12, source="saw"):
+                  pitch_var=12, source="saw", dtype=numpy.int16):
     """Granular synthesis — clouds of tiny sound grains.
 
     Chops a source waveform into overlapping micro-grains (10-200ms),
@@ -1909,7 +1993,7 @@ def granular_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Generate source material — longer than needed for scatter headroom
-    src_len = n_samples + int(SAMPLE_RATE * scatter * 2)
+    src_len = n_samples + int(_rate() * scatter * 2)
     src_fns = {
         "saw": sawtooth_wave, "sine": sine_wave, "triangle": triangle_wave,
         "square": square_wave, "noise": noise_wave,
@@ -1918,8 +2002,8 @@ def granular_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     src = src_fn(hz, n_samples=src_len).astype(numpy.float64) / SAMPLE_PEAK
 
     # Grain parameters
-    grain_samples = max(64, int(grain_size * SAMPLE_RATE))
-    n_grains = max(1, int(n_samples / SAMPLE_RATE * density))
+    grain_samples = max(64, int(grain_size * _rate()))
+    n_grains = max(1, int(n_samples / _rate() * density))
 
     # Hanning window for each grain (smooth fade in/out, no clicks)
     window = numpy.hanning(grain_samples).astype(numpy.float64)
@@ -1961,17 +2045,18 @@ def granular_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def pedal_steel_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def pedal_steel_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                     dtype=numpy.int16):
     """Pedal steel guitar — the Nashville crying sound.
 
     Sustained steel string with natural portamento character,
     very smooth, lots of harmonics, and a singing quality from
     the bar sliding on the strings.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     # Slow, singing vibrato — the bar wobbling on the strings
     vib = hz * 0.002 * numpy.sin(2 * numpy.pi * 4.0 * t)
@@ -1979,7 +2064,7 @@ def pedal_steel_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
     for n in range(1, 12):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         amp = 1.0 / n * numpy.exp(-0.08 * n)
         phase = rng.uniform(0, 2 * numpy.pi)
@@ -1989,17 +2074,18 @@ def pedal_steel_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def theremin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def theremin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Theremin — pure sine with natural wobble.
 
     The theremin's sound is a nearly pure sine wave with slight
     pitch instability from hand position. The eerie, sci-fi sound
     comes from this purity combined with continuous pitch.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # Natural hand wobble — slightly irregular vibrato
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     wobble = hz * 0.004 * numpy.sin(2 * numpy.pi * 5.8 * t)
@@ -2010,16 +2096,17 @@ def theremin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def kalimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def kalimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Kalimba/thumb piano — metal tines on a wooden body.
 
     Bright, bell-like attack with inharmonic overtones from the
     metal tines. The wooden resonator gives warmth underneath.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # Metal tine modes — slightly inharmonic like marimba
     wave = numpy.sin(2 * numpy.pi * hz * t) * 0.8
     wave += numpy.sin(2 * numpy.pi * hz * 2.92 * t) * 0.25 * numpy.exp(-12 * t)
@@ -2032,23 +2119,24 @@ def kalimba_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Wooden body resonance
     import scipy.signal as _sig
     for center, bw, gain in [(300, 100, 0.2), (600, 120, 0.15)]:
-        lo, hi = max(20, center - bw), min(SAMPLE_RATE // 2 - 1, center + bw)
+        lo, hi = max(20, center - bw), min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             wave += _sig.lfilter(bp, ap, wave) * gain
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def steel_drum_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def steel_drum_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                    dtype=numpy.int16):
     """Steel drum/pan — hammered metal with bright, ringing tone.
 
     The steel pan has specific inharmonic partials from the
     hand-hammered notes. Bright, tropical, bell-like.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     # Steel pan modes — distinctly metallic
     wave = numpy.sin(2 * numpy.pi * hz * t) * 0.7
     wave += numpy.sin(2 * numpy.pi * hz * 2.0 * t) * 0.4 * numpy.exp(-5 * t)
@@ -2057,7 +2145,7 @@ def steel_drum_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave += numpy.sin(2 * numpy.pi * hz * 5.3 * t) * 0.08 * numpy.exp(-18 * t)
     # Mallet impact
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
-    hit_len = min(int(SAMPLE_RATE * 0.008), n_samples)
+    hit_len = min(int(_rate() * 0.008), n_samples)
     hit = rng.uniform(-0.2, 0.2, hit_len) * numpy.exp(-numpy.linspace(0, 12, hit_len))
     wave[:hit_len] += hit
     # Two-stage decay
@@ -2068,10 +2156,11 @@ def steel_drum_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def harmonium_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def harmonium_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                   dtype=numpy.int16):
     """Harmonium — Indian pump organ, single free reed per note.
 
     Unlike accordion (doubled musette reeds), the harmonium has one
@@ -2079,14 +2168,14 @@ def harmonium_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     Constant bellows pressure, warm but slightly buzzy. The sound
     of kirtan, qawwali, and devotional music.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Single reed — odd harmonics stronger (like clarinet but warmer)
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
     for n in range(1, 12):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         amp = (1.0 / n) * (1.0 if n % 2 == 1 else 0.5)
         phase = rng.uniform(0, 2 * numpy.pi)
@@ -2100,26 +2189,27 @@ def harmonium_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     import scipy.signal as _sig
     center = min(1200, hz * 3)
     lo = max(20, int(center - 300))
-    hi = min(SAMPLE_RATE // 2 - 1, int(center + 300))
+    hi = min(_rate() // 2 - 1, int(center + 300))
     if lo < hi:
-        bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
         nasal = _sig.lfilter(bp, ap, wave) * 0.2
         wave += nasal
 
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def accordion_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def accordion_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                   dtype=numpy.int16):
     """Accordion — bellows-driven free reeds.
 
     Two reeds per note slightly detuned (musette tuning) create
     the characteristic beating/tremolo. Rich in harmonics from
     the reed vibration.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     # Two reeds slightly detuned — musette beating
     detune_cents = 8
@@ -2129,7 +2219,7 @@ def accordion_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     for reed_hz in [hz, hz2]:
         for n in range(1, 10):
             f_n = reed_hz * n
-            if f_n >= SAMPLE_RATE / 2:
+            if f_n >= _rate() / 2:
                 break
             # Odd harmonics stronger (reed character)
             amp = (1.0 / n) * (1.2 if n % 2 == 1 else 0.6)
@@ -2142,23 +2232,24 @@ def accordion_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def didgeridoo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def didgeridoo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                    dtype=numpy.int16):
     """Didgeridoo — circular breathing drone through a wooden tube.
 
     Deep fundamental with strong odd harmonics from the cylindrical
     bore. The overtone singing technique creates shifting formants.
     Buzzy, droning, primal.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     # Lip buzz source — rich, raw
-    phase = numpy.cumsum(2 * numpy.pi * hz / SAMPLE_RATE * numpy.ones(n_samples))
+    phase = numpy.cumsum(2 * numpy.pi * hz / _rate() * numpy.ones(n_samples))
     buzz = numpy.zeros(n_samples, dtype=numpy.float64)
     for n in range(1, 15):
-        if hz * n >= SAMPLE_RATE / 2:
+        if hz * n >= _rate() / 2:
             break
         # Odd harmonics stronger (cylindrical bore, like clarinet)
         amp = (1.0 / n) * (1.0 if n % 2 == 1 else 0.4)
@@ -2174,9 +2265,9 @@ def didgeridoo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
         end = min(i + block, n_samples)
         fc = formant_center[(i + end) // 2]
         lo = max(20, int(fc - 300))
-        hi = min(SAMPLE_RATE // 2 - 1, int(fc + 300))
+        hi = min(_rate() // 2 - 1, int(fc + 300))
         if lo < hi:
-            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             seg = _sig.lfilter(bp, ap, buzz[i:end])
             out[i:end] = buzz[i:end] * 0.5 + seg * 0.5
         else:
@@ -2187,23 +2278,24 @@ def didgeridoo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def bagpipe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def bagpipe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Bagpipes — chanter reed with constant drone pressure.
 
     The chanter (melody pipe) uses a double reed like an oboe
     but with more buzz and brightness. The constant air pressure
     from the bag means no dynamics — always ff.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
     # Chanter — all harmonics, bright and reedy
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
     for n in range(1, 18):
         f_n = hz * n
-        if f_n >= SAMPLE_RATE / 2:
+        if f_n >= _rate() / 2:
             break
         # Peaked around harmonics 3-7 (the piercing brightness)
         amp = (1.0 / n) * numpy.exp(-0.03 * (n - 5) ** 2)
@@ -2213,9 +2305,9 @@ def bagpipe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     reed = rng.normal(0, 0.08, n_samples)
     import scipy.signal as _sig
     lo = max(20, int(hz * 2))
-    hi = min(SAMPLE_RATE // 2 - 1, int(hz * 8))
+    hi = min(_rate() // 2 - 1, int(hz * 8))
     if lo < hi:
-        br, ar = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+        br, ar = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
         reed = _sig.lfilter(br, ar, reed).astype(numpy.float64) * 1.5
     wave += reed
     # Bag pressure wobble — very subtle
@@ -2224,10 +2316,10 @@ def bagpipe_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     mx = numpy.abs(wave).max()
     if mx > 0:
         wave /= mx
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def banjo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def banjo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Banjo — steel strings on a drum-head body.
 
     The banjo's distinctive twang comes from the membrane head
@@ -2235,7 +2327,7 @@ def banjo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     a sharp attack, bright tone, and fast decay with a nasal,
     metallic quality. The 5th string drone adds shimmer.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
@@ -2254,25 +2346,26 @@ def banjo_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     import scipy.signal as _sig
     for center, bw, gain in [(600, 200, 0.5), (1500, 300, 0.4), (3000, 500, 0.25)]:
         lo = max(20, center - bw)
-        hi = min(SAMPLE_RATE // 2 - 1, center + bw)
+        hi = min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             out += _sig.lfilter(bp, ap, out) * gain
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def mandolin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def mandolin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Mandolin — paired steel strings, bright and ringing.
 
     The mandolin has 4 courses of paired strings, tuned in unison.
     The doubled strings create natural chorus. Bright attack from
     the plectrum, small body with high-frequency resonance.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
@@ -2294,25 +2387,26 @@ def mandolin_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     import scipy.signal as _sig
     for center, bw, gain in [(500, 120, 0.3), (1000, 200, 0.25), (2000, 300, 0.15)]:
         lo = max(20, center - bw)
-        hi = min(SAMPLE_RATE // 2 - 1, center + bw)
+        hi = min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             out += _sig.lfilter(bp, ap, out) * gain
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def ukulele_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def ukulele_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Ukulele — nylon strings on a small resonant body.
 
     Brighter and thinner than guitar, shorter sustain. The small
     body gives a mid-heavy resonance (no deep bass). Nylon strings
     have a softer, warmer attack than steel.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
@@ -2329,21 +2423,22 @@ def ukulele_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     import scipy.signal as _sig
     for center, bw, gain in [(350, 100, 0.35), (700, 150, 0.25), (1200, 200, 0.15)]:
         lo = max(20, center - bw)
-        hi = min(SAMPLE_RATE // 2 - 1, center + bw)
+        hi = min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = _sig.butter(2, [lo, hi], btype='band', fs=_rate())
             out += _sig.lfilter(bp, ap, out) * gain
 
-    bl, al = _sig.butter(2, min(6000, hz * 12), btype='low', fs=SAMPLE_RATE)
+    bl, al = _sig.butter(2, min(6000, hz * 12), btype='low', fs=_rate())
     out = _sig.lfilter(bl, al, out)
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def acoustic_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def acoustic_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                         dtype=numpy.int16):
     """Acoustic guitar — Karplus-Strong with wooden body resonance.
 
     Models a steel string exciting a resonant wooden body:
@@ -2353,7 +2448,7 @@ def acoustic_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
        frequencies (~100Hz air cavity, ~250Hz top plate, ~500Hz back)
     3. Warmer, rounder attack than electric (fingers vs pickup)
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
 
@@ -2374,25 +2469,26 @@ def acoustic_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     resonances = numpy.zeros(n_samples, dtype=numpy.float64)
     for center, bw, gain in [(110, 60, 0.4), (250, 80, 0.3), (500, 120, 0.2)]:
         lo = max(20, center - bw)
-        hi = min(SAMPLE_RATE // 2 - 1, center + bw)
+        hi = min(_rate() // 2 - 1, center + bw)
         if lo < hi:
-            bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=SAMPLE_RATE)
+            bp, ap = scipy.signal.butter(2, [lo, hi], btype='band', fs=_rate())
             resonances += scipy.signal.lfilter(bp, ap, out) * gain
 
     out = out * 0.6 + resonances
 
     # Gentle rolloff above 5kHz (no brightness of electric pickup)
-    bl, al = scipy.signal.butter(2, 5000, btype='low', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, 5000, btype='low', fs=_rate())
     out = scipy.signal.lfilter(bl, al, out)
 
     mx = numpy.abs(out).max()
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def electric_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def electric_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                         dtype=numpy.int16):
     """Electric guitar — Karplus-Strong through magnetic pickup simulation.
 
     Models a steel string vibrating over a magnetic pickup:
@@ -2403,7 +2499,7 @@ def electric_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
        characteristic electric guitar "honk"
     3. Slightly longer sustain than acoustic (no body absorption)
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
 
@@ -2441,10 +2537,10 @@ def electric_guitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE, dtype=numpy.int16):
     """Sitar — Karplus-Strong with jawari bridge buzz and sympathetic strings.
 
     The sitar's distinctive sound comes from three things:
@@ -2458,7 +2554,7 @@ def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     3. Sharp mizrab (plectrum) attack with moderate decay — plucky,
        not sustained like a bowed instrument.
     """
-    period = int(SAMPLE_RATE / hz)
+    period = int(_rate() / hz)
     if period < 2:
         period = 2
 
@@ -2489,12 +2585,12 @@ def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
         # The 0.4/0.6 averaging weights give a brighter initial tone
         # than the standard 0.5/0.5 Karplus-Strong.
         next_idx = (i + 1) % period
-        decay = 0.9992 if i < SAMPLE_RATE * 0.3 else 0.9996
+        decay = 0.9992 if i < _rate() * 0.3 else 0.9996
         buf[i % period] = (0.4 * sample + 0.6 * buf[next_idx]) * decay
 
     # Chikari shimmer — the 3 high drone strings that ring sympathetically
     # These are tuned to the tonic (Sa) and its octave
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     chikari = (numpy.sin(2 * numpy.pi * hz * 2 * t) * 0.04 +
                numpy.sin(2 * numpy.pi * hz * 3 * t) * 0.025)
     chikari *= numpy.exp(-2.0 * t)  # gentle fade
@@ -2502,9 +2598,9 @@ def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     # Sympathetic taraf strings — very quiet harmonic halo
     for harmonic in [2, 3, 4, 5]:
         sym_hz = hz * harmonic
-        if sym_hz > SAMPLE_RATE / 2:
+        if sym_hz > _rate() / 2:
             break
-        sym_period = max(2, int(SAMPLE_RATE / sym_hz))
+        sym_period = max(2, int(_rate() / sym_hz))
         if sym_period < n_samples:
             chikari[sym_period:] += out[:-sym_period] * 0.04
 
@@ -2515,10 +2611,11 @@ def sitar_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         out /= mx
 
-    return (peak * out).astype(numpy.int16)
+    return (peak * out).astype(dtype)
 
 
-def crotales_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def crotales_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                  dtype=numpy.int16):
     """Crotales — small tuned bronze discs struck with brass mallets.
 
     Antique cymbals. Bright, crystalline, bell-like tone that rings
@@ -2527,7 +2624,7 @@ def crotales_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     crotales their penetrating brilliance. Played in the octave
     above written — they cut through any orchestra.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
@@ -2548,14 +2645,14 @@ def crotales_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for ratio, amp, decay_rate in disc_modes:
         f = hz * ratio
-        if f >= SAMPLE_RATE / 2:
+        if f >= _rate() / 2:
             break
         phase = rng.uniform(0, 2 * numpy.pi)
         mode_decay = numpy.exp(-decay_rate * t)
         wave += amp * numpy.sin(2 * numpy.pi * f * t + phase) * mode_decay
 
     # Hard mallet strike — brass on bronze, bright transient
-    strike_len = min(int(SAMPLE_RATE * 0.002), n_samples)
+    strike_len = min(int(_rate() * 0.002), n_samples)
     strike_t = numpy.linspace(0, 1, strike_len)
     strike = 0.5 * numpy.sin(2 * numpy.pi * hz * 8 * strike_t) * numpy.exp(-strike_t * 25)
     wave[:strike_len] += strike
@@ -2564,10 +2661,11 @@ def crotales_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                 dtype=numpy.int16):
     """Tingsha — two small Tibetan cymbals clashed together on a cord.
 
     When the pair strikes, both discs ring simultaneously at slightly
@@ -2576,7 +2674,7 @@ def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     than a singing bowl — a clear, cutting tone that fades over a
     few seconds. The two-disc interference is the whole character.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     # Two discs at slightly different pitches — this IS the tingsha sound
@@ -2587,7 +2685,7 @@ def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     # Upper partials — both discs, slightly different inharmonicity
     for ratio, amp, dec in [(2.72, 0.3, 5.0), (5.1, 0.12, 10.0), (8.3, 0.05, 18.0)]:
-        if hz * ratio >= SAMPLE_RATE / 2:
+        if hz * ratio >= _rate() / 2:
             break
         p1 = rng.uniform(0, 2 * numpy.pi)
         p2 = rng.uniform(0, 2 * numpy.pi)
@@ -2599,7 +2697,7 @@ def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     wave *= decay
 
     # Clash transient — metal on metal, sharper than a mallet hit
-    clash_len = min(int(SAMPLE_RATE * 0.003), n_samples)
+    clash_len = min(int(_rate() * 0.003), n_samples)
     clash = rng.uniform(-0.4, 0.4, clash_len).astype(numpy.float64)
     clash *= numpy.exp(-numpy.linspace(0, 20, clash_len))
     wave[:clash_len] += clash
@@ -2608,10 +2706,11 @@ def tingsha_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                             dtype=numpy.int16):
     """Singing bowl strike — mallet hit that excites all modes at once.
 
     The initial hit produces a bright chirp as the higher partials
@@ -2619,7 +2718,7 @@ def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     with slow beating. Higher modes decay fast, the fundamental
     rings for seconds.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
@@ -2638,7 +2737,7 @@ def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for ratio, amp, decay_rate, beat_hz in bowl_modes:
         f = hz * ratio
-        if f >= SAMPLE_RATE / 2:
+        if f >= _rate() / 2:
             break
 
         phase1 = rng.uniform(0, 2 * numpy.pi)
@@ -2651,10 +2750,10 @@ def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
         wave += amp * (tone1 + tone2) * 0.5 * mode_decay
 
     # Strike chirp — higher partials ring briefly on impact
-    chirp_len = min(int(SAMPLE_RATE * 0.04), n_samples)
+    chirp_len = min(int(_rate() * 0.04), n_samples)
     chirp_t = numpy.linspace(0, 1, chirp_len)
     chirp_freq = hz * (3.0 - 2.0 * chirp_t)
-    chirp_phase = numpy.cumsum(chirp_freq) / SAMPLE_RATE * 2 * numpy.pi
+    chirp_phase = numpy.cumsum(chirp_freq) / _rate() * 2 * numpy.pi
     chirp = 0.6 * numpy.sin(chirp_phase) * numpy.exp(-chirp_t * 8)
     wave[:chirp_len] += chirp
 
@@ -2662,10 +2761,11 @@ def singing_bowl_strike_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def singing_bowl_ring_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
+def singing_bowl_ring_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE,
+                           dtype=numpy.int16):
     """Singing bowl ring — sustained rubbing around the rim with a mallet.
 
     When you rub the rim, the bowl builds up slowly as the mallet
@@ -2674,7 +2774,7 @@ def singing_bowl_ring_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     the mallet catches different modes. The sound has a pulsing,
     breathing quality from the slow amplitude modulation.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float64) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float64) / _rate()
     rng = numpy.random.default_rng(int(hz * 100) % 2**31)
 
     wave = numpy.zeros(n_samples, dtype=numpy.float64)
@@ -2690,7 +2790,7 @@ def singing_bowl_ring_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
 
     for ratio, amp, decay_rate, beat_hz in bowl_modes:
         f = hz * ratio
-        if f >= SAMPLE_RATE / 2:
+        if f >= _rate() / 2:
             break
 
         phase1 = rng.uniform(0, 2 * numpy.pi)
@@ -2709,24 +2809,26 @@ def singing_bowl_ring_wave(hz, peak=SAMPLE_PEAK, n_samples=SAMPLE_RATE):
     if mx > 0:
         wave /= mx
 
-    return (peak * wave).astype(numpy.int16)
+    return (peak * wave).astype(dtype)
 
 
-def _apply_envelope(samples, attack, decay, sustain, release, sample_rate=SAMPLE_RATE):
-    """Apply an ADSR amplitude envelope to a sample array.
+def _adsr_envelope(attack, decay, sustain, release, n, sample_rate=None):
+    """The ADSR gain curve for an *n*-sample note, memoized.
 
-    Args:
-        samples: NumPy array of audio samples.
-        attack: Attack time in seconds.
-        decay: Decay time in seconds.
-        sustain: Sustain level (0.0 to 1.0).
-        release: Release time in seconds.
-        sample_rate: Sample rate in Hz.
+    Note lengths repeat constantly within a Part, so curves are kept in
+    ``_ENVELOPE_CACHE`` keyed by ``(attack, decay, sustain, release, n,
+    sample_rate)``. The returned array is shared and read-only.
 
     Returns:
-        NumPy float32 array with envelope applied.
+        NumPy float32 array of *n* gains.
     """
-    n = len(samples)
+    if sample_rate is None:
+        sample_rate = _rate()
+    key = (attack, decay, sustain, release, n, sample_rate)
+    envelope = _ENVELOPE_CACHE.get(key)
+    if envelope is not None:
+        return envelope
+
     envelope = numpy.ones(n, dtype=numpy.float32)
 
     a_samples = int(attack * sample_rate)
@@ -2757,6 +2859,64 @@ def _apply_envelope(samples, attack, decay, sustain, release, sample_rate=SAMPLE
     if r_samples > 0:
         envelope[n - r_samples:] = numpy.linspace(sustain, 0.0, r_samples)
 
+    envelope.flags.writeable = False
+    _ENVELOPE_CACHE[key] = envelope
+    return envelope
+
+
+def _adsr_gain(attack, decay, sustain, release, n, lo, hi,
+               sample_rate=None):
+    """Samples ``lo:hi`` of :func:`_adsr_envelope`'s *n*-sample curve,
+    without building the whole curve (for notes rendered in blocks).
+
+    Returns:
+        NumPy float32 array of ``hi - lo`` gains.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    a_samples = min(int(attack * sample_rate), n)
+    r_samples = min(int(release * sample_rate), max(0, n - a_samples))
+    d_samples = min(int(decay * sample_rate),
+                    max(0, n - a_samples - r_samples))
+    i = numpy.arange(lo, hi, dtype=numpy.float64)
+    gain = numpy.full(hi - lo, float(sustain))
+
+    def ramp(begin, length, start, stop):
+        inside = (i >= begin) & (i < begin + length)
+        step = (stop - start) / (length - 1) if length > 1 else 0.0
+        gain[inside] = start + (i[inside] - begin) * step
+        if length > 1:
+            gain[i == begin + length - 1] = stop
+
+    ramp(0, a_samples, 0.0, 1.0)
+    ramp(a_samples, d_samples, 1.0, sustain)
+    ramp(n - r_samples, r_samples, sustain, 0.0)
+    return gain.astype(numpy.float32)
+
+
+def _apply_envelope(samples, attack, decay, sustain, release,
+                    sample_rate=None, out=None):
+    """Apply an ADSR amplitude envelope to a sample array.
+
+    Args:
+        samples: NumPy array of audio samples.
+        attack: Attack time in seconds.
+        decay: Decay time in seconds.
+        sustain: Sustain level (0.0 to 1.0).
+        release: Release time in seconds.
+        sample_rate: Sample rate in Hz.
+        out: Optional float32 array to write into — pass *samples*
+            itself to shape a float32 buffer in place.
+
+    Returns:
+        NumPy float32 array with envelope applied.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    envelope = _adsr_envelope(attack, decay, sustain, release,
+                              len(samples), sample_rate)
+    if out is not None:
+        return numpy.multiply(samples, envelope, out=out)
     return samples.astype(numpy.float32) * envelope
 
 
@@ -2788,7 +2948,7 @@ def _play_for(sample_wave, ms):
     normalized_wave = sample_wave.astype(numpy.float32) / SAMPLE_PEAK
     _sd = _get_sd()
     try:
-        _sd.play(normalized_wave, SAMPLE_RATE)
+        _sd.play(normalized_wave, _rate())
         _sd.wait()
     except KeyboardInterrupt:
         _sd.stop()
@@ -2797,7 +2957,9 @@ def _play_for(sample_wave, ms):
 class Synth(Enum):
     """Waveform types for synthesis.
 
-    Each waveform has a distinct timbre based on its harmonic content:
+    Each waveform has a distinct timbre based on its harmonic content
+    (every synth returns int16 samples, or unquantized float32 at the
+    same scale with ``dtype=numpy.float32``):
 
     - **SINE** — pure tone, no harmonics. Smooth and clean.
     - **SAW** — all harmonics at 1/n amplitude. Bright, buzzy, aggressive.
@@ -2903,6 +3065,208 @@ _SYNTH_FUNCTIONS = {
     "wavefold": wavefold_wave, "drift": drift_wave,
 }
 
+# Synths whose opening samples don't depend on how long the note is:
+# once a note is at least _PREFIX_MIN_SAMPLES long and reaches its loudest
+# sample (the synths that normalise scale to their peak), it is exactly
+# the start of any longer note at the same pitch. _synth_wave_cached
+# renders these once at the longest length asked for and hands out
+# prefix views. A custom synth opts in by setting ``prefix_stable = True``
+# on the function.
+_PREFIX_MIN_SAMPLES = 2048
+for _fn in (sine_wave, sawtooth_wave, triangle_wave, square_wave,
+            pulse_wave, fm_wave, noise_wave, supersaw_wave, pwm_slow_wave,
+            pwm_fast_wave, pluck_wave, organ_wave, piano_wave, rhodes_wave,
+            wurlitzer_wave, vibraphone_wave, bass_guitar_wave, flute_wave,
+            clarinet_wave, marimba_wave, oboe_wave, harpsichord_wave,
+            upright_bass_wave, timpani_wave, pedal_steel_wave,
+            kalimba_wave, steel_drum_wave, harmonium_wave,
+            accordion_wave, bagpipe_wave, banjo_wave, mandolin_wave,
+            ukulele_wave, acoustic_guitar_wave, sitar_wave,
+            electric_guitar_wave, crotales_wave, tingsha_wave,
+            singing_bowl_strike_wave, singing_bowl_ring_wave,
+            hard_sync_wave, ring_mod_wave, wavefold_wave):
+    _fn.prefix_stable = True
+del _fn
+
+# Synths that render one cycle and tile it: the note at *hz* is the cycle
+# ``synth_fn(hz, n_samples=int(sample_rate / hz))`` repeated, so
+# _synth_stack can mix a whole chord straight from the cycles.
+_TILED_SYNTHS = frozenset({sine_wave, sawtooth_wave, triangle_wave,
+                           square_wave, pulse_wave})
+
+# Synths that take ``dtype=numpy.float32`` and return the same samples
+# (``SAMPLE_PEAK`` = full scale) unquantized, so the renderer's note path
+# stays float32 from oscillator to mix bus. A custom synth opts in by
+# accepting ``dtype`` and setting ``native_float32 = True``; any other
+# synth's int16 output is converted once, by _synth_render.
+for _fn in _SYNTH_FUNCTIONS.values():
+    _fn.native_float32 = True
+del _fn
+
+
+def _synth_render(synth_fn, hz, n_samples, skw):
+    """Synthesize *n_samples* of *synth_fn* at *hz* as float32, in sample
+    units (``SAMPLE_PEAK`` = full scale)."""
+    if getattr(synth_fn, "native_float32", False):
+        return synth_fn(hz, n_samples=n_samples, dtype=numpy.float32, **skw)
+    wave = synth_fn(hz, n_samples=n_samples, **skw)
+    return numpy.asarray(wave, dtype=numpy.float32)
+
+
+# ── Wavetable oscillators ─────────────────────────────────────────────────
+#
+# The classic synths above render one naive cycle and tile it — cheap and
+# cacheable for a steady pitch, but it can't follow a moving pitch and it
+# aliases. Where the pitch moves (legato glides, pitch bends, live voices
+# under the pitch wheel) notes are played from band-limited wavetables
+# instead: one cycle per waveform, stored at several bandwidths (a
+# "mip-map", one table per octave of fundamental), read by a
+# phase-increment oscillator that picks, sample by sample, the richest
+# table whose harmonics all stay below Nyquist.
+
+_WAVETABLE_SIZE = 2048
+_WAVETABLE_LEVELS = 10            # tables hold 512, 256, ... 1 harmonics
+
+# Naive single cycles, phase in [0, 1) → [-1, 1], matching the shapes of
+# the tiled synths (saw rises, pulse has the default 25% duty).
+_WAVETABLE_SHAPES = {
+    "sine": lambda p: numpy.sin(2 * numpy.pi * p),
+    "saw": lambda p: 2.0 * p - 1.0,
+    "triangle": lambda p: 1.0 - 4.0 * numpy.abs(p - 0.5),
+    "square": lambda p: numpy.where(p < 0.5, 1.0, -1.0),
+    "pulse": lambda p: numpy.where(p < 0.25, 1.0, -1.0),
+}
+_WAVETABLES: dict[str, "_Wavetable"] = {}
+
+
+class _Wavetable:
+    """Mip-mapped, band-limited single-cycle tables for one waveform.
+
+    Level *k* keeps harmonics ``1 .. 512 >> k`` of the waveform's Fourier
+    series (worked out from a 16x oversampled naive cycle), so a note at
+    frequency *f* can use any level whose top harmonic is below Nyquist.
+    Each table carries one wrap-around guard sample for interpolation.
+    The whole set is ~80 KB per waveform.
+    """
+
+    def __init__(self, cycle):
+        size = _WAVETABLE_SIZE
+        over = size * 16
+        spectrum = numpy.fft.rfft(cycle(numpy.arange(over) / over)) / over
+        self.harmonics = [512 >> k for k in range(_WAVETABLE_LEVELS)]
+        self.tables = numpy.zeros((_WAVETABLE_LEVELS, size + 1),
+                                  dtype=numpy.float32)
+        for k, top in enumerate(self.harmonics):
+            band = numpy.zeros(size // 2 + 1, dtype=numpy.complex128)
+            band[:top + 1] = spectrum[:top + 1] * size
+            cycle_k = numpy.fft.irfft(band, size)
+            self.tables[k, :size] = cycle_k
+            self.tables[k, size] = cycle_k[0]
+
+    def levels(self, freq, sample_rate=None):
+        """Table level for each frequency — the most harmonics that fit."""
+        if sample_rate is None:
+            sample_rate = _rate()
+        freq = numpy.maximum(numpy.abs(freq), 1e-6)
+        need = numpy.ceil(numpy.log2(512 * freq / (sample_rate / 2)))
+        return numpy.clip(need, 0, _WAVETABLE_LEVELS - 1).astype(numpy.intp)
+
+    def read(self, phase, level):
+        """Linearly interpolated table lookup at *phase* (cycles)."""
+        pos = (phase % 1.0) * _WAVETABLE_SIZE
+        idx = pos.astype(numpy.intp)
+        frac = (pos - idx).astype(numpy.float32)
+        lo = self.tables[level, idx]
+        hi = self.tables[level, idx + 1]
+        return lo + (hi - lo) * frac
+
+
+def _wavetable(shape):
+    """Return the shared :class:`_Wavetable` for *shape*, building it once."""
+    table = _WAVETABLES.get(shape)
+    if table is None:
+        table = _WAVETABLES[shape] = _Wavetable(_WAVETABLE_SHAPES[shape])
+    return table
+
+
+class _Oscillator:
+    """A phase-increment oscillator over a shared :class:`_Wavetable`.
+
+    Stacks one or more voices detuned by *cents* (the supersaw's seven)
+    and keeps each voice's phase between calls, so a sound can be rendered
+    a block at a time — a live voice — or a whole phrase at once with a
+    per-sample frequency curve for glides and bends.
+    """
+
+    def __init__(self, shape, cents=(0.0,)):
+        self.table = _wavetable(shape)
+        self.ratios = 2.0 ** (numpy.asarray(cents, dtype=numpy.float64) / 1200)
+        self.phase = numpy.zeros(len(self.ratios))
+
+    def render(self, freq, n_samples=None, sample_rate=None):
+        """Render float32 samples in ``[-1, 1]`` and advance the phase.
+
+        Args:
+            freq: A frequency in Hz (then pass *n_samples*), or an array
+                with one frequency per output sample.
+            n_samples: Output length when *freq* is a scalar.
+        """
+        if sample_rate is None:
+            sample_rate = _rate()
+        if numpy.ndim(freq) == 0:
+            steps = numpy.arange(n_samples, dtype=numpy.float64)
+            freqs = numpy.full(1, float(freq))
+        else:
+            freqs = numpy.asarray(freq, dtype=numpy.float64)
+            n_samples = len(freqs)
+            # Phase before each sample: running sum of earlier increments
+            steps = numpy.empty(n_samples, dtype=numpy.float64)
+            if n_samples:
+                steps[0] = 0.0
+                numpy.cumsum(freqs[:-1], out=steps[1:])
+        out = numpy.zeros(n_samples, dtype=numpy.float32)
+        if n_samples == 0:
+            return out
+        for v, ratio in enumerate(self.ratios):
+            inc = ratio / sample_rate
+            if numpy.ndim(freq) == 0:
+                phase = self.phase[v] + steps * (float(freq) * inc)
+                level = self.table.levels(numpy.full(1, freq * ratio),
+                                          sample_rate)[0]
+                end = phase[-1] + float(freq) * inc
+            else:
+                phase = self.phase[v] + steps * inc
+                level = self.table.levels(freqs * ratio, sample_rate)
+                end = phase[-1] + freqs[-1] * inc
+            out += self.table.read(phase, level)
+            self.phase[v] = end % 1.0
+        if len(self.ratios) > 1:
+            out /= len(self.ratios)
+        return out
+
+
+# Synths that have a wavetable form: synth function → (shape, voice cents)
+_OSCILLATOR_SYNTHS = {
+    sine_wave: ("sine", (0.0,)),
+    sawtooth_wave: ("saw", (0.0,)),
+    triangle_wave: ("triangle", (0.0,)),
+    square_wave: ("square", (0.0,)),
+    pulse_wave: ("pulse", (0.0,)),
+    supersaw_wave: ("saw", tuple(numpy.linspace(-15, 15, 7))),
+}
+
+
+def _oscillator_for(synth_fn, synth_kwargs=None):
+    """Return a fresh :class:`_Oscillator` for *synth_fn*, or ``None``.
+
+    ``None`` when the synth has no wavetable form, or is called with
+    kwargs (a custom duty or voice count) the tables don't model.
+    """
+    spec = _OSCILLATOR_SYNTHS.get(synth_fn)
+    if spec is None or synth_kwargs:
+        return None
+    return _Oscillator(*spec)
+
 
 def _render(tone_or_chord, temperament="equal", synth=Synth.SINE, t=1_000,
             envelope=Envelope.PIANO, **synth_kw):
@@ -2922,7 +3286,8 @@ def _render(tone_or_chord, temperament="equal", synth=Synth.SINE, t=1_000,
             ``slave_ratio=2.0`` for Hard Sync).
 
     Returns:
-        A NumPy int16 array of audio samples.
+        A NumPy float32 array of audio samples (``SAMPLE_PEAK`` = full
+        scale).
     """
     from .rhythm import Score, Part, Section
     if isinstance(tone_or_chord, (Score, Part, Section)):
@@ -2931,22 +3296,24 @@ def _render(tone_or_chord, temperament="equal", synth=Synth.SINE, t=1_000,
             f"{type(tone_or_chord).__name__}. Use play_score(), "
             f"render_score(), or save_midi() for multi-part music.")
 
-    n_samples = int(SAMPLE_RATE * t / 1_000)
+    n_samples = int(_rate() * t / 1_000)
+    synth_fn = (_SYNTH_FUNCTIONS[synth.value] if isinstance(synth, Synth)
+                else synth)
 
     if isinstance(tone_or_chord, Tone):
-        waves = [synth(tone_or_chord.pitch(temperament=temperament), n_samples=n_samples, **synth_kw)]
+        tones = [tone_or_chord]
     else:
-        waves = [
-            synth(tone.pitch(temperament=temperament), n_samples=n_samples, **synth_kw)
-            for tone in tone_or_chord.tones
-        ]
+        tones = tone_or_chord.tones
 
-    mixed = sum(waves)
+    mixed = numpy.zeros(n_samples, dtype=numpy.float32)
+    for tone in tones:
+        mixed += _synth_render(synth_fn, tone.pitch(temperament=temperament),
+                               n_samples, synth_kw)
 
     # Apply ADSR envelope
     attack, decay, sustain, release = envelope.value
     if attack > 0 or decay > 0 or sustain < 1.0 or release > 0:
-        mixed = _apply_envelope(mixed, attack, decay, sustain, release)
+        _apply_envelope(mixed, attack, decay, sustain, release, out=mixed)
 
     return mixed
 
@@ -3004,7 +3371,7 @@ def save(tone_or_chord, path, temperament="equal", synth=Synth.SINE, t=1_000,
     normalized = samples.astype(numpy.float32) / SAMPLE_PEAK
     # Convert to 16-bit PCM
     pcm = (normalized * 32767).astype(numpy.int16)
-    scipy.io.wavfile.write(path, SAMPLE_RATE, pcm)
+    scipy.io.wavfile.write(path, _rate(), pcm)
 
 
 def play_progression(chords, *, t=1000, synth=Synth.SINE, gap=100,
@@ -3045,9 +3412,10 @@ _time_cache = {}
 
 def _get_time_array(n_samples):
     """Cached time array — avoids reallocation on every synth call."""
-    if n_samples not in _time_cache:
-        _time_cache[n_samples] = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
-    return _time_cache[n_samples]
+    key = (n_samples, _rate())
+    if key not in _time_cache:
+        _time_cache[key] = numpy.arange(n_samples, dtype=numpy.float32) / key[1]
+    return _time_cache[key]
 
 
 def _sine_f32(hz, n_samples):
@@ -3060,7 +3428,7 @@ _decay_cache = {}
 
 def _exp_decay(n_samples, decay_rate):
     """Exponential decay envelope from 1→0. Cached."""
-    key = (n_samples, decay_rate)
+    key = (n_samples, decay_rate, _rate())
     if key not in _decay_cache:
         _decay_cache[key] = numpy.exp(-decay_rate * _get_time_array(n_samples))
     return _decay_cache[key]
@@ -3068,10 +3436,10 @@ def _exp_decay(n_samples, decay_rate):
 
 def _synth_kick(n_samples):
     """Synthesize a kick drum: 808-style sine with pitch sweep + transient punch."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Pitch sweeps from 200 Hz down to 45 Hz — fast sweep for punch
     freq = 45 + 155 * numpy.exp(-50 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     # Main body with longer sustain
     body = numpy.sin(phase) * _exp_decay(n_samples, 6)
     # Hard transient click — the "beater" hitting the head
@@ -3079,7 +3447,7 @@ def _synth_kick(n_samples):
     click = _noise(click_len) * _exp_decay(click_len, 100)
     body[:click_len] += click * 0.5
     # Sub thump — a brief low sine for chest punch
-    sub_len = min(int(SAMPLE_RATE * 0.08), n_samples)
+    sub_len = min(int(_rate() * 0.08), n_samples)
     sub = _sine_f32(50, sub_len) * _exp_decay(sub_len, 20)
     body[:sub_len] += sub * 0.4
     # Soft saturation for warmth and presence
@@ -3103,8 +3471,8 @@ def _synth_snare(n_samples):
 
 def _synth_hat_closed(n_samples):
     """Closed hi-hat: short, crisp, metallic."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.03))  # 30ms (was 50ms)
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.03))  # 30ms (was 50ms)
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Metallic harmonics — inharmonic frequencies that make cymbals shimmer
     metallic = (numpy.sin(2 * numpy.pi * 6000 * t) * 0.3 +
                 numpy.sin(2 * numpy.pi * 8500 * t) * 0.2 +
@@ -3118,8 +3486,8 @@ def _synth_hat_closed(n_samples):
 
 def _synth_hat_open(n_samples):
     """Open hi-hat: bright, metallic, controlled decay."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.15))  # 150ms (was 250ms)
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.15))  # 150ms (was 250ms)
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     metallic = (numpy.sin(2 * numpy.pi * 6000 * t) * 0.3 +
                 numpy.sin(2 * numpy.pi * 8500 * t) * 0.2 +
                 numpy.sin(2 * numpy.pi * 12000 * t) * 0.15)
@@ -3135,13 +3503,13 @@ def _synth_clap(n_samples):
     wave = numpy.zeros(n_samples, dtype=numpy.float32)
     # Multiple hands hitting slightly apart — the 808 clap sound
     for offset_ms in [0, 8, 16, 24, 30]:
-        start = int(offset_ms * SAMPLE_RATE / 1000)
-        burst_len = min(int(SAMPLE_RATE * 0.015), n_samples - start)
+        start = int(offset_ms * _rate() / 1000)
+        burst_len = min(int(_rate() * 0.015), n_samples - start)
         if burst_len > 0:
             burst = _noise(burst_len) * _exp_decay(burst_len, 60)
             wave[start:start + burst_len] += burst * 0.5
     # Filtered noise tail — bandpassed for that snappy clap character
-    tail_len = min(int(SAMPLE_RATE * 0.12), n_samples)
+    tail_len = min(int(_rate() * 0.12), n_samples)
     tail = _noise(tail_len) * _exp_decay(tail_len, 22) * 0.4
     wave[:tail_len] += tail
     # Slight saturation for presence
@@ -3150,8 +3518,8 @@ def _synth_clap(n_samples):
 
 def _synth_rimshot(n_samples):
     """Rimshot: bright attack + pitched ring, like a stick hitting the rim and head."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.05))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.05))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Two pitched components — the rim and the head resonate together
     rim = _sine_f32(1200, n) * _exp_decay(n, 50) * 0.6
     head = _sine_f32(400, n) * _exp_decay(n, 35) * 0.4
@@ -3166,10 +3534,10 @@ def _synth_rimshot(n_samples):
 
 def _synth_tom(hz, n_samples):
     """Tom: pitched membrane with body resonance and attack transient."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Pitch sweep — higher pitch drops to target (stick impact)
     freq = hz + 60 * numpy.exp(-35 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 5) * 0.8
     # Second harmonic for fullness
     body += numpy.sin(phase * 1.5) * _exp_decay(n_samples, 8) * 0.2
@@ -3182,8 +3550,8 @@ def _synth_tom(hz, n_samples):
 
 def _synth_crash(n_samples):
     """Crash cymbal: complex metallic noise with inharmonic partials."""
-    n = min(n_samples, int(SAMPLE_RATE * 2.0))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 2.0))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Metallic partials — inharmonic frequencies that make cymbals shimmer
     wave = (numpy.sin(2 * numpy.pi * 4200 * t) * 0.15 +
             numpy.sin(2 * numpy.pi * 5800 * t) * 0.12 +
@@ -3194,7 +3562,7 @@ def _synth_crash(n_samples):
     noise = _noise(n) * 0.4
     wave = (wave + noise) * _exp_decay(n, 2.5)
     # Bright attack burst
-    attack_len = min(int(SAMPLE_RATE * 0.01), n)
+    attack_len = min(int(_rate() * 0.01), n)
     wave[:attack_len] += _noise(attack_len) * 0.6
     out = numpy.zeros(n_samples, dtype=numpy.float32)
     out[:n] = wave
@@ -3203,8 +3571,8 @@ def _synth_crash(n_samples):
 
 def _synth_ride(n_samples):
     """Ride cymbal: sustained metallic ring with stick definition."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.8))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.8))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Inharmonic partials — the shimmer
     ring = (numpy.sin(2 * numpy.pi * 3200 * t) * 0.2 +
             numpy.sin(2 * numpy.pi * 4800 * t) * 0.15 +
@@ -3212,7 +3580,7 @@ def _synth_ride(n_samples):
             numpy.sin(2 * numpy.pi * 9200 * t) * 0.06)
     ring *= _exp_decay(n, 5)
     # Stick click — the initial "ting"
-    click_len = min(int(SAMPLE_RATE * 0.005), n)
+    click_len = min(int(_rate() * 0.005), n)
     click = _noise(click_len) * 0.5
     ring[:click_len] += click
     # Subtle noise wash
@@ -3224,8 +3592,8 @@ def _synth_ride(n_samples):
 
 def _synth_ride_bell(n_samples):
     """Ride bell: brighter, more sustain, pronounced ping."""
-    n = min(n_samples, int(SAMPLE_RATE * 1.0))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 1.0))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Stronger fundamental + harmonics
     ring = (numpy.sin(2 * numpy.pi * 2800 * t) * 0.35 +
             numpy.sin(2 * numpy.pi * 4100 * t) * 0.25 +
@@ -3239,8 +3607,8 @@ def _synth_ride_bell(n_samples):
 
 def _synth_cowbell(n_samples):
     """Cowbell: 808-style — two detuned square-ish tones with bandpass character."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.25))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.25))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Two inharmonic tones — the 808 cowbell frequencies
     tone1 = numpy.tanh(numpy.sin(2 * numpy.pi * 540 * t) * 2) * 0.5
     tone2 = numpy.tanh(numpy.sin(2 * numpy.pi * 800 * t) * 2) * 0.4
@@ -3252,8 +3620,8 @@ def _synth_cowbell(n_samples):
 
 def _synth_clave(n_samples):
     """Clave: sharp wooden click — two resonant frequencies."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.02))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.02))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Two wood resonances
     wave = (_sine_f32(2500, n) * 0.6 + _sine_f32(3800, n) * 0.3)
     wave *= _exp_decay(n, 120)
@@ -3267,15 +3635,15 @@ def _synth_clave(n_samples):
 
 def _synth_conga(hz, n_samples):
     """Conga/bongo: pitched membrane with slap transient and body resonance."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Pitch drops from impact
     freq = hz + 80 * numpy.exp(-30 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 8) * 0.7
     # Second mode — the shell resonance
     body += numpy.sin(phase * 1.6) * _exp_decay(n_samples, 12) * 0.2
     # Slap — the hand hitting the skin
-    slap_len = min(int(SAMPLE_RATE * 0.008), n_samples)
+    slap_len = min(int(_rate() * 0.008), n_samples)
     slap = _noise(slap_len) * _exp_decay(slap_len, 100) * 0.5
     body[:slap_len] += slap
     return numpy.tanh(body * 1.1)
@@ -3283,8 +3651,8 @@ def _synth_conga(hz, n_samples):
 
 def _synth_shaker(n_samples):
     """Shaker/maracas: filtered noise with attack transient."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.06))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.06))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Noise shaped with an attack bump
     env = numpy.exp(-40 * t) + 0.3 * numpy.exp(-8 * t)
     wave = _noise(n) * env * 0.5
@@ -3297,8 +3665,8 @@ def _synth_shaker(n_samples):
 
 def _synth_tambourine(n_samples):
     """Tambourine: jingle metal + noise body."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.2))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.2))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Multiple jingle frequencies — each zil is slightly different
     jingle = (numpy.sin(2 * numpy.pi * 6500 * t) * 0.15 +
               numpy.sin(2 * numpy.pi * 7800 * t) * 0.12 +
@@ -3314,8 +3682,8 @@ def _synth_tambourine(n_samples):
 
 def _synth_timbale(hz, n_samples):
     """Timbale: bright metallic shell ring with sharp attack."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.25))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.25))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Fundamental + inharmonic overtones (metal shell)
     wave = (_sine_f32(hz, n) * 0.5 +
             numpy.sin(2 * numpy.pi * hz * 2.3 * t) * 0.25 +
@@ -3331,8 +3699,8 @@ def _synth_timbale(hz, n_samples):
 
 def _synth_agogo(hz, n_samples):
     """Agogo bell: two-tone metallic ring with sustain."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.4))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.4))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Two resonant modes — the bell shape creates inharmonic partials
     wave = (numpy.sin(2 * numpy.pi * hz * t) * 0.5 +
             numpy.sin(2 * numpy.pi * hz * 1.48 * t) * 0.3 +
@@ -3349,13 +3717,13 @@ def _synth_tabla_na(n_samples):
     The goatskin head struck near the rim + syahi edge. Wooden shell
     gives a dry, snappy resonance. Membrane thump is the foundation.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Goatskin membrane thump — bandpass filtered noise for drum body
-    thump_len = min(int(SAMPLE_RATE * 0.05), n_samples)
+    thump_len = min(int(_rate() * 0.05), n_samples)
     thump_raw = _noise(thump_len)
     # Bandpass 200-800 Hz — goatskin membrane character
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [200, 800], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [200, 800], btype='band', fs=_rate())
         thump_padded = numpy.pad(thump_raw, (0, max(0, n_samples - thump_len)))
         thump = scipy.signal.lfilter(bl, al, thump_padded)[:thump_len]
     else:
@@ -3383,12 +3751,12 @@ def _synth_tabla_tin(n_samples):
     Full open stroke on the wooden dayan. Goatskin membrane body with
     long syahi ring. The most "singing" dayan sound.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Membrane body — fuller than Na
-    thump_len = min(int(SAMPLE_RATE * 0.06), n_samples)
+    thump_len = min(int(_rate() * 0.06), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [150, 600], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [150, 600], btype='band', fs=_rate())
         thump_padded = numpy.pad(thump_raw, (0, max(0, n_samples - thump_len)))
         thump = scipy.signal.lfilter(bl, al, thump_padded)[:thump_len]
     else:
@@ -3413,23 +3781,23 @@ def _synth_tabla_ge(n_samples):
     more resonant bass with metallic sustain. Goatskin membrane provides
     the initial thud, then the metal body resonates.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Goatskin membrane thud — heavy, bassy
-    thump_len = min(int(SAMPLE_RATE * 0.07), n_samples)
+    thump_len = min(int(_rate() * 0.07), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [40, 250], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [40, 250], btype='band', fs=_rate())
         thump_padded = numpy.pad(thump_raw, (0, max(0, n_samples - thump_len)))
         thump = scipy.signal.lfilter(bl, al, thump_padded)[:thump_len]
     else:
         thump = thump_raw
     thump *= _exp_decay(thump_len, 20) * 0.8
     # Metal shell resonance — longer, rounder than wooden dayan
-    metal_len = min(int(SAMPLE_RATE * 0.1), n_samples)
+    metal_len = min(int(_rate() * 0.1), n_samples)
     metal = numpy.sin(2 * numpy.pi * 120 * t[:metal_len]) * _exp_decay(metal_len, 12) * 0.3
     # Pitch sweep body (hand modulates the head)
     freq = 55 + 100 * numpy.exp(-10 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 5) * 0.7
     # Sub boom from the large cavity
     sub = _sine_f32(40, n_samples) * _exp_decay(n_samples, 6) * 0.5
@@ -3456,8 +3824,8 @@ def _synth_tabla_tit(n_samples):
     The rapid-fire dayan sound for tiri-kita, taka-dina patterns.
     Very short, snappy, mostly attack with brief pitch.
     """
-    n = min(n_samples, int(SAMPLE_RATE * 0.06))  # 60ms max
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.06))  # 60ms max
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Quick membrane pop
     pop = _noise(min(80, n)) * _exp_decay(min(80, n), 250) * 0.9
     # Brief pitched ring
@@ -3472,8 +3840,8 @@ def _synth_tabla_tit(n_samples):
 
 def _synth_tabla_ke(n_samples):
     """Tabla Ke/Ka — muted bayan slap. Dead thud, no ring."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.08))  # 80ms max
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.08))  # 80ms max
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Muted membrane thud
     body = numpy.sin(2 * numpy.pi * 80 * t) * _exp_decay(n, 25) * 0.7
     thump = _noise(min(200, n)) * _exp_decay(min(200, n), 50) * 0.7
@@ -3491,19 +3859,19 @@ def _synth_dhol_dagga(n_samples):
     stick (dagga). Massive, thunderous low-end — the kind of hit
     you feel in your chest before you hear it.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Heavy membrane thud — longer, wider band
-    thump_len = min(int(SAMPLE_RATE * 0.12), n_samples)
+    thump_len = min(int(_rate() * 0.12), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [25, 150], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [25, 150], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
     thump *= _exp_decay(thump_len, 10) * 1.2
     # Deep pitched body with pitch sweep — thunderous boom
     freq = 45 + 80 * numpy.exp(-15 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 5) * 1.0
     # Massive sub boom — sustained
     sub = _sine_f32(30, n_samples) * _exp_decay(n_samples, 4) * 0.8
@@ -3523,12 +3891,12 @@ def _synth_dhol_tilli(n_samples):
     The treble head is thinner goatskin, hit with a thin bamboo stick
     (tilli). Bright, cutting, high-pitched crack.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Thin membrane snap
-    thump_len = min(int(SAMPLE_RATE * 0.03), n_samples)
+    thump_len = min(int(_rate() * 0.03), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [400, 2000], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [400, 2000], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -3558,11 +3926,11 @@ def _synth_dholak_ge(n_samples):
     The dholak is lighter and higher-pitched than the dhol, used
     in folk music and qawwali. Bass side has cotton/thread tuning.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
-    thump_len = min(int(SAMPLE_RATE * 0.05), n_samples)
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
+    thump_len = min(int(_rate() * 0.05), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [60, 300], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [60, 300], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -3579,11 +3947,11 @@ def _synth_dholak_ge(n_samples):
 
 def _synth_dholak_na(n_samples):
     """Dholak Na — treble side finger strike."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
-    thump_len = min(int(SAMPLE_RATE * 0.03), n_samples)
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
+    thump_len = min(int(_rate() * 0.03), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [250, 1200], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [250, 1200], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -3600,9 +3968,9 @@ def _synth_dholak_na(n_samples):
 
 def _synth_dholak_tit(n_samples):
     """Dholak light tap — fast finger pattern sound."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.05))
+    n = min(n_samples, int(_rate() * 0.05))
     pop = _noise(min(60, n)) * _exp_decay(min(60, n), 300) * 0.8
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     ring = numpy.sin(2 * numpy.pi * 500 * t) * _exp_decay(n, 30) * 0.4
     result = ring
     result[:min(60, n)] += pop
@@ -3617,12 +3985,12 @@ def _synth_mridangam_tham(n_samples):
     The mridangam's left head is tuned with wet wheat paste, giving
     a darker, more muted bass than tabla's bayan. Clay body resonance.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Membrane with wheat paste — darker character
-    thump_len = min(int(SAMPLE_RATE * 0.06), n_samples)
+    thump_len = min(int(_rate() * 0.06), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [40, 200], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [40, 200], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -3644,11 +4012,11 @@ def _synth_mridangam_nam(n_samples):
     The right head has a permanent syahi (called soru) that gives
     a clear, bell-like pitch. More overtones than tabla dayan.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
-    thump_len = min(int(SAMPLE_RATE * 0.04), n_samples)
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
+    thump_len = min(int(_rate() * 0.04), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [200, 900], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [200, 900], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -3675,9 +4043,9 @@ def _synth_mridangam_din(n_samples):
 
 def _synth_mridangam_tha(n_samples):
     """Mridangam Tha — muted treble stroke."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.07))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
-    thump_len = min(int(SAMPLE_RATE * 0.03), n)
+    n = min(n_samples, int(_rate() * 0.07))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
+    thump_len = min(int(_rate() * 0.03), n)
     thump = _noise(thump_len) * _exp_decay(thump_len, 50) * 0.7
     body = numpy.sin(2 * numpy.pi * 280 * t) * _exp_decay(n, 22) * 0.5
     result = body
@@ -3689,15 +4057,15 @@ def _synth_mridangam_tha(n_samples):
 
 def _synth_doumbek_dum(n_samples):
     """Doumbek Dum — open center strike, deep and round."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     freq = 80 + 40 * numpy.exp(-25 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 8) * 0.8
-    thump_len = min(int(SAMPLE_RATE * 0.04), n_samples)
+    thump_len = min(int(_rate() * 0.04), n_samples)
     import scipy.signal as _sig
     thump = _noise(thump_len)
     if thump_len > 20:
-        bl, al = _sig.butter(2, [50, 250], btype='band', fs=SAMPLE_RATE)
+        bl, al = _sig.butter(2, [50, 250], btype='band', fs=_rate())
         thump = _sig.lfilter(bl, al, numpy.pad(thump, (0, max(0, n_samples - thump_len))))[:thump_len].astype(numpy.float32)
     thump *= _exp_decay(thump_len, 22) * 0.7
     body[:thump_len] += thump
@@ -3706,14 +4074,14 @@ def _synth_doumbek_dum(n_samples):
 
 def _synth_doumbek_tek(n_samples):
     """Doumbek Tek — sharp edge strike, bright and cutting."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     ring = numpy.sin(2 * numpy.pi * 400 * t) * _exp_decay(n_samples, 22) * 0.5
     ring2 = numpy.sin(2 * numpy.pi * 900 * t) * 0.3 * _exp_decay(n_samples, 30)
-    click_len = min(int(SAMPLE_RATE * 0.005), n_samples)
+    click_len = min(int(_rate() * 0.005), n_samples)
     click = _noise(click_len) * _exp_decay(click_len, 300) * 0.9
     import scipy.signal as _sig
     if click_len > 10:
-        bl, al = _sig.butter(2, [2000, min(8000, SAMPLE_RATE // 2 - 1)], btype='band', fs=SAMPLE_RATE)
+        bl, al = _sig.butter(2, [2000, min(8000, _rate() // 2 - 1)], btype='band', fs=_rate())
         click = _sig.lfilter(bl, al, numpy.pad(click, (0, max(0, n_samples - click_len))))[:click_len].astype(numpy.float32)
     result = ring + ring2
     result[:click_len] += click
@@ -3722,8 +4090,8 @@ def _synth_doumbek_tek(n_samples):
 
 def _synth_doumbek_ka(n_samples):
     """Doumbek Ka — muted edge slap, short and dry."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.04))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.04))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     body = numpy.sin(2 * numpy.pi * 350 * t) * _exp_decay(n, 30) * 0.4
     slap = _noise(min(80, n)) * _exp_decay(min(80, n), 200) * 0.7
     result = body
@@ -3733,59 +4101,19 @@ def _synth_doumbek_ka(n_samples):
     return out
 
 
-def _synth_cajon_bass(n_samples):
-    """Cajón bass — open palm slaps the center of the plywood face.
-
-    Two sounds happening at once: the fleshy THUD of the palm
-    hitting wood, then the box resonating. The hand sound is
-    a soft, round impact — skin on plywood — followed by the
-    hollow chamber boom.
-    """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
-    # HAND IMPACT — fleshy palm on wood, round and thuddy
-    hand_len = min(int(SAMPLE_RATE * 0.015), n_samples)
-    hand_raw = _noise(hand_len)
-    if hand_len > 10:
-        # Lowpassed — palm is soft, not bright
-        bl, al = scipy.signal.butter(2, 1500 / (SAMPLE_RATE / 2), btype='low')
-        hand = scipy.signal.lfilter(bl, al, numpy.pad(hand_raw, (0, max(0, n_samples - hand_len))))[:hand_len].astype(numpy.float32)
-    else:
-        hand = hand_raw
-    hand *= _exp_decay(hand_len, 100) * 1.0
-    # BOX RESONANCE — hollow chamber thud
-    body = numpy.sin(2 * numpy.pi * 75 * t) * _exp_decay(n_samples, 5) * 0.7
-    box1 = numpy.sin(2 * numpy.pi * 170 * t) * _exp_decay(n_samples, 10) * 0.4
-    box2 = numpy.sin(2 * numpy.pi * 300 * t) * _exp_decay(n_samples, 16) * 0.2
-    # Panel flex — deep sub thud
-    sub = _sine_f32(45, n_samples) * _exp_decay(n_samples, 6) * 0.5
-    # Broader thump from the air cavity
-    thump_len = min(int(SAMPLE_RATE * 0.1), n_samples)
-    thump_raw = _noise(thump_len)
-    if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [40, 350], btype='band', fs=SAMPLE_RATE)
-        thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len].astype(numpy.float32)
-    else:
-        thump = thump_raw
-    thump *= _exp_decay(thump_len, 12) * 0.6
-    result = body + box1 + box2 + sub
-    result[:thump_len] += thump
-    result[:hand_len] += hand
-    return numpy.tanh(result * 1.5).astype(numpy.float32)
-
-
 def _synth_cajon_slap(n_samples):
     """Cajón slap — fingers near the top edge, pure wood crack.
 
     No snare wires. Just the sharp crack of fingers on the plywood
     edge with the box resonance underneath. Dry and woody.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Wood panel resonance — boxy mid
     body = numpy.sin(2 * numpy.pi * 240 * t) * _exp_decay(n_samples, 28) * 0.4
     box = numpy.sin(2 * numpy.pi * 400 * t) * _exp_decay(n_samples, 38) * 0.2
     box2 = numpy.sin(2 * numpy.pi * 600 * t) * _exp_decay(n_samples, 50) * 0.1
     # Sharp edge slap — fingers on plywood
-    slap_len = min(int(SAMPLE_RATE * 0.004), n_samples)
+    slap_len = min(int(_rate() * 0.004), n_samples)
     slap = _noise(slap_len) * _exp_decay(slap_len, 300) * 1.0
     result = body + box + box2
     result[:slap_len] += slap
@@ -3799,10 +4127,10 @@ def _synth_cajon_slap_snare(n_samples):
     """
     wood = _synth_cajon_slap(n_samples)
     # Add snare wire buzz on top
-    wire_len = min(int(SAMPLE_RATE * 0.06), n_samples)
+    wire_len = min(int(_rate() * 0.06), n_samples)
     wire = _noise(wire_len) * _exp_decay(wire_len, 20) * 0.45
     if wire_len > 20:
-        bl, al = scipy.signal.butter(2, [1500, 5000], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [1500, 5000], btype='band', fs=_rate())
         wire = scipy.signal.lfilter(bl, al, numpy.pad(wire, (0, max(0, n_samples - wire_len))))[:wire_len].astype(numpy.float32)
     result = wood.copy()
     result[:wire_len] += wire
@@ -3811,8 +4139,8 @@ def _synth_cajon_slap_snare(n_samples):
 
 def _synth_cajon_tap(n_samples):
     """Cajón tap — light fingertip on the plywood face. Ghost note."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.05))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.05))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     # Finger on wood — hollow tap
     tap = numpy.sin(2 * numpy.pi * 280 * t) * _exp_decay(n, 40) * 0.3
     box = numpy.sin(2 * numpy.pi * 450 * t) * _exp_decay(n, 55) * 0.12
@@ -3830,19 +4158,19 @@ def _synth_metal_kick(n_samples):
     Tight low end with a beater click for definition. Not thin —
     needs the low-end weight to anchor the mix alongside bass guitar.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Pitch sweep — fast attack, tight body
     freq = 50 + 120 * numpy.exp(-60 * t)
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 9) * 0.9
     # Beater click — present but not harsh
-    click_len = min(int(SAMPLE_RATE * 0.012), n_samples)
+    click_len = min(int(_rate() * 0.012), n_samples)
     click = _noise(click_len) * _exp_decay(click_len, 200) * 0.7
     # Sub punch — gives it weight
-    sub_len = min(int(SAMPLE_RATE * 0.06), n_samples)
+    sub_len = min(int(_rate() * 0.06), n_samples)
     sub = _sine_f32(50, sub_len) * _exp_decay(sub_len, 20) * 0.5
     # Membrane thump
-    thump_len = min(int(SAMPLE_RATE * 0.03), n_samples)
+    thump_len = min(int(_rate() * 0.03), n_samples)
     thump = _noise(thump_len) * _exp_decay(thump_len, 60) * 0.4
     body[:sub_len] += sub
     body[:click_len] += click
@@ -3856,16 +4184,16 @@ def _synth_metal_snare(n_samples):
     High-tuned, cranked snare wires, lots of attack. Needs to cut
     through double kicks and wall-of-gain guitars.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Higher pitched body than rock snare — tuned tight
     body = numpy.sin(2 * numpy.pi * 280 * t) * _exp_decay(n_samples, 30) * 0.5
     # Snare wire rattle — shorter, tighter than rock
     wire = _noise(n_samples) * _exp_decay(n_samples, 25) * 0.7
     # Bandpass the wire for presence
-    bl, al = scipy.signal.butter(2, [2000, 8000], btype='band', fs=SAMPLE_RATE)
+    bl, al = scipy.signal.butter(2, [2000, 8000], btype='band', fs=_rate())
     wire = scipy.signal.lfilter(bl, al, wire).astype(numpy.float32) * 1.5
     # Hard stick crack
-    crack_len = min(int(SAMPLE_RATE * 0.005), n_samples)
+    crack_len = min(int(_rate() * 0.005), n_samples)
     crack = _noise(crack_len) * _exp_decay(crack_len, 400) * 1.5
     result = body + wire
     result[:crack_len] += crack
@@ -3874,8 +4202,8 @@ def _synth_metal_snare(n_samples):
 
 def _synth_metal_hat(n_samples):
     """Metal hi-hat — ultra tight, precise, machine-gun ready."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.02))  # 20ms — very tight
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.02))  # 20ms — very tight
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     metallic = (numpy.sin(2 * numpy.pi * 7000 * t) * 0.3 +
                 numpy.sin(2 * numpy.pi * 9500 * t) * 0.25 +
                 numpy.sin(2 * numpy.pi * 13000 * t) * 0.2)
@@ -3892,18 +4220,18 @@ def _synth_march_snare(n_samples):
     Higher pitched than a kit snare. Very short decay — all attack,
     no sustain. Tight snare wires give a brief sizzle.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Higher-pitched body — tight kevlar pops high
     body = numpy.sin(2 * numpy.pi * 450 * t) * _exp_decay(n_samples, 60) * 0.4
     body2 = numpy.sin(2 * numpy.pi * 700 * t) * _exp_decay(n_samples, 75) * 0.2
     # Sharp stick pop
-    click_len = min(int(SAMPLE_RATE * 0.001), n_samples)
+    click_len = min(int(_rate() * 0.001), n_samples)
     click = _noise(click_len) * _exp_decay(click_len, 400) * 1.2
     # Very tight snare sizzle — higher band, shorter
-    buzz_len = min(int(SAMPLE_RATE * 0.025), n_samples)
+    buzz_len = min(int(_rate() * 0.025), n_samples)
     buzz_raw = _noise(buzz_len)
     if buzz_len > 20:
-        bl, al = scipy.signal.butter(2, [3500, 8000], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [3500, 8000], btype='band', fs=_rate())
         buzz = scipy.signal.lfilter(bl, al, numpy.pad(buzz_raw, (0, max(0, n_samples - buzz_len))))[:buzz_len]
     else:
         buzz = buzz_raw
@@ -3922,12 +4250,12 @@ def _synth_march_rimshot(n_samples):
     ring that dies fast but gives it that cutting edge.
     """
     wave = _synth_march_snare(n_samples)
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Rim crack — bright but short, woody-metallic character
     rim = numpy.sin(2 * numpy.pi * 1100 * t) * _exp_decay(n_samples, 45) * 0.35
     rim2 = numpy.sin(2 * numpy.pi * 2200 * t) * _exp_decay(n_samples, 55) * 0.2
     # Hard transient pop
-    pop_len = min(int(SAMPLE_RATE * 0.002), n_samples)
+    pop_len = min(int(_rate() * 0.002), n_samples)
     pop = _noise(pop_len) * _exp_decay(pop_len, 350) * 1.5
     # Extra body punch
     punch = numpy.sin(2 * numpy.pi * 500 * t) * _exp_decay(n_samples, 65) * 0.3
@@ -3943,17 +4271,17 @@ def _synth_march_click(n_samples):
     electrical tape. Not as ringy as a clave — the tape absorbs
     some of the high overtones — but still bright and snappy.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Wood resonance — brighter than before, but tape dampens ring
     body = numpy.sin(2 * numpy.pi * 1100 * t) * _exp_decay(n_samples, 65) * 0.45
     body2 = numpy.sin(2 * numpy.pi * 1800 * t) * _exp_decay(n_samples, 80) * 0.25
     # Woody overtone — gives it that hickory character
     body3 = numpy.sin(2 * numpy.pi * 2600 * t) * _exp_decay(n_samples, 95) * 0.12
     # Bright but slightly muffled transient (tape on wood)
-    click_len = min(int(SAMPLE_RATE * 0.001), n_samples)
+    click_len = min(int(_rate() * 0.001), n_samples)
     click_raw = _noise(click_len)
     if click_len > 10:
-        bl, al = scipy.signal.butter(2, [800, 7000], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [800, 7000], btype='band', fs=_rate())
         click = scipy.signal.lfilter(bl, al, numpy.pad(click_raw, (0, max(0, n_samples - click_len))))[:click_len]
     else:
         click = click_raw
@@ -3970,7 +4298,7 @@ def _synth_quad(n_samples, pitch=300):
     mylar head and aluminum shell. More ring than a kit tom,
     brighter attack, clear pitch.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Pitched body — more ring/sustain than snare
     body = numpy.sin(2 * numpy.pi * pitch * t) * _exp_decay(n_samples, 22) * 0.5
     # Metallic overtones — the ting
@@ -3979,7 +4307,7 @@ def _synth_quad(n_samples, pitch=300):
     # Shell ring
     shell = numpy.sin(2 * numpy.pi * pitch * 4.7 * t) * _exp_decay(n_samples, 55) * 0.06
     # Sharp stick attack
-    click_len = min(int(SAMPLE_RATE * 0.001), n_samples)
+    click_len = min(int(_rate() * 0.001), n_samples)
     click = _noise(click_len) * _exp_decay(click_len, 400) * 0.8
     result = body + ting + ting2 + shell
     result[:click_len] += click
@@ -3988,10 +4316,10 @@ def _synth_quad(n_samples, pitch=300):
 
 def _synth_quad_spock(n_samples):
     """Quad spock — rim shot on the tenor shell. Bright, ringy, cutting."""
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     ring = numpy.sin(2 * numpy.pi * 1400 * t) * _exp_decay(n_samples, 40) * 0.5
     ring2 = numpy.sin(2 * numpy.pi * 2100 * t) * _exp_decay(n_samples, 55) * 0.25
-    click_len = min(int(SAMPLE_RATE * 0.001), n_samples)
+    click_len = min(int(_rate() * 0.001), n_samples)
     click = _noise(click_len) * _exp_decay(click_len, 400) * 1.0
     result = ring + ring2
     result[:click_len] += click
@@ -4006,24 +4334,24 @@ def _synth_march_bass(n_samples, pitch=60):
     sound than a kit bass drum because marching bass drums project
     outward.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Deep pitched body — sustains and rings
     body = numpy.sin(2 * numpy.pi * pitch * t) * _exp_decay(n_samples, 10) * 0.7
     body2 = numpy.sin(2 * numpy.pi * pitch * 2 * t) * _exp_decay(n_samples, 16) * 0.2
     # Sub thump
     sub = numpy.sin(2 * numpy.pi * pitch * 0.5 * t) * _exp_decay(n_samples, 8) * 0.3
     # BIG beater thwack — dominant part of the attack
-    thwack_len = min(int(SAMPLE_RATE * 0.025), n_samples)
+    thwack_len = min(int(_rate() * 0.025), n_samples)
     thwack_raw = _noise(thwack_len)
     if thwack_len > 10:
-        bl, al = scipy.signal.butter(2, [150, 2500], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [150, 2500], btype='band', fs=_rate())
         thwack = scipy.signal.lfilter(bl, al, numpy.pad(thwack_raw, (0, max(0, n_samples - thwack_len))))[:thwack_len]
     else:
         thwack = thwack_raw
     thwack *= _exp_decay(thwack_len, 55) * 1.5
     # Head slap — the mylar flexing on impact
-    slap_len = min(int(SAMPLE_RATE * 0.008), n_samples)
-    slap = numpy.sin(2 * numpy.pi * pitch * 3 * numpy.arange(slap_len, dtype=numpy.float32) / SAMPLE_RATE)
+    slap_len = min(int(_rate() * 0.008), n_samples)
+    slap = numpy.sin(2 * numpy.pi * pitch * 3 * numpy.arange(slap_len, dtype=numpy.float32) / _rate())
     slap *= _exp_decay(slap_len, 90) * 0.4
     result = body + body2 + sub
     result[:thwack_len] += thwack
@@ -4038,12 +4366,12 @@ def _synth_tabla_ge_bend(n_samples):
     head, raising the pitch dramatically. The signature bayan sound
     in Bollywood and fusion music.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Membrane thud
-    thump_len = min(int(SAMPLE_RATE * 0.07), n_samples)
+    thump_len = min(int(_rate() * 0.07), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [40, 250], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [40, 250], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -4051,10 +4379,10 @@ def _synth_tabla_ge_bend(n_samples):
     # Pitch sweep UP — 60 Hz rising to 200+ Hz as palm presses
     # Gets quieter as pitch rises (palm mutes the head as it presses)
     freq = 60 + 180 * (1 - numpy.exp(-4 * t))
-    phase = 2 * numpy.pi * numpy.cumsum(freq) / SAMPLE_RATE
+    phase = 2 * numpy.pi * numpy.cumsum(freq) / _rate()
     body = numpy.sin(phase) * _exp_decay(n_samples, 6) * 0.9
     # Metal shell resonance
-    metal_len = min(int(SAMPLE_RATE * 0.1), n_samples)
+    metal_len = min(int(_rate() * 0.1), n_samples)
     metal = numpy.sin(2 * numpy.pi * 150 * t[:metal_len]) * _exp_decay(metal_len, 8) * 0.3
     # Sub
     sub = _sine_f32(50, n_samples) * _exp_decay(n_samples, 5) * 0.4
@@ -4073,12 +4401,12 @@ def _synth_djembe_bass(n_samples):
     Deep, warm, round bass. The goblet-shaped wooden body amplifies
     the low frequencies. Played with a flat palm in the center.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Goatskin membrane — prominent, round
-    thump_len = min(int(SAMPLE_RATE * 0.08), n_samples)
+    thump_len = min(int(_rate() * 0.08), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [50, 250], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [50, 250], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -4101,12 +4429,12 @@ def _synth_djembe_tone(n_samples):
     Clear, pitched, ringing. Fingers strike the edge of the head with
     the palm off the surface so the head rings freely.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # Goatskin membrane at the edge — brighter than center
-    thump_len = min(int(SAMPLE_RATE * 0.04), n_samples)
+    thump_len = min(int(_rate() * 0.04), n_samples)
     thump_raw = _noise(thump_len)
     if thump_len > 20:
-        bl, al = scipy.signal.butter(2, [150, 800], btype='band', fs=SAMPLE_RATE)
+        bl, al = scipy.signal.butter(2, [150, 800], btype='band', fs=_rate())
         thump = scipy.signal.lfilter(bl, al, numpy.pad(thump_raw, (0, max(0, n_samples - thump_len))))[:thump_len]
     else:
         thump = thump_raw
@@ -4129,16 +4457,16 @@ def _synth_djembe_slap(n_samples):
     goatskin membrane — NOT a snare. Tight attack, very short decay,
     skin character rather than wire rattle.
     """
-    t = numpy.arange(n_samples, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(n_samples, dtype=numpy.float32) / _rate()
     # High membrane pop — goatskin resonance, much higher than snare
     pop = numpy.sin(2 * numpy.pi * 900 * t) * _exp_decay(n_samples, 50) * 0.5
     pop2 = numpy.sin(2 * numpy.pi * 1600 * t) * _exp_decay(n_samples, 60) * 0.25
     pop3 = numpy.sin(2 * numpy.pi * 2400 * t) * _exp_decay(n_samples, 80) * 0.12
     # Very short filtered click — hand-on-skin transient, not noise rattle
-    click_len = min(int(SAMPLE_RATE * 0.008), n_samples)
+    click_len = min(int(_rate() * 0.008), n_samples)
     click_raw = _noise(click_len)
     if click_len > 20:
-        bl, al = scipy.signal.butter(2, 1800 / (SAMPLE_RATE / 2), btype='high')
+        bl, al = scipy.signal.butter(2, 1800 / (_rate() / 2), btype='high')
         click = scipy.signal.lfilter(bl, al, numpy.pad(click_raw, (0, max(0, n_samples - click_len))))[:click_len]
     else:
         click = click_raw
@@ -4151,9 +4479,9 @@ def _synth_djembe_slap(n_samples):
 def _synth_guiro(n_samples):
     """Guiro: scraped ridged surface — rhythmic noise bursts."""
     wave = numpy.zeros(n_samples, dtype=numpy.float32)
-    total = min(n_samples, int(SAMPLE_RATE * 0.18))
-    scrape_len = min(int(SAMPLE_RATE * 0.006), n_samples)
-    gap = int(SAMPLE_RATE * 0.004)
+    total = min(n_samples, int(_rate() * 0.18))
+    scrape_len = min(int(_rate() * 0.006), n_samples)
+    gap = int(_rate() * 0.004)
     pos = 0
     loudness = 0.7
     while pos < total:
@@ -4162,7 +4490,7 @@ def _synth_guiro(n_samples):
         wave[pos:end] += _noise(end - pos) * loudness
         # Subtle pitched component — the ridges
         ridge_len = end - pos
-        t = numpy.arange(ridge_len, dtype=numpy.float32) / SAMPLE_RATE
+        t = numpy.arange(ridge_len, dtype=numpy.float32) / _rate()
         wave[pos:end] += numpy.sin(2 * numpy.pi * 3000 * t) * loudness * 0.2
         pos += scrape_len + gap
         loudness *= 0.95  # slight fade
@@ -4175,7 +4503,7 @@ def _synth_rainstick_slow(n_samples):
     wave = numpy.zeros(n_samples, dtype=numpy.float32)
     rng = numpy.random.default_rng(77)
 
-    cascade_len = min(n_samples, int(SAMPLE_RATE * 4.0))
+    cascade_len = min(n_samples, int(_rate() * 4.0))
     n_pebbles = 800
     # More uniform distribution — shallow angle means steadier flow
     positions = rng.beta(1.2, 1.8, n_pebbles) * cascade_len
@@ -4192,13 +4520,13 @@ def _synth_rainstick_slow(n_samples):
         click *= rng.uniform(0.03, 0.18)
         wave[pos:end] += click
 
-    t = numpy.arange(cascade_len, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(cascade_len, dtype=numpy.float32) / _rate()
     body = numpy.sin(2 * numpy.pi * 160 * t) * 0.04
     body *= numpy.exp(-0.8 * t)
     wave[:cascade_len] += body
 
     full_env = numpy.ones(n_samples, dtype=numpy.float32)
-    fade_len = min(int(SAMPLE_RATE * 1.2), n_samples)
+    fade_len = min(int(_rate() * 1.2), n_samples)
     if fade_len > 0 and cascade_len > fade_len:
         full_env[cascade_len - fade_len:cascade_len] = numpy.linspace(
             1.0, 0.0, fade_len).astype(numpy.float32)
@@ -4220,14 +4548,14 @@ def _synth_ocean_drum(n_samples):
     wave = numpy.zeros(n_samples, dtype=numpy.float32)
     rng = numpy.random.default_rng(55)
 
-    wash_len = min(n_samples, int(SAMPLE_RATE * 2.5))
-    t = numpy.arange(wash_len, dtype=numpy.float32) / SAMPLE_RATE
+    wash_len = min(n_samples, int(_rate() * 2.5))
+    t = numpy.arange(wash_len, dtype=numpy.float32) / _rate()
 
     # Dense bead noise — smoother than rain stick (steel beads on drum head)
     noise = rng.standard_normal(wash_len).astype(numpy.float32)
     # Bandpass to ~1-6kHz — beads on mylar head
     import scipy.signal as _sig
-    bp, ap = _sig.butter(2, [1000, 6000], btype='band', fs=SAMPLE_RATE)
+    bp, ap = _sig.butter(2, [1000, 6000], btype='band', fs=_rate())
     noise = _sig.lfilter(bp, ap, noise).astype(numpy.float32)
 
     # Swell envelope — wave comes in, peaks, recedes
@@ -4251,8 +4579,8 @@ def _synth_cabasa(n_samples):
     Brighter and more metallic than a shaker — the beads are steel
     chain wrapped around a textured metal cylinder.
     """
-    n = min(n_samples, int(SAMPLE_RATE * 0.08))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.08))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     rng = numpy.random.default_rng(33)
 
     # Metallic noise — brighter than shaker
@@ -4278,14 +4606,14 @@ def _synth_wind_chimes(n_samples):
     wave = numpy.zeros(n_samples, dtype=numpy.float32)
     rng = numpy.random.default_rng(22)
 
-    chime_len = min(n_samples, int(SAMPLE_RATE * 3.0))
-    t = numpy.arange(chime_len, dtype=numpy.float32) / SAMPLE_RATE
+    chime_len = min(n_samples, int(_rate() * 3.0))
+    t = numpy.arange(chime_len, dtype=numpy.float32) / _rate()
 
     # 6-8 tubes at different pitches — pentatonic-ish spread
     tube_freqs = [1200, 1450, 1700, 2000, 2400, 2850, 3300]
     for freq in tube_freqs:
         # Each tube starts at a random offset (breeze hits them at different times)
-        offset = rng.integers(0, int(SAMPLE_RATE * 0.3))
+        offset = rng.integers(0, int(_rate() * 0.3))
         if offset >= chime_len:
             continue
         tube_t = t[offset:]
@@ -4308,8 +4636,8 @@ def _synth_wind_chimes(n_samples):
 
 def _synth_finger_cymbal(n_samples):
     """Finger cymbal (zill): single small cymbal tap — bright metallic ping."""
-    n = min(n_samples, int(SAMPLE_RATE * 0.8))
-    t = numpy.arange(n, dtype=numpy.float32) / SAMPLE_RATE
+    n = min(n_samples, int(_rate() * 0.8))
+    t = numpy.arange(n, dtype=numpy.float32) / _rate()
     rng = numpy.random.default_rng(11)
 
     # High-pitched metallic modes
@@ -4321,7 +4649,7 @@ def _synth_finger_cymbal(n_samples):
     wave *= numpy.exp(-3.0 * t).astype(numpy.float32)
 
     # Tap transient
-    tap_len = min(int(SAMPLE_RATE * 0.001), n)
+    tap_len = min(int(_rate() * 0.001), n)
     wave[:tap_len] += rng.uniform(-0.2, 0.2, tap_len).astype(numpy.float32)
 
     out = numpy.zeros(n_samples, dtype=numpy.float32)
@@ -4343,7 +4671,7 @@ def _synth_rainstick(n_samples):
     rng = numpy.random.default_rng(42)
 
     # Duration of the cascade — up to 2.5 seconds
-    cascade_len = min(n_samples, int(SAMPLE_RATE * 2.5))
+    cascade_len = min(n_samples, int(_rate() * 2.5))
 
     # Generate random pebble impacts — denser at the start, sparse at the end
     n_pebbles = 800
@@ -4368,7 +4696,7 @@ def _synth_rainstick(n_samples):
         wave[pos:end] += click
 
     # Tube body resonance — hollow cactus, low rumble underneath
-    t = numpy.arange(cascade_len, dtype=numpy.float32) / SAMPLE_RATE
+    t = numpy.arange(cascade_len, dtype=numpy.float32) / _rate()
     body = numpy.sin(2 * numpy.pi * 180 * t) * 0.06
     body *= numpy.exp(-1.5 * t)
     # Modulate body resonance by the cascade density
@@ -4378,7 +4706,7 @@ def _synth_rainstick(n_samples):
 
     # Overall envelope — smooth fade
     full_env = numpy.ones(n_samples, dtype=numpy.float32)
-    fade_len = min(int(SAMPLE_RATE * 0.8), n_samples)
+    fade_len = min(int(_rate() * 0.8), n_samples)
     if fade_len > 0 and cascade_len > fade_len:
         full_env[cascade_len - fade_len:cascade_len] = numpy.linspace(
             1.0, 0.0, fade_len).astype(numpy.float32)
@@ -4391,6 +4719,109 @@ def _synth_rainstick(n_samples):
     return wave
 
 
+# DrumSound value → synth, filled on first use by _drum_synths()
+_DRUM_SYNTHS: dict = {}
+
+
+def _drum_synths():
+    """Return the ``DrumSound`` value → ``synth(n_samples)`` registry."""
+    if not _DRUM_SYNTHS:
+        from functools import partial
+        from .rhythm import DrumSound
+        # CAJON_BASS shares MIDI note 108 with TABLA_GE_BEND (it's an
+        # alias of it in the enum), so note 108 plays the Ge bend.
+        _DRUM_SYNTHS.update({
+            DrumSound.KICK.value: _synth_kick,
+            DrumSound.SNARE.value: _synth_snare,
+            DrumSound.RIMSHOT.value: _synth_rimshot,
+            DrumSound.CLAP.value: _synth_clap,
+            DrumSound.CLOSED_HAT.value: _synth_hat_closed,
+            DrumSound.OPEN_HAT.value: _synth_hat_open,
+            DrumSound.PEDAL_HAT.value: _synth_hat_closed,
+            DrumSound.LOW_TOM.value: partial(_synth_tom, 100),
+            DrumSound.MID_TOM.value: partial(_synth_tom, 150),
+            DrumSound.HIGH_TOM.value: partial(_synth_tom, 200),
+            DrumSound.CRASH.value: _synth_crash,
+            DrumSound.RIDE.value: _synth_ride,
+            DrumSound.RIDE_BELL.value: _synth_ride_bell,
+            DrumSound.COWBELL.value: _synth_cowbell,
+            DrumSound.CLAVE.value: _synth_clave,
+            DrumSound.SHAKER.value: _synth_shaker,
+            DrumSound.TAMBOURINE.value: _synth_tambourine,
+            DrumSound.CONGA_HIGH.value: partial(_synth_conga, 300),
+            DrumSound.CONGA_LOW.value: partial(_synth_conga, 200),
+            DrumSound.BONGO_HIGH.value: partial(_synth_conga, 450),
+            DrumSound.BONGO_LOW.value: partial(_synth_conga, 350),
+            DrumSound.TIMBALE_HIGH.value: partial(_synth_timbale, 800),
+            DrumSound.TIMBALE_LOW.value: partial(_synth_timbale, 600),
+            DrumSound.AGOGO_HIGH.value: partial(_synth_agogo, 900),
+            DrumSound.AGOGO_LOW.value: partial(_synth_agogo, 700),
+            DrumSound.GUIRO.value: _synth_guiro,
+            DrumSound.MARACAS.value: _synth_shaker,
+            # Tabla
+            DrumSound.TABLA_NA.value: _synth_tabla_na,
+            DrumSound.TABLA_TIN.value: _synth_tabla_tin,
+            DrumSound.TABLA_GE.value: _synth_tabla_ge,
+            DrumSound.TABLA_DHA.value: _synth_tabla_dha,
+            DrumSound.TABLA_TIT.value: _synth_tabla_tit,
+            DrumSound.TABLA_KE.value: _synth_tabla_ke,
+            DrumSound.TABLA_GE_BEND.value: _synth_tabla_ge_bend,
+            # Dhol
+            DrumSound.DHOL_DAGGA.value: _synth_dhol_dagga,
+            DrumSound.DHOL_TILLI.value: _synth_dhol_tilli,
+            DrumSound.DHOL_BOTH.value: _synth_dhol_both,
+            # Dholak
+            DrumSound.DHOLAK_GE.value: _synth_dholak_ge,
+            DrumSound.DHOLAK_NA.value: _synth_dholak_na,
+            DrumSound.DHOLAK_TIT.value: _synth_dholak_tit,
+            # Mridangam
+            DrumSound.MRIDANGAM_THAM.value: _synth_mridangam_tham,
+            DrumSound.MRIDANGAM_NAM.value: _synth_mridangam_nam,
+            DrumSound.MRIDANGAM_DIN.value: _synth_mridangam_din,
+            DrumSound.MRIDANGAM_THA.value: _synth_mridangam_tha,
+            # Djembe
+            DrumSound.DJEMBE_BASS.value: _synth_djembe_bass,
+            DrumSound.DJEMBE_TONE.value: _synth_djembe_tone,
+            DrumSound.DJEMBE_SLAP.value: _synth_djembe_slap,
+            # Doumbek
+            DrumSound.DOUMBEK_DUM.value: _synth_doumbek_dum,
+            DrumSound.DOUMBEK_TEK.value: _synth_doumbek_tek,
+            DrumSound.DOUMBEK_KA.value: _synth_doumbek_ka,
+            # Cajon
+            DrumSound.CAJON_SLAP.value: _synth_cajon_slap,
+            DrumSound.CAJON_SLAP_SNARE.value: _synth_cajon_slap_snare,
+            DrumSound.CAJON_TAP.value: _synth_cajon_tap,
+            # Metal kit
+            DrumSound.METAL_KICK.value: _synth_metal_kick,
+            DrumSound.METAL_SNARE.value: _synth_metal_snare,
+            DrumSound.METAL_HAT.value: _synth_metal_hat,
+            # Marching
+            DrumSound.MARCH_SNARE.value: _synth_march_snare,
+            DrumSound.MARCH_RIMSHOT.value: _synth_march_rimshot,
+            DrumSound.MARCH_CLICK.value: _synth_march_click,
+            # Quads (tenor drums) — pitched high to low
+            DrumSound.QUAD_1.value: partial(_synth_quad, pitch=400),
+            DrumSound.QUAD_2.value: partial(_synth_quad, pitch=330),
+            DrumSound.QUAD_3.value: partial(_synth_quad, pitch=270),
+            DrumSound.QUAD_4.value: partial(_synth_quad, pitch=220),
+            DrumSound.QUAD_SPOCK.value: _synth_quad_spock,
+            # Marching bass drums — pitched high to low
+            DrumSound.BASS_1.value: partial(_synth_march_bass, pitch=90),
+            DrumSound.BASS_2.value: partial(_synth_march_bass, pitch=75),
+            DrumSound.BASS_3.value: partial(_synth_march_bass, pitch=62),
+            DrumSound.BASS_4.value: partial(_synth_march_bass, pitch=52),
+            DrumSound.BASS_5.value: partial(_synth_march_bass, pitch=42),
+            # Effects / world
+            DrumSound.RAINSTICK.value: _synth_rainstick,
+            DrumSound.RAINSTICK_SLOW.value: _synth_rainstick_slow,
+            DrumSound.OCEAN_DRUM.value: _synth_ocean_drum,
+            DrumSound.CABASA.value: _synth_cabasa,
+            DrumSound.WIND_CHIMES.value: _synth_wind_chimes,
+            DrumSound.FINGER_CYMBAL.value: _synth_finger_cymbal,
+        })
+    return _DRUM_SYNTHS
+
+
 def _render_drum_hit(sound_value, n_samples):
     """Render a single drum sound to a float32 array.
 
@@ -4401,117 +4832,282 @@ def _render_drum_hit(sound_value, n_samples):
     Returns:
         Float32 numpy array.
     """
-    from .rhythm import DrumSound
+    return _drum_synths().get(sound_value, _synth_clave)(n_samples)
 
-    _dispatch = {
-        DrumSound.KICK.value: lambda n: _synth_kick(n),
-        DrumSound.SNARE.value: lambda n: _synth_snare(n),
-        DrumSound.RIMSHOT.value: lambda n: _synth_rimshot(n),
-        DrumSound.CLAP.value: lambda n: _synth_clap(n),
-        DrumSound.CLOSED_HAT.value: lambda n: _synth_hat_closed(n),
-        DrumSound.OPEN_HAT.value: lambda n: _synth_hat_open(n),
-        DrumSound.PEDAL_HAT.value: lambda n: _synth_hat_closed(n),
-        DrumSound.LOW_TOM.value: lambda n: _synth_tom(100, n),
-        DrumSound.MID_TOM.value: lambda n: _synth_tom(150, n),
-        DrumSound.HIGH_TOM.value: lambda n: _synth_tom(200, n),
-        DrumSound.CRASH.value: lambda n: _synth_crash(n),
-        DrumSound.RIDE.value: lambda n: _synth_ride(n),
-        DrumSound.RIDE_BELL.value: lambda n: _synth_ride_bell(n),
-        DrumSound.COWBELL.value: lambda n: _synth_cowbell(n),
-        DrumSound.CLAVE.value: lambda n: _synth_clave(n),
-        DrumSound.SHAKER.value: lambda n: _synth_shaker(n),
-        DrumSound.TAMBOURINE.value: lambda n: _synth_tambourine(n),
-        DrumSound.CONGA_HIGH.value: lambda n: _synth_conga(300, n),
-        DrumSound.CONGA_LOW.value: lambda n: _synth_conga(200, n),
-        DrumSound.BONGO_HIGH.value: lambda n: _synth_conga(450, n),
-        DrumSound.BONGO_LOW.value: lambda n: _synth_conga(350, n),
-        DrumSound.TIMBALE_HIGH.value: lambda n: _synth_timbale(800, n),
-        DrumSound.TIMBALE_LOW.value: lambda n: _synth_timbale(600, n),
-        DrumSound.AGOGO_HIGH.value: lambda n: _synth_agogo(900, n),
-        DrumSound.AGOGO_LOW.value: lambda n: _synth_agogo(700, n),
-        DrumSound.GUIRO.value: lambda n: _synth_guiro(n),
-        DrumSound.MARACAS.value: lambda n: _synth_shaker(n),
-        # Tabla
-        DrumSound.TABLA_NA.value: lambda n: _synth_tabla_na(n),
-        DrumSound.TABLA_TIN.value: lambda n: _synth_tabla_tin(n),
-        DrumSound.TABLA_GE.value: lambda n: _synth_tabla_ge(n),
-        DrumSound.TABLA_DHA.value: lambda n: _synth_tabla_dha(n),
-        DrumSound.TABLA_TIT.value: lambda n: _synth_tabla_tit(n),
-        DrumSound.TABLA_KE.value: lambda n: _synth_tabla_ke(n),
-        DrumSound.TABLA_GE_BEND.value: _synth_tabla_ge_bend,
-        # Dhol
-        DrumSound.DHOL_DAGGA.value: lambda n: _synth_dhol_dagga(n),
-        DrumSound.DHOL_TILLI.value: lambda n: _synth_dhol_tilli(n),
-        DrumSound.DHOL_BOTH.value: lambda n: _synth_dhol_both(n),
-        # Dholak
-        DrumSound.DHOLAK_GE.value: lambda n: _synth_dholak_ge(n),
-        DrumSound.DHOLAK_NA.value: lambda n: _synth_dholak_na(n),
-        DrumSound.DHOLAK_TIT.value: lambda n: _synth_dholak_tit(n),
-        # Mridangam
-        DrumSound.MRIDANGAM_THAM.value: lambda n: _synth_mridangam_tham(n),
-        DrumSound.MRIDANGAM_NAM.value: lambda n: _synth_mridangam_nam(n),
-        DrumSound.MRIDANGAM_DIN.value: lambda n: _synth_mridangam_din(n),
-        DrumSound.MRIDANGAM_THA.value: lambda n: _synth_mridangam_tha(n),
-        # Djembe
-        DrumSound.DJEMBE_BASS.value: lambda n: _synth_djembe_bass(n),
-        DrumSound.DJEMBE_TONE.value: lambda n: _synth_djembe_tone(n),
-        DrumSound.DJEMBE_SLAP.value: lambda n: _synth_djembe_slap(n),
-        # Doumbek
-        DrumSound.DOUMBEK_DUM.value: lambda n: _synth_doumbek_dum(n),
-        DrumSound.DOUMBEK_TEK.value: lambda n: _synth_doumbek_tek(n),
-        DrumSound.DOUMBEK_KA.value: lambda n: _synth_doumbek_ka(n),
-        # Cajon
-        DrumSound.CAJON_BASS.value: lambda n: _synth_cajon_bass(n),
-        DrumSound.CAJON_SLAP.value: lambda n: _synth_cajon_slap(n),
-        DrumSound.CAJON_SLAP_SNARE.value: lambda n: _synth_cajon_slap_snare(n),
-        DrumSound.CAJON_TAP.value: lambda n: _synth_cajon_tap(n),
-        # Metal kit
-        DrumSound.METAL_KICK.value: lambda n: _synth_metal_kick(n),
-        DrumSound.METAL_SNARE.value: lambda n: _synth_metal_snare(n),
-        DrumSound.METAL_HAT.value: lambda n: _synth_metal_hat(n),
-        # Marching
-        DrumSound.MARCH_SNARE.value: lambda n: _synth_march_snare(n),
-        DrumSound.MARCH_RIMSHOT.value: lambda n: _synth_march_rimshot(n),
-        DrumSound.MARCH_CLICK.value: lambda n: _synth_march_click(n),
-        # Quads (tenor drums) — pitched high to low
-        DrumSound.QUAD_1.value: lambda n: _synth_quad(n, pitch=400),
-        DrumSound.QUAD_2.value: lambda n: _synth_quad(n, pitch=330),
-        DrumSound.QUAD_3.value: lambda n: _synth_quad(n, pitch=270),
-        DrumSound.QUAD_4.value: lambda n: _synth_quad(n, pitch=220),
-        DrumSound.QUAD_SPOCK.value: lambda n: _synth_quad_spock(n),
-        # Marching bass drums — pitched high to low
-        DrumSound.BASS_1.value: lambda n: _synth_march_bass(n, pitch=90),
-        DrumSound.BASS_2.value: lambda n: _synth_march_bass(n, pitch=75),
-        DrumSound.BASS_3.value: lambda n: _synth_march_bass(n, pitch=62),
-        DrumSound.BASS_4.value: lambda n: _synth_march_bass(n, pitch=52),
-        DrumSound.BASS_5.value: lambda n: _synth_march_bass(n, pitch=42),
-        # Effects / world
-        DrumSound.RAINSTICK.value: lambda n: _synth_rainstick(n),
-        DrumSound.RAINSTICK_SLOW.value: lambda n: _synth_rainstick_slow(n),
-        DrumSound.OCEAN_DRUM.value: lambda n: _synth_ocean_drum(n),
-        DrumSound.CABASA.value: lambda n: _synth_cabasa(n),
-        DrumSound.WIND_CHIMES.value: lambda n: _synth_wind_chimes(n),
-        DrumSound.FINGER_CYMBAL.value: lambda n: _synth_finger_cymbal(n),
-    }
 
-    renderer = _dispatch.get(sound_value, lambda n: _synth_clave(n))
-    result = renderer(n_samples)
-    # Override for ge_bend — dispatch closure has stale reference
-    if sound_value == 108:
-        result = _synth_tabla_ge_bend(n_samples)
-    return result
+class AudioCache:
+    """A thread-safe, byte-budgeted LRU cache of audio arrays.
+
+    The renderer's caches (synthesized notes, drum hits, Part stems) are
+    all instances of this. Entries are sized by their arrays' ``nbytes``
+    — a tuple of arrays counts them all — and once the total passes
+    ``max_bytes`` the least recently used entries are evicted. A single
+    entry bigger than the whole budget is simply not kept.
+
+    ``hits``, ``misses``, ``evictions`` and ``bytes`` are live counters
+    (see :meth:`stats`), so a budget can be tuned from real hit rates::
+
+        >>> from pytheory.play import _SYNTH_WAVE_CACHE
+        >>> _SYNTH_WAVE_CACHE.stats()
+        {'entries': 212, 'bytes': 18734080, 'max_bytes': 268435456,
+         'hits': 1890, 'misses': 212, 'evictions': 0}
+        >>> _SYNTH_WAVE_CACHE.max_bytes = 64 * 1024 * 1024
+    """
+
+    def __init__(self, max_bytes):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = int(max_bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(value):
+        if isinstance(value, (tuple, list)):
+            return sum(AudioCache._sizeof(v) for v in value)
+        return getattr(value, "nbytes", 0)
+
+    @property
+    def max_bytes(self):
+        """The byte budget. Lowering it evicts down to the new budget."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = int(value)
+            self._evict()
+
+    def _evict(self):
+        while self.bytes > self._max_bytes and self._data:
+            _key, old = self._data.popitem(last=False)
+            self.bytes -= self._sizeof(old)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """Return the entry for *key* (marking it recently used), or *default*."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= self._sizeof(old)
+            if size > self._max_bytes:
+                return
+            self._data[key] = value
+            self.bytes += size
+            self._evict()
+
+    def setdefault(self, key, value):
+        """Insert *value* unless *key* is already cached; return the entry."""
+        with self._lock:
+            if key in self._data:
+                return self._data[key]
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def items(self):
+        """A snapshot list of ``(key, value)`` pairs, oldest first."""
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self):
+        """Drop every entry. The hit/miss/eviction counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Return the cache's counters as a dict."""
+        with self._lock:
+            return {"entries": len(self._data), "bytes": self.bytes,
+                    "max_bytes": self._max_bytes, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
+
+    def __repr__(self):
+        with self._lock:
+            entries, used = len(self._data), self.bytes
+        return (f"<AudioCache {entries} entries, "
+                f"{used / 1048576:.1f}/{self._max_bytes / 1048576:.0f} MB>")
 
 
 # Drum hit cache — same sound at same length sounds identical
-_drum_cache = {}
+_drum_cache = AudioCache(64 * 1024 * 1024)
+
 
+# (DrumSound value, n_samples, rate) → read-only view into a DrumKit bank
+_DRUM_BANK: dict = {}
+
+
+def _drum_hit(sound_value, n_samples):
+    """A drum hit as a shared, read-only float32 array.
+
+    Comes straight out of a prerendered :class:`DrumKit` bank when one
+    holds this sound at this length, else from the drum hit cache
+    (synthesizing it on a miss).
+    """
+    key = (sound_value, n_samples, _rate())
+    hit = _DRUM_BANK.get(key)
+    if hit is None:
+        hit = _drum_cache.get(key)
+    if hit is None:
+        hit = _render_drum_hit(sound_value, n_samples)
+        hit.flags.writeable = False
+        _drum_cache[key] = hit
+    return hit
+
+
+class DrumKit:
+    """Drum sounds synthesized up front into one contiguous bank.
+
+    Drum hits are normally synthesized the first time each sound is
+    heard at each length, which puts the synthesis on the render (or
+    live audio) path. :meth:`prerender` does all of it ahead of time:
+    every sound in the kit, at every length asked for, lands in a
+    single float32 ``bank`` array, and from then on pattern playback,
+    ``Score.drums()`` and the live drum channel read their hits out of
+    it::
+
+        >>> from pytheory.play import DrumKit
+        >>> kit = DrumKit().prerender()                  # the whole kit
+        >>> DrumKit("tabla").prerender(workers=4)        # just tabla
+
+    Kits are named in :attr:`KITS`: ``"standard"`` (the General MIDI
+    and metal kits), ``"tabla"`` (tabla, dhol, dholak, mridangam),
+    ``"marching"`` (snare line, quads and basses) and ``"world"``
+    (djembe, doumbek, cajon and effects). With no names, all four.
+    """
+
+    KITS = {
+        "standard": ("KICK", "SNARE", "RIMSHOT", "CLAP", "CLOSED_HAT",
+                     "OPEN_HAT", "PEDAL_HAT", "LOW_TOM", "MID_TOM",
+                     "HIGH_TOM", "CRASH", "RIDE", "RIDE_BELL", "COWBELL",
+                     "CLAVE", "SHAKER", "TAMBOURINE", "CONGA_HIGH",
+                     "CONGA_LOW", "BONGO_HIGH", "BONGO_LOW", "TIMBALE_HIGH",
+                     "TIMBALE_LOW", "AGOGO_HIGH", "AGOGO_LOW", "GUIRO",
+                     "METAL_KICK", "METAL_SNARE", "METAL_HAT"),
+        "tabla": ("TABLA_NA", "TABLA_TIN", "TABLA_GE", "TABLA_DHA",
+                  "TABLA_TIT", "TABLA_KE", "TABLA_GE_BEND", "DHOL_DAGGA",
+                  "DHOL_TILLI", "DHOL_BOTH", "DHOLAK_GE", "DHOLAK_NA",
+                  "DHOLAK_TIT", "MRIDANGAM_THAM", "MRIDANGAM_NAM",
+                  "MRIDANGAM_DIN", "MRIDANGAM_THA"),
+        "marching": ("MARCH_SNARE", "MARCH_RIMSHOT", "MARCH_CLICK",
+                     "QUAD_1", "QUAD_2", "QUAD_3", "QUAD_4", "QUAD_SPOCK",
+                     "BASS_1", "BASS_2", "BASS_3", "BASS_4", "BASS_5"),
+        "world": ("DJEMBE_BASS", "DJEMBE_TONE", "DJEMBE_SLAP", "DOUMBEK_DUM",
+                  "DOUMBEK_TEK", "DOUMBEK_KA", "CAJON_SLAP", "CAJON_TAP",
+                  "CAJON_SLAP_SNARE", "RAINSTICK", "RAINSTICK_SLOW",
+                  "OCEAN_DRUM", "CABASA", "WIND_CHIMES", "FINGER_CYMBAL"),
+    }
 
-def _render_drum_hit_cached(sound_value, n_samples):
-    """Cached version of _render_drum_hit for pattern playback."""
-    key = (sound_value, n_samples)
-    if key not in _drum_cache:
-        _drum_cache[key] = _render_drum_hit(sound_value, n_samples)
-    return _drum_cache[key].copy()  # copy so callers can mutate
+    def __init__(self, *kits):
+        from .rhythm import DrumSound
+
+        names = []
+        for kit in kits or tuple(self.KITS):
+            if kit not in self.KITS:
+                raise ValueError(
+                    f"Unknown drum kit: {kit!r}. "
+                    f"Available: {', '.join(sorted(self.KITS))}")
+            names.extend(self.KITS[kit])
+        self.kits = tuple(kits or self.KITS)
+        self.sounds = tuple(dict.fromkeys(
+            DrumSound[name].value for name in names))
+        self.bank = numpy.zeros(0, dtype=numpy.float32)
+        self._index = {}
+
+    def prerender(self, lengths=None, *, workers=1, sample_rate=None):
+        """Synthesize every sound in the kit into :attr:`bank`.
+
+        Args:
+            lengths: The hit lengths to render each sound at, in
+                samples. The default is the half-second hit that drum
+                patterns and ``Score.drums()`` play; the live engine's
+                drum channel uses three seconds. Hits cut short by the
+                end of a render still synthesize on demand.
+            workers: Threads to synthesize with. ``None`` uses the
+                thread pool's default. Drum noise comes from NumPy's
+                global generator, so only ``workers=1`` draws it in a
+                repeatable order under ``numpy.random.seed``.
+            sample_rate: The rate renders using the kit run at
+                (default ``SAMPLE_RATE``). Hits are only served to
+                renders at that rate.
+
+        Returns:
+            The kit, so it chains off the constructor.
+        """
+        rate = int(sample_rate or _rate())
+        if lengths is None:
+            lengths = (int(rate * 0.5),)
+        jobs = [(sound, int(n), rate)
+                for n in lengths for sound in self.sounds]
+        offsets = numpy.concatenate(
+            ([0], numpy.cumsum([n for _, n, _ in jobs]))).tolist()
+        bank = numpy.empty(offsets[-1], dtype=numpy.float32)
+
+        def fill(i):
+            sound, n, _ = jobs[i]
+            with _at_rate(rate):
+                bank[offsets[i]:offsets[i] + n] = _render_drum_hit(sound, n)
+
+        if workers == 1:
+            for i in range(len(jobs)):
+                fill(i)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(fill, range(len(jobs))))
+        bank.flags.writeable = False
+
+        self.discard()
+        self.bank = bank
+        self._index = {job: bank[offsets[i]:offsets[i] + job[1]]
+                       for i, job in enumerate(jobs)}
+        _DRUM_BANK.update(self._index)
+        return self
+
+    def hit(self, sound, n_samples, sample_rate=None):
+        """The prerendered hit for *sound* at *n_samples*, or ``None``.
+
+        Returns a read-only view into :attr:`bank`.
+        """
+        return self._index.get((getattr(sound, "value", sound), n_samples,
+                                int(sample_rate or _rate())))
+
+    def discard(self):
+        """Stop serving this kit's hits; they synthesize on demand again."""
+        for key, view in self._index.items():
+            if _DRUM_BANK.get(key) is view:
+                del _DRUM_BANK[key]
+        self.bank = numpy.zeros(0, dtype=numpy.float32)
+        self._index = {}
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return (f"<DrumKit {'+'.join(self.kits)}: {len(self.sounds)} sounds, "
+                f"{self.bank.nbytes / 1048576:.1f} MB>")
 
 
 def _render_pattern(pattern, bpm=120):
@@ -4526,7 +5122,7 @@ def _render_pattern(pattern, bpm=120):
     """
     if bpm <= 0:
         raise ValueError("bpm must be positive")
-    samples_per_beat = int(SAMPLE_RATE * 60.0 / bpm)
+    samples_per_beat = int(_rate() * 60.0 / bpm)
     total_samples = int(pattern.beats * samples_per_beat)
     buf = numpy.zeros(total_samples, dtype=numpy.float32)
 
@@ -4536,8 +5132,8 @@ def _render_pattern(pattern, bpm=120):
             continue
         remaining = total_samples - start
         # Render each hit for up to 0.5 seconds
-        hit_len = min(int(SAMPLE_RATE * 0.5), remaining)
-        wave = _render_drum_hit_cached(hit.sound.value, hit_len)
+        hit_len = min(int(_rate() * 0.5), remaining)
+        wave = _drum_hit(hit.sound.value, hit_len)
         vel_scale = hit.velocity / 127.0
         buf[start:start + hit_len] += wave * vel_scale
 
@@ -4571,14 +5167,14 @@ def play_pattern(pattern, repeats=1, bpm=120):
     if repeats > 1:
         rendered = numpy.tile(rendered, repeats)
     _sd = _get_sd()
-    _sd.play(rendered, SAMPLE_RATE)
+    _sd.play(rendered, _rate())
     _sd.wait()
 
 
 # ── Audio effects ───────────────────────────────────────────────────────────
 
 
-def _apply_sidechain(samples, trigger_samples, amount=0.8, attack=0.001, release=0.1, sample_rate=SAMPLE_RATE):
+def _apply_sidechain(samples, trigger_samples, amount=0.8, attack=0.001, release=0.1, sample_rate=None):
     """Apply sidechain compression — duck the signal when the trigger is loud.
 
     Args:
@@ -4591,6 +5187,8 @@ def _apply_sidechain(samples, trigger_samples, amount=0.8, attack=0.001, release
     Returns:
         Float32 array with sidechain applied.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     # Match lengths
     min_len = min(len(samples), len(trigger_samples))
     trigger = trigger_samples[:min_len]
@@ -4638,6 +5236,18 @@ _IR_DURATIONS = {
 # deterministic and expensive to build, so each is generated at most once.
 _GENERATED_IR_CACHE: dict[tuple, numpy.ndarray] = {}
 
+# Partitioned IR spectra for _Convolver, keyed by (preset, sample_rate, seed,
+# partition size). Each holds the FFT of every partition plus the wet gain.
+_IR_SPECTRA: dict[tuple, tuple] = {}
+
+# Partition size for block-by-block convolution (streaming and live).
+_STREAM_PARTITION = 1024
+
+# Whole-buffer IR spectra for offline renders, keyed by (preset, sample_rate,
+# seed, fft size). Each is as long as the song, so they live in a byte-
+# budgeted LRU (shared safely by concurrent renders) rather than a dict.
+_IR_FULL_SPECTRA = AudioCache(128 * 1024 * 1024)
+
 
 def _time_varying_lowpass(x, a_curve, chunk=1024):
     """Apply a 1-pole lowpass ``y[i] = a*y[i-1] + (1-a)*x[i]`` whose
@@ -4664,7 +5274,7 @@ def _time_varying_lowpass(x, a_curve, chunk=1024):
     return out.astype(numpy.float32)
 
 
-def _generate_ir(preset="taj_mahal", sample_rate=SAMPLE_RATE, seed=42):
+def _generate_ir(preset="taj_mahal", sample_rate=None, seed=42):
     """Generate a synthetic impulse response for convolution reverb.
 
     These model the acoustic properties of real spaces — early reflections
@@ -4689,6 +5299,8 @@ def _generate_ir(preset="taj_mahal", sample_rate=SAMPLE_RATE, seed=42):
         parking_garage: Concrete box — 3s, bright, flutter echoes.
         canyon: Open canyon — 5s, sparse discrete echoes then diffuse tail.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     cache_key = (preset, sample_rate, seed)
     cached = _GENERATED_IR_CACHE.get(cache_key)
     if cached is not None:
@@ -4854,13 +5466,165 @@ def _generate_ir(preset="taj_mahal", sample_rate=SAMPLE_RATE, seed=42):
     return ir
 
 
-def _get_ir(preset, sample_rate=SAMPLE_RATE):
-    """Get a (memoised) impulse response for the mono reverb path."""
-    return _generate_ir(preset, sample_rate)
+def _ir_spectra(preset, sample_rate=None, seed=42,
+                partition=_STREAM_PARTITION):
+    """Split an IR into ``partition``-sample pieces and FFT each one.
+
+    Returns ``(head, rest, gain)``: the first partition's spectrum, the
+    others stacked last partition first (so row ``i`` lines up with the
+    ``i``-th oldest block in :class:`_Convolver`'s history), and
+    ``1 / ‖ir‖₂``. Memoised per ``(preset, sample_rate, seed, partition)``.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    key = (preset, sample_rate, seed, partition)
+    cached = _IR_SPECTRA.get(key)
+    if cached is not None:
+        return cached
+    ir = _generate_ir(preset, sample_rate, seed).astype(numpy.float64)
+    count = -(-len(ir) // partition)
+    parts = numpy.zeros((count, partition))
+    parts.flat[:len(ir)] = ir
+    spectra = numpy.fft.rfft(parts, 2 * partition)
+    rest = numpy.ascontiguousarray(spectra[:0:-1])
+    for arr in (spectra, rest):
+        arr.flags.writeable = False
+    gain = 1.0 / (numpy.sqrt(numpy.sum(ir ** 2)) + 1e-10)
+    cached = _IR_SPECTRA[key] = (spectra[0], rest, gain)
+    return cached
+
+
+class _Convolver:
+    """Uniformly-partitioned overlap-save convolution with a preset IR.
+
+    The IR is cut into equal partitions whose spectra are cached (see
+    :func:`_ir_spectra`), and a frequency-domain delay line holds the
+    spectra of the last few input blocks. Each finished block costs one
+    FFT plus one multiply-accumulate across the partitions, so a 12 s
+    cathedral runs a block at a time without latency, and offline renders
+    reuse the same cached spectra instead of re-transforming the IR.
+
+    Blocks of any length can be fed to :meth:`process`; a block that ends
+    mid-partition is convolved as far as it goes and finished by the next
+    call. With ``normalize`` the wet output is scaled by ``1 / ‖ir‖₂`` —
+    the RMS gain the offline reverb measures from the whole signal isn't
+    known until the song is over, and for broadband material this is the
+    level that measurement converges to.
+    """
+
+    BATCH = 32                # partitions transformed together offline
+
+    def __init__(self, preset, sample_rate=None, seed=42,
+                 partition=_STREAM_PARTITION, normalize=True):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.partition = partition
+        self.head, self.rest, gain = _ir_spectra(preset, sample_rate, seed,
+                                                 partition)
+        self.gain = gain if normalize else 1.0
+        count = len(self.rest)
+        # Input spectra, oldest first, doubled so the last ``count`` blocks
+        # are always one contiguous slice ending at ``self.pos + count``.
+        self.history = numpy.zeros((2 * count, partition + 1),
+                                   dtype=numpy.complex128)
+        self.pos = 0
+        self.frame = numpy.zeros(2 * partition)
+        self.fill = 0
+        self.tail = numpy.zeros(partition + 1, dtype=numpy.complex128)
+
+    def process(self, x):
+        """Process one block; returns the wet signal."""
+        n, size = len(x), self.partition
+        out = numpy.empty(n, dtype=numpy.float64)
+        i = 0
+        while i < n:
+            whole = (n - i) // size
+            if self.fill == 0 and whole > 1:
+                # Many partitions at once (offline): transform them together
+                count = min(whole, self.BATCH)
+                out[i:i + count * size] = self._batch(x[i:i + count * size])
+                i += count * size
+                continue
+            m = min(size - self.fill, n - i)
+            start = size + self.fill
+            self.frame[start:start + m] = x[i:i + m]
+            spectrum = numpy.fft.rfft(self.frame)
+            y = numpy.fft.irfft(spectrum * self.head + self.tail)
+            out[i:i + m] = y[start:start + m]
+            self.fill += m
+            i += m
+            if self.fill == size:
+                self._advance(spectrum)
+        out *= self.gain
+        return out.astype(numpy.float32)
+
+    def _batch(self, x):
+        """Convolve a run of whole partitions with one batched FFT each way."""
+        size, count = self.partition, len(self.rest)
+        blocks = len(x) // size
+        seq = numpy.concatenate([self.frame[:size], x])
+        frames = numpy.lib.stride_tricks.sliding_window_view(
+            seq, 2 * size)[::size]
+        spectra = numpy.fft.rfft(frames, axis=1)
+        recent = self.history[self.pos:self.pos + count]
+        ext = numpy.concatenate([recent, spectra])
+        acc = spectra * self.head
+        for k in range(1, count + 1):
+            acc += self.rest[count - k] * ext[count - k:count - k + blocks]
+        y = numpy.fft.irfft(acc, axis=1)[:, size:]
+        if count:
+            self.history[:count] = ext[-count:]
+            self.history[count:] = ext[-count:]
+            self.pos = 0
+            self.tail = numpy.einsum("ij,ij->j", self.history[:count],
+                                     self.rest)
+        self.frame[:size] = x[-size:]
+        return y.ravel()
+
+    def _advance(self, spectrum):
+        """Push a finished block into the delay line and precompute the
+        older partitions' contribution to the next one."""
+        count, size = len(self.rest), self.partition
+        if count:
+            self.history[self.pos] = spectrum
+            self.history[self.pos + count] = spectrum
+            self.pos = (self.pos + 1) % count
+            recent = self.history[self.pos:self.pos + count]
+            self.tail = numpy.einsum("ij,ij->j", recent, self.rest)
+        self.frame[:size] = self.frame[size:]
+        self.frame[size:] = 0.0
+        self.fill = 0
+
+
+def _convolve_whole(samples, preset, seeds, sample_rate=None):
+    """Convolve a whole buffer with one preset IR per seed.
+
+    Matches ``scipy.signal.fftconvolve(samples, ir)[:len(samples)]``, but
+    the input is transformed once for all seeds and each IR's spectrum at
+    this FFT size is memoised, so every reverb Part after the first pays
+    a single forward FFT plus one inverse FFT per seed.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    n = len(samples)
+    irs = [_generate_ir(preset, sample_rate, seed) for seed in seeds]
+    size = scipy.fft.next_fast_len(n + len(irs[0]) - 1, True)
+    spectrum = scipy.fft.rfft(samples, size)
+    wets = []
+    for seed, ir in zip(seeds, irs):
+        key = (preset, sample_rate, seed, size)
+        ir_fft = _IR_FULL_SPECTRA.get(key)
+        if ir_fft is None:
+            ir_fft = scipy.fft.rfft(ir, size)
+            ir_fft.flags.writeable = False  # shared between renders
+            _IR_FULL_SPECTRA[key] = ir_fft
+        wet = scipy.fft.irfft(spectrum * ir_fft, size)[:n]
+        wets.append(wet.astype(numpy.float32))
+    return wets
 
 
 def _apply_convolution_reverb(samples, preset="taj_mahal", mix=0.3,
-                               sample_rate=SAMPLE_RATE):
+                               sample_rate=None):
     """Apply convolution reverb using a synthetic impulse response.
 
     Convolves the input signal with an IR that models the acoustic
@@ -4876,14 +5640,13 @@ def _apply_convolution_reverb(samples, preset="taj_mahal", mix=0.3,
     Returns:
         Float32 array with convolution reverb applied (same length as input).
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if mix <= 0:
         return samples
 
-    ir = _get_ir(preset, sample_rate)
-
-    # FFT-based convolution — fast even for long IRs
-    wet = scipy.signal.fftconvolve(samples, ir, mode='full')[:len(samples)]
-    wet = wet.astype(numpy.float32)
+    # One FFT of the whole buffer against the cached IR spectrum
+    wet, = _convolve_whole(samples, preset, (42,), sample_rate)
 
     # Normalize wet signal to match dry RMS
     dry_rms = numpy.sqrt(numpy.mean(samples ** 2)) + 1e-10
@@ -4894,7 +5657,7 @@ def _apply_convolution_reverb(samples, preset="taj_mahal", mix=0.3,
 
 
 def _apply_convolution_reverb_stereo(samples, preset="taj_mahal", mix=0.3,
-                                      sample_rate=SAMPLE_RATE):
+                                      sample_rate=None):
     """Stereo convolution reverb — different IR per channel.
 
     Generates two impulse responses with different random seeds,
@@ -4910,6 +5673,8 @@ def _apply_convolution_reverb_stereo(samples, preset="taj_mahal", mix=0.3,
     Returns:
         Float32 (N, 2) stereo array.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     n = len(samples)
     if mix <= 0:
         stereo = numpy.zeros((n, 2), dtype=numpy.float32)
@@ -4918,13 +5683,9 @@ def _apply_convolution_reverb_stereo(samples, preset="taj_mahal", mix=0.3,
         return stereo
 
     # Two IRs with *different* seeds — different noise tails for L and R is
-    # what gives the reverb real stereo width. (Both are memoised.)
-    ir_l = _generate_ir(preset, sample_rate, seed=42)
-    ir_r = _generate_ir(preset, sample_rate, seed=4242)
-
-    # Convolve separately
-    wet_l = scipy.signal.fftconvolve(samples, ir_l, mode='full')[:n].astype(numpy.float32)
-    wet_r = scipy.signal.fftconvolve(samples, ir_r, mode='full')[:n].astype(numpy.float32)
+    # what gives the reverb real stereo width. The input is transformed
+    # once and both IR spectra are memoised.
+    wet_l, wet_r = _convolve_whole(samples, preset, (42, 4242), sample_rate)
 
     # Normalize to match dry RMS
     dry_rms = numpy.sqrt(numpy.mean(samples ** 2)) + 1e-10
@@ -4939,7 +5700,7 @@ def _apply_convolution_reverb_stereo(samples, preset="taj_mahal", mix=0.3,
     return stereo
 
 
-def _apply_reverb(samples, mix=0.3, decay=1.0, sample_rate=SAMPLE_RATE):
+def _apply_reverb(samples, mix=0.3, decay=1.0, sample_rate=None):
     """Apply a simple Schroeder reverb to a float32 buffer.
 
     Uses 4 parallel comb filters + 2 series allpass filters —
@@ -4954,6 +5715,8 @@ def _apply_reverb(samples, mix=0.3, decay=1.0, sample_rate=SAMPLE_RATE):
     Returns:
         Float32 array with reverb applied.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if mix <= 0:
         return samples
 
@@ -4979,7 +5742,7 @@ def _apply_reverb(samples, mix=0.3, decay=1.0, sample_rate=SAMPLE_RATE):
 
 
 def _apply_reverb_stereo(samples, mix=0.3, decay=1.0, width=0.8,
-                         sample_rate=SAMPLE_RATE):
+                         sample_rate=None):
     """Stereo reverb — different early reflections for L and R channels.
 
     Creates natural stereo width by using slightly different comb filter
@@ -4996,6 +5759,8 @@ def _apply_reverb_stereo(samples, mix=0.3, decay=1.0, width=0.8,
     Returns:
         Float32 (N, 2) stereo array.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if mix <= 0:
         stereo = numpy.zeros((len(samples), 2), dtype=numpy.float32)
         stereo[:, 0] = samples
@@ -5038,51 +5803,6 @@ def _apply_reverb_stereo(samples, mix=0.3, decay=1.0, width=0.8,
     return stereo
 
 
-def _apply_delay(samples, mix=0.25, time=0.375, feedback=0.4,
-                 sample_rate=SAMPLE_RATE):
-    """Apply a tempo-synced delay effect.
-
-    Args:
-        samples: Float32 numpy array.
-        mix: Wet/dry ratio 0.0–1.0.
-        time: Delay time in seconds (0.375 = dotted 8th at 120bpm).
-        feedback: How much each echo feeds back (0.0–1.0).
-        sample_rate: Sample rate in Hz.
-
-    Returns:
-        Float32 array with delay applied.
-    """
-    if mix <= 0:
-        return samples
-
-    delay_samples = int(time * sample_rate)
-    if delay_samples <= 0:
-        return samples
-
-    n = len(samples)
-    wet = numpy.zeros(n, dtype=numpy.float32)
-    buf = numpy.zeros(n, dtype=numpy.float32)
-    buf[:] = samples
-
-    # Generate echo taps
-    max_echoes = 8
-    gain = 1.0
-    for _ in range(max_echoes):
-        gain *= feedback
-        if gain < 0.01:
-            break
-        shifted = numpy.zeros(n, dtype=numpy.float32)
-        offset = delay_samples * (_ + 1)
-        if offset >= n:
-            break
-        end = min(n, n - offset)
-        if end > 0:
-            shifted[offset:offset + end] = buf[:end] * gain
-            wet += shifted
-
-    return samples * (1 - mix) + wet * mix
-
-
 def effects_tail_seconds(part) -> float:
     """Estimate how long a part's reverb/delay tail keeps ringing.
 
@@ -5108,7 +5828,7 @@ def effects_tail_seconds(part) -> float:
             tail += getattr(part, "reverb_decay", 1.0)
 
     # Delay: echoes repeat until they fall below the audible floor, capped
-    # at the same 8 taps _apply_delay() generates.
+    # at the same 8 taps the EffectChain delay generates.
     if getattr(part, "delay_mix", 0.0) > 0:
         delay_time = getattr(part, "delay_time", 0.375)
         feedback = getattr(part, "delay_feedback", 0.4)
@@ -5123,7 +5843,7 @@ def effects_tail_seconds(part) -> float:
     return tail
 
 
-def _apply_lowpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
+def _apply_lowpass(samples, cutoff, q=0.707, sample_rate=None):
     """Apply a 2nd-order Butterworth lowpass filter (12 dB/octave).
 
     A resonant lowpass filter — the sound of analog synthesizers.
@@ -5141,10 +5861,19 @@ def _apply_lowpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
     Returns:
         Float32 array with filter applied.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if cutoff <= 0 or cutoff >= sample_rate / 2:
         return samples
 
-    # Biquad coefficient calculation
+    b, a = _lowpass_coeffs(cutoff, q, sample_rate)
+    return scipy.signal.lfilter(b, a, samples).astype(numpy.float32)
+
+
+def _lowpass_coeffs(cutoff, q=0.707, sample_rate=None):
+    """Normalized ``(b, a)`` biquad coefficients for :func:`_apply_lowpass`."""
+    if sample_rate is None:
+        sample_rate = _rate()
     w0 = 2 * numpy.pi * cutoff / sample_rate
     alpha = numpy.sin(w0) / (2 * q)
 
@@ -5158,11 +5887,10 @@ def _apply_lowpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
     # Normalize
     b = numpy.array([b0/a0, b1/a0, b2/a0])
     a = numpy.array([1.0, a1/a0, a2/a0])
-
-    return scipy.signal.lfilter(b, a, samples).astype(numpy.float32)
+    return b, a
 
 
-def _apply_highpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
+def _apply_highpass(samples, cutoff, q=0.707, sample_rate=None):
     """Apply a 2nd-order Butterworth highpass filter (12 dB/octave).
 
     Removes low-frequency content below the cutoff. Useful for cleaning
@@ -5178,9 +5906,19 @@ def _apply_highpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
     Returns:
         Float32 array with filter applied.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if cutoff <= 0 or cutoff >= sample_rate / 2:
         return samples
 
+    b, a = _highpass_coeffs(cutoff, q, sample_rate)
+    return scipy.signal.lfilter(b, a, samples).astype(numpy.float32)
+
+
+def _highpass_coeffs(cutoff, q=0.707, sample_rate=None):
+    """Normalized ``(b, a)`` biquad coefficients for :func:`_apply_highpass`."""
+    if sample_rate is None:
+        sample_rate = _rate()
     w0 = 2 * numpy.pi * cutoff / sample_rate
     alpha = numpy.sin(w0) / (2 * q)
 
@@ -5193,57 +5931,12 @@ def _apply_highpass(samples, cutoff, q=0.707, sample_rate=SAMPLE_RATE):
 
     b = numpy.array([b0/a0, b1/a0, b2/a0])
     a = numpy.array([1.0, a1/a0, a2/a0])
-
-    return scipy.signal.lfilter(b, a, samples).astype(numpy.float32)
-
-
-def _apply_chorus(samples, mix=0.5, rate=1.5, depth=0.003,
-                   sample_rate=SAMPLE_RATE):
-    """Apply a chorus effect — slightly detuned delayed copy mixed in.
-
-    Chorus works by duplicating the signal, modulating the copy's delay
-    time with an LFO, and mixing it back. The varying delay creates
-    pitch wobble that thickens the sound — like two musicians playing
-    the same part slightly out of sync.
-
-    This is the classic Roland Juno chorus, the Boss CE-1, and every
-    string ensemble synth ever made.
-
-    Args:
-        samples: Float32 numpy array.
-        mix: Wet/dry ratio 0.0–1.0.
-        rate: LFO speed in Hz (default 1.5). 0.5–1 = slow shimmer,
-            2–4 = fast vibrato, 5+ = Leslie speaker territory.
-        depth: Modulation depth in seconds (default 0.003 = 3ms).
-            Controls how far the pitch wobbles.
-        sample_rate: Sample rate in Hz.
-
-    Returns:
-        Float32 array with chorus applied.
-    """
-    if mix <= 0:
-        return samples
-
-    n = len(samples)
-    t = numpy.arange(n, dtype=numpy.float32) / sample_rate
-
-    # LFO modulates the delay time
-    base_delay = 0.007  # 7ms base delay
-    lfo = depth * numpy.sin(2 * numpy.pi * rate * t)
-    delay_samples = ((base_delay + lfo) * sample_rate).astype(numpy.int32)
-
-    # Build the modulated delayed copy
-    wet = numpy.zeros(n, dtype=numpy.float32)
-    read_pos = numpy.arange(n, dtype=numpy.int64) - delay_samples
-    valid = (read_pos >= 0) & (read_pos < n)
-    wet[valid] = samples[read_pos[valid]]
-
-    return samples * (1 - mix * 0.5) + wet * mix * 0.5
+    return b, a
 
 
 def _apply_filter_envelope(samples, base_cutoff, amount, f_attack, f_decay,
                            f_sustain, q=0.707, vel_cutoff_boost=0.0,
-                           sample_rate=SAMPLE_RATE):
+                           sample_rate=None):
     """Apply a per-note filter envelope — cutoff sweeps over time.
 
     This is the core of subtractive synthesis: the filter opens on the
@@ -5253,6 +5946,8 @@ def _apply_filter_envelope(samples, base_cutoff, amount, f_attack, f_decay,
     Uses block-based processing (64-sample blocks) with biquad coefficient
     interpolation for efficiency and smooth sweeps.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     n = len(samples)
     if n == 0 or amount <= 0:
         return samples
@@ -5322,7 +6017,7 @@ def _apply_saturation(samples, amount=0.5):
     polynomial waveshaper that adds 2nd and 4th harmonics — the
     warm, pleasing character of analog tape and tube preamps.
     """
-    if amount <= 0:
+    if numpy.max(amount) <= 0:
         return samples
     # Asymmetric polynomial: x + k*x^2 adds even harmonics
     driven = samples + amount * samples * samples
@@ -5332,74 +6027,86 @@ def _apply_saturation(samples, amount=0.5):
     return numpy.clip(driven, -1.0, 1.0).astype(numpy.float32)
 
 
-def _apply_tremolo(samples, depth=0.5, rate=5.0, sample_rate=SAMPLE_RATE):
-    """Apply tremolo — amplitude modulation by a sine LFO.
-
-    The classic vibrating amp sound. Essential for vibraphone,
-    electric guitar, and organ Leslie speaker simulation.
+def _allpass_cells(x, c0, c1, lens, state):
+    """Run *x* through the phaser's cascade of allpass biquads, whose
+    coefficients ``b = (c0, c1, 1)``, ``a = (1, c1, c0)`` change from one
+    cell of ``lens`` samples to the next.
+
+    Vectorized over the cells, with no per-cell Python loop: within a
+    cell the filter is time-invariant, so its output is the zero-state
+    response to the cell's input (one Toeplitz product against the
+    cell's impulse response) plus the response to the two outputs it
+    inherits. Those inherited outputs chain from cell to cell as affine
+    maps, which a prefix scan composes in ``log2(cells)`` array steps.
+    *state* holds ``[x1, x2, y1, y2]`` — the last two inputs and outputs
+    — for every stage, and is updated in place so the next block
+    continues where this one stopped.
     """
-    if depth <= 0:
-        return samples
-    t = numpy.arange(len(samples), dtype=numpy.float64) / sample_rate
-    lfo = 1.0 - depth * 0.5 * (1.0 + numpy.sin(2 * numpy.pi * rate * t))
-    return (samples * lfo).astype(numpy.float32)
-
-
-def _apply_phaser(samples, mix=0.5, rate=0.5, stages=4,
-                  sample_rate=SAMPLE_RATE):
-    """Apply phaser — swept allpass filter chain.
-
-    Creates moving notches in the frequency spectrum by passing
-    the signal through a chain of allpass filters whose center
-    frequencies are modulated by an LFO. Classic effect for
-    electric piano, pads, and guitar.
-    """
-    if mix <= 0:
-        return samples
-    n = len(samples)
-    block_size = 64
-    t = numpy.arange(n, dtype=numpy.float64) / sample_rate
-
-    # LFO sweeps center frequency between 200Hz and 4000Hz (log scale)
-    lfo = 0.5 + 0.5 * numpy.sin(2 * numpy.pi * rate * t)
-    center_freqs = 200.0 * (20.0 ** lfo)  # 200Hz to 4000Hz
-
-    # Process through allpass stages
-    wet = samples.copy().astype(numpy.float64)
-    for _stage in range(stages):
-        out = numpy.empty(n, dtype=numpy.float64)
-        # Allpass state
-        x1 = x2 = y1 = y2 = 0.0
-        pos = 0
-        while pos < n:
-            end = min(pos + block_size, n)
-            mid = (pos + end) // 2
-            fc = center_freqs[mid]
-            # Allpass biquad coefficients
-            w0 = 2 * numpy.pi * fc / sample_rate
-            alpha = numpy.sin(w0) / 2.0  # Q=0.5 for wide sweep
-            cos_w0 = numpy.cos(w0)
-            b0 = 1 - alpha
-            b1 = -2 * cos_w0
-            b2 = 1 + alpha
-            a0 = 1 + alpha
-            a1 = -2 * cos_w0
-            a2 = 1 - alpha
-            b0 /= a0; b1 /= a0; b2 /= a0
-            a1 /= a0; a2 /= a0
-            for i in range(pos, end):
-                x0 = wet[i]
-                y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
-                out[i] = y0
-                x2 = x1; x1 = x0
-                y2 = y1; y1 = y0
-            pos = end
+    count = len(lens)
+    j = numpy.arange(64)
+    valid = j < lens[:, None]
+    # Poles r·e^(±iθ): the impulse response is r^m·sin((m+1)θ)/sin θ,
+    # tending to r^m·(m+1)·cos(mθ) as θ nears 0 or π
+    r = numpy.sqrt(c0)
+    theta = numpy.arccos(numpy.clip(-c1 / (2 * r), -1.0, 1.0))
+    sin_t = numpy.sin(theta)[:, None]
+    tiny = sin_t < 1e-9
+    h = r[:, None] ** j * numpy.where(
+        tiny, (j + 1) * numpy.cos(j * theta[:, None]),
+        numpy.sin((j + 1) * theta[:, None]) / numpy.where(tiny, 1.0, sin_t))
+    # Responses to an inherited y[-1] (g1) and y[-2] (g2)
+    h_prev = numpy.zeros_like(h)
+    h_prev[:, 1:] = h[:, :-1]
+    g1 = -c1[:, None] * h - c0[:, None] * h_prev
+    g2 = -c0[:, None] * h
+    toeplitz = numpy.lib.stride_tricks.sliding_window_view(
+        numpy.concatenate([numpy.zeros((count, 63)), h], axis=1),
+        64, axis=1)[:, :, ::-1]
+
+    # Each cell maps the (y[-1], y[-2]) it inherits to the pair it hands
+    # on: (last, second last) = maps @ inherited + offsets
+    rows = numpy.arange(count)
+    last, second = lens - 1, numpy.maximum(lens - 2, 0)
+    one = lens == 1
+    maps = numpy.empty((count, 2, 2))
+    maps[:, 0, 0], maps[:, 0, 1] = g1[rows, last], g2[rows, last]
+    maps[:, 1, 0] = numpy.where(one, 1.0, g1[rows, second])
+    maps[:, 1, 1] = numpy.where(one, 0.0, g2[rows, second])
+    # Prefix products of the maps, keeping each step's for the offsets
+    steps = []
+    step = 1
+    while step < count:
+        steps.append((step, maps))
+        maps = maps.copy()
+        maps[step:] = numpy.matmul(maps[step:], steps[-1][1][:-step])
+        step *= 2
+
+    c0_at, c1_at = numpy.repeat(c0, lens), numpy.repeat(c1, lens)
+    cells = numpy.zeros((count, 64))
+    wet = x
+    for stage in state:
+        x1, x2, y1, y2 = stage
+        prev = numpy.concatenate([(x2, x1), wet])
+        cells[valid] = c0_at * wet + c1_at * prev[1:-1] + prev[:-2]
+        zero_state = numpy.einsum("kji,ki->kj", toeplitz, cells)
+        offsets = numpy.stack(
+            [zero_state[rows, last],
+             numpy.where(one, 0.0, zero_state[rows, second])], axis=1)
+        for step, before in steps:
+            offsets[step:] = (numpy.einsum("kij,kj->ki", before[step:],
+                                           offsets[:-step])
+                              + offsets[step:])
+        handed = maps @ numpy.array([y1, y2]) + offsets
+        inherited = numpy.concatenate([[(y1, y2)], handed[:-1]])
+        out = (zero_state + g1 * inherited[:, :1]
+               + g2 * inherited[:, 1:])[valid]
+        x1, x2 = (wet[-1], wet[-2]) if len(wet) > 1 else (wet[0], x1)
+        stage[:] = [x1, x2, *handed[-1]]
         wet = out
+    return wet
 
-    return (samples * (1 - mix) + wet.astype(numpy.float32) * mix).astype(numpy.float32)
 
-
-def _apply_cabinet(samples, brightness=0.5, sample_rate=SAMPLE_RATE):
+def _apply_cabinet(samples, brightness=0.5, sample_rate=None):
     """Guitar speaker cabinet simulation.
 
     A real guitar cabinet (4x12, 2x12, 1x12) rolls off everything
@@ -5414,24 +6121,42 @@ def _apply_cabinet(samples, brightness=0.5, sample_rate=SAMPLE_RATE):
         samples: Float32 numpy array.
         brightness: 0.0 = dark (jazz combo), 0.5 = normal, 1.0 = bright.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
+    highpass, lowpass, presence = _cabinet_filters(brightness, sample_rate)
     # Highpass at 80Hz — speakers don't go that low
     if len(samples) > 10:
-        bl, al = scipy.signal.butter(2, 80, btype='high', fs=sample_rate)
-        samples = scipy.signal.lfilter(bl, al, samples).astype(numpy.float32)
+        samples = scipy.signal.lfilter(*highpass, samples).astype(numpy.float32)
     # Steep lowpass — the cabinet rolloff. This is the magic.
+    if lowpass is not None:
+        samples = scipy.signal.lfilter(*lowpass, samples).astype(numpy.float32)
+    # Presence bump at 2-3kHz (the "cut through the mix" frequency)
+    if presence is not None:
+        bump = scipy.signal.lfilter(*presence, samples).astype(numpy.float32)
+        samples = samples + bump * 0.3 * brightness
+    return samples
+
+
+def _cabinet_filters(brightness=0.5, sample_rate=None):
+    """The three ``(b, a)`` filters behind :func:`_apply_cabinet`.
+
+    Returns ``(highpass, lowpass, presence)``; a stage that would sit above
+    Nyquist at this sample rate is ``None``.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    highpass = scipy.signal.butter(2, 80, btype='high', fs=sample_rate)
     cutoff = 3500 + brightness * 2000  # 3.5kHz (dark) to 5.5kHz (bright)
+    lowpass = None
     if cutoff < sample_rate / 2:
-        bl, al = scipy.signal.butter(3, cutoff, btype='low', fs=sample_rate)
-        samples = scipy.signal.lfilter(bl, al, samples).astype(numpy.float32)
-    # Presence bump at 2-3kHz (the "cut through the mix" frequency)
+        lowpass = scipy.signal.butter(3, cutoff, btype='low', fs=sample_rate)
     center = 2500
     bw = 800
+    presence = None
     if center + bw < sample_rate / 2:
-        bp, ap = scipy.signal.butter(2, [center - bw, center + bw],
-                                     btype='band', fs=sample_rate)
-        presence = scipy.signal.lfilter(bp, ap, samples).astype(numpy.float32)
-        samples = samples + presence * 0.3 * brightness
-    return samples
+        presence = scipy.signal.butter(2, [center - bw, center + bw],
+                                       btype='band', fs=sample_rate)
+    return highpass, lowpass, presence
 
 
 def _apply_distortion(samples, drive=1.0, mix=1.0):
@@ -5457,7 +6182,7 @@ def _apply_distortion(samples, drive=1.0, mix=1.0):
     Returns:
         Float32 array with distortion applied.
     """
-    if mix <= 0 or drive <= 0:
+    if numpy.max(mix) <= 0 or drive <= 0:
         return samples
     # Multi-stage gain + clipping like a real amp:
     # Stage 1: preamp gain — push the signal hard
@@ -5477,38 +6202,11 @@ def _apply_distortion(samples, drive=1.0, mix=1.0):
 
 def _apply_effects_with_params(samples, params, skip_reverb=False):
     """Apply effects using a params dict. Used for both static and automated rendering."""
-    # Signal chain: saturation → tremolo → distortion → cabinet → chorus
-    #             → phaser → highpass → lowpass → delay → reverb
-    if params.get("saturation", 0) > 0:
-        samples = _apply_saturation(samples, amount=params["saturation"])
-    if params.get("tremolo_depth", 0) > 0:
-        samples = _apply_tremolo(samples, depth=params["tremolo_depth"],
-                                 rate=params.get("tremolo_rate", 5.0))
-    if params.get("distortion_mix", 0) > 0:
-        samples = _apply_distortion(samples,
-                                    drive=params.get("distortion_drive", 3.0),
-                                    mix=params["distortion_mix"])
-    if params.get("cabinet", 0) > 0:
-        samples = _apply_cabinet(samples,
-                                 brightness=params.get("cabinet_brightness", 0.5))
-    if params.get("chorus_mix", 0) > 0:
-        samples = _apply_chorus(samples,
-                                mix=params["chorus_mix"],
-                                rate=params.get("chorus_rate", 1.5),
-                                depth=params.get("chorus_depth", 0.003))
-    if params.get("phaser_mix", 0) > 0:
-        samples = _apply_phaser(samples, mix=params["phaser_mix"],
-                                rate=params.get("phaser_rate", 0.5))
-    if params.get("highpass", 0) > 0:
-        samples = _apply_highpass(samples, params["highpass"],
-                                  params.get("highpass_q", 0.707))
-    if params.get("lowpass", 0) > 0:
-        samples = _apply_lowpass(samples, params["lowpass"],
-                                 params.get("lowpass_q", 0.707))
-    if params.get("delay_mix", 0) > 0:
-        samples = _apply_delay(samples, mix=params["delay_mix"],
-                               time=params.get("delay_time", 0.375),
-                               feedback=params.get("delay_feedback", 0.4))
+    # One pass of the block-wise chain over the whole buffer; reverb
+    # here uses the whole-signal versions, whose convolution wet level
+    # is measured from the finished signal
+    samples = EffectChain(params, len(samples), skip_reverb=True).process(
+        samples)
     if not skip_reverb and params.get("reverb_mix", 0) > 0:
         reverb_type = params.get("reverb_type", "algorithmic")
         if reverb_type in _IR_DURATIONS:
@@ -5522,7 +6220,14 @@ def _apply_effects_with_params(samples, params, skip_reverb=False):
 
 def _apply_part_effects(samples, part):
     """Apply all effects configured on a Part to a float32 buffer."""
-    params = {
+    # Skip mono reverb — stereo reverb is applied in the mixer
+    return _apply_effects_with_params(samples, _part_effect_params(part),
+                                      skip_reverb=True)
+
+
+def _part_effect_params(part):
+    """Snapshot a Part's static effect settings as an effects params dict."""
+    return {
         "saturation": part.saturation,
         "tremolo_depth": part.tremolo_depth,
         "tremolo_rate": part.tremolo_rate,
@@ -5546,8 +6251,397 @@ def _apply_part_effects(samples, part):
         "reverb_decay": part.reverb_decay,
         "reverb_type": getattr(part, "reverb_type", "algorithmic"),
     }
-    # Skip mono reverb — stereo reverb is applied in the mixer
-    return _apply_effects_with_params(samples, params, skip_reverb=True)
+
+
+# The params that switch an effect on; everything else in an effects
+# params dict tunes one of these
+_EFFECT_KEYS = ("saturation", "tremolo_depth", "distortion_mix", "cabinet",
+                "chorus_mix", "phaser_mix", "highpass", "lowpass",
+                "delay_mix", "reverb_mix")
+
+
+# Automation runs at control rate: Part._automation is compiled into one
+# value per _CONTROL_BLOCK samples. Gains and mixes are interpolated per
+# sample between those values; LFO rates are integrated so the sweep keeps
+# its phase; everything else steps at a control-block edge.
+_CONTROL_BLOCK = 64
+_SMOOTH_PARAMS = frozenset((
+    "volume", "saturation", "tremolo_depth", "distortion_mix", "chorus_mix",
+    "chorus_depth", "phaser_mix", "delay_mix", "reverb_mix"))
+_REVERB_PARAMS = ("reverb_type", "reverb_decay")
+
+
+class _Automation:
+    """A Part's ``set()`` / ``ramp()`` / ``lfo()`` points compiled to
+    control-rate curves over *total_samples*.
+
+    Only the automated parameters get a curve; ``curves[key][b]`` is the
+    value in effect from sample ``b * _CONTROL_BLOCK`` on (a point takes
+    effect at the first control-block edge at or after its beat).
+    """
+
+    def __init__(self, part, total_samples, samples_per_beat, tempo_map=None):
+        points = sorted(part._automation, key=lambda a: a[0])
+        base = part._get_params_at(float("-inf"))
+        blocks = total_samples // _CONTROL_BLOCK + 2
+        positions = _beat_positions([beat for beat, _ in points],
+                                    samples_per_beat, tempo_map)
+        starts = (-(-positions // _CONTROL_BLOCK)).tolist()
+        index = numpy.arange(blocks)
+        self.curves = {}
+        for key in {k for _, changes in points for k in changes}:
+            edges, values = [0], [base.get(key, 0.0)]
+            for start, (_, changes) in zip(starts, points):
+                if key in changes:
+                    edges.append(start)
+                    values.append(changes[key])
+            try:
+                table = numpy.asarray(values, dtype=numpy.float64)
+            except (TypeError, ValueError):
+                table = numpy.asarray(values, dtype=object)
+            self.curves[key] = table[
+                numpy.searchsorted(edges, index, side="right") - 1]
+        self.knots = index * _CONTROL_BLOCK
+        self._cumulative = {}
+
+    def __contains__(self, key):
+        return key in self.curves
+
+    def peak(self, key):
+        """The largest magnitude *key* reaches."""
+        return float(numpy.max(numpy.abs(self.curves[key])))
+
+    def _blocks(self, start, end):
+        last = len(self.knots) - 1
+        return min(start // _CONTROL_BLOCK, last), min(
+            -(-end // _CONTROL_BLOCK), last)
+
+    def block(self, key, start, end):
+        """*key* for samples ``[start, end)``: a number while it holds
+        still, else one value per sample, ramping between control values."""
+        first, last = self._blocks(start, end)
+        values = self.curves[key][first:last + 1]
+        if (values == values[0]).all():
+            return values[0]
+        return numpy.interp(numpy.arange(start, end, dtype=numpy.float64),
+                            self.knots[first:last + 1], values)
+
+    def integral(self, key, positions):
+        """The running sum of *key* (per sample) up to each of *positions* —
+        an automated LFO rate integrates to its phase."""
+        curve = self.curves[key]
+        cumulative = self._cumulative.get(key)
+        if cumulative is None:
+            cumulative = numpy.concatenate(
+                ([0.0], numpy.cumsum(curve * _CONTROL_BLOCK)))
+            self._cumulative[key] = cumulative
+        positions = numpy.asarray(positions, dtype=numpy.float64)
+        b = numpy.clip(positions // _CONTROL_BLOCK, 0,
+                       len(curve) - 1).astype(numpy.int64)
+        return cumulative[b] + (positions - b * _CONTROL_BLOCK) * curve[b]
+
+    def runs(self, keys, start, end):
+        """Split ``[start, end)`` where any of the stepped *keys* changes.
+
+        Yields ``(lo, hi, values)`` with *values* the keys' settings over
+        the run.
+        """
+        keys = [k for k in keys if k in self.curves]
+        last = len(self.knots) - 1
+        first = min(start // _CONTROL_BLOCK, last)
+        last = min((end - 1) // _CONTROL_BLOCK, last)
+        edges = [first]
+        for key in keys:
+            values = self.curves[key][first:last + 1]
+            edges.extend((numpy.flatnonzero(values[1:] != values[:-1])
+                          + first + 1).tolist())
+        edges = sorted(set(edges))
+        bounds = [start] + [b * _CONTROL_BLOCK for b in edges[1:]] + [end]
+        for b, lo, hi in zip(edges, bounds, bounds[1:]):
+            yield lo, hi, {k: self.curves[k][b] for k in keys}
+
+
+class EffectChain:
+    """A Part's effects, run a block at a time with their state carried
+    from one block to the next.
+
+    Signal chain: saturation → tremolo → distortion → cabinet → chorus
+    → phaser → highpass → lowpass → delay → reverb, configured by an
+    effects params dict (the keys of :meth:`Part.set`). Filter memory,
+    delay lines, LFO phase and reverb tails persist between calls to
+    :meth:`process`, so feeding a signal through in blocks of any size
+    matches processing it whole — which is how the offline renderer,
+    :func:`render_score_iter` and the ``LiveEngine`` channels all run
+    the same code::
+
+        >>> chain = EffectChain({"lowpass": 2000, "delay_mix": 0.3})
+        >>> for block in blocks:
+        ...     out = chain.process(block)
+        >>> chain.set(lowpass=800)        # picked up by the next block
+
+    *length* is the total number of samples the chain will see, when
+    that's known: the phaser's control grid and the delay taps stop at
+    the end of the signal, exactly as a whole-buffer render does. Leave
+    it ``None`` for an open-ended stream. Parameters can change between
+    blocks; each effect keeps its memory across the change where its
+    shape allows (a new reverb type or decay starts a fresh tail).
+    ``skip_reverb`` leaves reverb to the stereo mixer, as Parts do.
+
+    *automation* is a Part's automation compiled to control rate: the
+    chain reads the automated parameters from it sample by sample as the
+    signal goes through, without restarting any effect.
+    """
+
+    def __init__(self, params=None, length=None, *, skip_reverb=False,
+                 sample_rate=None, automation=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.params = dict(params or {})
+        self.length = length
+        self.skip_reverb = skip_reverb
+        self.sample_rate = sample_rate
+        self.automation = automation
+        self.pos = 0
+        self._stages = {}
+
+    @classmethod
+    def for_part(cls, part, length=None, automation=None):
+        """The chain for *part*'s effect settings (reverb is left to the
+        stereo mixer), following *automation* if given."""
+        return cls(_part_effect_params(part), length, skip_reverb=True,
+                   automation=automation)
+
+    @property
+    def active(self):
+        """True if any effect in the chain is switched on."""
+        auto = self.automation
+        return any(self.params.get(k, 0) > 0
+                   or (auto is not None and k in auto and auto.peak(k) > 0)
+                   for k in _EFFECT_KEYS)
+
+    def set(self, **params):
+        """Update parameters from the next block on. Returns the chain."""
+        self.params.update(params)
+        return self
+
+    def reset(self):
+        """Forget all effect state, as if no signal had gone through."""
+        self.pos = 0
+        self._stages.clear()
+
+    def _stage(self, name, key, build):
+        """The state of effect *name*, built by ``build(old)`` the first
+        time and again whenever its *key* settings change."""
+        entry = self._stages.get(name)
+        if entry is None or entry[0] != key:
+            entry = (key, build(None if entry is None else entry[1]))
+            self._stages[name] = entry
+        return entry[1]
+
+    def process(self, x):
+        """Run one block through the chain and return it."""
+        auto = self.automation
+        if auto is None or len(x) == 0:
+            return self._run(x, self.params)
+        # Stepped parameters split the block into runs; within a run the
+        # smooth ones come in per sample
+        stepped = [k for k in auto.curves if k not in _SMOOTH_PARAMS
+                   and not (self.skip_reverb and k in _REVERB_PARAMS)]
+        smooth = [k for k in auto.curves if k in _SMOOTH_PARAMS]
+        start = self.pos
+        pieces = []
+        for lo, hi, values in auto.runs(stepped, start, start + len(x)):
+            p = dict(self.params, **values)
+            for key in smooth:
+                p[key] = auto.block(key, lo, hi)
+            pieces.append(self._run(x[lo - start:hi - start], p))
+        return pieces[0] if len(pieces) == 1 else numpy.concatenate(pieces)
+
+    def _run(self, x, p):
+        sr, pos, n = self.sample_rate, self.pos, len(x)
+        if n == 0:
+            return x
+        if _on(p, "saturation"):
+            x = _apply_saturation(x, amount=p["saturation"])
+        if _on(p, "tremolo_depth"):
+            if self._automated("tremolo_rate"):
+                sweep = self._sweep("tremolo_rate", numpy.arange(pos, pos + n))
+            else:
+                t = numpy.arange(pos, pos + n, dtype=numpy.float64) / sr
+                sweep = 2 * numpy.pi * p.get("tremolo_rate", 5.0) * t
+            lfo = 1.0 - p["tremolo_depth"] * 0.5 * (1.0 + numpy.sin(sweep))
+            x = (x * lfo).astype(numpy.float32)
+        if _on(p, "distortion_mix"):
+            x = _apply_distortion(x, drive=p.get("distortion_drive", 3.0),
+                                  mix=p["distortion_mix"])
+        if _on(p, "cabinet"):
+            x = self._cabinet(x, p)
+        if _on(p, "chorus_mix"):
+            x = self._chorus(x, p)
+        if _on(p, "phaser_mix"):
+            x = self._phase(x, p)
+        for key in ("highpass", "lowpass"):
+            cutoff = p.get(key, 0)
+            if 0 < cutoff < sr / 2:
+                x = self._filter(key, x, cutoff, p.get(key + "_q", 0.707))
+        if _on(p, "delay_mix") and int(p.get("delay_time", 0.375) * sr) > 0:
+            x = self._delay(x, p)
+        if not self.skip_reverb and _on(p, "reverb_mix"):
+            mix = p["reverb_mix"]
+            x = x * (1 - mix) + self._reverb(p).process(x) * mix
+        self.pos += n
+        return x.astype(numpy.float32, copy=False)
+
+    def _automated(self, key):
+        return self.automation is not None and key in self.automation
+
+    def _sweep(self, key, positions):
+        """The phase (radians) of an LFO whose rate *key* is automated, at
+        sample *positions*."""
+        return 2 * numpy.pi * self.automation.integral(
+            key, positions) / self.sample_rate
+
+    @staticmethod
+    def _carry(filters, old):
+        """``[b, a, zi]`` stages for *filters*, keeping *old* memory."""
+        stages = []
+        for i, f in enumerate(filters):
+            if f is None:
+                stages.append(None)
+                continue
+            zi = numpy.zeros(max(len(f[0]), len(f[1])) - 1)
+            if old is not None and old[i] is not None and len(old[i][2]) == len(zi):
+                zi = old[i][2]
+            stages.append([f[0], f[1], zi])
+        return stages
+
+    def _cabinet(self, x, p):
+        brightness = p.get("cabinet_brightness", 0.5)
+
+        def build(old):
+            filters = _cabinet_filters(brightness, self.sample_rate)
+            if self.length is not None and self.length <= 10:
+                filters = (None,) + filters[1:]
+            return self._carry(filters, old)
+
+        highpass, lowpass, presence = self._stage("cabinet", brightness, build)
+        for stage in (highpass, lowpass):
+            if stage is not None:
+                x, stage[2] = scipy.signal.lfilter(stage[0], stage[1], x,
+                                                   zi=stage[2])
+                x = x.astype(numpy.float32)
+        if presence is not None:
+            bump, presence[2] = scipy.signal.lfilter(
+                presence[0], presence[1], x, zi=presence[2])
+            x = x + bump.astype(numpy.float32) * 0.3 * brightness
+        return x
+
+    def _filter(self, key, x, cutoff, q):
+        coeffs = _highpass_coeffs if key == "highpass" else _lowpass_coeffs
+        stage = self._stage(key, (cutoff, q), lambda old: self._carry(
+            [coeffs(cutoff, q, self.sample_rate)], old))[0]
+        x, stage[2] = scipy.signal.lfilter(stage[0], stage[1], x, zi=stage[2])
+        return x.astype(numpy.float32)
+
+    @staticmethod
+    def _history(size, old):
+        """A history line of *size* samples, ending with *old*'s latest."""
+        hist = numpy.zeros(size, dtype=numpy.float32)
+        if old is not None and size:
+            keep = min(size, len(old))
+            hist[size - keep:] = old[len(old) - keep:]
+        return hist
+
+    def _chorus(self, x, p):
+        sr, n = self.sample_rate, len(x)
+        mix = p["chorus_mix"]
+        depth = p.get("chorus_depth", 0.003)
+        # An automated depth reserves its deepest reach up front
+        widest = (self.automation.peak("chorus_depth")
+                  if self._automated("chorus_depth") else abs(depth))
+        reach = int((0.007 + widest) * sr) + 2
+        hist = self._stage("chorus", reach,
+                           lambda old: self._history(reach, old))
+        if self._automated("chorus_rate"):
+            sweep = self._sweep("chorus_rate",
+                                numpy.arange(self.pos, self.pos + n))
+        else:
+            t = numpy.arange(self.pos, self.pos + n, dtype=numpy.float32) / sr
+            sweep = 2 * numpy.pi * p.get("chorus_rate", 1.5) * t
+        lfo = depth * numpy.sin(sweep)
+        delay_samples = ((0.007 + lfo) * sr).astype(numpy.int32)
+        src = numpy.concatenate([hist, x])
+        read_pos = numpy.arange(n, dtype=numpy.int64) - delay_samples
+        valid = (read_pos + self.pos >= 0) & (read_pos < n)
+        wet = numpy.zeros(n, dtype=numpy.float32)
+        wet[valid] = src[read_pos[valid] + len(hist)]
+        self._stages["chorus"] = (reach, src[-len(hist):])
+        return x * (1 - mix * 0.5) + wet * mix * 0.5
+
+    def _phase(self, x, p):
+        sr, n = self.sample_rate, len(x)
+        mix, rate = p["phaser_mix"], p.get("phaser_rate", 0.5)
+        state = self._stage("phaser", None,
+                            lambda old: [[0.0, 0.0, 0.0, 0.0] for _ in range(4)])
+        # The allpass sweep is set once per 64-sample cell of the whole
+        # signal, so cells may straddle blocks.
+        end = self.pos + n
+        cells = numpy.arange(self.pos // 64, (end - 1) // 64 + 1)
+        ends = cells * 64 + 64
+        if self.length is not None:
+            ends = numpy.minimum(ends, max(self.length, end))
+        lens = numpy.diff(numpy.minimum(ends, end), prepend=self.pos)
+        mids = (cells * 64 + ends) // 2
+        if self._automated("phaser_rate"):
+            sweep = self._sweep("phaser_rate", mids)
+        else:
+            sweep = 2 * numpy.pi * rate * (mids.astype(numpy.float64) / sr)
+        lfo = 0.5 + 0.5 * numpy.sin(sweep)
+        w0 = 2 * numpy.pi * 200.0 * (20.0 ** lfo) / sr
+        alpha = numpy.sin(w0) / 2.0  # Q=0.5 for wide sweep
+        a0 = 1 + alpha
+        c0, c1 = (1 - alpha) / a0, -2 * numpy.cos(w0) / a0
+        wet = _allpass_cells(x.astype(numpy.float64), c0, c1, lens, state)
+        return (x * (1 - mix) + wet.astype(numpy.float32) * mix).astype(
+            numpy.float32)
+
+    def _delay(self, x, p):
+        n = len(x)
+        mix = p["delay_mix"]
+        delay_samples = int(p.get("delay_time", 0.375) * self.sample_rate)
+        feedback = p.get("delay_feedback", 0.4)
+        taps = []
+        gain = 1.0
+        for i in range(8):
+            gain *= feedback
+            if gain < 0.01 or (self.length is not None
+                               and delay_samples * (i + 1) >= self.length):
+                break
+            taps.append((delay_samples * (i + 1), gain))
+        size = taps[-1][0] if taps else 0
+        hist = self._stage("delay", size, lambda old: self._history(size, old))
+        src = numpy.concatenate([hist, x])
+        wet = numpy.zeros(n, dtype=numpy.float32)
+        for offset, gain in taps:
+            wet += src[size - offset:size - offset + n] * gain
+        self._stages["delay"] = (size, src[len(src) - size:])
+        return x * (1 - mix) + wet * mix
+
+    def _reverb(self, p):
+        sr = self.sample_rate
+        reverb_type = p.get("reverb_type", "algorithmic")
+        decay = p.get("reverb_decay", 1.0)
+        if reverb_type in _IR_DURATIONS:
+            return self._stage("reverb", (reverb_type, None), lambda old:
+                               _Convolver(reverb_type, sr))
+        return self._stage("reverb", (reverb_type, decay),
+                           lambda old: _StreamReverb(decay, sr))
+
+
+def _on(params, key):
+    """True if effect *key* is up anywhere in *params* (a number, or one
+    value per sample when automated)."""
+    return numpy.max(params.get(key, 0)) > 0
 
 
 def _pan_to_stereo(mono, pan=0.0):
@@ -5572,7 +6666,7 @@ def _pan_to_stereo(mono, pan=0.0):
 
 def _master_compress(samples, threshold=0.7, ratio=4.0, attack=0.002,
                      release=0.05, makeup=True, limiter=True,
-                     sample_rate=SAMPLE_RATE):
+                     sample_rate=None):
     """Master bus compressor with brick-wall limiter.
 
     Makes the mix louder, punchier, and more cohesive. Reduces the
@@ -5597,6 +6691,8 @@ def _master_compress(samples, threshold=0.7, ratio=4.0, attack=0.002,
     Returns:
         Float32 array — compressed and limited.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     if len(samples) == 0:
         return samples
 
@@ -5698,7 +6794,7 @@ def _dc_block(x):
 
 
 def _master_bus(stereo, threshold=0.7, ratio=4.0, attack=0.002,
-                release=0.05, ceiling=0.98, sample_rate=SAMPLE_RATE):
+                release=0.05, ceiling=0.98, sample_rate=None):
     """Stereo-linked master bus: DC block + glue compression + soft limiter.
 
     Gain reduction is detected once from the *louder* of the two channels
@@ -5715,6 +6811,8 @@ def _master_bus(stereo, threshold=0.7, ratio=4.0, attack=0.002,
     Returns:
         Float32 ``(N, 2)`` mastered buffer.
     """
+    if sample_rate is None:
+        sample_rate = _rate()
     n = stereo.shape[0]
     if n == 0:
         return stereo
@@ -5776,291 +6874,1194 @@ def _resolve_envelope(name):
     return _map.get(name, Envelope.PIANO.value)
 
 
-def _build_tempo_map(score):
-    """Return sorted list of (beat, samples_per_beat) tuples."""
-    changes = [(0.0, int(SAMPLE_RATE * 60.0 / score.bpm))]
-    for beat, bpm in sorted(score._tempo_changes):
-        changes.append((beat, int(SAMPLE_RATE * 60.0 / bpm)))
-    return changes
+class TempoMap:
+    """Beat ↔ sample conversion for a tempo that changes over time.
 
+    Built from a starting tempo plus ``(beat, bpm)`` changes — or
+    ``(beat, bpm, ramp)`` to glide linearly from the tempo in effect at
+    *beat* to *bpm* over *ramp* beats (accelerando / ritardando). Each
+    segment's start sample is precomputed in floating point, so a
+    conversion is one :func:`numpy.searchsorted` plus a closed-form step
+    within the segment, and rounding never accumulates across changes.
 
-def _beat_to_sample(beat, tempo_map):
-    """Convert a beat position to a sample position using tempo map."""
-    sample = 0
-    prev_beat = 0.0
-    prev_spb = tempo_map[0][1]
-    for change_beat, spb in tempo_map[1:]:
-        if beat <= change_beat:
-            break
-        sample += int((change_beat - prev_beat) * prev_spb)
-        prev_beat = change_beat
-        prev_spb = spb
-    sample += int((beat - prev_beat) * prev_spb)
-    return sample
+    Example::
 
+        >>> tm = TempoMap(120, [(8.0, 90), (16.0, 140, 4.0)])
+        >>> tm.beat_to_sample([0.0, 8.0, 20.0])
+        array([     0, 176400, 367626])
+        >>> tm.sample_to_beat(176400)
+        8.0
+    """
 
-def _total_samples_from_tempo_map(total_beats, tempo_map):
-    """Compute total samples accounting for tempo changes."""
-    return _beat_to_sample(total_beats, tempo_map)
+    def __init__(self, bpm, changes=(), sample_rate=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.sample_rate = sample_rate
+        changes = sorted(changes)
+        points = [(0.0, float(bpm), 0.0)]     # (start beat, bpm, bpm/beat)
+        for k, change in enumerate(changes):
+            beat, bpm = float(change[0]), float(change[1])
+            ramp = float(change[2]) if len(change) > 2 else 0.0
+            if ramp > 0:
+                start_beat, start_bpm, slope = points[-1]
+                from_bpm = start_bpm + slope * (beat - start_beat)
+                points.append((beat, from_bpm, (bpm - from_bpm) / ramp))
+                # Hold the target tempo after the ramp, unless the next
+                # change arrives first
+                if k + 1 == len(changes) or beat + ramp < changes[k + 1][0]:
+                    points.append((beat + ramp, bpm, 0.0))
+            else:
+                points.append((beat, bpm, 0.0))
+        self.beats = numpy.array([p[0] for p in points])
+        self.bpm = numpy.array([p[1] for p in points])
+        self.slope = numpy.array([p[2] for p in points])
+        self.samples = numpy.zeros(len(points))
+        for k in range(1, len(points)):
+            self.samples[k] = self.samples[k - 1] + self._span(
+                k - 1, self.beats[k] - self.beats[k - 1])
+
+    @classmethod
+    def from_score(cls, score, sample_rate=None):
+        """The tempo map of *score* (its ``bpm`` and ``set_tempo`` calls)."""
+        if sample_rate is None:
+            sample_rate = _rate()
+        return cls(score.bpm, score._tempo_changes, sample_rate)
+
+    def __len__(self):
+        return len(self.beats)
+
+    def __repr__(self):
+        return f"<TempoMap {len(self)} segments>"
+
+    def _span(self, seg, dx):
+        """Samples covered by *dx* beats from the start of segment *seg*."""
+        per_minute = self.sample_rate * 60.0
+        bpm, slope = self.bpm[seg], self.slope[seg]
+        ramping = numpy.abs(slope) > 1e-12
+        safe = numpy.where(ramping, slope, 1.0)
+        return numpy.where(
+            ramping,
+            per_minute * numpy.log1p(safe * dx / bpm) / safe,
+            dx * per_minute / bpm)
+
+    def beat_to_sample(self, beat):
+        """Sample position of *beat* (a number or an array of beats)."""
+        beat = numpy.asarray(beat, dtype=numpy.float64)
+        # A beat exactly on a change belongs to the segment before it
+        seg = numpy.searchsorted(self.beats[1:], beat, side="left")
+        pos = self.samples[seg] + self._span(seg, beat - self.beats[seg])
+        pos = numpy.floor(pos + 1e-6).astype(numpy.int64)
+        return int(pos) if pos.ndim == 0 else pos
+
+    def seconds(self, beat):
+        """Time of *beat* in seconds, unrounded."""
+        beat = numpy.asarray(beat, dtype=numpy.float64)
+        seg = numpy.searchsorted(self.beats[1:], beat, side="left")
+        pos = self.samples[seg] + self._span(seg, beat - self.beats[seg])
+        pos = pos / self.sample_rate
+        return float(pos) if pos.ndim == 0 else pos
+
+    def sample_to_beat(self, sample):
+        """Beat position at *sample* (a number or an array) — the inverse
+        of :meth:`beat_to_sample`."""
+        sample = numpy.asarray(sample, dtype=numpy.float64)
+        seg = numpy.maximum(
+            numpy.searchsorted(self.samples, sample, side="right") - 1, 0)
+        dt = (sample - self.samples[seg]) / (self.sample_rate * 60.0)
+        bpm, slope = self.bpm[seg], self.slope[seg]
+        ramping = numpy.abs(slope) > 1e-12
+        safe = numpy.where(ramping, slope, 1.0)
+        dx = numpy.where(ramping, bpm * numpy.expm1(dt * safe) / safe,
+                         dt * bpm)
+        beat = self.beats[seg] + dx
+        return float(beat) if beat.ndim == 0 else beat
+
+    def bpm_at(self, beat):
+        """The tempo in effect at *beat*."""
+        seg = int(numpy.searchsorted(self.beats, beat, side="right")) - 1
+        seg = max(seg, 0)
+        return float(self.bpm[seg] + self.slope[seg] * (beat - self.beats[seg]))
+
+
+def _beat_positions(beats, samples_per_beat, tempo_map=None):
+    """Sample positions of *beats* (an array): through *tempo_map* when the
+    tempo changes, else on the fixed ``samples_per_beat`` grid."""
+    if tempo_map is not None and len(tempo_map) > 1:
+        return tempo_map.beat_to_sample(beats)
+    return (numpy.asarray(beats, dtype=numpy.float64)
+            * samples_per_beat).astype(numpy.int64)
 
 
 # Persistent cache of synthesised note waveforms, keyed by
 # (synth_fn, hz, n_samples, sorted-kwargs). Synths are deterministic per
 # pitch, so an identical note is never resynthesised — across parts and
-# across repeated renders. Bounded with FIFO eviction so a long session
-# doesn't grow without limit.
-_SYNTH_WAVE_CACHE: dict[tuple, numpy.ndarray] = {}
-_SYNTH_WAVE_CACHE_MAX = 512
+# across repeated renders. Bounded by bytes with LRU eviction so a long
+# session doesn't grow without limit.
+_SYNTH_WAVE_CACHE = AudioCache(256 * 1024 * 1024)
+
+# Single cycles of the tiled synths, keyed by (synth_fn, hz,
+# sorted-kwargs) — a few KB each, mixed into chords by _synth_stack.
+_SYNTH_CYCLE_CACHE = AudioCache(16 * 1024 * 1024)
+
+# ADSR gain curves, keyed by (a, d, s, r, n, sample_rate) — see
+# _adsr_envelope. A Part reuses a handful of note lengths.
+_ENVELOPE_CACHE = AudioCache(32 * 1024 * 1024)
+
+
+# Optional on-disk layer beneath _SYNTH_WAVE_CACHE. Point the
+# PYTHEORY_CACHE_DIR environment variable at a directory and every
+# synthesised note is also saved there as a content-addressed .npy file,
+# memory-mapped back on load — so a fresh process (a CLI run, a batch
+# job, docs/generate_audio.py) reuses yesterday's waveforms instead of
+# resynthesising them. PYTHEORY_CACHE_MAX_MB caps the directory size
+# (default 1024); the least recently used files are pruned first.
+# Bump _DISK_CACHE_VERSION whenever synth output changes without a
+# release (every release already gets its own keys).
+_DISK_CACHE_VERSION = 2
+_DISK_CACHE_MAX_MB = 1024
+_disk_cache_unpruned = 0  # bytes written since the last prune
+_disk_cache_lock = threading.Lock()  # guards _disk_cache_unpruned
+
+
+def _disk_cache_path(synth_fn, hz, n_samples, skw):
+    """Return the cache file for a note, or ``None`` if it can't be cached.
+
+    *n_samples* is ``None`` for a prefix-stable synth's shared render.
+    Only module-level synths with plain scalar kwargs get a file: a
+    closure or lambda has no stable identity across processes, and an
+    array kwarg has no stable repr.
+    """
+    cache_dir = os.environ.get("PYTHEORY_CACHE_DIR")
+    if not cache_dir:
+        return None
+    qualname = getattr(synth_fn, "__qualname__", "<unknown>")
+    if "<" in qualname:
+        return None
+    for value in skw.values():
+        if not isinstance(value, (bool, int, float, str, type(None))):
+            return None
+    import hashlib
+    from . import __version__
+    ident = (synth_fn.__module__, qualname, __version__,
+             _DISK_CACHE_VERSION, float(hz),
+             None if n_samples is None else int(n_samples),
+             sorted(skw.items()))
+    if _rate() != SAMPLE_RATE:
+        # Only other rates extend the key, so existing caches stay valid.
+        ident += (_rate(),)
+    ident = repr(ident)
+    digest = hashlib.sha1(ident.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, digest[:2], digest + ".npy")
+
+
+def _disk_cache_load(path):
+    """Memory-map a cached note, or return ``None`` on a miss."""
+    try:
+        wave = numpy.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(path)  # mark as recently used for LRU pruning
+    except OSError:
+        pass
+    return numpy.asarray(wave)  # plain read-only view of the mapping
+
+
+def _disk_cache_store(path, wave):
+    """Atomically write a note to the disk cache.
+
+    Each writer saves to its own temp file and renames it into place, so
+    concurrent processes never see a half-written file — at worst two of
+    them write the same bytes and the last rename wins.
+    """
+    global _disk_cache_unpruned
+    import tempfile
+    folder = os.path.dirname(path)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            numpy.save(f, wave)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+    limit = _disk_cache_limit()
+    # Render threads store notes concurrently; only the one that crosses
+    # the threshold prunes, and it walks the directory outside the lock.
+    with _disk_cache_lock:
+        _disk_cache_unpruned += wave.nbytes
+        prune = _disk_cache_unpruned > limit // 16
+        if prune:
+            _disk_cache_unpruned = 0
+    if prune:
+        _prune_disk_cache(os.path.dirname(folder), limit)
+
+
+def _disk_cache_limit():
+    """Byte cap for the disk cache, from ``PYTHEORY_CACHE_MAX_MB``."""
+    try:
+        mb = float(os.environ.get("PYTHEORY_CACHE_MAX_MB", _DISK_CACHE_MAX_MB))
+    except ValueError:
+        mb = _DISK_CACHE_MAX_MB
+    return int(mb * 1024 * 1024)
+
+
+def _prune_disk_cache(cache_dir, limit):
+    """Delete least recently used cache files until under *limit* bytes.
+
+    Also clears out temp files a crashed writer left behind. Files that
+    vanish mid-scan (another process pruning) are skipped.
+    """
+    entries = []
+    total = 0
+    stale = time.time() - 3600
+    for root, _dirs, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith(".tmp"):
+                if st.st_mtime < stale:
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+            elif name.endswith(".npy"):
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= limit:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _synth_prefix_cached(synth_fn, hz, n_samples, skw):
+    """Return a note as a prefix view of one shared, longest-yet render.
+
+    Only valid for ``prefix_stable`` synths. The cache keeps a single
+    render per (synth, pitch, kwargs) together with the index of its
+    loudest sample, and re-renders only when a longer note comes along.
+    Returns ``None`` when the note would end before that peak — a synth
+    that normalises would scale such a note differently, so the caller
+    synthesises it exactly instead.
+    """
+    key = (synth_fn, hz, None, tuple(sorted(skw.items())), _rate())
+    entry = _SYNTH_WAVE_CACHE.get(key)
+    if entry is None or len(entry[0]) < n_samples:
+        path = _disk_cache_path(synth_fn, hz, None, skw)
+        wave = _disk_cache_load(path) if path else None
+        if wave is None or len(wave) < n_samples:
+            # Grow geometrically so a run of ever-longer notes costs a
+            # handful of renders, not one each.
+            length = n_samples
+            if entry is not None:
+                length = max(length, 2 * len(entry[0]))
+            wave = _synth_render(synth_fn, hz, length, skw)
+            wave.flags.writeable = False
+            if path:
+                _disk_cache_store(path, wave)
+        peak = int(numpy.argmax(numpy.abs(wave)))
+        entry = (wave, peak)
+        _SYNTH_WAVE_CACHE[key] = entry
+    wave, peak = entry
+    if n_samples <= peak:
+        return None
+    return wave[:n_samples]
 
 
 def _synth_wave_cached(synth_fn, hz, n_samples, skw):
     """Return a memoised synthesised note waveform.
 
-    The returned array is shared; callers treat it as read-only (the
-    envelope and gain stages already allocate new arrays).
+    The returned array is shared and read-only (the envelope and gain
+    stages already allocate new arrays). Misses fall
+    through to the disk cache when ``PYTHEORY_CACHE_DIR`` is set.
+    Prefix-stable synths share one render across every note length.
     """
-    key = (synth_fn, hz, n_samples, tuple(sorted(skw.items())))
+    if (n_samples >= _PREFIX_MIN_SAMPLES
+            and getattr(synth_fn, "prefix_stable", False)):
+        wave = _synth_prefix_cached(synth_fn, hz, n_samples, skw)
+        if wave is not None:
+            return wave
+    key = (synth_fn, hz, n_samples, tuple(sorted(skw.items())), _rate())
     wave = _SYNTH_WAVE_CACHE.get(key)
     if wave is None:
-        wave = synth_fn(hz, n_samples=n_samples, **skw)
-        if len(_SYNTH_WAVE_CACHE) >= _SYNTH_WAVE_CACHE_MAX:
-            _SYNTH_WAVE_CACHE.pop(next(iter(_SYNTH_WAVE_CACHE)))  # evict oldest
+        path = _disk_cache_path(synth_fn, hz, n_samples, skw)
+        wave = _disk_cache_load(path) if path else None
+        if wave is None:
+            wave = _synth_render(synth_fn, hz, n_samples, skw)
+            if path:
+                _disk_cache_store(path, wave)
+        wave.flags.writeable = False
         _SYNTH_WAVE_CACHE[key] = wave
     return wave
 
 
+def _synth_cycle_cached(synth_fn, hz, skw):
+    """One float32 cycle of a tiled synth at *hz*, memoised; ``None``
+    when *hz* is above the sample rate (no whole-sample cycle)."""
+    key = (synth_fn, hz, tuple(sorted(skw.items())), _rate())
+    cycle = _SYNTH_CYCLE_CACHE.get(key)
+    if cycle is None:
+        cycle_len = int(key[-1] / float(hz))
+        if cycle_len < 1:
+            return None
+        cycle = _synth_render(synth_fn, hz, cycle_len, skw)
+        cycle.flags.writeable = False
+        _SYNTH_CYCLE_CACHE[key] = cycle
+    return cycle
+
+
+def _synth_stack(synth_fn, freqs, n_samples, gains=None, skw=None,
+                 out=None):
+    """Sum *synth_fn* at every frequency in *freqs*, voice by voice.
+
+    Returns a float32 array in sample units (``SAMPLE_PEAK`` = full
+    scale) holding the sum of the voices, each scaled by its entry in
+    *gains* when given. With unit gains the sum is exact, so a chord
+    matches adding up the individual notes sample for sample. Pass a
+    float32 *out* of *n_samples* to mix into it (it is cleared first)
+    instead of a new array.
+
+    Each voice is still one Python-level add: tiled single-cycle synths
+    add their cached cycle into *out* a period at a time, with no
+    per-voice note array, and other synths add their cached note.
+    Synthesizing every voice at once as a 2-D (voices x samples) array
+    measured ~20x slower than these cached adds, so the synths keep
+    their one-frequency signature.
+    """
+    skw = skw or {}
+    if out is None:
+        out = numpy.zeros(n_samples, dtype=numpy.float32)
+    else:
+        out.fill(0)
+    if gains is None:
+        gains = (1,) * len(freqs)
+    for hz, gain in zip(freqs, gains):
+        cycle = (_synth_cycle_cached(synth_fn, hz, skw)
+                 if synth_fn in _TILED_SYNTHS else None)
+        if cycle is not None:
+            _tile_add(out, cycle if gain == 1 else cycle * numpy.float32(gain))
+        else:
+            wave = _synth_wave_cached(synth_fn, hz, n_samples, skw)
+            out += wave if gain == 1 else wave * numpy.float32(gain)
+    return out
+
+
+# Articulation names, indexed by NoteTable.articulation code. Unknown
+# names compile to 0 (plain), which is how the renderer treats them.
+ARTICULATIONS = ("", "staccato", "legato", "marcato", "tenuto", "accent",
+                 "fermata")
+
+# Per articulation code: (duration, velocity, envelope attack) multipliers
+_ARTICULATION_MULTS = numpy.array([
+    (1.0, 1.0, 1.0),
+    (0.4, 1.0, 1.0),     # staccato: short and bouncy
+    (1.15, 1.0, 1.0),    # legato: slight overlap into the next note
+    (1.0, 1.25, 0.3),    # marcato: heavier, sharper attack
+    (1.0, 1.0, 1.8),     # tenuto: softer attack, full duration
+    (1.0, 1.2, 1.0),     # accent
+    (1.5, 1.0, 1.0),     # fermata: held longer
+])
+
+
+class NoteTable:
+    """A list of Notes compiled to NumPy columns — one row per note.
+
+    The columns describe the notes as written:
+
+    - ``beat`` / ``beats`` — start and length in beats (float64).
+      ``Part.hold()`` notes start where the next note does.
+    - ``hz`` — ``(rows, voices)`` float64 pitches, one column per chord
+      tone, zero-padded; ``voices`` counts the real ones per row.
+    - ``velocity`` (int64), ``articulation`` (int8 code into
+      :data:`ARTICULATIONS`), ``bend`` (semitones, float64), ``hold``
+      and ``rest`` (bool), and ``drum`` — the ``DrumSound`` value of a
+      ``Part.hit()`` row, else -1.
+    - ``midi`` — ``(rows, voices)`` MIDI note numbers, -1 where a tone
+      has none; worked out on first use.
+
+    Given a tempo (*bpm* and *samples_per_beat*), :meth:`compile` also
+    schedules the notes the way the renderer plays them, adding
+    ``nominal`` (grid position in samples), ``start`` (after swing and
+    humanize), ``n_samples`` (after articulation, trimmed to
+    *total_samples*), ``played_velocity`` and the ``sounding`` mask.
+    ``hz`` then includes any ``analog`` drift.
+
+    Example::
+
+        >>> table = NoteTable.compile(part.notes)
+        >>> table.beat[:4]
+        array([0. , 1. , 1.5, 2. ])
+    """
+
+    def __init__(self, notes):
+        self.notes = notes
+        self._midi = None
+
+    def __len__(self):
+        return len(self.notes)
+
+    def __repr__(self):
+        return f"<NoteTable {len(self)} notes>"
+
+    @classmethod
+    def compile(cls, notes, *, temperament="equal", reference_pitch=440.0,
+                bpm=None, samples_per_beat=None, total_samples=None,
+                tempo_map=None, swing=0.0, humanize=0.0, analog=0.0):
+        """Compile *notes* into a table, scheduling them if a tempo is given.
+
+        Humanize and analog drift draw from :mod:`random` in the same
+        order as note-by-note rendering, so a seeded render is unchanged.
+        """
+        from .rhythm import _DrumTone
+        import random as _rnd
+
+        table = cls(notes)
+        n = len(notes)
+        beats = numpy.empty(n, dtype=numpy.float64)
+        velocity = numpy.empty(n, dtype=numpy.int64)
+        articulation = numpy.zeros(n, dtype=numpy.int8)
+        bend = numpy.zeros(n, dtype=numpy.float64)
+        hold = numpy.zeros(n, dtype=bool)
+        rest = numpy.zeros(n, dtype=bool)
+        drum = numpy.full(n, -1, dtype=numpy.int16)
+        voices = numpy.zeros(n, dtype=numpy.int16)
+        codes = {name: code for code, name in enumerate(ARTICULATIONS)}
+        pitch_of = {}
+        rows = []
+        for i, note in enumerate(notes):
+            beats[i] = note.duration.value
+            velocity[i] = note.velocity
+            articulation[i] = codes.get(note.articulation, 0)
+            bend[i] = note.bend
+            hold[i] = note._hold
+            tone = note.tone
+            row = ()
+            if tone is None:
+                rest[i] = True
+            elif isinstance(tone, _DrumTone):
+                drum[i] = tone.sound.value
+            else:
+                tones = tone.tones if hasattr(tone, "tones") else (tone,)
+                row = []
+                for t in tones:
+                    key = (t.name, t.octave, id(getattr(t, "system", None)))
+                    hz = pitch_of.get(key)
+                    if hz is None:
+                        hz = pitch_of[key] = t.pitch(
+                            temperament=temperament,
+                            reference_pitch=reference_pitch)
+                    row.append(hz)
+                voices[i] = len(row)
+            rows.append(row)
+        hz = numpy.zeros((n, max(1, int(voices.max(initial=0)))))
+        for i, row in enumerate(rows):
+            hz[i, :len(row)] = row
+
+        # hold() notes don't advance the beat position
+        beat = numpy.zeros(n, dtype=numpy.float64)
+        if n > 1:
+            numpy.cumsum(numpy.where(hold, 0.0, beats)[:-1], out=beat[1:])
+
+        table.beat, table.beats, table.hz, table.voices = beat, beats, hz, voices
+        table.velocity, table.articulation, table.bend = velocity, articulation, bend
+        table.hold, table.rest, table.drum = hold, rest, drum
+        if samples_per_beat is None:
+            return table
+
+        nominal = _beat_positions(beat, samples_per_beat, tempo_map)
+        start = nominal.copy()
+        # Swing: shift every other note later
+        if swing > 0.0:
+            start[1::2] += int(swing * 0.5 * samples_per_beat)
+        mults = _ARTICULATION_MULTS[articulation]
+        dur_ms = beats * 60_000 / bpm * mults[:, 0]
+        n_samples = (_rate() * dur_ms / 1000).astype(numpy.int64)
+        played = numpy.minimum(127, (velocity * mults[:, 1]).astype(numpy.int64))
+
+        if humanize > 0.0 or analog > 0:
+            # Timing offset (±fraction of a beat), then — for notes that
+            # sound — analog pitch drift and velocity jitter, note by note
+            max_offset = int(humanize * 0.05 * samples_per_beat)
+            vel_jitter = int(humanize * 15)
+            for i in numpy.flatnonzero(~rest).tolist():
+                if humanize > 0.0:
+                    start[i] = max(0, start[i] + _rnd.randint(-max_offset,
+                                                              max_offset))
+                length = n_samples[i]
+                if total_samples is not None:
+                    length = min(length, total_samples - start[i])
+                if length <= 0 or start[i] < 0:
+                    continue
+                if drum[i] < 0 and analog > 0:
+                    for v in range(voices[i]):
+                        hz[i, v] = hz[i, v] * (
+                            2 ** (_rnd.gauss(0, analog * 5) / 1200))
+                if humanize > 0.0:
+                    played[i] = max(1, min(127, played[i] + _rnd.randint(
+                        -vel_jitter, vel_jitter)))
+
+        if total_samples is not None:
+            n_samples = numpy.minimum(n_samples, total_samples - start)
+        table.nominal, table.start, table.n_samples = nominal, start, n_samples
+        table.played_velocity = played
+        table.sounding = ~rest & (n_samples > 0) & (start >= 0)
+        return table
+
+    @property
+    def midi(self):
+        if self._midi is None:
+            midi = numpy.full(self.hz.shape, -1, dtype=numpy.int16)
+            for i, note in enumerate(self.notes):
+                if self.voices[i]:
+                    tone = note.tone
+                    tones = tone.tones if hasattr(tone, "tones") else (tone,)
+                    for v, t in enumerate(tones):
+                        if t.midi is not None:
+                            midi[i, v] = t.midi
+            self._midi = midi
+        return self._midi
+
+
+class _ScratchArena:
+    """Reusable float32 work buffers for one render's note loop.
+
+    ``take(name, shape)`` hands out a view of the buffer called *name*,
+    growing it (geometrically) only when a longer note needs more, so a
+    whole Part renders through a handful of buffers instead of several
+    fresh arrays per note. A view holds whatever the last note left
+    there, and is only valid until *name* is taken again.
+
+    With ``reuse=False`` every ``take`` is a fresh array — for consumers
+    that hold on to the notes they're given, like the streaming renderer.
+    """
+
+    def __init__(self, reuse=True):
+        self.reuse = reuse
+        self._buffers = {}
+
+    def take(self, name, shape):
+        """An uninitialised float32 array of *shape* backed by *name*."""
+        if not self.reuse:
+            return numpy.empty(shape, dtype=numpy.float32)
+        size = shape if isinstance(shape, int) else shape[0] * shape[1]
+        buf = self._buffers.get(name)
+        if buf is None or len(buf) < size:
+            grown = 0 if buf is None else 2 * len(buf)
+            buf = numpy.empty(max(size, grown), dtype=numpy.float32)
+            self._buffers[name] = buf
+        return buf[:size].reshape(shape)
+
+
+def _periodic_runs(starts, keys, max_period=256):
+    """Find stretches of a schedule that repeat period after period.
+
+    *starts* are the events' start samples, sorted, and *keys* an
+    ``(events, columns)`` array of everything else that decides how an
+    event sounds. Returns ``(first, per, times, period)`` tuples: events
+    ``first`` to ``first + per * times`` play the same *per* events
+    *times* over, each copy *period* samples after the last. Runs don't
+    overlap, and each covers at least two periods of up to *max_period*
+    events.
+
+    An event matches its counterpart a period later only if the gap to
+    its next event matches too, so the spacing repeats exactly — to the
+    sample — and anything that varies (humanize jitter, a hit cut short
+    by the end of the render) simply breaks the run there.
+    """
+    n = len(starts)
+    if n < 2:
+        return []
+    gaps = numpy.append(numpy.diff(starts), -1)
+    rows = numpy.column_stack((gaps, keys)).astype(numpy.float64)
+    _, ids = numpy.unique(rows, axis=0, return_inverse=True)
+    ids = ids.reshape(-1)
+    found = []
+    for per in range(1, min(max_period, n // 2) + 1):
+        same = numpy.concatenate(([False], ids[per:] == ids[:-per], [False]))
+        edges = numpy.flatnonzero(same[1:] != same[:-1])
+        firsts, stops = edges[::2], edges[1::2]
+        # A run of r matches holds r // per + 1 whole periods
+        times = (stops - firsts) // per + 1
+        keep = times >= 2
+        for first, count in zip(firsts[keep].tolist(), times[keep].tolist()):
+            period = int(starts[first + per] - starts[first])
+            if period > 0:
+                found.append((count * per, first, per, count, period))
+    # Longest stretches first; keep those that don't overlap
+    runs, taken = [], numpy.zeros(n, dtype=bool)
+    for covered, first, per, times, period in sorted(
+            found, key=lambda f: (-f[0], f[2], f[1])):
+        if not taken[first:first + covered].any():
+            taken[first:first + covered] = True
+            runs.append((first, per, times, period))
+    return sorted(runs)
+
+
+def _mix_tiled(out, block, start, period, times):
+    """Mix *block* into *out* at *start* and *times* - 1 more periods on.
+
+    The block is one period's worth of events plus whatever rings past
+    the period. Cut into period-long chunks, every period that all the
+    chunks overlap gets their sum in one strided pass; only the first
+    and last few periods, where the tails run in and out, add chunks
+    one at a time. The copies must fit in *out*.
+    """
+    chunks = [block[at:at + period] for at in range(0, len(block), period)]
+    steady = numpy.zeros((period,) + block.shape[1:], dtype=numpy.float32)
+    for chunk in chunks:
+        steady[:len(chunk)] += chunk
+    lo = len(chunks) - 1
+    hi = min(times, (len(out) - start) // period)
+    if hi > lo:
+        view = out[start + lo * period:start + hi * period]
+        view.reshape((hi - lo, period) + out.shape[1:])[...] += steady
+    for j in range(times + len(chunks) - 1):
+        if lo <= j < hi:
+            continue
+        at = start + j * period
+        for c, chunk in enumerate(chunks):
+            if 0 <= j - c < times:
+                out[at:at + len(chunk)] += chunk
+
+
+def _iter_note_events(notes, samples_per_beat, total_samples,
+                      synth_fn, envelope_tuple, volume, bpm,
+                      swing=0.0, tempo_map=None, humanize=0.0,
+                      detune=0.0, spread=0.0, stereo=False,
+                      sub_osc=0.0, noise_mix=0.0,
+                      filter_attack=0.01, filter_decay=0.3,
+                      filter_sustain=0.0, filter_amount=0.0,
+                      vel_to_filter=0.0, filter_q=0.707,
+                      synth_kwargs=None, temperament="equal",
+                      reference_pitch=440.0, analog=0.0, scratch=None,
+                      table=None, rows=None):
+    """Synthesize a list of Notes one at a time, in order.
+
+    Yields ``(nominal, start, mono, spread)`` for every sounding note:
+
+    - *nominal* — the note's grid position in samples, before swing and
+      humanize offsets. It never decreases, so a consumer knows that once
+      it passes a point (plus the humanize margin) no later note can land
+      before that point.
+    - *start* — the sample where the note actually begins.
+    - *mono* — the finished float32 note (envelope, filter, velocity and
+      part volume applied), already trimmed to ``total_samples``.
+    - *spread* — an ``(n, 2)`` float32 block of detuned oscillators
+      destined for the stereo bus when ``stereo`` and ``spread`` are
+      set, else ``None``.
+
+    :func:`_render_notes_to_buf` mixes the whole list into a buffer;
+    :func:`render_score_iter` pulls notes lazily as its blocks need them.
+
+    Work buffers come from *scratch*, a :class:`_ScratchArena`. With a
+    reusing arena the yielded arrays are views into it, valid only until
+    the next note is pulled; by default every note gets fresh arrays.
+
+    A caller that has already compiled the notes' :class:`NoteTable`
+    passes it as *table*, and *rows* picks which of its sounding notes
+    to synthesize (default all of them).
+    """
+    a, d, s, r = envelope_tuple
+    _skw = synth_kwargs or {}
+    if scratch is None:
+        scratch = _ScratchArena(reuse=False)
+    if table is None:
+        table = NoteTable.compile(
+            notes, temperament=temperament, reference_pitch=reference_pitch,
+            bpm=bpm, samples_per_beat=samples_per_beat,
+            total_samples=total_samples, tempo_map=tempo_map, swing=swing,
+            humanize=humanize, analog=analog)
+    if rows is None:
+        rows = numpy.flatnonzero(table.sounding)
+    for note_index in rows.tolist():
+        note = notes[note_index]
+        nominal = int(table.nominal[note_index])
+        start = int(table.start[note_index])
+        n_samples = int(table.n_samples[note_index])
+        code = int(table.articulation[note_index])
+        art = ARTICULATIONS[code]
+        art_attack_mult = float(_ARTICULATION_MULTS[code, 2])
+        vel_scale = int(table.played_velocity[note_index]) / 127.0
+        if table.drum[note_index] >= 0:
+            # Drum hit via Part.hit() — use drum synth directly
+            drum_wave = _drum_hit(int(table.drum[note_index]), n_samples)
+            mixed = scratch.take("main", len(drum_wave))
+            mixed[:] = drum_wave
+            # Staccato fade-out for drums
+            if art == 'staccato':
+                fade_len = min(int(_rate() * 0.01), len(mixed))
+                if fade_len > 0:
+                    mixed[-fade_len:] *= numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
+            end = min(start + len(mixed), total_samples)
+            mono = mixed[:end - start]
+            mono *= volume * vel_scale
+            yield (nominal, start, mono, None)
+            continue
+        # Pitches (with any analog drift) come from the table
+        pitches = table.hz[note_index, :table.voices[note_index]].tolist()
+        # Pitch bend: render at base pitch, then resample to shift
+        # pitch over time. Resampling preserves the synth's timbre
+        # perfectly — no sine waves, no retriggering.
+        bend_amt = float(table.bend[note_index])
+        if bend_amt != 0:
+            bend_type = note.bend_type
+            t_norm = numpy.linspace(0, 1, n_samples)
+
+            main = scratch.take("main", n_samples)
+            main.fill(0)
+            for hz in pitches:
+                hz_end = hz * (2 ** (bend_amt / 12))
+                # Build pitch ratio curve (1.0 = no shift)
+                if bend_type == 'smooth':
+                    ratio = (hz_end / hz) ** t_norm
+                elif bend_type == 'linear':
+                    ratio = 1.0 + (hz_end / hz - 1.0) * t_norm
+                elif bend_type == 'late':
+                    late_t = numpy.clip((t_norm - 0.6) / 0.4, 0.0, 1.0)
+                    ratio = (hz_end / hz) ** late_t
+                else:
+                    ratio = (hz_end / hz) ** t_norm
+
+                # Oscillator synths follow the bend directly
+                osc = _oscillator_for(synth_fn, _skw)
+                if osc is not None:
+                    bent = osc.render(hz * ratio)
+                    bent *= SAMPLE_PEAK
+                    main += bent
+                    continue
+
+                # Others: render a longer buffer at base pitch
+                max_ratio = max(ratio.max(), 1.0)
+                src_len = int(n_samples * max_ratio) + 100
+                src = _synth_render(synth_fn, hz, src_len, _skw)
+
+                # Variable-rate resampling: read through source
+                # at speed determined by the ratio curve
+                read_pos = numpy.cumsum(ratio)
+                read_pos = (read_pos - read_pos[0]).astype(numpy.float64)
+                # Clamp to source bounds
+                read_pos = numpy.clip(read_pos, 0, src_len - 2)
+                # Linear interpolation
+                idx = read_pos.astype(numpy.int64)
+                frac = (read_pos - idx).astype(numpy.float32)
+                main += src[idx] * (1 - frac)
+                main += src[numpy.minimum(idx + 1, src_len - 1)] * frac
+        else:
+            # Per-note kwargs (e.g. lyric for vocal synth)
+            note_skw = dict(_skw)
+            note_lyric = getattr(note, 'lyric', '')
+            if note_lyric:
+                note_skw['lyric'] = note_lyric
+            # All of the note's pitches, added voice by voice from the caches
+            main = _synth_stack(synth_fn, pitches, n_samples,
+                                skw=note_skw,
+                                out=scratch.take("main", n_samples))
+        n_main = len(pitches)
+        # Detune: add oscillators shifted by ±cents
+        detune_up = None
+        detune_down = None
+        if detune > 0:
+            up = _synth_stack(
+                synth_fn, [hz * (2 ** (detune / 1200)) for hz in pitches],
+                n_samples, skw=_skw, out=scratch.take("up", n_samples))
+            down = _synth_stack(
+                synth_fn, [hz * (2 ** (-detune / 1200)) for hz in pitches],
+                n_samples, skw=_skw, out=scratch.take("down", n_samples))
+            if spread > 0 and stereo:
+                # Spread: detuned oscillators go to opposite channels
+                up /= SAMPLE_PEAK
+                down /= SAMPLE_PEAK
+                detune_up = up
+                detune_down = down
+            else:
+                main += up
+                main += down
+                n_main *= 3
+        mixed = main
+        mixed /= SAMPLE_PEAK * n_main
+        # Sub-oscillator: octave-below sine, balanced against the
+        # main (and any mono detune) oscillators
+        if sub_osc > 0:
+            sub = _synth_stack(sine_wave, [hz / 2 for hz in pitches],
+                               n_samples, out=scratch.take("sub", n_samples))
+            sub /= SAMPLE_PEAK * len(pitches)
+            sub *= sub_osc * 0.3
+            mixed *= 1.0 - sub_osc * 0.3
+            mixed += sub
+        # Noise layer: add noise following the note
+        if noise_mix > 0:
+            noise = numpy.random.uniform(-1, 1, n_samples).astype(numpy.float32)
+            noise *= noise_mix * 0.5
+            mixed *= 1.0 - noise_mix * 0.5
+            mixed += noise
+        # Amplitude envelope (articulation may adjust attack)
+        art_a = a * art_attack_mult
+        if art_a > 0 or d > 0 or s < 1.0 or r > 0:
+            _apply_envelope(mixed, art_a, d, s, r, out=mixed)
+        # Staccato: apply a quick fade-out at the end
+        if art == 'staccato':
+            fade_len = min(int(_rate() * 0.01), len(mixed))
+            if fade_len > 0:
+                mixed[-fade_len:] *= numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
+        # Filter envelope (per-note subtractive filter sweep)
+        if filter_amount > 0:
+            base_cut = 200.0  # base cutoff before envelope opens it
+            vel_boost = vel_to_filter * vel_scale if vel_to_filter > 0 else 0.0
+            mixed = _apply_filter_envelope(
+                mixed, base_cut, filter_amount,
+                filter_attack, filter_decay, filter_sustain,
+                q=filter_q, vel_cutoff_boost=vel_boost)
+        elif vel_to_filter > 0:
+            # Velocity brightness without filter envelope
+            vel_cutoff = vel_to_filter * vel_scale + 1000
+            mixed = _apply_lowpass(mixed, vel_cutoff, q=filter_q)
+        end = min(start + len(mixed), total_samples)
+        spread_block = None
+        # Spread detuned oscillators into stereo L/R
+        if detune_up is not None:
+            spread_amt = spread
+            up_env = detune_up[:end - start]
+            down_env = detune_down[:end - start]
+            if a > 0 or d > 0 or s < 1.0 or r > 0:
+                _apply_envelope(up_env, a, d, s, r, out=up_env)
+                _apply_envelope(down_env, a, d, s, r, out=down_env)
+            gain = volume * vel_scale * 0.5 * spread_amt
+            # Right channel gets up-detuned, left gets down-detuned
+            spread_block = scratch.take("spread", (end - start, 2))
+            numpy.multiply(up_env, gain, out=spread_block[:, 1])
+            numpy.multiply(down_env, gain, out=spread_block[:, 0])
+        # Velocity and part volume in one pass, in place
+        mono = mixed[:end - start]
+        mono *= volume * vel_scale
+        yield (nominal, start, mono, spread_block)
+
+
 def _render_notes_to_buf(notes, buf, samples_per_beat, total_samples,
                          synth_fn, envelope_tuple, volume, bpm,
                          swing=0.0, tempo_map=None, humanize=0.0,
                          detune=0.0, spread=0.0, stereo_buf=None,
-                         sub_osc=0.0, noise_mix=0.0,
-                         filter_attack=0.01, filter_decay=0.3,
-                         filter_sustain=0.0, filter_amount=0.0,
-                         vel_to_filter=0.0, filter_q=0.707,
-                         synth_kwargs=None, temperament="equal",
-                         reference_pitch=440.0, analog=0.0):
-    """Render a list of Notes into an existing buffer at the correct positions."""
-    import random as _rnd
+                         **note_kw):
+    """Render a list of Notes into an existing buffer at the correct positions.
+
+    Spread detune voices go straight into ``stereo_buf`` when one is given.
+    Remaining keyword arguments are passed to :func:`_iter_note_events`.
+    Notes are built in one reused :class:`_ScratchArena` and added into
+    the buffers in place, so the loop allocates almost nothing per note.
+
+    When nothing random goes into the notes (no humanize, analog drift
+    or noise), a phrase that repeats exactly — ``Score.repeat()``, or
+    the same bar written out again — is synthesized for one period and
+    tiled across the rest with :func:`_mix_tiled`.
+    """
+    scratch = _ScratchArena()
+
+    def events(table=None, rows=None):
+        return _iter_note_events(
+            notes, samples_per_beat, total_samples, synth_fn,
+            envelope_tuple, volume, bpm, swing=swing, tempo_map=tempo_map,
+            humanize=humanize, detune=detune, spread=spread,
+            stereo=stereo_buf is not None, scratch=scratch, table=table,
+            rows=rows, **note_kw)
+
+    if (humanize > 0 or note_kw.get("analog", 0.0) > 0
+            or note_kw.get("noise_mix", 0.0) > 0):
+        _mix_note_events(events(), buf, stereo_buf)
+        return
+    table = NoteTable.compile(
+        notes, temperament=note_kw.get("temperament", "equal"),
+        reference_pitch=note_kw.get("reference_pitch", 440.0),
+        bpm=bpm, samples_per_beat=samples_per_beat,
+        total_samples=total_samples, tempo_map=tempo_map, swing=swing)
+    rows = numpy.flatnonzero(table.sounding)
+    rest = numpy.ones(len(rows), dtype=bool)
+    for first, per, times, period in _periodic_runs(
+            table.start[rows], _note_keys(table, rows)):
+        period_rows = rows[first:first + per]
+        base = int(table.start[period_rows].min())
+        span = int((table.start[period_rows]
+                    + table.n_samples[period_rows]).max()) - base
+        block = numpy.zeros(span, dtype=numpy.float32)
+        spread_block = (None if stereo_buf is None
+                        else numpy.zeros((span, 2), dtype=numpy.float32))
+        _mix_note_events(events(table, period_rows), block, spread_block,
+                         offset=base)
+        _mix_tiled(buf, block, base, period, times)
+        if spread_block is not None:
+            _mix_tiled(stereo_buf, spread_block, base, period, times)
+        rest[first:first + per * times] = False
+    _mix_note_events(events(table, rows[rest]), buf, stereo_buf)
+
+
+def _note_keys(table, rows):
+    """What decides how each of a compiled table's *rows* sounds, bar
+    its position — one row of numbers per note, for :func:`_periodic_runs`.
+    """
+    names = {}
+    words = [names.setdefault((getattr(note, "bend_type", ""),
+                               getattr(note, "lyric", "")), len(names))
+             for note in (table.notes[i] for i in rows.tolist())]
+    return numpy.column_stack((
+        table.n_samples[rows], table.played_velocity[rows],
+        table.articulation[rows], table.bend[rows], table.drum[rows],
+        table.voices[rows], table.hz[rows], words))
+
+
+def _mix_note_events(events, buf, stereo_buf, offset=0):
+    """Add :func:`_iter_note_events` output into *buf* (and any spread
+    into *stereo_buf*), each note landing at its start less *offset*."""
+    for _, start, mono, spread_block in events:
+        start -= offset
+        target = buf[start:start + len(mono)]
+        numpy.add(target, mono, out=target)
+        if spread_block is not None:
+            target = stereo_buf[start:start + len(spread_block)]
+            numpy.add(target, spread_block, out=target)
+
+
+# Legato phrases are rendered a block at a time, so a glide Part never
+# holds more than a block of curves (plus one source note) in memory.
+_LEGATO_BLOCK = 8192
+# How much of a synth's own note the resampling reader keeps per pitch, and
+# the crossfaded sustain loop inside it (shared with the live wavetables).
+_LEGATO_SOURCE_SECS = 3.0
+_LOOP_START_SECS = 1.5
+_LOOP_END_SECS = 2.75
+_LOOP_XFADE = 2048
+_LEGATO_XFADE = 256               # note-to-note crossfade of the resampler
+
+
+def _sustain_loop(wave, sustain, loop_start, loop_end, sample_rate=None):
+    """Crossfade a sustain loop into *wave* in place if the sound holds.
+
+    Only genuinely sustaining sounds loop: the envelope's *sustain* must
+    hold a real level (organ/pad/strings) AND the source must still be
+    ringing at the loop region. Struck/plucked sources (piano, guitar,
+    mallets) decay on their own and stay one-shot.
+
+    Returns:
+        ``(loop_start, loop_end)``, or ``(None, None)`` for a one-shot.
+    """
+    if sample_rate is None:
+        sample_rate = _rate()
+    if sustain < 0.7 or len(wave) <= loop_end:
+        return None, None
+    early = numpy.sqrt(numpy.mean(
+        wave[int(sample_rate * 0.2):int(sample_rate * 0.5)] ** 2))
+    late = numpy.sqrt(numpy.mean(
+        wave[loop_start:loop_start + sample_rate // 4] ** 2))
+    if not (early > 0 and late > 0.3 * early):
+        return None, None
+    xf = _LOOP_XFADE
+    fade = numpy.linspace(0.0, 1.0, xf, dtype=numpy.float32)
+    wave[loop_end - xf:loop_end] = (wave[loop_end - xf:loop_end] * (1 - fade)
+                                    + wave[loop_start - xf:loop_start] * fade)
+    return loop_start, loop_end
+
+
+class _Resampler:
+    """Plays any synth along a frequency curve by resampling its notes.
+
+    Each pitch the phrase lands on is the synth's own render of that
+    note, read at ``freq / hz`` samples per sample — so piano, strings or
+    vocal glide parts keep their real timbre. The read position follows
+    the time since the phrase began: a new pitch picks up its note at
+    the same age (no re-attack) and at the same point in the waveform's
+    cycle, with a short crossfade from the old note for synths whose
+    cycles don't line up. Sources that are still ringing at the loop
+    region loop their settled middle; decaying ones ring out. Whether a
+    source loops depends on the source alone — the phrase envelope is
+    applied on top, separately.
+    """
+
+    def __init__(self, synth_fn, skw, length):
+        self.synth_fn = synth_fn
+        self.skw = skw
+        sr = _rate()
+        self.length = min(length, int(_LEGATO_SOURCE_SECS * sr)) + 2
+        self.loop_points = (int(sr * _LOOP_START_SECS),
+                            int(sr * _LOOP_END_SECS))
+        self.elapsed = 0
+        self.hz = 0.0
+        self.pos = 0.0
+        self.wave = None
+        self.loop = (None, None)
+        self.fading = None          # (wave, loop, pos, hz, samples faded)
+
+    def _switch(self, hz):
+        sr = _rate()
+        cycle = 0.0
+        if self.wave is not None:
+            cycle = (self.pos * self.hz / sr) % 1.0
+            self.fading = (self.wave, self.loop, self.pos, self.hz, 0)
+        wave = _synth_wave_cached(self.synth_fn, hz, self.length, self.skw)
+        self.wave = wave / numpy.float32(SAMPLE_PEAK)
+        self.loop = _sustain_loop(self.wave, 1.0, *self.loop_points,
+                                  sample_rate=sr)
+        self.hz = hz
+        self.pos = float(self._wrap(
+            self.loop, (numpy.floor(self.elapsed * hz / sr) + cycle) * sr / hz))
+
+    @staticmethod
+    def _wrap(loop, positions):
+        loop_start, loop_end = loop
+        if loop_end is None:
+            return positions
+        span = loop_end - loop_start
+        return numpy.where(positions >= loop_end,
+                           loop_start + (positions - loop_start) % span,
+                           positions)
+
+    def _read(self, wave, loop, pos, ratio):
+        """Read *wave* from *pos* advancing by *ratio* per sample; returns
+        the samples and the position after them."""
+        steps = numpy.empty(len(ratio), dtype=numpy.float64)
+        steps[0] = 0.0
+        numpy.cumsum(ratio[:-1], out=steps[1:])
+        positions = self._wrap(loop, pos + steps)
+        out = numpy.zeros(len(ratio), dtype=numpy.float32)
+        inside = positions < len(wave) - 1
+        idx = positions[inside].astype(numpy.int64)
+        frac = (positions[inside] - idx).astype(numpy.float32)
+        out[inside] = wave[idx] * (1 - frac) + wave[idx + 1] * frac
+        return out, float(self._wrap(loop, positions[-1] + ratio[-1]))
+
+    def render(self, freq, pitch):
+        """Render float32 samples for a frequency curve; *pitch* gives the
+        note each sample belongs to (its target after any glide)."""
+        n = len(freq)
+        out = numpy.zeros(n, dtype=numpy.float32)
+        edges = numpy.flatnonzero(numpy.diff(pitch)) + 1
+        for lo, hi in zip([0, *edges.tolist()], [*edges.tolist(), n]):
+            hz = float(pitch[lo])
+            if hz > 0 and hz != self.hz:
+                self._switch(hz)
+            if self.wave is not None and hz > 0:
+                seg, self.pos = self._read(self.wave, self.loop, self.pos,
+                                           freq[lo:hi] / self.hz)
+                if self.fading is not None:
+                    wave, loop, pos, old_hz, done = self.fading
+                    k = min(hi - lo, _LEGATO_XFADE - done)
+                    old, pos = self._read(wave, loop, pos,
+                                          freq[lo:lo + k] / old_hz)
+                    gain = ((numpy.arange(done, done + k) + 1)
+                            / (_LEGATO_XFADE + 1)).astype(numpy.float32)
+                    seg[:k] = old * (1 - gain) + seg[:k] * gain
+                    done += k
+                    self.fading = (None if done >= _LEGATO_XFADE
+                                   else (wave, loop, pos, old_hz, done))
+                out[lo:hi] = seg
+            self.elapsed += hi - lo
+        return out
 
-    a, d, s, r = envelope_tuple
-    _skw = synth_kwargs or {}
 
-    def _synth_cached(hz, n_samples, skw):
-        return _synth_wave_cached(synth_fn, hz, n_samples, skw)
-    beat_pos = 0.0
-    for note_index, note in enumerate(notes):
-        if note.tone is not None:
-            if tempo_map and len(tempo_map) > 1:
-                start = _beat_to_sample(beat_pos, tempo_map)
+def _iter_legato_blocks(notes, samples_per_beat, total_samples, synth_fn,
+                        envelope_tuple, volume, bpm, glide_time=0.0,
+                        swing=0.0, tempo_map=None, temperament="equal",
+                        reference_pitch=440.0, synth_kwargs=None,
+                        block_size=_LEGATO_BLOCK):
+    """Yield ``(start, samples)`` blocks of a legato phrase, in order.
+
+    See :func:`_render_legato_to_buf`. The frequency, amplitude and
+    envelope curves are worked out per block from the notes, and the
+    oscillator (or :class:`_Resampler`) carries its phase between blocks,
+    so memory stays at one block whatever the length of the Part.
+    """
+    # Frequency timeline from the compiled notes: (start_sample,
+    # end_sample, hz (0 for rests), velocity) per note. Chords play
+    # their first tone.
+    table = NoteTable.compile(
+        notes, temperament=temperament, reference_pitch=reference_pitch,
+        bpm=bpm, samples_per_beat=samples_per_beat, tempo_map=tempo_map,
+        swing=swing)
+    ends = numpy.minimum(
+        table.start + (table.beats * samples_per_beat).astype(numpy.int64),
+        total_samples)
+    keep = table.start < total_samples
+    starts, ends = table.start[keep], ends[keep]
+    hzs, vels = table.hz[keep, 0], table.velocity[keep]
+    sounding = (hzs > 0) & (vels > 0) & (ends > starts)
+    if not sounding.any():
+        return
+
+    # The pitch each note glides from (rests hold the last one)
+    prev = numpy.zeros(len(hzs))
+    held = 0.0
+    for i, hz in enumerate(hzs.tolist()):
+        prev[i] = held
+        if hz > 0:
+            held = hz
+
+    # The envelope spans the whole active region: attack at the first
+    # note, release at the end of the last
+    first = int(starts[sounding].min())
+    last = int(ends[sounding].max())
+    a, d, s, r = envelope_tuple
+    shaped = a > 0 or d > 0 or s < 1.0 or r > 0
+    glide_samples = int(glide_time * _rate())
+    skw = dict(synth_kwargs or {})
+    osc = _oscillator_for(synth_fn, skw)
+    reader = None
+    if osc is None:
+        reader = _Resampler(synth_fn, skw, last - first)
+
+    for lo in range(first, last, block_size):
+        hi = min(lo + block_size, last)
+        n = hi - lo
+        freq = numpy.zeros(n, dtype=numpy.float64)
+        pitch = numpy.zeros(n, dtype=numpy.float64)
+        amp = numpy.zeros(n, dtype=numpy.float32)
+        for i in numpy.flatnonzero((starts < hi) & (ends > lo)).tolist():
+            start, end = int(starts[i]), int(ends[i])
+            a0, b0 = max(start, lo) - lo, min(end, hi) - lo
+            hz, prev_hz = float(hzs[i]), float(prev[i])
+            if hz > 0:
+                amp[a0:b0] = vels[i] / 127.0
+                freq[a0:b0] = hz
+                pitch[a0:b0] = hz
+                if glide_samples > 0 and prev_hz > 0 and prev_hz != hz:
+                    # Exponential glide — perceptually linear in pitch
+                    g_end = min(start + glide_samples, end)
+                    g_lo, g_hi = max(start, lo), min(g_end, hi)
+                    if g_hi > g_lo:
+                        t = numpy.linspace(0, 1, g_end - start)[
+                            g_lo - start:g_hi - start]
+                        freq[g_lo - lo:g_hi - lo] = prev_hz * (hz / prev_hz) ** t
             else:
-                start = int(beat_pos * samples_per_beat)
-            # Apply swing: shift every other note later
-            if swing > 0.0 and note_index % 2 == 1:
-                swing_offset = int(swing * 0.5 * samples_per_beat)
-                start += swing_offset
-            # Humanize: random timing offset (±fraction of a beat)
-            if humanize > 0.0:
-                max_offset = int(humanize * 0.05 * samples_per_beat)
-                start += _rnd.randint(-max_offset, max_offset)
-                start = max(0, start)
-            dur_ms = note.beats * 60_000 / bpm
-            # Articulation: adjust duration and velocity
-            art = getattr(note, 'articulation', '')
-            art_vel_mult = 1.0
-            art_attack_mult = 1.0  # multiplier for envelope attack
-            if art == 'staccato':
-                dur_ms *= 0.4  # short and bouncy
-            elif art == 'legato':
-                dur_ms *= 1.15  # slight overlap into next note
-            elif art == 'marcato':
-                art_vel_mult = 1.25  # heavier
-                art_attack_mult = 0.3  # sharper attack
-            elif art == 'tenuto':
-                art_attack_mult = 1.8  # softer attack, full duration
-            elif art == 'accent':
-                art_vel_mult = 1.2
-            elif art == 'fermata':
-                dur_ms *= 1.5  # held longer
-            n_samples = int(SAMPLE_RATE * dur_ms / 1000)
-            if start + n_samples > total_samples:
-                n_samples = total_samples - start
-            if n_samples > 0 and start >= 0:
-                # Drum hit via Part.hit() — use drum synth directly
-                from .rhythm import _DrumTone
-                if isinstance(note.tone, _DrumTone):
-                    drum_wave = _render_drum_hit_cached(note.tone.sound.value, n_samples)
-                    mixed = drum_wave.astype(numpy.float32)
-                    # Staccato fade-out for drums
-                    if art == 'staccato':
-                        fade_len = min(int(SAMPLE_RATE * 0.01), len(mixed))
-                        if fade_len > 0:
-                            mixed[-fade_len:] *= numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
-                    vel = getattr(note, 'velocity', 100)
-                    vel = min(127, int(vel * art_vel_mult))
-                    if humanize > 0.0:
-                        vel_jitter = int(humanize * 15)
-                        vel = max(1, min(127, vel + _rnd.randint(-vel_jitter, vel_jitter)))
-                    vel_scale = vel / 127.0
-                    end = min(start + len(mixed), total_samples)
-                    buf[start:end] += mixed[:end - start] * volume * vel_scale
-                    if not getattr(note, '_hold', False):
-                        beat_pos += note.beats
-                    continue
-                # Get pitches
-                if hasattr(note.tone, 'tones'):
-                    pitches = [t.pitch(temperament=temperament, reference_pitch=reference_pitch) for t in note.tone.tones]
-                else:
-                    pitches = [note.tone.pitch(temperament=temperament, reference_pitch=reference_pitch)]
-                # Analog drift: slight random pitch offset per note,
-                # simulating analog oscillator instability. Each note
-                # gets a unique drift amount (±cents scaled by analog).
-                if analog > 0:
-                    pitches = [hz * (2 ** (_rnd.gauss(0, analog * 5) / 1200))
-                               for hz in pitches]
-                # Pitch bend: render at base pitch, then resample to shift
-                # pitch over time. Resampling preserves the synth's timbre
-                # perfectly — no sine waves, no retriggering.
-                bend_amt = getattr(note, 'bend', 0.0)
-                if bend_amt != 0:
-                    bend_type = getattr(note, 'bend_type', 'smooth')
-                    t_norm = numpy.linspace(0, 1, n_samples)
-
-                    waves = []
-                    for hz in pitches:
-                        hz_end = hz * (2 ** (bend_amt / 12))
-                        # Build pitch ratio curve (1.0 = no shift)
-                        if bend_type == 'smooth':
-                            ratio = (hz_end / hz) ** t_norm
-                        elif bend_type == 'linear':
-                            ratio = 1.0 + (hz_end / hz - 1.0) * t_norm
-                        elif bend_type == 'late':
-                            late_t = numpy.clip((t_norm - 0.6) / 0.4, 0.0, 1.0)
-                            ratio = (hz_end / hz) ** late_t
-                        else:
-                            ratio = (hz_end / hz) ** t_norm
-
-                        # Render a longer buffer at base pitch
-                        max_ratio = max(ratio.max(), 1.0)
-                        src_len = int(n_samples * max_ratio) + 100
-                        src = synth_fn(hz, n_samples=src_len, **_skw)
-                        src_f = src.astype(numpy.float64) / SAMPLE_PEAK
-
-                        # Variable-rate resampling: read through source
-                        # at speed determined by the ratio curve
-                        read_pos = numpy.cumsum(ratio)
-                        read_pos = (read_pos - read_pos[0]).astype(numpy.float64)
-                        # Clamp to source bounds
-                        read_pos = numpy.clip(read_pos, 0, src_len - 2)
-                        # Linear interpolation
-                        idx = read_pos.astype(numpy.int64)
-                        frac = read_pos - idx
-                        bent = src_f[idx] * (1 - frac) + src_f[numpy.minimum(idx + 1, src_len - 1)] * frac
-                        waves.append((bent * SAMPLE_PEAK).astype(numpy.int16))
-                else:
-                    # Per-note kwargs (e.g. lyric for vocal synth)
-                    note_skw = dict(_skw)
-                    note_lyric = getattr(note, 'lyric', '')
-                    if note_lyric:
-                        note_skw['lyric'] = note_lyric
-                    # Render oscillators (cached per hz+n_samples)
-                    waves = [_synth_cached(hz, n_samples, note_skw)
-                             for hz in pitches]
-                # Sub-oscillator: octave-below sine, appended right after the
-                # main oscillators. Record its slice so the mix below can find
-                # it even when detune appends more waves after it.
-                sub_slice = (0, 0)
-                if sub_osc > 0:
-                    sub_start = len(waves)
-                    for hz in pitches:
-                        sub = sine_wave(hz / 2, n_samples=n_samples)
-                        waves.append(sub)
-                    sub_slice = (sub_start, len(waves))
-                # Detune: add oscillators shifted by ±cents
-                detune_up = None
-                detune_down = None
-                if detune > 0:
-                    up_waves = []
-                    down_waves = []
-                    for hz in pitches:
-                        hz_up = hz * (2 ** (detune / 1200))
-                        hz_down = hz * (2 ** (-detune / 1200))
-                        up_waves.append(_synth_cached(hz_up, n_samples, _skw))
-                        down_waves.append(_synth_cached(hz_down, n_samples, _skw))
-                    if spread > 0 and stereo_buf is not None:
-                        # Spread: detuned oscillators go to opposite channels
-                        detune_up = sum(w.astype(numpy.float32) for w in up_waves) / SAMPLE_PEAK
-                        detune_down = sum(w.astype(numpy.float32) for w in down_waves) / SAMPLE_PEAK
-                    else:
-                        waves.extend(up_waves + down_waves)
-                n_osc = len(waves)
-                mixed = sum(w.astype(numpy.float32) for w in waves) / (SAMPLE_PEAK * max(1, n_osc))
-                # Mix sub-oscillator with appropriate gain
-                if sub_osc > 0:
-                    # Sub was already included in waves; split it back out by
-                    # its recorded slice (everything else — mains and any
-                    # detune voices — is "main") and rebalance.
-                    s0, s1 = sub_slice
-                    sub_waves = waves[s0:s1]
-                    main_waves = waves[:s0] + waves[s1:]
-                    if main_waves:
-                        main_mix = sum(w.astype(numpy.float32) for w in main_waves) / (SAMPLE_PEAK * max(1, len(main_waves)))
-                        sub_mix = sum(w.astype(numpy.float32) for w in sub_waves) / (SAMPLE_PEAK * max(1, len(sub_waves)))
-                        mixed = main_mix * (1.0 - sub_osc * 0.3) + sub_mix * sub_osc * 0.3
-                # Noise layer: add noise following the note
-                if noise_mix > 0:
-                    noise = numpy.random.uniform(-1, 1, n_samples).astype(numpy.float32)
-                    mixed = mixed * (1.0 - noise_mix * 0.5) + noise * noise_mix * 0.5
-                # Amplitude envelope (articulation may adjust attack)
-                art_a = a * art_attack_mult
-                if art_a > 0 or d > 0 or s < 1.0 or r > 0:
-                    mixed = _apply_envelope(mixed, art_a, d, s, r)
-                # Staccato: apply a quick fade-out at the end
-                if art == 'staccato':
-                    fade_len = min(int(SAMPLE_RATE * 0.01), len(mixed))
-                    if fade_len > 0:
-                        mixed[-fade_len:] *= numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
-                # Per-note velocity (articulation may boost)
-                vel = getattr(note, 'velocity', 100)
-                vel = min(127, int(vel * art_vel_mult))
-                if humanize > 0.0:
-                    vel_jitter = int(humanize * 15)
-                    vel = max(1, min(127, vel + _rnd.randint(-vel_jitter, vel_jitter)))
-                vel_scale = vel / 127.0
-                # Filter envelope (per-note subtractive filter sweep)
-                if filter_amount > 0:
-                    base_cut = 200.0  # base cutoff before envelope opens it
-                    vel_boost = vel_to_filter * vel_scale if vel_to_filter > 0 else 0.0
-                    mixed = _apply_filter_envelope(
-                        mixed, base_cut, filter_amount,
-                        filter_attack, filter_decay, filter_sustain,
-                        q=filter_q, vel_cutoff_boost=vel_boost)
-                elif vel_to_filter > 0:
-                    # Velocity brightness without filter envelope
-                    vel_cutoff = vel_to_filter * vel_scale + 1000
-                    mixed = _apply_lowpass(mixed, vel_cutoff, q=filter_q)
-                end = min(start + len(mixed), total_samples)
-                buf[start:end] += mixed[:end - start] * volume * vel_scale
-                # Spread detuned oscillators into stereo L/R
-                if detune_up is not None and stereo_buf is not None:
-                    spread_amt = spread
-                    up_env = detune_up[:end - start]
-                    down_env = detune_down[:end - start]
-                    if a > 0 or d > 0 or s < 1.0 or r > 0:
-                        up_env = _apply_envelope(up_env.copy(), a, d, s, r)
-                        down_env = _apply_envelope(down_env.copy(), a, d, s, r)
-                    gain = volume * vel_scale * 0.5
-                    # Right channel gets up-detuned, left gets down-detuned
-                    stereo_buf[start:end, 1] += up_env * gain * spread_amt
-                    stereo_buf[start:end, 0] += down_env * gain * spread_amt
-        # hold() notes don't advance the beat position
-        if not getattr(note, '_hold', False):
-            beat_pos += note.beats
+                # Rest: silence, the oscillator idling at the last pitch
+                amp[a0:b0] = 0.0
+                freq[a0:b0] = prev_hz if prev_hz > 0 else 440
+                pitch[a0:b0] = prev_hz
+        if osc is not None:
+            wave = osc.render(freq)
+        else:
+            wave = reader.render(freq, pitch)
+        wave *= amp
+        if shaped:
+            wave *= _adsr_gain(a, d, s, r, last - first, lo - first,
+                               hi - first)
+        yield lo, wave * volume
 
 
 def _render_legato_to_buf(notes, buf, samples_per_beat, total_samples,
                           synth_fn, envelope_tuple, volume, bpm,
                           glide_time=0.0, swing=0.0, tempo_map=None,
-                          temperament="equal", reference_pitch=440.0):
+                          temperament="equal", reference_pitch=440.0,
+                          synth_kwargs=None):
     """Render notes as one continuous waveform with pitch glide.
 
     Instead of rendering each note separately with its own envelope,
@@ -6072,132 +8073,421 @@ def _render_legato_to_buf(notes, buf, samples_per_beat, total_samples,
     When glide > 0, the frequency slides smoothly between consecutive
     pitches using exponential interpolation (so slides sound linear
     in pitch, not frequency — matching how humans perceive pitch).
+
+    The classic waveforms run the band-limited wavetable oscillator
+    along the pitch curve; every other synth is played by a
+    :class:`_Resampler` from its own notes. Either way the phrase is
+    rendered in blocks (:func:`_iter_legato_blocks`).
     """
-    # Build a frequency timeline: (sample_position, target_hz) pairs
-    events = []  # (start_sample, end_sample, hz_or_none, velocity)
-    beat_pos = 0.0
-    for note_index, note in enumerate(notes):
-        if tempo_map and len(tempo_map) > 1:
-            start = _beat_to_sample(beat_pos, tempo_map)
-        else:
-            start = int(beat_pos * samples_per_beat)
-        # Apply swing
-        if swing > 0.0 and note_index % 2 == 1:
-            swing_offset = int(swing * 0.5 * samples_per_beat)
-            start += swing_offset
-        dur_samples = int(note.beats * samples_per_beat)
-        end = min(start + dur_samples, total_samples)
-        vel = getattr(note, 'velocity', 100)
-        if note.tone is not None:
-            if hasattr(note.tone, 'tones'):
-                hz = note.tone.tones[0].pitch(temperament=temperament, reference_pitch=reference_pitch)
-            else:
-                hz = note.tone.pitch(temperament=temperament, reference_pitch=reference_pitch)
-            events.append((start, end, hz, vel))
-        else:
-            events.append((start, end, 0, vel))  # rest
-        if not getattr(note, '_hold', False):
-            beat_pos += note.beats
+    for start, block in _iter_legato_blocks(
+            notes, samples_per_beat, total_samples, synth_fn,
+            envelope_tuple, volume, bpm, glide_time=glide_time, swing=swing,
+            tempo_map=tempo_map, temperament=temperament,
+            reference_pitch=reference_pitch, synth_kwargs=synth_kwargs):
+        buf[start:start + len(block)] += block
+
+
+# Drum pan map — how a real kit is mic'd from the audience perspective.
+# Filled on first use (DrumSound lives in rhythm, which imports this module).
+_DRUM_PAN: dict[int, float] = {}
+
+
+def _drum_pan_map():
+    """Return the ``DrumSound`` value → pan position map."""
+    if not _DRUM_PAN:
+        from .rhythm import DrumSound
+        _DRUM_PAN.update({
+            DrumSound.KICK.value: 0.0,          # center
+            DrumSound.SNARE.value: 0.0,         # center
+            DrumSound.RIMSHOT.value: -0.1,      # slightly left
+            DrumSound.CLAP.value: 0.0,          # center
+            DrumSound.CLOSED_HAT.value: 0.3,    # right
+            DrumSound.OPEN_HAT.value: 0.3,      # right
+            DrumSound.PEDAL_HAT.value: 0.3,     # right
+            DrumSound.LOW_TOM.value: 0.4,       # right
+            DrumSound.MID_TOM.value: 0.0,       # center
+            DrumSound.HIGH_TOM.value: -0.3,     # left
+            DrumSound.CRASH.value: -0.4,        # left
+            DrumSound.RIDE.value: 0.4,          # right
+            DrumSound.RIDE_BELL.value: 0.4,     # right
+            DrumSound.COWBELL.value: 0.2,       # slightly right
+            DrumSound.CLAVE.value: -0.2,        # slightly left
+            DrumSound.SHAKER.value: 0.35,       # right
+            DrumSound.TAMBOURINE.value: -0.25,  # slightly left
+            DrumSound.CONGA_HIGH.value: -0.3,   # left
+            DrumSound.CONGA_LOW.value: 0.2,     # slightly right
+            DrumSound.BONGO_HIGH.value: -0.2,   # slightly left
+            DrumSound.BONGO_LOW.value: 0.15,    # slightly right
+            DrumSound.TIMBALE_HIGH.value: -0.25,
+            DrumSound.TIMBALE_LOW.value: 0.2,
+            DrumSound.AGOGO_HIGH.value: -0.3,
+            DrumSound.AGOGO_LOW.value: 0.25,
+            DrumSound.GUIRO.value: -0.15,
+            DrumSound.MARACAS.value: 0.3,
+            # Tabla: dayan (right drum) slightly right, bayan slightly left
+            DrumSound.TABLA_NA.value: 0.2,
+            DrumSound.TABLA_TIN.value: 0.2,
+            DrumSound.TABLA_TIT.value: 0.25,
+            DrumSound.TABLA_GE.value: -0.2,
+            DrumSound.TABLA_KE.value: -0.2,
+            DrumSound.TABLA_DHA.value: 0.0,   # both drums = center
+            DrumSound.TABLA_GE_BEND.value: -0.2,
+            # Dhol: bass left, treble right
+            DrumSound.DHOL_DAGGA.value: -0.2,
+            DrumSound.DHOL_TILLI.value: 0.2,
+            DrumSound.DHOL_BOTH.value: 0.0,
+            # Dholak: similar to dhol
+            DrumSound.DHOLAK_GE.value: -0.15,
+            DrumSound.DHOLAK_NA.value: 0.15,
+            DrumSound.DHOLAK_TIT.value: 0.2,
+            # Mridangam: bass left, treble right
+            DrumSound.MRIDANGAM_THAM.value: -0.2,
+            DrumSound.MRIDANGAM_NAM.value: 0.2,
+            DrumSound.MRIDANGAM_DIN.value: 0.0,
+            DrumSound.MRIDANGAM_THA.value: 0.15,
+            # Djembe: centered (single drum)
+            DrumSound.DJEMBE_BASS.value: 0.0,
+            DrumSound.DJEMBE_TONE.value: 0.1,
+            DrumSound.DJEMBE_SLAP.value: -0.1,
+            # Doumbek
+            DrumSound.DOUMBEK_DUM.value: 0.0,
+            DrumSound.DOUMBEK_TEK.value: 0.1,
+            DrumSound.DOUMBEK_KA.value: -0.1,
+            # Cajon — centered (single instrument)
+            DrumSound.CAJON_BASS.value: 0.0,
+            DrumSound.CAJON_SLAP.value: 0.0,
+            DrumSound.CAJON_SLAP_SNARE.value: 0.0,
+            DrumSound.CAJON_TAP.value: 0.1,
+            # Metal kit
+            DrumSound.METAL_KICK.value: 0.0,
+            DrumSound.METAL_SNARE.value: 0.0,
+            DrumSound.METAL_HAT.value: 0.3,
+            # Marching — centered
+            DrumSound.MARCH_SNARE.value: 0.0,
+            DrumSound.MARCH_RIMSHOT.value: 0.0,
+            DrumSound.MARCH_CLICK.value: 0.0,
+            # Quads — spread across the field
+            DrumSound.QUAD_1.value: -0.3,
+            DrumSound.QUAD_2.value: -0.1,
+            DrumSound.QUAD_3.value: 0.1,
+            DrumSound.QUAD_4.value: 0.3,
+            DrumSound.QUAD_SPOCK.value: 0.0,
+            # Bass drums — spread wide
+            DrumSound.BASS_1.value: -0.5,
+            DrumSound.BASS_2.value: -0.25,
+            DrumSound.BASS_3.value: 0.0,
+            DrumSound.BASS_4.value: 0.25,
+            DrumSound.BASS_5.value: 0.5,
+        })
+    return _DRUM_PAN
+
+
+# Cross-choke groups (DrumSound value → the values a hit on it dampens)
+# and the sounds that build sympathetic resonance, filled on first use.
+_CHOKE_GROUPS: dict[int, tuple] = {}
+_RESONANCE_SOUNDS: set[int] = set()
+
+
+def _drum_choke_groups():
+    """Return the ``DrumSound`` value → choked sound values map.
+
+    A new hit on one sound dampens the ring of related sounds on the
+    same instrument (e.g. djembe slap kills the bass resonance, closed
+    hat kills open hat).
+    """
+    if not _CHOKE_GROUPS:
+        from .rhythm import DrumSound
+        _CHOKE_GROUPS.update({
+            # Djembe — any strike dampens the others
+            DrumSound.DJEMBE_BASS.value: (DrumSound.DJEMBE_TONE.value, DrumSound.DJEMBE_SLAP.value),
+            DrumSound.DJEMBE_TONE.value: (DrumSound.DJEMBE_BASS.value, DrumSound.DJEMBE_SLAP.value),
+            DrumSound.DJEMBE_SLAP.value: (DrumSound.DJEMBE_BASS.value, DrumSound.DJEMBE_TONE.value),
+            # Hi-hats — closed chokes open
+            DrumSound.CLOSED_HAT.value: (DrumSound.OPEN_HAT.value,),
+            DrumSound.PEDAL_HAT.value: (DrumSound.OPEN_HAT.value,),
+            # Cajón — slap dampens bass ring
+            DrumSound.CAJON_SLAP.value: (DrumSound.CAJON_BASS.value,),
+            DrumSound.CAJON_TAP.value: (DrumSound.CAJON_BASS.value,),
+            # Doumbek — tek/ka dampen dum
+            DrumSound.DOUMBEK_TEK.value: (DrumSound.DOUMBEK_DUM.value,),
+            DrumSound.DOUMBEK_KA.value: (DrumSound.DOUMBEK_DUM.value,),
+        })
+    return _CHOKE_GROUPS
+
+
+def _drum_resonance_sounds():
+    """Return the ``DrumSound`` values that build up snare-wire buzz."""
+    if not _RESONANCE_SOUNDS:
+        from .rhythm import DrumSound
+        _RESONANCE_SOUNDS.update({
+            DrumSound.MARCH_SNARE.value, DrumSound.MARCH_RIMSHOT.value,
+        })
+    return _RESONANCE_SOUNDS
+
+
+def _drum_schedule(drum_part, total_samples, samples_per_beat, tempo_map=None,
+                   swing=0.0, humanize=0.0):
+    """Place a drum Part's hits on the sample timeline.
+
+    Returns ``(starts, sounds, velocities)`` — int64 arrays, one entry per
+    hit, sorted by start (ties keep the Part's hit order) — with swing,
+    tempo changes and humanize (timing and velocity jitter) applied.
+    Hits that land outside the render are dropped.
+    """
+    import random as _drum_rnd
+    hits = drum_part._drum_hits
+    positions = numpy.array([hit.position for hit in hits], dtype=numpy.float64)
+    if swing > 0:
+        beat_frac = positions % 1.0
+        positions[(beat_frac > 0.1) & (beat_frac < 0.9)] += swing * 0.15
+    starts = _beat_positions(positions, samples_per_beat, tempo_map)
+    sounds = numpy.array([hit.sound.value for hit in hits], dtype=numpy.int64)
+    velocities = numpy.array([hit.velocity for hit in hits], dtype=numpy.int64)
+    if humanize > 0:
+        # Jitter is drawn hit by hit, in the Part's order — a timing
+        # offset, then a velocity nudge if the hit still lands — so a
+        # seeded render repeats exactly.
+        max_offset = int(humanize * 0.03 * samples_per_beat)
+        vel_jitter = int(humanize * 10)
+        jittered = starts.tolist()
+        for i, start in enumerate(jittered):
+            start = max(0, start + _drum_rnd.randint(-max_offset, max_offset))
+            jittered[i] = start
+            if start < total_samples:
+                velocities[i] += _drum_rnd.randint(-vel_jitter, vel_jitter)
+        starts = numpy.array(jittered, dtype=numpy.int64)
+        velocities = numpy.clip(velocities, 1, 127)
+    keep = numpy.flatnonzero((starts >= 0) & (starts < total_samples))
+    keep = keep[numpy.argsort(starts[keep], kind="stable")]
+    return starts[keep], sounds[keep], velocities[keep]
+
+
+def _drum_chokes(starts, sounds):
+    """Work out a drum schedule's choke ramps, as arrays.
+
+    A hit dampens the ring of the previous hit on the same drum with a
+    2 ms fade, and the last hit on each drum in its choke group
+    (:func:`_drum_choke_groups`) with a 4 ms one. Each fade ends where
+    the choking hit begins, and is never longer than the gap back to
+    the hit it chokes.
+
+    Returns ``(hits, fade_starts, fade_lens)`` int64 arrays: schedule
+    index of the choking hit, and where its 1 → 0 ramp starts and how
+    many samples it lasts.
+    """
+    hits, fade_starts, fade_lens = [], [], []
+
+    def choke(hit_idx, prev_idx, max_len):
+        lens = numpy.minimum(starts[hit_idx] - starts[prev_idx], max_len)
+        ok = (lens > 0) & (starts[hit_idx] > 0)
+        hits.append(hit_idx[ok])
+        fade_starts.append(starts[hit_idx[ok]] - lens[ok])
+        fade_lens.append(lens[ok])
+
+    # Same drum: each hit after the first chokes the one before it
+    order = numpy.lexsort((numpy.arange(len(sounds)), sounds))
+    same = sounds[order[1:]] == sounds[order[:-1]]
+    choke(order[1:][same], order[:-1][same], int(_rate() * 0.002))
+    # Related drums: the latest earlier hit on each target
+    for sound, targets in _drum_choke_groups().items():
+        hit_idx = numpy.flatnonzero(sounds == sound)
+        if not len(hit_idx):
+            continue
+        for target in targets:
+            target_idx = numpy.flatnonzero(sounds == target)
+            k = numpy.searchsorted(target_idx, hit_idx) - 1
+            has = k >= 0
+            choke(hit_idx[has], target_idx[k[has]], int(_rate() * 0.004))
+    return (numpy.concatenate(hits), numpy.concatenate(fade_starts),
+            numpy.concatenate(fade_lens))
 
-    if not events:
-        return
 
-    # Build the frequency curve with glide
-    glide_samples = int(glide_time * SAMPLE_RATE)
-    freq_curve = numpy.zeros(total_samples, dtype=numpy.float64)
-    amp_curve = numpy.zeros(total_samples, dtype=numpy.float32)
-    prev_hz = 0
+def _choke_ramps(fade_lens):
+    """The 1 → 0 fade gains for ramps of *fade_lens*, concatenated.
 
-    for start, end, hz, vel in events:
-        if start >= total_samples:
-            break
-        end = min(end, total_samples)
-        vel_scale = vel / 127.0
-        if hz > 0:
-            amp_curve[start:end] = vel_scale
-            if glide_samples > 0 and prev_hz > 0 and prev_hz != hz:
-                # Exponential glide from prev_hz to hz
-                g_end = min(start + glide_samples, end)
-                g_len = g_end - start
-                if g_len > 0:
-                    t = numpy.linspace(0, 1, g_len)
-                    # Log interpolation for perceptually linear pitch slide
-                    freq_curve[start:g_end] = prev_hz * (hz / prev_hz) ** t
-                    freq_curve[g_end:end] = hz
-                else:
-                    freq_curve[start:end] = hz
-            else:
-                freq_curve[start:end] = hz
-            prev_hz = hz
-        else:
-            # Rest: silence but keep prev_hz for next glide
-            amp_curve[start:end] = 0.0
-            freq_curve[start:end] = prev_hz if prev_hz > 0 else 440
-
-    def _wave_from_phase(freq_curve):
-        """Continuous oscillator for synths that can follow a pitch curve."""
-        phase = numpy.cumsum(2 * numpy.pi * freq_curve / SAMPLE_RATE)
-        cycle = (phase / (2 * numpy.pi)) % 1.0
-        if synth_fn is sawtooth_wave:
-            return (2.0 * cycle - 1.0).astype(numpy.float32)
-        if synth_fn is triangle_wave:
-            return (1.0 - 4.0 * numpy.abs(cycle - 0.5)).astype(numpy.float32)
-        if synth_fn is square_wave:
-            return numpy.sign(numpy.sin(phase)).astype(numpy.float32)
-        if synth_fn is pulse_wave:
-            return numpy.where(cycle < 0.25, 1.0, -1.0).astype(numpy.float32)
-        if synth_fn is supersaw_wave:
-            mixed = numpy.zeros_like(freq_curve, dtype=numpy.float32)
-            for cents in numpy.linspace(-15, 15, 7):
-                ratio = 2 ** (cents / 1200)
-                ph = numpy.cumsum(2 * numpy.pi * freq_curve * ratio / SAMPLE_RATE)
-                cyc = (ph / (2 * numpy.pi)) % 1.0
-                mixed += (2.0 * cyc - 1.0).astype(numpy.float32)
-            return mixed / 7.0
-        # Complex sampled/physical-model synths do not have a cheap
-        # continuous pitch-curve form here, so fall back to the historical
-        # sine oscillator rather than retriggering envelopes.
-        return numpy.sin(phase).astype(numpy.float32)
-
-    # Generate continuous waveform from frequency curve.
-    wave = _wave_from_phase(freq_curve)
-
-    # Apply amplitude (on/off for notes vs rests, scaled by velocity)
-    wave *= amp_curve
-
-    # Apply single envelope over the entire active region
-    # Find first and last non-zero samples
-    active = numpy.nonzero(amp_curve)[0]
-    if len(active) == 0:
+    Returns ``(offsets, gains)``: each sample's offset into its ramp and
+    its float32 gain.
+    """
+    firsts = numpy.cumsum(fade_lens) - fade_lens
+    offsets = (numpy.arange(int(fade_lens.sum()))
+               - numpy.repeat(firsts, fade_lens))
+    spans = numpy.repeat(numpy.maximum(fade_lens - 1, 1), fade_lens)
+    return offsets, (1.0 - offsets / spans).astype(numpy.float32)
+
+
+def _apply_chokes(buf, fade_starts, fade_lens):
+    """Multiply every choke ramp into *buf* (mono or ``(N, 2)``) at once.
+
+    Overlapping ramps multiply together, as if applied one by one.
+    """
+    if not len(fade_lens):
         return
+    offsets, gains = _choke_ramps(fade_lens)
+    idx = numpy.repeat(fade_starts, fade_lens) + offsets
+    order = numpy.argsort(idx, kind="stable")
+    idx = idx[order]
+    firsts = numpy.flatnonzero(numpy.r_[True, idx[1:] != idx[:-1]])
+    gains = numpy.multiply.reduceat(gains[order], firsts)
+    if buf.ndim > 1:
+        gains = gains[:, None]
+    buf[idx[firsts]] *= gains
+
+
+def _drum_resonance(starts, sounds):
+    """Sympathetic resonance level (0–0.6) for each scheduled hit.
+
+    Marching snares build up buzz as hits accumulate: each hit adds to
+    its drum's level, which decays with the gap since that drum's last
+    hit. Other sounds get 0.
+    """
+    levels = numpy.zeros(len(starts))
+    for sound in _drum_resonance_sounds():
+        reso = 0.0
+        prev = None
+        for i in numpy.flatnonzero(sounds == sound).tolist():
+            if prev is not None:
+                gap_sec = (starts[i] - prev) / _rate()
+                if gap_sec > 1.0:
+                    reso *= 0.2
+                elif gap_sec > 0.5:
+                    reso *= 0.5
+                elif gap_sec > 0.25:
+                    reso *= 0.8
+            # Build up (caps at 0.6)
+            reso = min(0.6, reso + 0.08)
+            levels[i] = reso
+            prev = starts[i]
+    return levels
+
+
+# The snare-wire band-pass per sample rate, designed on first use
+_BUZZ_BAND: dict = {}
+
+
+def _resonance_buzz(level, hit_len):
+    """Snare-wire buzz for a hit at resonance *level*, as float32."""
+    buzz_len = min(int(_rate() * 0.06), hit_len)
+    buzz = _noise(buzz_len) * level * 0.18
+    if buzz_len > 20:
+        rate = _rate()
+        if rate not in _BUZZ_BAND:
+            _BUZZ_BAND[rate] = scipy.signal.butter(
+                2, [3000, 9000], btype='band', fs=rate)
+        bl, al = _BUZZ_BAND[rate]
+        buzz = scipy.signal.lfilter(bl, al, buzz)
+    buzz *= _exp_decay(buzz_len, 25)
+    return buzz.astype(numpy.float32)
 
-    first = active[0]
-    last = active[-1] + 1
-    a, d, s, r = envelope_tuple
-    if a > 0 or d > 0 or s < 1.0 or r > 0:
-        env_buf = wave[first:last].copy()
-        env_buf = _apply_envelope(env_buf, a, d, s, r)
-        wave[first:last] = env_buf
 
-    end = min(len(wave), total_samples)
-    buf[:end] += wave[:end] * volume
+def _drum_template(sound_value, n_samples):
+    """A drum hit and its stereo copy panned to the kit position.
 
+    Returns ``(mono, stereo)`` float32 arrays, cached and read-only.
+    """
+    key = (sound_value, n_samples, _rate(), "panned")
+    entry = _drum_cache.get(key)
+    if entry is None:
+        mono = _drum_hit(sound_value, n_samples)
+        stereo = _pan_to_stereo(mono, _drum_pan_map().get(sound_value, 0.0))
+        stereo.flags.writeable = False
+        entry = (mono, stereo)
+        _drum_cache[key] = entry
+    return entry
+
+
+class _DrumVoicing:
+    """A drum schedule worked out for playback, as arrays.
+
+    Holds each hit's ``starts``, ``sounds``, ``lens`` (half a second,
+    trimmed at the end of the render) and ``gains`` (velocity × 0.7 ×
+    Part volume), its resonance ``buzz`` (schedule index → float32
+    noise, drawn in time order) and the choke ramps from
+    :func:`_drum_chokes`. Hits play from the pre-panned templates of
+    :func:`_drum_template`.
+    """
 
-def render_scores(scores, *, workers=None):
+    def __init__(self, schedule, total_samples, volume):
+        self.starts, self.sounds, velocities = schedule
+        self.lens = numpy.minimum(int(_rate() * 0.5),
+                                  total_samples - self.starts)
+        self.gains = velocities / 127.0 * 0.7 * volume
+        levels = _drum_resonance(self.starts, self.sounds)
+        # Synthesize each template, and each hit's buzz, in time order
+        # so the drums draw their noise in the order they play
+        _, firsts = numpy.unique(self.sounds * (1 << 32) + self.lens,
+                                 return_index=True)
+        firsts = set(firsts.tolist())
+        self.buzz = {}
+        for i in sorted(firsts.union(
+                numpy.flatnonzero(levels > 0.1).tolist())):
+            if i in firsts:
+                _drum_template(int(self.sounds[i]), int(self.lens[i]))
+            if levels[i] > 0.1:
+                self.buzz[i] = _resonance_buzz(levels[i], int(self.lens[i]))
+        self.choke_hits, self.fade_starts, self.fade_lens = _drum_chokes(
+            self.starts, self.sounds)
+
+    def groups(self, hits=None):
+        """Yield ``(sound, length, indices)`` for each distinct hit.
+
+        *hits* limits this to those schedule indices (default all).
+        """
+        order = numpy.arange(len(self.starts)) if hits is None else hits
+        order = order[numpy.lexsort((self.starts[order], self.lens[order],
+                                     self.sounds[order]))]
+        sounds = self.sounds[order]
+        lens = self.lens[order]
+        cuts = numpy.flatnonzero((sounds[1:] != sounds[:-1])
+                                 | (lens[1:] != lens[:-1])) + 1
+        for idx in numpy.split(order, cuts):
+            if len(idx):
+                yield int(self.sounds[idx[0]]), int(self.lens[idx[0]]), idx
+
+    def periods(self):
+        """:func:`_periodic_runs` over the hits, resonance buzz aside."""
+        return _periodic_runs(self.starts, numpy.column_stack(
+            (self.sounds, self.lens, self.gains)))
+
+    def buzz_stereo(self, i):
+        """Hit *i*'s resonance buzz, scaled and panned, or ``None``."""
+        buzz = self.buzz.get(i)
+        if buzz is None:
+            return None
+        pan = _drum_pan_map().get(int(self.sounds[i]), 0.0)
+        return _pan_to_stereo(buzz * self.gains[i], pan)
+
+
+def render_scores(scores, *, workers=None, backend="thread",
+                  quality="final", sample_rate=None):
     """Render many Scores in parallel across CPU cores.
 
     A single :func:`render_score` is already fast (the synths are cached
     and vectorized), so the win from multiple cores is in *batch* work:
     exporting an album, rendering every clip in a set, or serving several
-    requests at once. Each Score renders independently in its own thread,
-    and NumPy releases the GIL during the heavy array math, so this scales
-    roughly with cores (about 2x on a typical machine) with no change to
+    requests at once. Each Score renders independently, with no change to
     how any individual Score sounds.
 
+    Two backends:
+
+    - ``"thread"`` (default) — one thread per Score. NumPy releases the
+      GIL during the heavy array math, but the per-note Python work
+      doesn't, so this tops out around 2x on a typical machine.
+    - ``"process"`` — Scores are pickled to a pool of worker processes,
+      which write their finished audio straight into
+      :mod:`multiprocessing.shared_memory` buffers (nothing large is
+      pickled back). Forked workers start with this process's synth
+      caches; spawned ones warm their own, and each worker's caches stay
+      warm across the Scores it renders. Scales with every core; worth it
+      once a batch takes more than a second or two.
+
     Args:
         scores: an iterable of :class:`Score` objects.
-        workers: thread count (default: one per core, capped at the number
-            of scores). ``workers=1`` renders sequentially.
+        workers: worker count (default: one per core, capped at the number
+            of scores). ``workers=1`` renders sequentially in-process.
+        backend: ``"thread"`` or ``"process"``.
+        quality: ``"final"`` or ``"draft"``, as for :func:`render_score`.
+        sample_rate: Rate to render at, in Hz, as for
+            :func:`render_score`.
 
     Returns:
         A list of float32 stereo buffers, in the same order as *scores*.
@@ -6206,459 +8496,784 @@ def render_scores(scores, *, workers=None):
 
         >>> from pytheory.play import render_scores
         >>> buffers = render_scores([verse, chorus, bridge])
+        >>> album = render_scores(tracks, backend="process")
     """
-    import os
-    from concurrent.futures import ThreadPoolExecutor
-
-    scores = list(scores)
+    if backend not in ("thread", "process"):
+        raise ValueError(
+            f"backend must be 'thread' or 'process', got {backend!r}")
+    import functools
+    scores = [_at_quality(s, quality) for s in scores]
+    rate = _check_rate(sample_rate)
+    render_rate = _quality_rate(quality, rate)
+    render = functools.partial(_render_at, render_rate=render_rate,
+                               sample_rate=rate)
     if workers is None:
         workers = min(len(scores) or 1, max(1, (os.cpu_count() or 2)))
     if workers <= 1 or len(scores) <= 1:
-        return [render_score(s) for s in scores]
+        return [render(s) for s in scores]
+    if backend == "process":
+        return _render_scores_in_processes(scores, workers, render_rate, rate)
+
+    from concurrent.futures import ThreadPoolExecutor
     with ThreadPoolExecutor(max_workers=workers) as pool:
-        return list(pool.map(render_score, scores))
+        return list(pool.map(render, scores))
+
+
+def _render_scores_in_processes(scores, workers, render_rate, sample_rate):
+    """The ``backend="process"`` half of :func:`render_scores`."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    # Forked workers inherit this process's synth and drum caches as-is.
+    # Spawned ones start cold and warm their own as they render (or read
+    # PYTHEORY_CACHE_DIR) — pickling the parent's caches into every
+    # worker would cost up to a few hundred MB each.
+    ctx = multiprocessing.get_context()
+
+    with _at_rate(sample_rate):
+        lengths = [_score_length(s) for s in scores]
+    blocks = []
+    try:
+        for n in lengths:
+            # SharedMemory refuses size 0; an empty Score still gets a name.
+            blocks.append(shared_memory.SharedMemory(
+                create=True, size=max(1, n * 2 * 4)))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=ctx) as pool:
+            futures = [pool.submit(_render_into_shared, s, shm.name, n,
+                                   render_rate, sample_rate)
+                       for s, shm, n in zip(scores, blocks, lengths)]
+            for future in futures:
+                future.result()
+        return [numpy.ndarray((n, 2), dtype=numpy.float32,
+                              buffer=shm.buf).copy()
+                for shm, n in zip(blocks, lengths)]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _render_into_shared(score, name, n_samples, render_rate, sample_rate):
+    """Render *score* in a worker at *render_rate*, straight into shared
+    memory *name* at *sample_rate*."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = numpy.ndarray((n_samples, 2), dtype=numpy.float32,
+                            buffer=shm.buf)
+        out[:] = _render_at(score, render_rate, sample_rate)
+        del out
+    finally:
+        shm.close()
+
+
+def _score_length(score):
+    """Rendered length of *score* in samples (tempo changes included)."""
+    tempo_map = TempoMap.from_score(score)
+    if len(tempo_map) > 1:
+        return tempo_map.beat_to_sample(score.total_beats)
+    return int(score.total_beats * int(_rate() * 60.0 / score.bpm))
+
+
+_ENSEMBLE_BLOCK = 65536
+
+
+class _Ensemble:
+    """An ``ensemble=n`` section played from one reference voice, as a
+    multi-tap delay line.
+
+    The reference is player 0; every other player reads it through a tap
+    with its own time offset (rushing or dragging), gain (velocity
+    jitter) and, with *detune* cents, a slow sinusoidal sweep of the
+    tap's delay, which bends that player's pitch up to *detune* cents
+    either way. Each player's settings come from its own seeded
+    ``random.Random``, so every render, offline or streamed, agrees.
+    """
+
+    def __init__(self, n, samples_per_beat, total_samples, detune=0.0,
+                 sample_rate=None):
+        import math
+        import random as _random_mod
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.n = n
+        self.taps = []
+        behind = ahead = 0
+        for i in range(1, n):
+            # Per-voice RNG instance — never reseed the global `random`,
+            # which other threads in render_scores() share.
+            rnd = _random_mod.Random(42 + i * 7)
+            shift = int(rnd.gauss(0, 0.018) * samples_per_beat)
+            if abs(shift) >= total_samples:
+                shift = 0
+            gain = 1.0 + rnd.gauss(0, 0.04)
+            sweep = None
+            if detune > 0:
+                # A delay swinging by ±depth at rate Hz bends the pitch
+                # by up to 2π·rate·depth/sr (as a frequency ratio).
+                rate = 0.1 + 0.15 * rnd.random()
+                cents = detune * (0.5 + 0.5 * rnd.random())
+                depth = (cents * math.log(2) / 1200 * sample_rate
+                         / (2 * math.pi * rate))
+                sweep = (depth, 2 * math.pi * rate / sample_rate,
+                         2 * math.pi * rnd.random())
+            reach = int(math.ceil(sweep[0])) + 1 if sweep else 0
+            behind = max(behind, shift + reach)
+            ahead = max(ahead, reach - shift)
+            self.taps.append((shift, gain, sweep))
+        self.behind, self.ahead = behind, ahead
+
+    def mix(self, window, lo, start, end):
+        """The section over ``[start, end)``, from *window* — the reference
+        voice from absolute sample *lo*, covering at least
+        ``[start - behind, end + ahead)``."""
+        n = self.n
+        out = window[start - lo:end - lo] * (1.0 / n)
+        for shift, gain, sweep in self.taps:
+            if sweep is None:
+                voice = window[start - shift - lo:end - shift - lo] * gain
+            else:
+                depth, omega, phase = sweep
+                t = numpy.arange(start, end, dtype=numpy.float64)
+                pos = t - shift - depth * numpy.sin(omega * t + phase) - lo
+                idx = numpy.floor(pos).astype(numpy.int64)
+                frac = (pos - idx).astype(numpy.float32)
+                voice = (window[idx] * (1 - frac)
+                         + window[idx + 1] * frac) * gain
+            out += voice / n
+        return out
+
+    def process(self, buf, block=_ENSEMBLE_BLOCK):
+        """Replace *buf*, the reference voice, with the whole section in
+        place, a block at a time — only the taps' reach of the original
+        is kept aside."""
+        history = numpy.zeros(self.behind, dtype=numpy.float32)
+        pad = numpy.zeros(self.ahead, dtype=numpy.float32)
+        for start in range(0, len(buf), block):
+            end = min(start + block, len(buf))
+            upcoming = buf[end:end + self.ahead]
+            window = numpy.concatenate(
+                (history, buf[start:end], upcoming,
+                 pad[:self.ahead - len(upcoming)]))
+            lo = start - self.behind
+            history = window[end - self.behind - lo:end - lo]
+            buf[start:end] = self.mix(window, lo, start, end)
+        return buf
+
+
+def _render_part_stem(part, score, total_samples, samples_per_beat,
+                      tempo_map=None):
+    """Render one named Part on its own, through its effects.
+
+    Returns ``(stereo, ducked, send)``. *stereo* is the Part's finished
+    ``(N, 2)`` contribution to the mix — panned, stereo reverb applied,
+    detune spread included. For a sidechained Part the ducking has to wait
+    for the kick, so *stereo* holds only its spread (or is ``None``) and
+    *ducked* is the processed mono signal for :func:`render_score` to duck
+    and pan. *send* is the mono signal the Part feeds its aux buses, or
+    ``None`` if it has no sends (or is sidechained, so sends after ducking).
+    """
+    spread_buf = None
+    if part.spread > 0 and not part.legato:
+        spread_buf = numpy.zeros((total_samples, 2), dtype=numpy.float32)
+    part_buf = numpy.zeros(total_samples, dtype=numpy.float32)
+    synth_fn = _resolve_synth(part.synth)
+    env_tuple = _resolve_envelope(part.envelope)
+    # Use part swing if set, otherwise score swing
+    effective_swing = part.swing if part.swing is not None else score.swing
+    # Build synth-specific kwargs (e.g. FM ratio/index, tape, folds)
+    synth_kwargs = dict(getattr(part, 'synth_kw', None) or {})
+    if part.synth in ("fm",):
+        synth_kwargs["mod_ratio"] = part.fm_ratio
+        synth_kwargs["mod_index"] = part.fm_index
+    _temperament = getattr(score, 'temperament', 'equal')
+    _ref_pitch = getattr(score, 'reference_pitch', 440.0)
+
+    if part.legato:
+        _render_legato_to_buf(
+            part.notes, part_buf, samples_per_beat, total_samples,
+            synth_fn, env_tuple, part.volume, score.bpm,
+            glide_time=part.glide, swing=effective_swing,
+            tempo_map=tempo_map,
+            temperament=_temperament, reference_pitch=_ref_pitch,
+            synth_kwargs=synth_kwargs)
+    else:
+        _render_notes_to_buf(
+            part.notes, part_buf, samples_per_beat, total_samples,
+            synth_fn, env_tuple, part.volume, score.bpm,
+            swing=effective_swing,
+            tempo_map=tempo_map,
+            humanize=part.humanize,
+            detune=part.detune,
+            spread=part.spread,
+            stereo_buf=spread_buf,
+            sub_osc=part.sub_osc,
+            noise_mix=part.noise_mix,
+            filter_attack=part.filter_attack,
+            filter_decay=part.filter_decay,
+            filter_sustain=part.filter_sustain,
+            filter_amount=part.filter_amount,
+            vel_to_filter=part.vel_to_filter,
+            filter_q=part.lowpass_q,
+            synth_kwargs=synth_kwargs,
+            temperament=_temperament,
+            reference_pitch=_ref_pitch,
+            analog=part.analog)
+
+    n_ensemble = max(1, getattr(part, 'ensemble', 1))
+    if n_ensemble > 1:
+        # FAST ENSEMBLE: the "reference" voice rendered above is played
+        # by every player through a multi-tap delay line
+        _Ensemble(n_ensemble, samples_per_beat, total_samples,
+                  getattr(part, 'ensemble_detune', 0.0)).process(part_buf)
+
+    # Apply effects — automation is read at control rate as one
+    # continuous pass goes through
+    automation = None
+    if part._automation:
+        automation = _Automation(part, total_samples, samples_per_beat,
+                                 tempo_map)
+        chain = EffectChain.for_part(part, total_samples, automation)
+        if chain.active:
+            part_buf = chain.process(part_buf)
+        part_buf = _automate_volume(part_buf, part, automation, 0)
+    elif EffectChain.for_part(part).active:
+        part_buf = _apply_part_effects(part_buf, part)
+
+    # Sidechain compression needs the kick — hand the mono signal back
+    if getattr(part, 'sidechain', 0) > 0:
+        return spread_buf, part_buf, None
+    send = _send_signal(part_buf, spread_buf) if part.sends else None
+
+    # Pan mono part into stereo, then apply stereo reverb
+    if _reverb_automated(automation):
+        stereo = _apply_automated_reverb_stereo(part_buf, part, automation)
+        if part.pan != 0:
+            angle = (part.pan + 1.0) * 0.25 * numpy.pi
+            stereo[:, 0] *= numpy.cos(angle)
+            stereo[:, 1] *= numpy.sin(angle)
+    elif part.reverb_mix > 0:
+        rev_type = getattr(part, 'reverb_type', 'algorithmic')
+        if rev_type in _IR_DURATIONS:
+            # Stereo convolution reverb
+            stereo = _apply_convolution_reverb_stereo(
+                part_buf, preset=rev_type,
+                mix=part.reverb_mix)
+        else:
+            # Stereo algorithmic reverb
+            stereo = _apply_reverb_stereo(
+                part_buf, mix=part.reverb_mix,
+                decay=part.reverb_decay)
+        # Apply pan offset to the stereo reverb
+        if part.pan != 0:
+            angle = (part.pan + 1.0) * 0.25 * numpy.pi
+            stereo[:, 0] *= numpy.cos(angle)
+            stereo[:, 1] *= numpy.sin(angle)
+    else:
+        stereo = _pan_to_stereo(part_buf, part.pan)
+    if spread_buf is not None:
+        stereo = spread_buf + stereo
+    return stereo, None, send
+
+
+def _automate_volume(mono, part, automation, start):
+    """Scale a Part's block starting at sample *start* by its volume
+    automation (its notes were voiced at ``part.volume``)."""
+    if "volume" not in automation or part.volume <= 0:
+        return mono
+    gain = automation.block("volume", start, start + len(mono)) / part.volume
+    return (mono * gain).astype(numpy.float32)
+
+
+def _reverb_automated(automation):
+    """True if *automation* moves any of the stereo reverb's settings."""
+    return automation is not None and any(
+        key in automation for key in ("reverb_mix",) + _REVERB_PARAMS)
+
+
+def _reverb_runs(part, automation, start, end):
+    """``(lo, hi, (reverb_type, decay))`` runs of a Part's reverb setup
+    over ``[start, end)``."""
+    for lo, hi, values in automation.runs(_REVERB_PARAMS, start, end):
+        yield lo, hi, (
+            values.get("reverb_type", getattr(part, "reverb_type", "algorithmic")),
+            float(values.get("reverb_decay", part.reverb_decay)))
+
+
+def _apply_automated_reverb_stereo(samples, part, automation):
+    """The Part's stereo reverb with its mix, type and decay automated.
+
+    Each reverb setup the Part uses gets one reverb, fed only the stretch
+    of signal played under it, so a change of setup leaves the earlier
+    tail ringing instead of cutting it off.
+    """
+    n = len(samples)
+    gated = {}
+    for lo, hi, setup in _reverb_runs(part, automation, 0, n):
+        feed = gated.setdefault(setup, numpy.zeros(n, dtype=numpy.float32))
+        feed[lo:hi] = samples[lo:hi]
+    wet = numpy.zeros((n, 2), dtype=numpy.float32)
+    for (reverb_type, decay), feed in gated.items():
+        if reverb_type in _IR_DURATIONS:
+            wet += _apply_convolution_reverb_stereo(feed, preset=reverb_type,
+                                                    mix=1.0)
+        else:
+            wet += _apply_reverb_stereo(feed, mix=1.0, decay=decay)
+    return _blend_reverb(samples, wet, part, automation, 0)
 
 
-def render_score(score):
+def _blend_reverb(dry, wet, part, automation, start):
+    mix = part.reverb_mix
+    if "reverb_mix" in automation:
+        mix = automation.block("reverb_mix", start, start + len(dry))
+    mix = numpy.reshape(mix, (-1, 1))
+    return (dry[:, None] * (1 - mix) + wet * mix).astype(numpy.float32)
+
+
+def _send_signal(mono, spread=None):
+    """The mono signal a Part feeds its aux buses: its processed voice plus
+    the centre of its detune spread."""
+    if spread is None:
+        return mono
+    return mono + spread.mean(axis=1)
+
+
+def _check_sends(score):
+    """Raise ValueError if a Part sends to a bus the Score doesn't have."""
+    buses = score.buses
+    for part in score.parts.values():
+        for name in part.sends:
+            if name not in buses:
+                raise ValueError(
+                    f"Part {part.name!r} sends to unknown bus {name!r}; "
+                    f"create it with score.bus({name!r}, ...).")
+
+
+def _feed_sends(sends, part, mono):
+    """Add *mono* into ``sends[bus]`` at each of *part*'s send levels."""
+    for name, level in part.sends.items():
+        if level <= 0:
+            continue
+        acc = sends.get(name)
+        if acc is None:
+            sends[name] = (mono * level).astype(numpy.float32)
+        else:
+            acc += mono * level
+
+
+def _bus_delay_params(bus):
+    """Effects params for a :class:`Bus`'s delay, fully wet."""
+    return {"delay_mix": 1.0, "delay_time": bus.delay_time,
+            "delay_feedback": bus.delay_feedback}
+
+
+def _render_bus(bus, send):
+    """Run a :class:`~pytheory.rhythm.Bus` over its summed mono *send*.
+
+    Returns the ``(N, 2)`` wet return: the delay's echoes at the bus's
+    delay level, and the stereo reverb of the send plus those echoes at
+    its reverb level. The dry signal is already in the mix.
+    """
+    ret = numpy.zeros((len(send), 2), dtype=numpy.float32)
+    if bus.delay_mix > 0:
+        echoes = _apply_effects_with_params(send, _bus_delay_params(bus))
+        echoes *= bus.delay_mix
+        ret += _pan_to_stereo(echoes, 0.0)
+        send = send + echoes
+    if bus.reverb_mix > 0:
+        if bus.reverb_type in _IR_DURATIONS:
+            wet = _apply_convolution_reverb_stereo(send, preset=bus.reverb_type,
+                                                   mix=1.0)
+        else:
+            wet = _apply_reverb_stereo(send, mix=1.0, decay=bus.reverb_decay)
+        ret += wet * bus.reverb_mix
+    return ret
+
+
+def _mix_drum_hits(voicing, hits, stereo_buf, kick_buf, scratch, offset=0,
+                   buzz=True):
+    """Mix the *hits* of a :class:`_DrumVoicing` into the buffers.
+
+    Each hit lands at its start less *offset*, with its resonance buzz
+    unless *buzz* is off; kicks also go into the mono *kick_buf*.
+    """
+    from .rhythm import DrumSound
+    starts = (voicing.starts - offset).tolist()
+    gains = voicing.gains.tolist()
+    for sound, hit_len, idx in voicing.groups(hits):
+        mono, stereo = _drum_template(sound, hit_len)
+        hit = scratch.take("hit", (hit_len, 2))
+        for i in idx.tolist():
+            start = starts[i]
+            numpy.multiply(stereo, gains[i], out=hit)
+            if buzz:
+                ring = voicing.buzz_stereo(i)
+                if ring is not None:
+                    hit[:len(ring)] += ring
+            target = stereo_buf[start:start + hit_len]
+            numpy.add(target, hit, out=target)
+            # Sidechain trigger — kick only
+            if sound == DrumSound.KICK.value:
+                target = kick_buf[start:start + hit_len]
+                target += mono * gains[i]
+
+
+def _render_drum_stem(drum_part, score, total_samples, samples_per_beat,
+                      tempo_map=None):
+    """Render one drum Part's hits through its effects.
+
+    Returns ``(stereo, kick)``: the Part's panned ``(N, 2)`` kit and the
+    mono kick signal used as the sidechain trigger. Hits are grouped by
+    sound and length, so each pre-panned template is looked up once and
+    scaled into the kit in place; choke fades go in afterwards as one
+    gain pass. Stretches that repeat exactly (see :func:`_periodic_runs`)
+    are mixed once and tiled.
+    """
+    kick = numpy.zeros(total_samples, dtype=numpy.float32)
+    part_stereo = numpy.zeros((total_samples, 2), dtype=numpy.float32)
+    voicing = _DrumVoicing(
+        _drum_schedule(drum_part, total_samples, samples_per_beat, tempo_map,
+                       swing=score.swing,
+                       humanize=getattr(score, '_drum_humanize', 0.15)),
+        total_samples, drum_part.volume)
+    scratch = _ScratchArena()
+    # A groove repeated bar after bar is mixed for one period and tiled
+    # across the rest; only what's left over is mixed hit by hit
+    rest = numpy.ones(len(voicing.starts), dtype=bool)
+    for first, per, times, period in voicing.periods():
+        hits = numpy.arange(first, first + per)
+        base = int(voicing.starts[first])
+        span = int((voicing.starts[hits] + voicing.lens[hits]).max()) - base
+        block = numpy.zeros((span, 2), dtype=numpy.float32)
+        block_kick = numpy.zeros(span, dtype=numpy.float32)
+        _mix_drum_hits(voicing, hits, block, block_kick, scratch,
+                       offset=base, buzz=False)
+        _mix_tiled(part_stereo, block, base, period, times)
+        _mix_tiled(kick, block_kick, base, period, times)
+        rest[first:first + per * times] = False
+        for i in voicing.buzz:
+            if first <= i < first + per * times:
+                buzz = voicing.buzz_stereo(i)
+                start = int(voicing.starts[i])
+                part_stereo[start:start + len(buzz)] += buzz
+    _mix_drum_hits(voicing, numpy.flatnonzero(rest), part_stereo, kick,
+                   scratch)
+    # Chokes notch the kit just before each choking hit
+    _apply_chokes(part_stereo, voicing.fade_starts, voicing.fade_lens)
+
+    # Apply this drum Part's effects
+    if EffectChain.for_part(drum_part).active:
+        for ch in range(2):
+            part_stereo[:, ch] = _apply_part_effects(part_stereo[:, ch], drum_part)
+    return part_stereo, kick
+
+
+# Finished per-Part stems (post-effects, pre-master), keyed by the Part's
+# fingerprint and the sample rate — tweak one Part of a big arrangement
+# and every other Part comes straight back from here, so only that Part
+# and the master bus re-render. Only Parts that render deterministically
+# are kept.
+_STEM_CACHE = AudioCache(512 * 1024 * 1024)
+
+
+def _stem_is_deterministic(part, score):
+    """True if rendering *part* draws no fresh random numbers."""
+    if part.is_drums:
+        return getattr(score, '_drum_humanize', 0.15) <= 0
+    return part.humanize <= 0 and part.analog <= 0 and part.noise_mix <= 0
+
+
+def _cached_stem(render_fn, part, score, *args):
+    """Call ``render_fn(part, score, *args)`` through the stem cache."""
+    if not _stem_is_deterministic(part, score):
+        return render_fn(part, score, *args)
+    key = (render_fn.__name__, part.fingerprint(score), _rate())
+    stem = _STEM_CACHE.get(key)
+    if stem is not None:
+        return stem
+    stem = render_fn(part, score, *args)
+    for arr in stem:
+        if arr is not None:
+            arr.flags.writeable = False  # shared between renders
+    _STEM_CACHE[key] = stem
+    return stem
+
+
+# Render quality tiers accepted by render_score() and play_score().
+_QUALITIES = ("draft", "final")
+
+
+def _draft_reverb(holder):
+    """The reverb settings a draft render uses in place of *holder*'s: an
+    algorithmic reverb, ringing as long as the convolution IR would."""
+    rev_type = holder.get("reverb_type", "algorithmic")
+    if rev_type not in _IR_DURATIONS:
+        return {}
+    return {"reverb_type": "algorithmic",
+            "reverb_decay": _IR_DURATIONS[rev_type]}
+
+
+def _draft_score(score):
+    """A shallow copy of *score* set up for a fast preview render.
+
+    Convolution reverbs (static, automated, and on buses) become the
+    algorithmic reverb, ensembles play a single voice, and analog drift
+    and the phaser (a per-sample allpass sweep, the slowest effect in the
+    chain) are off. Notes, drum hits and every other setting are shared
+    with the original, which is left untouched.
+    """
+    import copy
+    draft = copy.copy(score)
+    draft.parts = {}
+    for name, part in score.parts.items():
+        p = copy.copy(part)
+        p.ensemble = 1
+        p.analog = 0.0
+        p.phaser_mix = 0.0
+        for k, v in _draft_reverb(vars(part)).items():
+            setattr(p, k, v)
+        p._automation = [
+            (beat, {**changes, **_draft_reverb(changes),
+                    **({"phaser_mix": 0.0} if "phaser_mix" in changes else {})})
+            for beat, changes in part._automation]
+        draft.parts[name] = p
+    draft.buses = {}
+    for name, bus in score.buses.items():
+        b = copy.copy(bus)
+        for k, v in _draft_reverb(vars(bus)).items():
+            setattr(b, k, v)
+        draft.buses[name] = b
+    return draft
+
+
+def _at_quality(score, quality):
+    """Return *score* as it should render at *quality* (see
+    :data:`_QUALITIES`), raising ValueError for an unknown tier."""
+    if quality not in _QUALITIES:
+        raise ValueError(f"quality must be one of {_QUALITIES}, "
+                         f"got {quality!r}")
+    return _draft_score(score) if quality == "draft" else score
+
+
+def _quality_rate(quality, sample_rate):
+    """The rate to render *quality* at for output at *sample_rate*: drafts
+    render at no more than :data:`PREVIEW_RATE` and are converted up to
+    *sample_rate* afterwards (see :class:`_RateConverter`)."""
+    if quality == "draft":
+        return min(sample_rate, PREVIEW_RATE)
+    return sample_rate
+
+
+class _RateConverter:
+    """Converts stereo audio from one sample rate to another, block by block.
+
+    The windowed-sinc filter :func:`scipy.signal.resample_poly` uses, run
+    through :func:`scipy.signal.upfirdn` over the inputs its next outputs
+    still need, so a stream converted in blocks of any size comes out
+    exactly as the whole buffer converted at once. Draft renders run
+    through it on their way back up to the output rate.
+    """
+
+    def __init__(self, from_rate, to_rate):
+        import math
+        g = math.gcd(from_rate, to_rate)
+        self.up, self.down = to_rate // g, from_rate // g
+        widest = max(self.up, self.down)
+        self.half = 10 * widest
+        self.h = scipy.signal.firwin(2 * self.half + 1, 1.0 / widest,
+                                     window=("kaiser", 5.0)) * self.up
+        # Outputs land on whole steps of the filtered stream only from
+        # inputs spaced `down` apart; this is the phase they start on.
+        self._phase = self.half * pow(self.up, -1, self.down) % self.down
+        self.first = self._start(0)     # input index of pending[0]
+        self.pending = numpy.zeros((-self.first, 2), dtype=numpy.float32)
+        self.received = 0
+        self.produced = 0
+
+    def _start(self, k):
+        """The latest input, on the right phase, at or before the first
+        input output *k* reads."""
+        oldest = -((self.half - k * self.down) // self.up)
+        return oldest - (oldest - self._phase) % self.down
+
+    def process(self, block, final=False, length=None):
+        """Feed *block* and return every output it completes. With
+        *final*, the input has ended: the remaining outputs are flushed,
+        up to *length* in all (default: the input length at the new
+        rate)."""
+        self.pending = numpy.concatenate(
+            [self.pending, numpy.asarray(block, dtype=numpy.float32)])
+        self.received += len(block)
+        if final:
+            end = length
+            if end is None:
+                end = -(-self.received * self.up // self.down)
+        else:
+            # Outputs whose newest input has arrived
+            end = (self.received * self.up - 1 - self.half) // self.down + 1
+        end = max(end, self.produced)
+        n = end - self.produced
+        if not n:
+            return numpy.zeros((0, 2), dtype=numpy.float32)
+
+        # Inputs past the end of the stream are silence
+        newest = ((end - 1) * self.down + self.half) // self.up
+        short = newest + 1 - (self.first + len(self.pending))
+        if short > 0:
+            self.pending = numpy.concatenate(
+                [self.pending, numpy.zeros((short, 2), numpy.float32)])
+        filtered = scipy.signal.upfirdn(self.h, self.pending, self.up,
+                                        self.down, axis=0)
+        skip = (self.produced * self.down + self.half
+                - self.first * self.up) // self.down
+        out = filtered[skip:skip + n].astype(numpy.float32)
+        self.produced = end
+
+        # Drop the inputs no later output reads
+        start = self._start(end)
+        if start > self.first:
+            self.pending = self.pending[start - self.first:]
+            self.first = start
+        return out
+
+
+def _render_at(score, render_rate, sample_rate, workers=None):
+    """Render *score* (already at its quality) at *render_rate*, returned
+    at *sample_rate* — as long as a render at that rate would be."""
+    with _at_rate(render_rate):
+        buf = _render_score(score, workers)
+    if render_rate == sample_rate:
+        return buf
+    with _at_rate(sample_rate):
+        length = _score_length(score)
+    return _RateConverter(render_rate, sample_rate).process(
+        buf, final=True, length=length)
+
+
+def render_score(score, *, workers=None, quality="final", sample_rate=None):
     """Render a Score to a float32 audio buffer.
 
     Mixes all parts (named and default), plus drum hits, into a
     single normalized buffer.
 
+    Every Part renders into its own buffer through its own effects, so
+    with ``workers`` the Parts (drum Parts included) render concurrently
+    on a thread pool — a big arrangement takes roughly as long as its
+    slowest Part. The stems are summed in Part order either way.
+
     Args:
         score: A :class:`Score` object.
+        workers: Thread count for rendering Parts concurrently.
+            ``None`` or ``1`` (the default) renders them one at a time.
+        quality: ``"final"`` (the default) renders the full sound.
+            ``"draft"`` is a quick preview for while you compose:
+            convolution reverbs are swapped for the algorithmic reverb,
+            and ensembles, analog drift and the phaser are skipped.
+        sample_rate: Rate to render at, in Hz (default ``SAMPLE_RATE``).
+            Every synth, envelope, effect and impulse response runs
+            natively at this rate — ``48_000`` for delivery, or
+            ``22_050`` for a preview at about half the cost. A draft
+            renders at ``PREVIEW_RATE`` when *sample_rate* is higher,
+            then is converted up to it, so drafts and finals come back
+            at the same rate.
 
     Returns:
-        Float32 stereo numpy array (N, 2).
+        Float32 stereo numpy array (N, 2) at *sample_rate*.
     """
+    score = _at_quality(score, quality)
+    rate = _check_rate(sample_rate)
+    return _render_at(score, _quality_rate(quality, rate), rate, workers)
+
+
+def _render_score(score, workers):
+    """The body of :func:`render_score`, at the current render rate."""
     # Build tempo map for variable tempo support
-    tempo_map = _build_tempo_map(score)
+    tempo_map = TempoMap.from_score(score)
     has_tempo_changes = len(tempo_map) > 1
 
-    samples_per_beat = int(SAMPLE_RATE * 60.0 / score.bpm)
+    samples_per_beat = int(_rate() * 60.0 / score.bpm)
     total_beats = score.total_beats
 
     if has_tempo_changes:
-        total_samples = _total_samples_from_tempo_map(total_beats, tempo_map)
+        total_samples = tempo_map.beat_to_sample(total_beats)
     else:
         total_samples = int(total_beats * samples_per_beat)
+        tempo_map = None
     # Stereo master buffer
     stereo_buf = numpy.zeros((total_samples, 2), dtype=numpy.float32)
     # Mono buffer for backwards-compat rendering
     buf = numpy.zeros(total_samples, dtype=numpy.float32)
 
+    _check_sends(score)
+    # Named parts — each rendered to own buffer for per-part effects;
+    # purely-drum parts are rendered separately via _drum_hits
+    note_parts = [p for p in score.parts.values() if p.notes]
+    drum_parts = [p for p in score.parts.values() if p.is_drums]
+    args = (score, total_samples, samples_per_beat, tempo_map)
+    if workers is not None and workers > 1 and len(note_parts) + len(drum_parts) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Each task runs in a copy of this context, so the workers
+            # render at this render's sample rate.
+            part_futures = [pool.submit(contextvars.copy_context().run,
+                                        _cached_stem, _render_part_stem,
+                                        p, *args)
+                            for p in note_parts]
+            drum_futures = [pool.submit(contextvars.copy_context().run,
+                                        _cached_stem, _render_drum_stem,
+                                        p, *args)
+                            for p in drum_parts]
+            part_stems = [f.result() for f in part_futures]
+            drum_stems = [f.result() for f in drum_futures]
+    else:
+        part_stems = [_cached_stem(_render_part_stem, p, *args)
+                      for p in note_parts]
+        drum_stems = [_cached_stem(_render_drum_stem, p, *args)
+                      for p in drum_parts]
+
     # Default notes (backwards-compatible .add() calls)
     if score.notes:
         _render_notes_to_buf(
             score.notes, buf, samples_per_beat, total_samples,
             sine_wave, Envelope.PIANO.value, 0.5, score.bpm,
-            swing=score.swing, tempo_map=tempo_map if has_tempo_changes else None)
+            swing=score.swing, tempo_map=tempo_map)
 
-    # Named parts — each rendered to own buffer for per-part effects
+    # Aux sends, summed per bus
+    sends = {}
     _pending_sidechain = []
-    for part in score.parts.values():
-        if part.is_drums and not part.notes:
-            continue  # purely-drum parts are rendered separately via _drum_hits
-        if part.notes:
-            part_buf = numpy.zeros(total_samples, dtype=numpy.float32)
-            synth_fn = _resolve_synth(part.synth)
-            env_tuple = _resolve_envelope(part.envelope)
-            # Use part swing if set, otherwise score swing
-            effective_swing = part.swing if part.swing is not None else score.swing
-            # Build synth-specific kwargs (e.g. FM ratio/index, tape, folds)
-            synth_kwargs = dict(getattr(part, 'synth_kw', None) or {})
-            if part.synth in ("fm",):
-                synth_kwargs["mod_ratio"] = part.fm_ratio
-                synth_kwargs["mod_index"] = part.fm_index
-            _temperament = getattr(score, 'temperament', 'equal')
-            _ref_pitch = getattr(score, 'reference_pitch', 440.0)
-
-            n_ensemble = max(1, getattr(part, 'ensemble', 1))
-
-            if n_ensemble > 1:
-                # FAST ENSEMBLE: render once, duplicate with time shifts
-                # Render the "reference" voice with light humanize
-                if part.legato:
-                    _render_legato_to_buf(
-                        part.notes, part_buf, samples_per_beat, total_samples,
-                        synth_fn, env_tuple, part.volume, score.bpm,
-                        glide_time=part.glide, swing=effective_swing,
-                        tempo_map=tempo_map if has_tempo_changes else None,
-                        temperament=_temperament, reference_pitch=_ref_pitch)
-                else:
-                    _render_notes_to_buf(
-                        part.notes, part_buf, samples_per_beat, total_samples,
-                        synth_fn, env_tuple, part.volume, score.bpm,
-                        swing=effective_swing,
-                        tempo_map=tempo_map if has_tempo_changes else None,
-                        humanize=part.humanize,
-                        detune=part.detune,
-                        spread=part.spread,
-                        stereo_buf=stereo_buf,
-                        sub_osc=part.sub_osc,
-                        noise_mix=part.noise_mix,
-                        filter_attack=part.filter_attack,
-                        filter_decay=part.filter_decay,
-                        filter_sustain=part.filter_sustain,
-                        filter_amount=part.filter_amount,
-                        vel_to_filter=part.vel_to_filter,
-                        filter_q=part.lowpass_q,
-                        synth_kwargs=synth_kwargs,
-                        temperament=_temperament,
-                        reference_pitch=_ref_pitch,
-                        analog=part.analog)
-
-                # Now duplicate with per-player offsets (cheap buffer ops)
-                import random as _random_mod
-                ref_buf = part_buf.copy()
-                part_buf *= 1.0 / n_ensemble  # scale down the reference voice
-
-                for _ens_i in range(1, n_ensemble):
-                    # Per-voice RNG instance — never reseed the global
-                    # `random`, which other threads in render_scores() share.
-                    _ens_rnd = _random_mod.Random(42 + _ens_i * 7)
-                    _player_tendency = _ens_rnd.gauss(0, 0.018)
-                    shift_samples = int(_player_tendency * samples_per_beat)
-
-                    voice = ref_buf.copy()
-
-                    # Time shift — player rushes or drags
-                    if shift_samples > 0 and shift_samples < total_samples:
-                        voice[shift_samples:] = voice[:-shift_samples].copy()
-                        voice[:shift_samples] = 0
-                    elif shift_samples < 0 and abs(shift_samples) < total_samples:
-                        voice[:shift_samples] = voice[-shift_samples:].copy()
-                        voice[shift_samples:] = 0
-
-                    # Slight velocity variation per voice
-                    vel_var = 1.0 + _ens_rnd.gauss(0, 0.04)
-                    voice *= vel_var
-
-                    part_buf += voice / n_ensemble
-            else:
-                if part.legato:
-                    _render_legato_to_buf(
-                        part.notes, part_buf, samples_per_beat, total_samples,
-                        synth_fn, env_tuple, part.volume, score.bpm,
-                        glide_time=part.glide, swing=effective_swing,
-                        tempo_map=tempo_map if has_tempo_changes else None,
-                        temperament=_temperament, reference_pitch=_ref_pitch)
-                else:
-                    _render_notes_to_buf(
-                        part.notes, part_buf, samples_per_beat, total_samples,
-                        synth_fn, env_tuple, part.volume, score.bpm,
-                        swing=effective_swing,
-                        tempo_map=tempo_map if has_tempo_changes else None,
-                        humanize=part.humanize,
-                        detune=part.detune,
-                        spread=part.spread,
-                        stereo_buf=stereo_buf,
-                        sub_osc=part.sub_osc,
-                        noise_mix=part.noise_mix,
-                        filter_attack=part.filter_attack,
-                        filter_decay=part.filter_decay,
-                        filter_sustain=part.filter_sustain,
-                        filter_amount=part.filter_amount,
-                        vel_to_filter=part.vel_to_filter,
-                        filter_q=part.lowpass_q,
-                        synth_kwargs=synth_kwargs,
-                        temperament=_temperament,
-                        reference_pitch=_ref_pitch,
-                        analog=part.analog)
-
-            # Apply effects — segmented if automation exists
-            auto_points = part._get_automation_points()
-            if auto_points:
-                # Split buffer at automation boundaries, process each segment
-                boundaries = sorted(set([0.0] + auto_points + [total_beats]))
-                for i in range(len(boundaries) - 1):
-                    seg_start_beat = boundaries[i]
-                    seg_end_beat = boundaries[i + 1]
-                    seg_start = int(seg_start_beat * samples_per_beat)
-                    seg_end = min(int(seg_end_beat * samples_per_beat),
-                                  total_samples)
-                    if seg_end <= seg_start:
-                        continue
-                    params = part._get_params_at(seg_start_beat)
-                    segment = part_buf[seg_start:seg_end].copy()
-                    has_fx = any(params.get(k, 0) > 0 for k in
-                                ["saturation", "tremolo_depth",
-                                 "distortion_mix", "cabinet", "chorus_mix",
-                                 "phaser_mix", "highpass", "lowpass",
-                                 "delay_mix", "reverb_mix"])
-                    if has_fx:
-                        segment = _apply_effects_with_params(segment, params)
-                    # Apply volume automation
-                    seg_vol = params.get("volume", part.volume)
-                    if seg_vol != part.volume:
-                        segment = segment * (seg_vol / part.volume) if part.volume > 0 else segment
-                    part_buf[seg_start:seg_end] = segment
-            else:
-                has_fx = (part.saturation > 0 or part.tremolo_depth > 0
-                          or part.distortion_mix > 0 or part.cabinet > 0
-                          or part.chorus_mix > 0
-                          or part.phaser_mix > 0 or part.highpass > 0
-                          or part.lowpass > 0 or part.delay_mix > 0
-                          or part.reverb_mix > 0)
-                if has_fx:
-                    part_buf = _apply_part_effects(part_buf, part)
-            # Apply sidechain compression if enabled
-            if getattr(part, 'sidechain', 0) > 0:
-                _pending_sidechain.append((part, part_buf))
-            else:
-                # Pan mono part into stereo, then apply stereo reverb
-                if part.reverb_mix > 0:
-                    rev_type = getattr(part, 'reverb_type', 'algorithmic')
-                    if rev_type in _IR_DURATIONS:
-                        # Stereo convolution reverb
-                        rev_stereo = _apply_convolution_reverb_stereo(
-                            part_buf, preset=rev_type,
-                            mix=part.reverb_mix)
-                    else:
-                        # Stereo algorithmic reverb
-                        rev_stereo = _apply_reverb_stereo(
-                            part_buf, mix=part.reverb_mix,
-                            decay=part.reverb_decay)
-                    # Apply pan offset to the stereo reverb
-                    if part.pan != 0:
-                        angle = (part.pan + 1.0) * 0.25 * numpy.pi
-                        rev_stereo[:, 0] *= numpy.cos(angle)
-                        rev_stereo[:, 1] *= numpy.sin(angle)
-                    stereo_buf += rev_stereo
-                else:
-                    stereo_buf += _pan_to_stereo(part_buf, part.pan)
-
-    # Drum pan map — how a real kit is mic'd from the audience perspective
-    from .rhythm import DrumSound
-    _DRUM_PAN = {
-        DrumSound.KICK.value: 0.0,          # center
-        DrumSound.SNARE.value: 0.0,         # center
-        DrumSound.RIMSHOT.value: -0.1,      # slightly left
-        DrumSound.CLAP.value: 0.0,          # center
-        DrumSound.CLOSED_HAT.value: 0.3,    # right
-        DrumSound.OPEN_HAT.value: 0.3,      # right
-        DrumSound.PEDAL_HAT.value: 0.3,     # right
-        DrumSound.LOW_TOM.value: 0.4,       # right
-        DrumSound.MID_TOM.value: 0.0,       # center
-        DrumSound.HIGH_TOM.value: -0.3,     # left
-        DrumSound.CRASH.value: -0.4,        # left
-        DrumSound.RIDE.value: 0.4,          # right
-        DrumSound.RIDE_BELL.value: 0.4,     # right
-        DrumSound.COWBELL.value: 0.2,       # slightly right
-        DrumSound.CLAVE.value: -0.2,        # slightly left
-        DrumSound.SHAKER.value: 0.35,       # right
-        DrumSound.TAMBOURINE.value: -0.25,  # slightly left
-        DrumSound.CONGA_HIGH.value: -0.3,   # left
-        DrumSound.CONGA_LOW.value: 0.2,     # slightly right
-        DrumSound.BONGO_HIGH.value: -0.2,   # slightly left
-        DrumSound.BONGO_LOW.value: 0.15,    # slightly right
-        DrumSound.TIMBALE_HIGH.value: -0.25,
-        DrumSound.TIMBALE_LOW.value: 0.2,
-        DrumSound.AGOGO_HIGH.value: -0.3,
-        DrumSound.AGOGO_LOW.value: 0.25,
-        DrumSound.GUIRO.value: -0.15,
-        DrumSound.MARACAS.value: 0.3,
-        # Tabla: dayan (right drum) slightly right, bayan slightly left
-        DrumSound.TABLA_NA.value: 0.2,
-        DrumSound.TABLA_TIN.value: 0.2,
-        DrumSound.TABLA_TIT.value: 0.25,
-        DrumSound.TABLA_GE.value: -0.2,
-        DrumSound.TABLA_KE.value: -0.2,
-        DrumSound.TABLA_DHA.value: 0.0,   # both drums = center
-        DrumSound.TABLA_GE_BEND.value: -0.2,
-        # Dhol: bass left, treble right
-        DrumSound.DHOL_DAGGA.value: -0.2,
-        DrumSound.DHOL_TILLI.value: 0.2,
-        DrumSound.DHOL_BOTH.value: 0.0,
-        # Dholak: similar to dhol
-        DrumSound.DHOLAK_GE.value: -0.15,
-        DrumSound.DHOLAK_NA.value: 0.15,
-        DrumSound.DHOLAK_TIT.value: 0.2,
-        # Mridangam: bass left, treble right
-        DrumSound.MRIDANGAM_THAM.value: -0.2,
-        DrumSound.MRIDANGAM_NAM.value: 0.2,
-        DrumSound.MRIDANGAM_DIN.value: 0.0,
-        DrumSound.MRIDANGAM_THA.value: 0.15,
-        # Djembe: centered (single drum)
-        DrumSound.DJEMBE_BASS.value: 0.0,
-        DrumSound.DJEMBE_TONE.value: 0.1,
-        DrumSound.DJEMBE_SLAP.value: -0.1,
-        # Doumbek
-        DrumSound.DOUMBEK_DUM.value: 0.0,
-        DrumSound.DOUMBEK_TEK.value: 0.1,
-        DrumSound.DOUMBEK_KA.value: -0.1,
-        # Cajon — centered (single instrument)
-        DrumSound.CAJON_BASS.value: 0.0,
-        DrumSound.CAJON_SLAP.value: 0.0,
-        DrumSound.CAJON_SLAP_SNARE.value: 0.0,
-        DrumSound.CAJON_TAP.value: 0.1,
-        # Metal kit
-        DrumSound.METAL_KICK.value: 0.0,
-        DrumSound.METAL_SNARE.value: 0.0,
-        DrumSound.METAL_HAT.value: 0.3,
-        # Marching — centered
-        DrumSound.MARCH_SNARE.value: 0.0,
-        DrumSound.MARCH_RIMSHOT.value: 0.0,
-        DrumSound.MARCH_CLICK.value: 0.0,
-        # Quads — spread across the field
-        DrumSound.QUAD_1.value: -0.3,
-        DrumSound.QUAD_2.value: -0.1,
-        DrumSound.QUAD_3.value: 0.1,
-        DrumSound.QUAD_4.value: 0.3,
-        DrumSound.QUAD_SPOCK.value: 0.0,
-        # Bass drums — spread wide
-        DrumSound.BASS_1.value: -0.5,
-        DrumSound.BASS_2.value: -0.25,
-        DrumSound.BASS_3.value: 0.0,
-        DrumSound.BASS_4.value: 0.25,
-        DrumSound.BASS_5.value: 0.5,
-    }
-
-    # Render all drum Parts (may be one "drums" or split into kick/snare/hats/etc.)
-    import random as _drum_rnd
-    drum_buf = numpy.zeros(total_samples, dtype=numpy.float32)  # mono for sidechain (kick only)
+    for part, (stereo, ducked, send) in zip(note_parts, part_stems):
+        if stereo is not None:
+            stereo_buf += stereo
+        if ducked is not None:
+            _pending_sidechain.append((part, ducked, stereo))
+        if send is not None:
+            _feed_sends(sends, part, send)
+
+    # Drums: mono kick for sidechain, stereo panned kit (effects applied)
+    drum_buf = numpy.zeros(total_samples, dtype=numpy.float32)
     drum_stereo = numpy.zeros((total_samples, 2), dtype=numpy.float32)
-    drum_swing = score.swing
-    drum_humanize = getattr(score, '_drum_humanize', 0.15)
-
-    drum_parts = [p for p in score.parts.values() if p.is_drums]
-    for drum_part in drum_parts:
-        part_stereo = numpy.zeros((total_samples, 2), dtype=numpy.float32)
-        # Track last hit position per sound for choke (new hit dampens
-        # the previous ring on the same drum)
-        _last_hit_start = {}
-        _resonance = {}  # sound_id → resonance level (0.0–1.0)
-
-        for hit in drum_part._drum_hits:
-            pos = hit.position
-            if drum_swing > 0:
-                beat_frac = pos % 1.0
-                if 0.1 < beat_frac < 0.9:
-                    pos += drum_swing * 0.15
-            if has_tempo_changes:
-                start = _beat_to_sample(pos, tempo_map)
-            else:
-                start = int(pos * samples_per_beat)
-            if drum_humanize > 0:
-                max_offset = int(drum_humanize * 0.03 * samples_per_beat)
-                start += _drum_rnd.randint(-max_offset, max_offset)
-                start = max(0, start)
-            if start >= total_samples or start < 0:
-                continue
-
-            # Choke: if the same sound was hit recently, fade out
-            # the tail at this point (new hit dampens old resonance)
-            sound_id = hit.sound.value
-            if sound_id in _last_hit_start:
-                prev_start = _last_hit_start[sound_id]
-                # Quick 2ms fade-out at the new hit position
-                fade_len = min(int(SAMPLE_RATE * 0.002), max(0, start - prev_start))
-                if fade_len > 0 and start > 0:
-                    fade = numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
-                    fade_start = max(0, start - fade_len)
-                    for ch in range(2):
-                        part_stereo[fade_start:start, ch] *= fade
-            _last_hit_start[sound_id] = start
-
-            # Cross-choke: a new hit on one sound dampens the ring of
-            # related sounds on the same instrument (e.g. djembe slap
-            # kills the bass resonance, closed hat kills open hat).
-            _CHOKE_GROUPS = {
-                # Djembe — any strike dampens the others
-                DrumSound.DJEMBE_BASS.value: (DrumSound.DJEMBE_TONE.value, DrumSound.DJEMBE_SLAP.value),
-                DrumSound.DJEMBE_TONE.value: (DrumSound.DJEMBE_BASS.value, DrumSound.DJEMBE_SLAP.value),
-                DrumSound.DJEMBE_SLAP.value: (DrumSound.DJEMBE_BASS.value, DrumSound.DJEMBE_TONE.value),
-                # Hi-hats — closed chokes open
-                DrumSound.CLOSED_HAT.value: (DrumSound.OPEN_HAT.value,),
-                DrumSound.PEDAL_HAT.value: (DrumSound.OPEN_HAT.value,),
-                # Cajón — slap dampens bass ring
-                DrumSound.CAJON_SLAP.value: (DrumSound.CAJON_BASS.value,),
-                DrumSound.CAJON_TAP.value: (DrumSound.CAJON_BASS.value,),
-                # Doumbek — tek/ka dampen dum
-                DrumSound.DOUMBEK_TEK.value: (DrumSound.DOUMBEK_DUM.value,),
-                DrumSound.DOUMBEK_KA.value: (DrumSound.DOUMBEK_DUM.value,),
-            }
-            choke_targets = _CHOKE_GROUPS.get(sound_id, ())
-            for target_id in choke_targets:
-                if target_id in _last_hit_start:
-                    prev_start = _last_hit_start[target_id]
-                    fade_len = min(int(SAMPLE_RATE * 0.004), max(0, start - prev_start))
-                    if fade_len > 0 and start > 0:
-                        fade = numpy.linspace(1.0, 0.0, fade_len).astype(numpy.float32)
-                        fade_start = max(0, start - fade_len)
-                        for ch in range(2):
-                            part_stereo[fade_start:start, ch] *= fade
-
-            remaining = total_samples - start
-            hit_len = min(int(SAMPLE_RATE * 0.5), remaining)
-            wave = _render_drum_hit_cached(hit.sound.value, hit_len)
-            vel = hit.velocity
-            if drum_humanize > 0:
-                vel_jitter = int(drum_humanize * 10)
-                vel = max(1, min(127, vel + _drum_rnd.randint(-vel_jitter, vel_jitter)))
-            vel_scale = vel / 127.0
-
-            # Sympathetic resonance: marching snare builds up buzz
-            # as hits accumulate. Each hit adds to a resonance counter
-            # that scales extra snare wire buzz into the sound.
-            _RESONANCE_SOUNDS = {
-                DrumSound.MARCH_SNARE.value, DrumSound.MARCH_RIMSHOT.value,
-            }
-            if sound_id in _RESONANCE_SOUNDS:
-                reso = _resonance.get(sound_id, 0.0)
-                # Decay based on gap since last hit
-                if sound_id in _last_hit_start:
-                    gap_samples = start - _last_hit_start[sound_id]
-                    gap_sec = gap_samples / SAMPLE_RATE
-                    if gap_sec > 1.0:
-                        reso *= 0.2
-                    elif gap_sec > 0.5:
-                        reso *= 0.5
-                    elif gap_sec > 0.25:
-                        reso *= 0.8
-                # Build up (caps at 0.6)
-                reso = min(0.6, reso + 0.08)
-                _resonance[sound_id] = reso
-                # Add sympathetic buzz proportional to resonance
-                if reso > 0.1:
-                    buzz_len = min(int(SAMPLE_RATE * 0.06), hit_len)
-                    buzz = _noise(buzz_len) * reso * 0.18
-                    if buzz_len > 20:
-                        bl, al = scipy.signal.butter(
-                            2, [3000, 9000], btype='band', fs=SAMPLE_RATE)
-                        buzz = scipy.signal.lfilter(bl, al, buzz)
-                    buzz *= _exp_decay(buzz_len, 25)
-                    wave[:buzz_len] = wave[:buzz_len] + buzz.astype(numpy.float32)
-
-            mono_hit = wave * vel_scale * 0.7 * drum_part.volume
-            # Sidechain trigger — kick only
-            if hit.sound.value == DrumSound.KICK.value:
-                drum_buf[start:start + hit_len] += mono_hit
-            # Stereo panned output for this drum Part
-            pan = _DRUM_PAN.get(hit.sound.value, 0.0)
-            panned = _pan_to_stereo(mono_hit, pan)
-            part_stereo[start:start + hit_len] += panned
-
-        # Apply this drum Part's effects
-        has_drum_fx = (drum_part.saturation > 0 or drum_part.tremolo_depth > 0
-                          or drum_part.phaser_mix > 0
-                          or drum_part.highpass > 0 or drum_part.lowpass > 0
-                          or drum_part.delay_mix > 0
-                       or drum_part.reverb_mix > 0 or drum_part.distortion_mix > 0
-                       or drum_part.cabinet > 0
-                       or drum_part.chorus_mix > 0)
-        if has_drum_fx:
-            for ch in range(2):
-                part_stereo[:, ch] = _apply_part_effects(part_stereo[:, ch], drum_part)
+    for part, (part_stereo, kick) in zip(drum_parts, drum_stems):
+        drum_buf += kick
         drum_stereo += part_stereo
+        if part.sends:
+            _feed_sends(sends, part, part_stereo.mean(axis=1))
 
     # Apply sidechain compression to parts that request it
-    for part, part_buf in _pending_sidechain:
+    for part, part_buf, spread in _pending_sidechain:
         part_buf = _apply_sidechain(
             part_buf, drum_buf,
             amount=part.sidechain,
             release=part.sidechain_release)
         stereo_buf += _pan_to_stereo(part_buf, part.pan)
+        if part.sends:
+            _feed_sends(sends, part, _send_signal(part_buf, spread))
+
+    # Aux bus returns — one pass of each bus's effects over its summed sends
+    for name, send in sends.items():
+        stereo_buf += _render_bus(score.buses[name], send)
 
     # Default notes (mono, center)
     if score.notes:
@@ -6674,7 +9289,763 @@ def render_score(score):
     return stereo_buf
 
 
-def play_score(score):
+# ── Streaming render ────────────────────────────────────────────────────────
+#
+# render_score() builds every buffer at full song length. The classes below
+# are its block-at-a-time twins: notes and drum hits are synthesized into
+# sliding windows just before they are needed, every effect keeps its state
+# (filter memory, delay lines, LFO phase, reverb tails) between blocks, and
+# the master bus follows the mix as it goes. Memory is bounded by the longest
+# note, hit or effect tail in flight instead of by the length of the song.
+
+class _SampleWindow:
+    """Sliding float32 buffer addressed by absolute sample index.
+
+    Notes and hits are mixed in at their real timeline positions, finished
+    blocks are read back out, and everything before the current block is
+    released — so the buffer only ever spans what is still ringing.
+    """
+
+    def __init__(self, channels=1):
+        self.channels = channels
+        self.offset = 0           # absolute sample index of data[0]
+        self.data = numpy.zeros(self._shape(4096), dtype=numpy.float32)
+
+    def _shape(self, n):
+        return (n,) if self.channels == 1 else (n, self.channels)
+
+    def _reserve(self, end):
+        need = end - self.offset
+        if need > len(self.data):
+            grown = numpy.zeros(self._shape(max(need, 2 * len(self.data))),
+                                dtype=numpy.float32)
+            grown[:len(self.data)] = self.data
+            self.data = grown
+
+    def add(self, start, block):
+        """Mix *block* in, starting at absolute sample *start*."""
+        if start < self.offset:
+            block = block[self.offset - start:]
+            start = self.offset
+        if len(block) == 0:
+            return
+        self._reserve(start + len(block))
+        i = start - self.offset
+        self.data[i:i + len(block)] += block
+
+    def scale(self, start, gain):
+        """Multiply ``[start, start + len(gain))`` by the 1-D ramp *gain*."""
+        lo = max(start, self.offset)
+        hi = min(start + len(gain), self.offset + len(self.data))
+        if hi <= lo:
+            return
+        g = gain[lo - start:hi - start]
+        if self.channels > 1:
+            g = g[:, None]
+        self.data[lo - self.offset:hi - self.offset] *= g
+
+    def read(self, start, end):
+        """Return a copy of ``[start, end)``; unwritten samples are zero."""
+        out = numpy.zeros(self._shape(end - start), dtype=numpy.float32)
+        lo = max(start, self.offset)
+        hi = min(end, self.offset + len(self.data))
+        if hi > lo:
+            out[lo - start:hi - start] = \
+                self.data[lo - self.offset:hi - self.offset]
+        return out
+
+    def release(self, upto):
+        """Forget everything before absolute sample *upto*."""
+        k = upto - self.offset
+        if k <= 0:
+            return
+        if k >= len(self.data):
+            self.data[:] = 0
+            self.offset = upto
+        elif k >= len(self.data) // 2:
+            # Compact only once half the buffer is dead, so the copy is
+            # amortized over many blocks.
+            keep = len(self.data) - k
+            self.data[:keep] = self.data[k:]
+            self.data[keep:] = 0
+            self.offset = upto
+
+
+class _NoteFeed:
+    """Pulls note events into a :class:`_SampleWindow` as blocks need them.
+
+    Events come from :func:`_iter_note_events` in order of their nominal
+    (pre-humanize) start, so once the next nominal start is past
+    ``upto + margin`` no remaining note can sound before ``upto``.
+    """
+
+    def __init__(self, events, margin, spread=False):
+        self.events = events
+        self.margin = margin
+        self.mono = _SampleWindow()
+        self.spread = _SampleWindow(2) if spread else None
+        self._next = None
+
+    def fill(self, upto):
+        while self.events is not None:
+            if self._next is None:
+                self._next = next(self.events, None)
+                if self._next is None:
+                    self.events = None
+                    break
+            nominal, start, mono, spread = self._next
+            if nominal >= upto + self.margin:
+                break
+            self.mono.add(start, mono)
+            if spread is not None and self.spread is not None:
+                self.spread.add(start, spread)
+            self._next = None
+
+
+class _StreamReverb:
+    """Streaming Schroeder reverb — state persists across audio blocks.
+
+    Same topology and tuning as the offline reverb in play.py (4
+    parallel feedback combs + 2 series allpasses), but processable
+    one buffer at a time. Each comb and allpass carries its last delay
+    line's worth of feedback into the next block, and each block runs
+    the recurrence a whole delay line at a time.
+    """
+    COMB_DELAY_SECS = (0.0297, 0.0371, 0.0411, 0.0437)
+    ALLPASS_DELAY_SECS = (0.005, 0.0017)
+
+    def __init__(self, decay=1.0, sample_rate=None, comb_delays=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.combs = []
+        for d_sec in comb_delays or self.COMB_DELAY_SECS:
+            d = int(d_sec * sample_rate)
+            gain = 0.001 ** (d / sample_rate / decay)
+            # [last D values of u where u[t] = x[t] + g*u[t-D], gain]
+            self.combs.append([numpy.zeros(d), gain])
+        self.allpasses = [[numpy.zeros(int(d_sec * sample_rate)), 0.7]
+                          for d_sec in self.ALLPASS_DELAY_SECS]
+
+    @staticmethod
+    def _ring(state, x):
+        """Run ``u[t] = x[t] + g*u[t-D]`` over *x*; returns ``(u, u[t-D])``.
+
+        The :func:`_feedback_comb` stride trick: *x* is cut into rows of
+        ``D`` samples, each row one vectorized step of the recurrence
+        from the row before, with the last ``D`` values of ``u`` carried
+        in from the previous block.
+        """
+        tail, gain = state
+        d, n = len(tail), len(x)
+        k = -(-n // d)
+        u = numpy.zeros((k + 1, d))
+        u[0] = tail
+        u[1:].reshape(-1)[:n] = x
+        for row in range(1, k + 1):
+            u[row] += gain * u[row - 1]
+        u = u.reshape(-1)[:d + n]
+        state[0] = u[-d:].copy()
+        return u[d:], u[:n]
+
+    def process(self, x):
+        """Process one block; returns the wet signal."""
+        wet = numpy.zeros(len(x))
+        for state in self.combs:
+            wet += self._ring(state, x)[1]
+        wet /= len(self.combs)
+        for state in self.allpasses:
+            u, delayed = self._ring(state, wet)
+            wet = delayed - state[1] * u      # (-g + z^-D) / (1 - g*z^-D)
+        return wet.astype(numpy.float32)
+
+
+class _StreamStereoReverb:
+    """Block-at-a-time twin of the mixer's stereo reverb
+    (:func:`_apply_reverb_stereo` / :func:`_apply_convolution_reverb_stereo`).
+    """
+
+    def __init__(self, reverb_type, mix, decay=1.0, width=0.8,
+                 sample_rate=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.mix = mix
+        self.width = width
+        self.convolution = reverb_type in _IR_DURATIONS
+        if self.convolution:
+            self.sides = [
+                _Convolver(reverb_type, sample_rate, seed=42),
+                _Convolver(reverb_type, sample_rate, seed=4242),
+            ]
+        else:
+            self.sides = [
+                _StreamReverb(decay, sample_rate),
+                _StreamReverb(decay, sample_rate,
+                              comb_delays=(0.0313, 0.0389, 0.0427, 0.0453)),
+            ]
+
+    def process(self, x):
+        wet_l, wet_r = (side.process(x) for side in self.sides)
+        if not self.convolution:
+            # Crossfeed based on width (0 = mono, 1 = full stereo)
+            mid = (wet_l + wet_r) * 0.5
+            wet_l = mid + (wet_l - mid) * self.width
+            wet_r = mid + (wet_r - mid) * self.width
+        stereo = numpy.zeros((len(x), 2), dtype=numpy.float32)
+        stereo[:, 0] = x * (1 - self.mix) + wet_l * self.mix
+        stereo[:, 1] = x * (1 - self.mix) + wet_r * self.mix
+        return stereo
+
+
+class _StreamAutomatedReverb:
+    """Block-at-a-time twin of :func:`_apply_automated_reverb_stereo`."""
+
+    def __init__(self, part, automation):
+        self.part = part
+        self.automation = automation
+        self.reverbs = {}
+        self.pos = 0
+
+    def process(self, x):
+        start, n = self.pos, len(x)
+        feeds = {}
+        for lo, hi, setup in _reverb_runs(self.part, self.automation,
+                                          start, start + n):
+            if setup not in self.reverbs:
+                self.reverbs[setup] = _StreamStereoReverb(
+                    setup[0], 1.0, decay=setup[1])
+            feed = feeds.setdefault(setup, numpy.zeros(n, dtype=numpy.float32))
+            feed[lo - start:hi - start] = x[lo - start:hi - start]
+        # Reverbs not fed this block still ring out
+        wet = numpy.zeros((n, 2), dtype=numpy.float32)
+        silence = numpy.zeros(n, dtype=numpy.float32)
+        for setup, reverb in self.reverbs.items():
+            wet += reverb.process(feeds.get(setup, silence))
+        self.pos += n
+        return _blend_reverb(x, wet, self.part, self.automation, start)
+
+
+class _StreamSidechain:
+    """Block-at-a-time approximation of :func:`_apply_sidechain`.
+
+    The follower is a decoupled peak detector: the rectified trigger is
+    held and released exponentially (``held = max(x, r*held)``, a running
+    maximum in the log domain), then smoothed by a one-pole attack filter
+    through ``lfilter`` with its state carried between blocks, so there is
+    no per-sample Python loop and any block size gives the same output.
+    It ducks with the offline follower's attack and release times but
+    not its exact curve, and the envelope is normalized by its running
+    peak rather than the peak of the whole trigger, so the first kick
+    already ducks fully.
+    """
+
+    def __init__(self, amount=0.8, attack=0.001, release=0.1,
+                 sample_rate=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.amount = amount
+        self.alpha_attack = 1.0 - numpy.exp(-1.0 / (attack * sample_rate))
+        self.log_release = -1.0 / (release * sample_rate)
+        self.held = 0.0
+        self.zi = numpy.zeros(1)
+        self.peak = numpy.float32(0.0)
+
+    def process(self, samples, trigger):
+        n = len(trigger)
+        if n == 0:
+            return samples.copy()
+        # held[i] = max(held_prev * r**(i+1), max over j <= i of x[j] * r**(i-j))
+        decay = numpy.arange(1, n + 1) * self.log_release
+        with numpy.errstate(divide="ignore"):
+            logs = numpy.log(numpy.abs(trigger).astype(numpy.float64))
+            start = numpy.log(self.held)
+        logs -= decay
+        numpy.maximum.accumulate(logs, out=logs)
+        numpy.maximum(logs, start, out=logs)
+        held = numpy.exp(logs + decay)
+        self.held = float(held[-1])
+        alpha = self.alpha_attack
+        smoothed, self.zi = scipy.signal.lfilter(
+            [alpha], [1.0, alpha - 1.0], held, zi=self.zi)
+        smoothed = smoothed.astype(numpy.float32)
+        running = numpy.maximum(numpy.maximum.accumulate(smoothed), self.peak)
+        self.peak = running[-1]
+        norm = numpy.divide(smoothed, running, out=numpy.zeros_like(smoothed),
+                            where=running > 0)
+        return samples * (1.0 - norm * self.amount)
+
+
+class _StreamMasterBus:
+    """Block-at-a-time twin of :func:`_master_bus`.
+
+    DC blocker and compressor state carry across blocks. The follower's
+    gain curve is interpolated between 32-sample control blocks, so
+    output lags input by one control block (:attr:`LOOKAHEAD` samples):
+    :meth:`push` mixed audio in, :meth:`pull` mastered audio out.
+
+    Makeup gain can't look at the peak of the finished song, so it tracks
+    the running peak instead (never boosting more than 3x): it matches
+    the offline render from the loudest moment on, and the first loud
+    transient is held to the same 0.95 the offline gain would give it.
+    """
+    BLOCK = 32
+    LOOKAHEAD = 32
+
+    def __init__(self, threshold=0.7, ratio=4.0, attack=0.002,
+                 release=0.05, ceiling=0.98, sample_rate=None):
+        if sample_rate is None:
+            sample_rate = _rate()
+        self.threshold = threshold
+        self.ratio = ratio
+        self.ceiling = ceiling
+        self.alpha_a = 1.0 - numpy.exp(-self.BLOCK / (attack * sample_rate))
+        self.alpha_r = 1.0 - numpy.exp(-self.BLOCK / (release * sample_rate))
+        self.zi = None
+        self.pending = numpy.zeros((0, 2), dtype=numpy.float32)
+        self.start = 0            # absolute index of pending[0]
+        self.ctrl = []            # smoothed levels, control blocks ctrl_first..
+        self.ctrl_first = 0
+        self.ctrl_end = 0         # samples the follower has consumed
+        self.prev = None
+        self.peak = 0.0
+
+    def push(self, stereo):
+        """Feed the next stretch of the raw stereo mix."""
+        if len(stereo) == 0:
+            return
+        b, a = [1.0, -1.0], [1.0, -0.9995]
+        if self.zi is None:
+            self.zi = [scipy.signal.lfilter_zi(b, a) * stereo[0, ch]
+                       for ch in range(2)]
+        cols = []
+        for ch in range(2):
+            y, self.zi[ch] = scipy.signal.lfilter(b, a, stereo[:, ch],
+                                                  zi=self.zi[ch])
+            cols.append(y.astype(numpy.float32))
+        self.pending = numpy.concatenate(
+            [self.pending, numpy.stack(cols, axis=1)])
+
+    def pull(self, n, final=False):
+        """Return the next *n* mastered samples.
+
+        Needs :attr:`LOOKAHEAD` samples pushed beyond them, unless
+        *final* (everything has been pushed).
+        """
+        block = self.BLOCK
+        avail = self.start + len(self.pending)
+        limit = avail if final else avail // block * block
+        if limit > self.ctrl_end:
+            seg = self.pending[self.ctrl_end - self.start:limit - self.start]
+            detector = numpy.maximum(numpy.abs(seg[:, 0]), numpy.abs(seg[:, 1]))
+            k = -(-len(detector) // block)
+            padded = numpy.zeros(k * block, dtype=numpy.float32)
+            padded[:len(detector)] = detector
+            prev = self.prev
+            for e in padded.reshape(k, block).max(axis=1):
+                if prev is None:
+                    prev = e
+                else:
+                    alpha = self.alpha_a if e > prev else self.alpha_r
+                    prev = alpha * e + (1 - alpha) * prev
+                self.ctrl.append(numpy.float32(prev))
+            self.prev = prev
+            self.ctrl_end = limit
+
+        # Drop control values no longer needed for interpolation.
+        first = max(self.start // block - 1, self.ctrl_first)
+        del self.ctrl[:first - self.ctrl_first]
+        self.ctrl_first = first
+        centers = (numpy.arange(first, first + len(self.ctrl)) * block
+                   + block / 2)
+        smoothed = numpy.interp(numpy.arange(self.start, self.start + n),
+                                centers, numpy.array(self.ctrl, dtype=numpy.float32)
+                                ).astype(numpy.float32)
+
+        gain = numpy.ones(n, dtype=numpy.float32)
+        above = smoothed > self.threshold
+        if numpy.any(above):
+            over = smoothed[above] / self.threshold
+            reduced = self.threshold * (over ** (1.0 / self.ratio))
+            gain[above] = reduced / smoothed[above]
+        out = self.pending[:n] * gain[:, None]
+        self.pending = self.pending[n:]
+        self.start += n
+
+        level = numpy.max(numpy.abs(out), axis=1)
+        running = numpy.maximum(numpy.maximum.accumulate(level), self.peak)
+        if len(running):
+            self.peak = float(running[-1])
+        makeup = numpy.minimum(
+            0.95 / numpy.maximum(running, 1e-30), 3.0).astype(numpy.float32)
+        makeup[running <= 0] = 1.0
+        return _soft_clip(out * makeup[:, None], knee=0.8,
+                          ceiling=self.ceiling)
+
+
+class _PartStream:
+    """One named Part, rendered a block at a time (see :func:`render_score`
+    for the one-shot version of every step here)."""
+
+    def __init__(self, part, score, total_samples, samples_per_beat,
+                 tempo_map):
+        self.part = part
+        synth_fn = _resolve_synth(part.synth)
+        env_tuple = _resolve_envelope(part.envelope)
+        effective_swing = part.swing if part.swing is not None else score.swing
+        synth_kwargs = dict(getattr(part, 'synth_kw', None) or {})
+        if part.synth in ("fm",):
+            synth_kwargs["mod_ratio"] = part.fm_ratio
+            synth_kwargs["mod_index"] = part.fm_index
+        temperament = getattr(score, 'temperament', 'equal')
+        ref_pitch = getattr(score, 'reference_pitch', 440.0)
+
+        if part.legato:
+            # Legato phrases are one continuous oscillator, generated a
+            # block at a time as the stream reaches them.
+            blocks = _iter_legato_blocks(
+                part.notes, samples_per_beat, total_samples,
+                synth_fn, env_tuple, part.volume, score.bpm,
+                glide_time=part.glide, swing=effective_swing,
+                tempo_map=tempo_map, temperament=temperament,
+                reference_pitch=ref_pitch, synth_kwargs=synth_kwargs)
+            self.notes = _NoteFeed(((start, start, block, None)
+                                    for start, block in blocks), 0)
+        else:
+            self.notes = _NoteFeed(_iter_note_events(
+                part.notes, samples_per_beat, total_samples,
+                synth_fn, env_tuple, part.volume, score.bpm,
+                swing=effective_swing, tempo_map=tempo_map,
+                humanize=part.humanize, detune=part.detune,
+                spread=part.spread, stereo=True,
+                sub_osc=part.sub_osc, noise_mix=part.noise_mix,
+                filter_attack=part.filter_attack,
+                filter_decay=part.filter_decay,
+                filter_sustain=part.filter_sustain,
+                filter_amount=part.filter_amount,
+                vel_to_filter=part.vel_to_filter,
+                filter_q=part.lowpass_q, synth_kwargs=synth_kwargs,
+                temperament=temperament, reference_pitch=ref_pitch,
+                analog=part.analog),
+                int(part.humanize * 0.05 * samples_per_beat) + 1,
+                spread=part.spread > 0)
+
+        # Ensemble: the same delay-line taps as render_score.
+        self.ensemble = None
+        self.behind = self.ahead = 0
+        if max(1, getattr(part, 'ensemble', 1)) > 1:
+            self.ensemble = _Ensemble(part.ensemble, samples_per_beat,
+                                      total_samples,
+                                      getattr(part, 'ensemble_detune', 0.0))
+            self.behind = self.ensemble.behind
+            self.ahead = self.ensemble.ahead
+
+        # Effects — one chain for the Part, following its automation.
+        self.automation = None
+        if part._automation:
+            self.automation = _Automation(part, total_samples,
+                                          samples_per_beat, tempo_map)
+        self.chain = EffectChain.for_part(part, total_samples, self.automation)
+        if not self.chain.active:
+            self.chain = None
+        self.pos = 0
+
+        self.sidechain = None
+        self.reverb = None
+        if getattr(part, 'sidechain', 0) > 0:
+            self.sidechain = _StreamSidechain(part.sidechain,
+                                              release=part.sidechain_release)
+        elif _reverb_automated(self.automation):
+            self.reverb = _StreamAutomatedReverb(part, self.automation)
+        elif part.reverb_mix > 0:
+            self.reverb = _StreamStereoReverb(
+                getattr(part, 'reverb_type', 'algorithmic'),
+                part.reverb_mix, decay=part.reverb_decay)
+
+    def block(self, start, end):
+        """Return ``(mono, spread)`` for ``[start, end)``: the Part after its
+        effects, and its stereo detune voices (or ``None``)."""
+        self.notes.fill(end + self.ahead)
+        if self.ensemble is not None:
+            lo = start - self.behind
+            window = self.notes.mono.read(lo, end + self.ahead)
+            mono = self.ensemble.mix(window, lo, start, end)
+        else:
+            mono = self.notes.mono.read(start, end)
+        self.notes.mono.release(end - self.behind)
+        spread = None
+        if self.notes.spread is not None:
+            spread = self.notes.spread.read(start, end)
+            self.notes.spread.release(end)
+
+        if self.chain is not None:
+            mono = self.chain.process(mono)
+        if self.automation is not None:
+            mono = _automate_volume(mono, self.part, self.automation, start)
+        return mono, spread
+
+    def stereo(self, mono):
+        """Place a processed (and, if sidechained, already ducked) block in
+        the stereo field: stereo reverb or plain pan."""
+        pan = self.part.pan
+        if self.reverb is None:
+            return _pan_to_stereo(mono, pan)
+        rev_stereo = self.reverb.process(mono)
+        if pan != 0:
+            angle = (pan + 1.0) * 0.25 * numpy.pi
+            rev_stereo[:, 0] *= numpy.cos(angle)
+            rev_stereo[:, 1] *= numpy.sin(angle)
+        return rev_stereo
+
+
+class _BusStream:
+    """One aux :class:`~pytheory.rhythm.Bus`, a block at a time (see
+    :func:`_render_bus`)."""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.delay = self.reverb = None
+        if bus.delay_mix > 0:
+            self.delay = EffectChain(_bus_delay_params(bus))
+        if bus.reverb_mix > 0:
+            self.reverb = _StreamStereoReverb(bus.reverb_type, 1.0,
+                                              decay=bus.reverb_decay)
+
+    def process(self, send):
+        ret = numpy.zeros((len(send), 2), dtype=numpy.float32)
+        if self.delay is not None:
+            echoes = self.delay.process(send) * self.bus.delay_mix
+            ret += _pan_to_stereo(echoes, 0.0)
+            send = send + echoes
+        if self.reverb is not None:
+            ret += self.reverb.process(send) * self.bus.reverb_mix
+        return ret
+
+
+class _DrumStream:
+    """One drum Part, rendered a block at a time.
+
+    Hits are voiced in start order as blocks reach them (a few ms early,
+    so choke fades can still reach back into samples not yet emitted);
+    kicks are also mixed into the shared sidechain trigger window.
+    """
+
+    def __init__(self, drum_part, schedule, total_samples, kick):
+        from .rhythm import DrumSound
+        self.part = drum_part
+        self.voicing = _DrumVoicing(schedule, total_samples, drum_part.volume)
+        self.next = 0
+        # Choke ramps, in the order their choking hits play
+        order = numpy.argsort(self.voicing.choke_hits, kind="stable")
+        self.chokes = list(zip(self.voicing.choke_hits[order].tolist(),
+                               self.voicing.fade_starts[order].tolist(),
+                               self.voicing.fade_lens[order].tolist()))
+        self.next_choke = 0
+        self.window = _SampleWindow(2)
+        self.kick = kick
+        self.kick_value = DrumSound.KICK.value
+        self.margin = int(_rate() * 0.004) + 1
+        self.chains = None
+        if EffectChain.for_part(drum_part).active:
+            self.chains = [EffectChain.for_part(drum_part, total_samples)
+                           for _ in range(2)]
+
+    def fill(self, upto):
+        voicing = self.voicing
+        while (self.next < len(voicing.starts)
+               and voicing.starts[self.next] < upto + self.margin):
+            i = self.next
+            self.next += 1
+            start = int(voicing.starts[i])
+            sound = int(voicing.sounds[i])
+            hit_len = int(voicing.lens[i])
+            while (self.next_choke < len(self.chokes)
+                   and self.chokes[self.next_choke][0] <= i):
+                _, fade_start, fade_len = self.chokes[self.next_choke]
+                self.next_choke += 1
+                self.window.scale(fade_start, _choke_ramps(
+                    numpy.array([fade_len]))[1])
+            mono, stereo = _drum_template(sound, hit_len)
+            gain = voicing.gains[i]
+            if sound == self.kick_value:
+                self.kick.add(start, mono * gain)
+            self.window.add(start, stereo * gain)
+            buzz = voicing.buzz_stereo(i)
+            if buzz is not None:
+                self.window.add(start, buzz)
+
+    def block(self, start, end):
+        self.fill(end)
+        out = self.window.read(start, end)
+        self.window.release(end)
+        if self.chains is not None:
+            for ch in range(2):
+                out[:, ch] = self.chains[ch].process(out[:, ch])
+        return out
+
+
+def render_score_iter(score, block_size=4096, *, quality="final",
+                      sample_rate=None):
+    """Render a Score as a stream of fixed-size stereo blocks.
+
+    The streaming counterpart of :func:`render_score`: instead of building
+    the whole song in memory, notes and drum hits are synthesized just
+    before the block that needs them, every effect carries its state
+    (filters, delay lines, reverb tails, the master compressor) from one
+    block to the next, and finished audio is handed over as soon as it's
+    ready. Memory stays bounded by what is ringing at once, and playback
+    or export can start after the first block.
+
+    The mix matches :func:`render_score` except where the offline render
+    looks at the whole song at once, which the stream can only estimate:
+    the master makeup gain follows the running peak, sidechain ducking is
+    normalized by the loudest kick so far, and convolution reverbs use a
+    fixed wet level instead of matching the whole signal's RMS. Legato
+    Parts are still rendered in one piece up front.
+
+    Args:
+        score: A :class:`Score` object.
+        block_size: Samples per block (default 4096, ~93 ms).
+        quality: ``"final"`` or ``"draft"``, as for :func:`render_score`.
+        sample_rate: Rate to render at, in Hz, as for
+            :func:`render_score`.
+
+    Yields:
+        Float32 stereo arrays of shape ``(block_size, 2)``; the last block
+        holds whatever remains. Concatenated, they are exactly as long as
+        :func:`render_score`'s buffer.
+
+    Example::
+
+        >>> from pytheory.play import render_score_iter
+        >>> for block in render_score_iter(score, block_size=2048):
+        ...     stream.write(block)
+    """
+    if isinstance(block_size, bool) or not isinstance(block_size, int):
+        raise TypeError(f"block_size must be an int, got {block_size!r}")
+    if block_size <= 0:
+        raise ValueError(f"block_size must be positive, got {block_size}")
+    score = _at_quality(score, quality)
+    _check_sends(score)
+    rate = _check_rate(sample_rate)
+    render_rate = _quality_rate(quality, rate)
+    blocks = _render_score_at(render_rate, score, block_size)
+    if render_rate == rate:
+        return blocks
+    with _at_rate(rate):
+        length = _score_length(score)
+    return _converted_blocks(blocks, _RateConverter(render_rate, rate),
+                             length, block_size)
+
+
+def _converted_blocks(blocks, converter, length, block_size):
+    """Re-block *blocks* into *block_size* blocks after *converter*, for
+    drafts streamed at a lower rate than they are delivered at."""
+    held = numpy.zeros((0, 2), dtype=numpy.float32)
+    done = False
+    while not done:
+        try:
+            held = numpy.concatenate([held, converter.process(next(blocks))])
+        except StopIteration:
+            held = numpy.concatenate([held, converter.process(
+                held[:0], final=True, length=length)])
+            done = True
+        while len(held) >= block_size or (done and len(held)):
+            yield held[:block_size]
+            held = held[block_size:]
+
+
+def _render_score_at(sample_rate, score, block_size):
+    """Run :func:`_render_score_blocks` in a context of its own at
+    *sample_rate*, so the rate holds whoever pulls the next block."""
+    ctx = contextvars.copy_context()
+    ctx.run(_RENDER_RATE.set, sample_rate)
+    blocks = _render_score_blocks(score, block_size)
+    while True:
+        try:
+            block = ctx.run(next, blocks)
+        except StopIteration:
+            return
+        yield block
+
+
+def _render_score_blocks(score, block_size):
+    """Generator behind :func:`render_score_iter`."""
+    tempo_map = TempoMap.from_score(score)
+    has_tempo_changes = len(tempo_map) > 1
+    samples_per_beat = int(_rate() * 60.0 / score.bpm)
+    if has_tempo_changes:
+        total_samples = tempo_map.beat_to_sample(score.total_beats)
+    else:
+        total_samples = int(score.total_beats * samples_per_beat)
+        tempo_map = None
+
+    default = None
+    if score.notes:
+        default = _NoteFeed(_iter_note_events(
+            score.notes, samples_per_beat, total_samples,
+            sine_wave, Envelope.PIANO.value, 0.5, score.bpm,
+            swing=score.swing, tempo_map=tempo_map), 1)
+
+    parts = [_PartStream(part, score, total_samples, samples_per_beat,
+                         tempo_map)
+             for part in score.parts.values() if part.notes]
+
+    kick = _SampleWindow()
+    drum_humanize = getattr(score, '_drum_humanize', 0.15)
+    drums = [
+        _DrumStream(part, _drum_schedule(
+            part, total_samples, samples_per_beat, tempo_map,
+            swing=score.swing, humanize=drum_humanize), total_samples, kick)
+        for part in score.parts.values() if part.is_drums]
+    buses = {name: _BusStream(bus) for name, bus in score.buses.items()}
+
+    def mix(start, end):
+        out = numpy.zeros((end - start, 2), dtype=numpy.float32)
+        drum_stereo = numpy.zeros((end - start, 2), dtype=numpy.float32)
+        sends = {}
+        for drum in drums:
+            block = drum.block(start, end)
+            drum_stereo += block
+            if drum.part.sends:
+                _feed_sends(sends, drum.part, block.mean(axis=1))
+        trigger = kick.read(start, end)
+        kick.release(end)
+        ducked = []
+        for part in parts:
+            mono, spread = part.block(start, end)
+            if spread is not None:
+                out += spread
+            if part.sidechain is not None:
+                ducked.append((part, mono, spread))
+                continue
+            out += part.stereo(mono)
+            if part.part.sends:
+                _feed_sends(sends, part.part, _send_signal(mono, spread))
+        for part, mono, spread in ducked:
+            mono = part.sidechain.process(mono, trigger)
+            out += part.stereo(mono)
+            if part.part.sends:
+                _feed_sends(sends, part.part, _send_signal(mono, spread))
+        for name, send in sends.items():
+            out += buses[name].process(send)
+        if default is not None:
+            default.fill(end)
+            out += _pan_to_stereo(default.mono.read(start, end), 0.0)
+            default.mono.release(end)
+        out += drum_stereo
+        return out
+
+    master = _StreamMasterBus()
+    mixed = 0
+    for out_start in range(0, total_samples, block_size):
+        out_end = min(out_start + block_size, total_samples)
+        need = min(out_end + master.LOOKAHEAD, total_samples)
+        if need > mixed:
+            master.push(mix(mixed, need))
+            mixed = need
+        yield master.pull(out_end - out_start, final=mixed == total_samples)
+
+
+def play_score(score, *, block_size=None, quality="final", sample_rate=None):
     """Play an entire Score through the speakers.
 
     Renders drums, default notes, and all named parts — each with
@@ -6682,6 +10053,14 @@ def play_score(score):
 
     Args:
         score: A :class:`Score` object with notes, parts, and/or drum hits.
+        block_size: Stream the Score instead of rendering it first —
+            playback starts after the first block of this many samples
+            (see :func:`render_score_iter`). ``None`` (the default)
+            renders the whole Score, then plays it.
+        quality: ``"final"`` (the default) or ``"draft"`` for a faster
+            preview (see :func:`render_score`).
+        sample_rate: Rate to play at, in Hz (default ``SAMPLE_RATE``),
+            as for :func:`render_score`.
 
     Example::
 
@@ -6696,10 +10075,24 @@ def play_score(score):
         >>> lead.add("E5", Duration.QUARTER).add("D5", Duration.QUARTER)
         >>> play_score(score)
     """
-    buf = render_score(score)
+    rate = _check_rate(sample_rate)
+    if block_size is not None:
+        blocks = render_score_iter(score, block_size=block_size,
+                                   quality=quality, sample_rate=rate)
+        _sd = _get_sd()
+        try:
+            with _sd.OutputStream(samplerate=rate, channels=2,
+                                  dtype="float32") as stream:
+                for block in blocks:
+                    stream.write(block)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    buf = render_score(score, quality=quality, sample_rate=rate)
     _sd = _get_sd()
     try:
-        _sd.play(buf, SAMPLE_RATE)
+        _sd.play(buf, rate)
         _sd.wait()
     except KeyboardInterrupt:
         _sd.stop()
@@ -108,7 +108,7 @@ def cmd_help(session, args):
     lfo lowpass 0.5 400 3000 8  part.lfo("lowpass", rate=0.5, ...)
 
   Playback:
-    play_score                  play the full score
+    play_score [draft]          play the full score (draft = fast preview)
     play_pattern                play just the drums
     render sketch.wav           render to WAV
     save_midi sketch.mid        save as MIDI
@@ -361,8 +361,12 @@ def cmd_legato(session, args):
 def cmd_play_score(session, args):
     try:
         from .play import play_score
-        print("  ♫ play_score()")
-        play_score(session.score)
+        if args and args[0] == "draft":
+            print('  ♫ play_score(quality="draft")')
+            play_score(session.score, quality="draft")
+        else:
+            print("  ♫ play_score()")
+            play_score(session.score)
     except Exception as e:
         print(f"  error: {e}")
 
@@ -2933,6 +2933,44 @@ Pattern._FILLS["metal cascade"] = dict(
 )
 
 
+def _fingerprint_state(value):
+    """Reduce a Part attribute to plain, repr-stable data for hashing.
+
+    Tones and chords reduce to what the renderer reads from them (name,
+    octave, tone system); other objects reduce to their attributes, so
+    two equal arrangements always produce the same state.
+    """
+    from .tones import Tone
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, Enum):
+        return (type(value).__name__, value.value)
+    if isinstance(value, Tone):
+        system = value.system_name or getattr(value._system, "name", None)
+        return ("Tone", value.name, value.octave, system)
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint_state(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _fingerprint_state(v))
+                            for k, v in value.items()))
+    if hasattr(value, "tobytes"):  # numpy arrays and scalars
+        return (type(value).__name__, str(getattr(value, "dtype", "")),
+                getattr(value, "shape", ()), value.tobytes())
+    if callable(value):
+        return (getattr(value, "__module__", None),
+                getattr(value, "__qualname__", repr(value)))
+    if hasattr(value, "tones"):  # Chord
+        return ("Chord", _fingerprint_state(list(value.tones)))
+    slots = getattr(type(value), "__slots__", None)
+    if slots is not None:
+        if isinstance(slots, str):
+            slots = (slots,)
+        attrs = {k: getattr(value, k, None) for k in slots}
+    else:
+        attrs = vars(value)
+    return (type(value).__name__, _fingerprint_state(attrs))
+
+
 def _check_reverb_type(value) -> None:
     """Raise ValueError if ``value`` isn't a known reverb type.
 
@@ -3003,8 +3041,10 @@ class Part:
                  cabinet_brightness: float = 0.5,
                  analog: float = 0.0,
                  ensemble: int = 1,
+                 ensemble_detune: float = 0.0,
                  fm_ratio: float = 2.0,
                  fm_index: float = 3.0,
+                 send: dict = None,
                  synth_kw: dict = None):
         self.name = name
         self.synth = synth
@@ -3051,8 +3091,10 @@ class Part:
         self.cabinet_brightness = cabinet_brightness
         self.analog = analog
         self.ensemble = ensemble
+        self.ensemble_detune = ensemble_detune
         self.fm_ratio = fm_ratio
         self.fm_index = fm_index
+        self.sends = dict(send or {})     # bus name → send level
         self.synth_kw = synth_kw or {}
         self._system = "western"  # default, overridden by Score.part()
         self._fretboard = None    # set by Score.part(fretboard=...)
@@ -3846,6 +3888,34 @@ class Part:
         """True if this part contains drum hits."""
         return len(self._drum_hits) > 0
 
+    # Attributes that never change how a Part sounds.
+    _FINGERPRINT_SKIP = frozenset({"name", "_system", "_fretboard"})
+
+    def fingerprint(self, score=None) -> str:
+        """A stable hash of everything that determines this Part's sound.
+
+        Covers the notes and drum hits, synth, envelope, every effect
+        parameter and the automation. Pass the owning *score* to also
+        cover its tempo map, swing, tuning and length. Two Parts with the
+        same fingerprint render to the same audio (barring humanize), which
+        is what lets ``render_score`` reuse a Part's finished stem when
+        only some other Part changed.
+
+        Returns:
+            A hex digest string.
+        """
+        import hashlib
+        state = [(k, _fingerprint_state(v))
+                 for k, v in sorted(vars(self).items())
+                 if k not in self._FINGERPRINT_SKIP]
+        if score is not None:
+            state.append(("score", (
+                score.bpm, tuple(sorted(score._tempo_changes)),
+                score.swing, score.temperament, score.reference_pitch,
+                score.total_beats,
+                score._drum_humanize if self.is_drums else None)))
+        return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
+
     @property
     def total_beats(self) -> float:
         note_beats = sum(n.beats for n in self.notes)
@@ -3987,6 +4057,49 @@ class Part:
                 f"{len(self.notes)} notes {self.total_beats:.1f} beats>")
 
 
+class Bus:
+    """An aux send/return bus: one reverb and delay shared by many Parts.
+
+    Parts feed a bus through their ``send`` levels; the sends are summed
+    and run through the bus's effects once, and the wet return is mixed
+    back in alongside the dry Parts — the way a mixing desk's aux buses
+    work. Eight Parts sharing a hall pay for one reverb, not eight.
+
+    ``reverb`` and ``delay`` are return levels: the bus is 100% wet, and
+    the delay feeds the reverb, as in a Part's own chain.
+
+    Don't instantiate directly — use ``Score.bus()`` instead.
+
+    Example::
+
+        score = Score("4/4", bpm=100)
+        score.bus("room", reverb=0.8, reverb_type="hall")
+        keys = score.part("keys", instrument="piano", send={"room": 0.4})
+        lead = score.part("lead", synth="saw", send={"room": 0.2})
+    """
+
+    def __init__(self, name: str, *, reverb: float = 0.0,
+                 reverb_decay: float = 1.0,
+                 reverb_type: str = "algorithmic",
+                 delay: float = 0.0, delay_time: float = 0.375,
+                 delay_feedback: float = 0.4):
+        self.name = name
+        self.reverb_mix = reverb
+        self.reverb_decay = reverb_decay
+        self.reverb_type = reverb_type
+        self.delay_mix = delay
+        self.delay_time = delay_time
+        self.delay_feedback = delay_feedback
+
+    def __repr__(self):
+        fx = []
+        if self.reverb_mix > 0:
+            fx.append(f"reverb={self.reverb_mix} ({self.reverb_type})")
+        if self.delay_mix > 0:
+            fx.append(f"delay={self.delay_mix}")
+        return f"<Bus {self.name!r} {' '.join(fx) or 'dry'}>"
+
+
 class Section:
     """A named section of a Score (verse, chorus, bridge, etc.)."""
 
@@ -4072,6 +4185,7 @@ class Score:
         self._drum_humanize = drum_humanize
         self.notes: list[Note] = []
         self.parts: dict[str, Part] = {}
+        self.buses: dict[str, Bus] = {}
         self._tempo_changes: list[tuple[float, int]] = []
         self._sections: dict[str, Section] = {}
         self._current_section: Optional[Section] = None
@@ -4180,7 +4294,8 @@ class Score:
         if seconds is None:
             from .play import effects_tail_seconds
             seconds = max(
-                (effects_tail_seconds(p) for p in self.parts.values()),
+                (effects_tail_seconds(p) for p in
+                 [*self.parts.values(), *self.buses.values()]),
                 default=0.0,
             )
         beats = seconds * self.bpm / 60.0
@@ -4224,8 +4339,10 @@ class Score:
              cabinet_brightness: float = None,
              analog: float = None,
              ensemble: int = None,
+             ensemble_detune: float = None,
              fm_ratio: float = None,
              fm_index: float = None,
+             send: dict = None,
              fretboard=None) -> Part:
         """Create a named part with its own synth voice and effects.
 
@@ -4275,6 +4392,15 @@ class Score:
                 0.8 = typical EDM pumping effect.
             sidechain_release: How fast the volume comes back after ducking,
                 in seconds (default 0.1).
+            ensemble: Number of players in the section (default 1). Each
+                extra player plays the part slightly early or late and a
+                little louder or softer.
+            ensemble_detune: Per-player pitch drift in cents (default 0,
+                off). Each player slowly bends up to this far sharp and
+                flat — 3–8 = a natural string or choir section.
+            send: Aux send levels, ``{bus name: level}`` — how much of
+                this Part (after its own effects) feeds each
+                :meth:`bus`. E.g. ``send={"room": 0.3}``.
 
         Returns:
             A :class:`Part` object. Add notes with ``.add()`` and ``.rest()``.
@@ -4338,7 +4464,9 @@ class Score:
             "phaser": phaser, "phaser_rate": phaser_rate,
             "cabinet": cabinet, "cabinet_brightness": cabinet_brightness,
             "analog": analog, "ensemble": ensemble,
+            "ensemble_detune": ensemble_detune,
             "fm_ratio": fm_ratio, "fm_index": fm_index,
+            "send": send,
         }
         for k, v in _locals.items():
             if v is not None:
@@ -4352,6 +4480,44 @@ class Score:
         self.parts[name] = p
         return p
 
+    def bus(self, name: str, *, reverb: float = 0.0,
+            reverb_decay: float = 1.0, reverb_type: str = "algorithmic",
+            delay: float = 0.0, delay_time: float = 0.375,
+            delay_feedback: float = 0.4) -> Bus:
+        """Create an aux send/return bus that Parts can share.
+
+        Every Part whose ``send`` names this bus feeds it; the bus runs its
+        delay and reverb once on the summed sends and returns the wet
+        signal to the mix. Use it instead of giving every Part its own
+        ``reverb=`` when several Parts should sit in the same room — the
+        effect cost then grows with the number of buses, not Parts.
+
+        Args:
+            name: Bus name, used as the key in a Part's ``send``.
+            reverb: Reverb return level, 0.0–1.0 (default 0, off).
+            reverb_decay: Algorithmic reverb tail in seconds (default 1.0).
+            reverb_type: ``"algorithmic"`` or a convolution IR preset
+                (see :meth:`part`).
+            delay: Delay return level, 0.0–1.0 (default 0, off).
+            delay_time: Delay time in seconds (default 0.375).
+            delay_feedback: Delay feedback 0.0–1.0 (default 0.4).
+
+        Returns:
+            The :class:`Bus`.
+
+        Example::
+
+            score.bus("room", reverb=0.8, reverb_type="hall")
+            pad = score.part("pad", synth="strings_synth", send={"room": 0.5})
+            pad.sends["room"] = 0.3   # adjust later
+        """
+        _check_reverb_type(reverb_type)
+        b = Bus(name, reverb=reverb, reverb_decay=reverb_decay,
+                reverb_type=reverb_type, delay=delay, delay_time=delay_time,
+                delay_feedback=delay_feedback)
+        self.buses[name] = b
+        return b
+
     @classmethod
     def list_instruments(cls) -> list:
         """Return a sorted list of available instrument preset names.
@@ -4509,7 +4675,7 @@ class Score:
         self.notes.append(Note(tone=None, duration=duration))
         return self
 
-    def set_tempo(self, bpm: int) -> "Score":
+    def set_tempo(self, bpm: int, *, ramp: float = 0.0) -> "Score":
         """Insert a tempo change at the current beat position.
 
         The new tempo takes effect from the current total_beats position
@@ -4517,13 +4683,25 @@ class Score:
 
         Args:
             bpm: New tempo in beats per minute.
+            ramp: Glide to the new tempo over this many beats instead of
+                jumping — an accelerando or ritardando. The tempo moves
+                linearly from the one in effect here.
 
         Returns:
             Self for chaining.
+
+        Example::
+
+            >>> score.set_tempo(90, ramp=8)   # ease down to 90 over 2 bars
         """
         if bpm <= 0:
             raise ValueError("bpm must be positive")
-        self._tempo_changes.append((self.total_beats, bpm))
+        if ramp < 0:
+            raise ValueError("ramp must be zero or positive")
+        if ramp:
+            self._tempo_changes.append((self.total_beats, bpm, float(ramp)))
+        else:
+            self._tempo_changes.append((self.total_beats, bpm))
         return self
 
     def section(self, name: str) -> "Section":
@@ -4619,20 +4797,8 @@ class Score:
         if not self._tempo_changes:
             return total * (60_000 / self.bpm)
 
-        ms = 0.0
-        prev_beat = 0.0
-        prev_bpm = self.bpm
-        for beat, bpm in sorted(self._tempo_changes):
-            if beat <= prev_beat:
-                prev_bpm = bpm
-                continue
-            if beat >= total:
-                break
-            ms += (beat - prev_beat) * (60_000 / prev_bpm)
-            prev_beat = beat
-            prev_bpm = bpm
-        ms += max(0.0, total - prev_beat) * (60_000 / prev_bpm)
-        return ms
+        from .play import TempoMap
+        return TempoMap.from_score(self).seconds(total) * 1000
 
     def __len__(self):
         return len(self.notes) + sum(len(p) for p in self.parts.values())
@@ -5621,16 +5787,25 @@ class Score:
 
         raise ValueError("No pitched parts with notes found in score")
 
-    def render(self):
+    def render(self, *, workers=None, quality="final", sample_rate=None):
         """Render this score to audio.
 
         Mixes every part and drum track, runs the master bus, and returns
         the finished stereo audio. This is the headless equivalent of
         ``play_score`` — handy for tests, export, or further processing.
 
+        Args:
+            workers: Render Parts concurrently on this many threads
+                (see :func:`~pytheory.play.render_score`).
+            quality: ``"final"`` (the default) or ``"draft"`` for a fast
+                preview while composing.
+            sample_rate: Rate to render at, in Hz (default 44.1 kHz).
+                Drafts render at 22.05 kHz and come back converted up
+                to this rate.
+
         Returns:
-            A float32 NumPy array of shape ``(n_samples, 2)`` at 44.1 kHz,
-            with samples in roughly ``[-1, 1]``.
+            A float32 NumPy array of shape ``(n_samples, 2)`` at
+            *sample_rate*, with samples in roughly ``[-1, 1]``.
 
         Example::
 
@@ -5638,13 +5813,20 @@ class Score:
             score.to_wav("song.wav")      # or save straight to disk
         """
         from .play import render_score
-        return render_score(self)
+        return render_score(self, workers=workers, quality=quality,
+                            sample_rate=sample_rate)
 
-    def to_wav(self, path):
+    def to_wav(self, path, *, block_size=None, sample_rate=None):
         """Render this score and save it as a 16-bit stereo WAV file.
 
         Args:
             path: Output path, e.g. ``"song.wav"``.
+            block_size: Stream the render to disk in blocks of this many
+                samples instead of building the whole song in memory
+                first (see :func:`~pytheory.play.render_score_iter`).
+            sample_rate: Rate to render and write at, in Hz — e.g.
+                ``48_000`` for a video or broadcast delivery. The default
+                is 44.1 kHz.
 
         Returns:
             The path written (so calls can be chained or logged).
@@ -5652,22 +5834,36 @@ class Score:
         Example::
 
             score.to_wav("demo.wav")
+            score.to_wav("album_side_a.wav", block_size=8192)
+            score.to_wav("for_video.wav", sample_rate=48_000)
         """
         import wave as _wave
         import numpy as _np
-        from .play import SAMPLE_RATE
+        from .play import SAMPLE_RATE, render_score_iter
 
-        buf = self.render()
-        data = (_np.clip(buf, -1.0, 1.0) * 32767).astype(_np.int16)
+        rate = sample_rate or SAMPLE_RATE
+        if block_size is None:
+            blocks = [self.render(sample_rate=rate)]
+        else:
+            blocks = render_score_iter(self, block_size=block_size,
+                                       sample_rate=rate)
         with _wave.open(str(path), "wb") as f:
             f.setnchannels(2)
             f.setsampwidth(2)
-            f.setframerate(SAMPLE_RATE)
-            f.writeframes(data.tobytes())
+            f.setframerate(int(rate))
+            for buf in blocks:
+                data = (_np.clip(buf, -1.0, 1.0) * 32767).astype(_np.int16)
+                f.writeframes(data.tobytes())
         return path
 
     def save_midi(self, path, velocity=100):
-        """Export to Standard MIDI File, measure-aware."""
+        """Export to Standard MIDI File, measure-aware.
+
+        Every note and drum hit is written at its own velocity scaled by
+        *velocity* percent, so the default of 100 keeps them as written.
+        Drum hits, from patterns or :meth:`Part.hit`, go to the General
+        MIDI drum channel (10); each Part's notes get a melodic channel.
+        """
         ticks_per_beat = 480
         us_per_beat = int(60_000_000 / self.bpm)
 
@@ -5692,28 +5888,56 @@ class Score:
         # at the same tick (no stuck notes on back-to-back pitches).
         timed = []
 
-        for beat, bpm in sorted(self._tempo_changes):
+        def _tempo_event(beat, bpm):
             change_us_per_beat = int(60_000_000 / bpm)
             payload = b"\xFF\x51\x03" + struct.pack(">I", change_us_per_beat)[1:]
             timed.append((int(beat * ticks_per_beat), -1, None, payload, 0))
 
+        if self._tempo_changes:
+            from .play import TempoMap
+            tempo_map = TempoMap.from_score(self)
+            for k in range(1, len(tempo_map)):
+                beat = float(tempo_map.beats[k])
+                if not tempo_map.slope[k]:
+                    _tempo_event(beat, float(tempo_map.bpm[k]))
+                    continue
+                # Ramps go out as a tempo step every eighth of a beat
+                end = float(tempo_map.beats[k + 1])
+                while beat < end - 1e-9:
+                    _tempo_event(beat, tempo_map.bpm_at(beat))
+                    beat += 0.125
+
+        def _velocity(note_velocity):
+            # Every note and hit keeps its own velocity, scaled by the
+            # ``velocity`` argument (100 writes them as written)
+            return max(1, min(127, int(note_velocity * velocity / 100)))
+
         def _emit_sequence(notes, channel):
-            on_status, off_status = 0x90 | channel, 0x80 | channel
             cursor = 0
             for note in notes:
-                duration_ticks = int(note.beats * ticks_per_beat)
+                on = cursor
+                # Each note advances the cursor by its whole-tick length
+                # (held notes don't advance it, but keep their written length)
+                cursor += int(note.beats * ticks_per_beat)
                 tone = note.tone
                 if tone is None:
-                    cursor += duration_ticks
                     continue
-                if hasattr(tone, "tones"):       # Chord-like object
-                    midi_notes = [t.midi for t in tone.tones if t.midi is not None]
-                else:
-                    midi_notes = [tone.midi] if tone.midi is not None else []
-                for mn in midi_notes:
-                    timed.append((cursor, 1, on_status, mn & 0x7F, velocity & 0x7F))
-                    timed.append((cursor + duration_ticks, 0, off_status, mn & 0x7F, 0))
-                cursor += duration_ticks
+                vel = _velocity(note.velocity)
+                if isinstance(tone, _DrumTone):
+                    # Part.hit() notes go to the GM drum channel, like
+                    # the pattern hits below
+                    sound = tone.sound.value & 0x7F
+                    timed.append((on, 1, 0x99, sound, vel))
+                    timed.append((on + int(0.1 * ticks_per_beat), 0, 0x89,
+                                  sound, 0))
+                    continue
+                off = on + int(note.duration.value * ticks_per_beat)
+                tones = tone.tones if hasattr(tone, "tones") else (tone,)
+                for mn in (t.midi for t in tones):
+                    if mn is None:
+                        continue
+                    timed.append((on, 1, 0x90 | channel, mn & 0x7F, vel))
+                    timed.append((off, 0, 0x80 | channel, mn & 0x7F, 0))
 
         # Default part on channel 0; named parts on the remaining melodic
         # channels (skipping 9, the GM drum channel), wrapping if there are
@@ -5734,7 +5958,7 @@ class Score:
                 hit_tick = int(hit.position * ticks_per_beat)
                 off_tick = hit_tick + int(0.1 * ticks_per_beat)  # short perc.
                 timed.append((hit_tick, 1, 0x99, hit.sound.value & 0x7F,
-                              hit.velocity & 0x7F))
+                              _velocity(hit.velocity)))
                 timed.append((off_tick, 0, 0x89, hit.sound.value & 0x7F, 0))
 
         # Merge all voices into one track as delta-time events.
@@ -86,21 +86,23 @@ def _transcribe_upload(body, name, params):
     }
 
 
-def _render_wav_bytes(score):
-    """Render a Score to in-memory WAV bytes."""
+def _render_wav_bytes(score, quality="final", sample_rate=None):
+    """Render a Score to in-memory WAV bytes at the given render quality
+    and sample rate (default: the render's own)."""
     import wave as wavemod
 
     import numpy
 
-    from .play import render_score
+    from .play import _check_rate, render_score
 
-    buf = render_score(score)
+    sample_rate = _check_rate(sample_rate)
+    buf = render_score(score, quality=quality, sample_rate=sample_rate)
     data = (numpy.clip(buf, -1, 1) * 32767).astype(numpy.int16)
     out = io.BytesIO()
     with wavemod.open(out, "wb") as f:
         f.setnchannels(2)
         f.setsampwidth(2)
-        f.setframerate(SAMPLE_RATE)
+        f.setframerate(sample_rate)
         f.writeframes(data.tobytes())
     return out.getvalue()
 
@@ -242,7 +244,7 @@ async function upload(file) {
 document.getElementById("play").onclick = async () => {
   if (!currentId) return;
   status.textContent = "Rendering\\u2026";
-  const res = await fetch("/render?id=" + currentId);
+  const res = await fetch("/render?quality=draft&id=" + currentId);
   const blob = await res.blob();
   status.textContent = "";
   if (audio) audio.pause();
@@ -330,7 +332,18 @@ def serve(port=8124, open_browser=True, host="127.0.0.1"):
                 if score is None:
                     return self._send(404, "unknown id", "text/plain")
                 if url.path == "/render":
-                    return self._send(200, _render_wav_bytes(score),
+                    quality = params.get("quality", "final")
+                    if quality not in ("draft", "final"):
+                        return self._send(400, "bad quality", "text/plain")
+                    from .play import _check_rate
+                    rate = params.get("rate")
+                    try:
+                        if rate is not None:
+                            rate = _check_rate(int(rate))
+                    except ValueError:
+                        return self._send(400, "bad rate", "text/plain")
+                    return self._send(200,
+                                      _render_wav_bytes(score, quality, rate),
                                       "audio/wav")
                 return self._send(200, _midi_bytes(score), "audio/midi")
             if url.path == "/stream":
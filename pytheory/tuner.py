@@ -59,6 +59,8 @@ import numpy
 from .audio import detect_pitch
 
 SAMPLE_RATE = 44_100
+# The pitch tracker's window: 4096 samples at 44.1 kHz, ~93 ms at any rate
+_FRAME_SECONDS = 4096 / SAMPLE_RATE
 
 _NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F',
                'F#', 'G', 'G#', 'A', 'A#', 'B']
@@ -92,6 +94,11 @@ def string_targets(instrument, reference_pitch=440.0):
     return [(n, _note_to_freq(n, reference_pitch)) for n in names]
 
 
+def _frame_len(sample_rate):
+    """Samples in one pitch-tracking window at *sample_rate*."""
+    return int(round(_FRAME_SECONDS * sample_rate))
+
+
 def analyze_frame(frame, sample_rate=SAMPLE_RATE, *,
                   reference_pitch=440.0, fmin=50.0, fmax=1500.0,
                   targets=None):
@@ -116,8 +123,9 @@ def analyze_frame(frame, sample_rate=SAMPLE_RATE, *,
         ``target`` and ``target_freq``.
     """
     frame = numpy.asarray(frame, dtype=numpy.float64)
+    window = min(len(frame), _frame_len(sample_rate))
     _, freqs, voiced = detect_pitch(frame, sample_rate,
-                                    frame_size=min(len(frame), 4096),
+                                    frame_size=window,
                                     hop=len(frame),
                                     fmin=fmin, fmax=fmax)
     if not voiced.any():
@@ -185,8 +193,9 @@ class Tuner:
         self.chord = None            # latest chord dict (or None)
         self.reading = None          # latest analysis dict (or None)
         # Chord ID needs ~1s of audio for a stable chromagram; the
-        # pitch tracker only ever looks at the newest 4096 samples.
-        self._buf_len = sample_rate if chords else 4096
+        # pitch tracker only ever looks at the newest ~93 ms.
+        self._frame_len = _frame_len(sample_rate)
+        self._buf_len = sample_rate if chords else self._frame_len
         self._buf = numpy.zeros(self._buf_len, dtype=numpy.float64)
         self._lock = threading.Lock()
         self._stream = None
@@ -216,7 +225,7 @@ class Tuner:
             with self._lock:
                 frame = self._buf.copy()
             self.reading = analyze_frame(
-                frame[-4096:], self.sample_rate,
+                frame[-self._frame_len:], self.sample_rate,
                 reference_pitch=self.reference_pitch,
                 fmin=self.fmin, fmax=self.fmax,
                 targets=self.targets)
@@ -467,3 +467,197 @@ def test_render_scores_batch():
     # workers=1 path also works.
     assert len(render_scores(scores, workers=1)) == 4
     assert len(render_scores([], workers=4)) == 0
+
+
+def test_render_scores_process_backend_matches_in_process_render():
+    """backend="process" hands back the same audio via shared memory."""
+    from pytheory import Score, Chord, Duration, render_score, render_scores
+    import numpy as np
+
+    scores = []
+    for sym in ["C", "Am", "F"]:
+        s = Score("4/4", bpm=140)
+        s.part("p", synth="saw", lowpass=1500).add(
+            Chord.from_symbol(sym), Duration.WHOLE)
+        scores.append(s)
+    scores.append(Score("4/4", bpm=120))    # empty score: zero-length buffer
+
+    out = render_scores(scores, workers=2, backend="process")
+    assert len(out) == 4
+    for s, buf in zip(scores, out):
+        assert buf.dtype == np.float32
+        assert np.array_equal(buf, render_score(s))
+
+    # Quality and sample rate reach every backend
+    for backend in ("thread", "process"):
+        drafts = render_scores(scores, workers=2, backend=backend,
+                               quality="draft")
+        at_48k = render_scores(scores, workers=2, backend=backend,
+                               sample_rate=48_000)
+        for s, draft, buf in zip(scores, drafts, at_48k):
+            assert np.array_equal(draft, render_score(s, quality="draft"))
+            assert np.array_equal(buf, render_score(s, sample_rate=48_000))
+
+    import pytest
+    with pytest.raises(ValueError):
+        render_scores(scores, backend="gpu")
+    with pytest.raises(ValueError):
+        render_scores(scores, quality="best")
+
+
+def test_synth_disk_cache_reuses_notes_across_processes(tmp_path, monkeypatch):
+    """PYTHEORY_CACHE_DIR keeps synthesised notes as memory-mapped .npy files."""
+    import os
+    import sys
+    import numpy as np
+    from pytheory.play import AudioCache, sawtooth_wave
+
+    play_module = sys.modules["pytheory.play"]  # pytheory.play is the function
+    monkeypatch.setenv("PYTHEORY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(play_module, "_SYNTH_WAVE_CACHE",
+                        AudioCache(1 << 30))
+
+    fresh = play_module._synth_wave_cached(sawtooth_wave, 220.0, 4410, {})
+    files = list(tmp_path.rglob("*.npy"))
+    assert len(files) == 1
+
+    # A "new process": empty memory cache, same directory.
+    monkeypatch.setattr(play_module, "_SYNTH_WAVE_CACHE",
+                        AudioCache(1 << 30))
+    loaded = play_module._synth_wave_cached(sawtooth_wave, 220.0, 4410, {})
+    assert np.array_equal(loaded, fresh)
+    assert not loaded.flags.writeable     # zero-copy, read-only mapping
+
+    # Pruning keeps the directory under its cap, oldest files first.
+    play_module._synth_wave_cached(sawtooth_wave, 330.0, 4410, {})
+    os.utime(files[0], (0, 0))
+    play_module._prune_disk_cache(str(tmp_path), files[0].stat().st_size)
+    assert not files[0].exists()
+    assert len(list(tmp_path.rglob("*.npy"))) == 1
+
+
+def test_disk_cache_counts_concurrent_writes(tmp_path, monkeypatch):
+    """Threads storing notes at once all add to the unpruned byte count."""
+    import sys
+    import threading
+    import numpy as np
+
+    play_module = sys.modules["pytheory.play"]
+    monkeypatch.setenv("PYTHEORY_CACHE_MAX_MB", "1024")
+    monkeypatch.setattr(play_module, "_disk_cache_unpruned", 0)
+    wave = np.zeros(256, dtype=np.float32)
+
+    def store(worker):
+        for i in range(25):
+            path = tmp_path / "ab" / f"{worker}-{i}.npy"
+            play_module._disk_cache_store(str(path), wave)
+
+    threads = [threading.Thread(target=store, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert play_module._disk_cache_unpruned == 8 * 25 * wave.nbytes
+
+
+def test_audio_cache_is_byte_budgeted_lru():
+    """AudioCache evicts least-recently-used entries once over budget."""
+    import numpy as np
+    from pytheory.play import AudioCache
+
+    cache = AudioCache(max_bytes=3000)
+    for name in "abc":
+        cache[name] = np.zeros(1000, dtype=np.int8)
+    assert cache.get("a") is not None        # "a" is now most recent
+    cache["d"] = np.zeros(1000, dtype=np.int8)
+    assert "b" not in cache and "a" in cache
+    assert cache.get("b") is None
+
+    # Tuples of arrays count every array; oversize entries aren't kept.
+    cache["pair"] = (np.zeros(500, np.int8), np.zeros(500, np.int8))
+    cache["huge"] = np.zeros(5000, dtype=np.int8)
+    assert "huge" not in cache
+
+    assert cache.stats() == {"entries": 3, "bytes": 3000, "max_bytes": 3000,
+                             "hits": 1, "misses": 1, "evictions": 2}
+    cache.max_bytes = 1000
+    assert len(cache) == 1 and cache.bytes == 1000
+
+
+def test_prefix_stable_synths_share_one_render_per_pitch(monkeypatch):
+    """Notes of any length are exact prefix views of one shared render."""
+    import sys
+    import numpy as np
+    from pytheory.play import AudioCache, _SYNTH_FUNCTIONS
+
+    play_module = sys.modules["pytheory.play"]  # pytheory.play is the function
+    monkeypatch.delenv("PYTHEORY_CACHE_DIR", raising=False)
+    stable = [fn for fn in _SYNTH_FUNCTIONS.values()
+              if getattr(fn, "prefix_stable", False)]
+    assert play_module.sine_wave in stable
+    assert play_module.choir_wave not in stable   # whole-note noise/normalising
+
+    for fn in stable:
+        monkeypatch.setattr(play_module, "_SYNTH_WAVE_CACHE", AudioCache(1 << 30))
+        for hz in (98.0, 659.25):
+            for n in (44100, 6000, 30000):   # longest first, then prefixes
+                wave = play_module._synth_wave_cached(fn, hz, n, {})
+                expected = fn(hz, n_samples=n, dtype=np.float32)
+                assert np.array_equal(wave, expected), fn.__name__
+
+    piano = play_module.piano_wave
+    full = play_module._synth_wave_cached(piano, 440.0, 44100, {})
+    short = play_module._synth_wave_cached(piano, 440.0, 5000, {})
+    assert np.shares_memory(short, full)       # a view, not a fresh render
+    assert not short.flags.writeable
+    # Short notes take the whole-note path; their entry is read-only too
+    tiny = play_module._synth_wave_cached(piano, 440.0, 100, {})
+    assert not tiny.flags.writeable
+
+
+def test_synth_stack_mixes_a_chord_exactly():
+    import sys
+    import numpy as np
+    play_module = sys.modules["pytheory.play"]
+
+    chord = [261.63, 329.63, 392.0, 1318.5]
+    for fn in (play_module.sawtooth_wave, play_module.square_wave,
+               play_module.supersaw_wave, play_module.piano_wave):
+        for n in (100, 30000):
+            summed = sum(fn(hz, n_samples=n, dtype=np.float32)
+                         for hz in chord)
+            stacked = play_module._synth_stack(fn, chord, n)
+            assert stacked.dtype == np.float32
+            assert np.array_equal(stacked, summed), fn.__name__
+
+    saw = play_module.sawtooth_wave
+    weighted = play_module._synth_stack(saw, [220.0, 330.0], 5000,
+                                        gains=[0.5, 0.25])
+    expected = (0.5 * saw(220.0, n_samples=5000, dtype=np.float32)
+                + 0.25 * saw(330.0, n_samples=5000, dtype=np.float32))
+    assert np.allclose(weighted, expected, atol=1e-3)
+
+
+def test_synths_render_float32_natively():
+    import sys
+    import numpy as np
+    play_module = sys.modules["pytheory.play"]
+
+    for name, fn in play_module._SYNTH_FUNCTIONS.items():
+        assert fn.native_float32, name
+    for fn in (play_module.sine_wave, play_module.pulse_wave,
+               play_module.fm_wave, play_module.pluck_wave,
+               play_module.pwm_slow_wave):
+        quantized = fn(330.0, n_samples=4000)
+        native = fn(330.0, n_samples=4000, dtype=np.float32)
+        assert quantized.dtype == np.int16
+        assert native.dtype == np.float32
+        # Same signal, minus the rounding to whole int16 steps
+        assert np.abs(native - quantized).max() <= 1.0, fn.__name__
+
+    def legacy_synth(hz, n_samples=44100):
+        return play_module.sine_wave(hz, n_samples=n_samples)
+
+    wave = play_module._synth_render(legacy_synth, 440.0, 1000, {})
+    assert wave.dtype == np.float32
+    assert np.array_equal(wave, legacy_synth(440.0, 1000))
@@ -428,3 +428,94 @@ def test_detect_drums_classifies_kick_snare_hat():
     found = {(b, s) for b, s, _ in hits}
     for t0, _, name in layout:
         assert (t0 * 2, name) in found  # 120bpm → beat = 2*seconds
+
+
+def test_drum_chokes_match_hit_by_hit_voicing():
+    from pytheory.rhythm import DrumSound
+    from pytheory.play import _drum_chokes, _apply_chokes
+
+    hat, open_hat, kick = (DrumSound.CLOSED_HAT.value,
+                           DrumSound.OPEN_HAT.value, DrumSound.KICK.value)
+    starts = numpy.array([0, 0, 1000, 1050, 1100, 5000, 5000])
+    sounds = numpy.array([kick, open_hat, hat, hat, kick, open_hat, hat])
+    hits, fade_starts, fade_lens = _drum_chokes(starts, sounds)
+    ramps = sorted(zip(hits.tolist(), fade_starts.tolist(),
+                       fade_lens.tolist()))
+    assert ramps == [
+        (2, 824, 176),    # closed hat chokes the open hat (4 ms)
+        (3, 874, 176),    # ...and again
+        (3, 1000, 50),    # hat re-hit, only 50 samples since the last
+        (4, 1012, 88),    # kick re-hit (2 ms)
+        (5, 4912, 88),    # open hat re-hit
+        (6, 4912, 88),    # hat re-hit; the open hat on its sample isn't
+    ]
+
+    buf = numpy.ones((6000, 2), dtype=numpy.float32)
+    _apply_chokes(buf, fade_starts, fade_lens)
+    expected = numpy.ones(6000, dtype=numpy.float32)
+    for start, n in zip(fade_starts, fade_lens):
+        expected[start:start + n] *= numpy.linspace(1.0, 0.0, n)
+    assert numpy.allclose(buf[:, 0], expected, atol=1e-6)
+    assert numpy.array_equal(buf[:, 0], buf[:, 1])
+
+
+def test_marching_snare_resonance_builds_and_decays():
+    from pytheory.rhythm import DrumSound
+    from pytheory.play import _drum_resonance
+
+    snare = DrumSound.MARCH_SNARE.value
+    starts = numpy.arange(8) * 4410          # a 100 ms roll...
+    starts = numpy.append(starts, starts[-1] + 2 * 44100)  # ...then a rest
+    levels = _drum_resonance(starts, numpy.full(len(starts), snare))
+    assert levels[:8] == pytest.approx([min(0.6, 0.08 * k)
+                                        for k in range(1, 9)])
+    assert levels[8] == pytest.approx(0.6 * 0.2 + 0.08)
+
+
+def test_drum_kit_prerenders_every_sound_into_one_bank():
+    from pytheory.rhythm import DrumSound
+    from pytheory.play import DrumKit, _drum_hit, _drum_synths, _synth_tabla_ge_bend
+
+    # The four kits cover the whole DrumSound enum, each sound once
+    kit = DrumKit()
+    assert sorted(kit.sounds) == sorted(s.value for s in DrumSound)
+    assert set(_drum_synths()) == set(kit.sounds)
+    with pytest.raises(ValueError):
+        DrumKit("polka")
+
+    numpy.random.seed(3)
+    kit = DrumKit("tabla", "marching").prerender(lengths=(400, 900),
+                                                 workers=4)
+    try:
+        assert len(kit) == len(kit.sounds) * 2
+        assert kit.bank.nbytes == len(kit.sounds) * 1300 * 4
+        ge_bend = kit.hit(DrumSound.TABLA_GE_BEND, 900)
+        assert ge_bend.base is kit.bank and not ge_bend.flags.writeable
+        assert _drum_hit(DrumSound.TABLA_GE_BEND.value, 900) is ge_bend
+        # Note 108 is the Ge bend (CAJON_BASS is an alias of it)
+        assert DrumSound.CAJON_BASS is DrumSound.TABLA_GE_BEND
+        assert _drum_synths()[108] is _synth_tabla_ge_bend
+        assert kit.hit(DrumSound.KICK, 900) is None
+    finally:
+        kit.discard()
+    assert _drum_hit(DrumSound.TABLA_GE_BEND.value, 900) is not ge_bend
+
+
+def test_repeated_drum_grooves_tile_like_hit_by_hit(monkeypatch):
+    from pytheory.play import _render_drum_stem, _DrumVoicing
+
+    score = Score("4/4", bpm=120, drum_humanize=0.0)
+    score.drums("cadence", repeats=4)
+    part = score.parts["drums"]
+    total = int(score.total_beats * 22050) + 44100
+    _render_drum_stem(part, score, total, 22050)  # synthesize the kit
+    numpy.random.seed(5)
+    tiled, tiled_kick = _render_drum_stem(part, score, total, 22050)
+    runs = _DrumVoicing.periods
+    monkeypatch.setattr(_DrumVoicing, "periods", lambda self: [])
+    numpy.random.seed(5)
+    plain, plain_kick = _render_drum_stem(part, score, total, 22050)
+    monkeypatch.setattr(_DrumVoicing, "periods", runs)
+    assert numpy.abs(plain).max() > 0.1
+    assert numpy.allclose(tiled, plain, atol=1e-6)
+    assert numpy.allclose(tiled_kick, plain_kick, atol=1e-6)
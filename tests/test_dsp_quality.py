@@ -10,6 +10,7 @@ Pure numpy/scipy; no audio device needed.
 import numpy as np
 import pytest
 
+from pytheory import EffectChain
 from pytheory.play import (
     SAMPLE_RATE,
     sine_wave,
@@ -18,7 +19,6 @@ from pytheory.play import (
     _apply_envelope,
     _apply_lowpass,
     _apply_highpass,
-    _apply_delay,
     _apply_reverb,
     _apply_convolution_reverb_stereo,
     _generate_ir,
@@ -28,7 +28,10 @@ from pytheory.play import (
     _soft_clip,
     _dc_block,
     _GENERATED_IR_CACHE,
+    _IR_SPECTRA,
+    _Convolver,
     _IR_DURATIONS,
+    _Oscillator,
 )
 
 
@@ -73,6 +76,22 @@ def test_triangle_pitch_matches_fundamental():
     assert abs(_dominant_freq(triangle_wave(330.0)) - 330.0) < 5.0
 
 
+def test_wavetable_saw_is_band_limited_at_exact_pitch():
+    # A high saw: nothing folds back below the fundamental, and the
+    # phase increment lands the pitch on the exact FFT bin.
+    wave = _Oscillator("saw").render(3000.0, SAMPLE_RATE)
+    assert abs(_dominant_freq(wave) - 3000.0) < 1.0
+    assert _band_energy(wave, 20, 2900) < 1e-6 * _band_energy(wave, 0, 22050)
+
+
+def test_oscillator_blocks_join_seamlessly():
+    whole = _Oscillator("square").render(440.0, 4096)
+    osc = _Oscillator("square")
+    blocks = np.concatenate([osc.render(440.0, 1000) for _ in range(4)]
+                            + [osc.render(440.0, 96)])
+    assert np.allclose(whole, blocks, atol=1e-5)
+
+
 # ── Envelope ───────────────────────────────────────────────────────────
 
 def test_envelope_decays_to_a_quiet_tail():
@@ -91,6 +110,18 @@ def test_envelope_attack_ramps_up_from_silence():
     assert _rms(enveloped[:441]) < _rms(enveloped[4410:8820])  # 10ms vs ~150ms
 
 
+def test_envelope_curves_are_shared_and_applied_in_place():
+    from pytheory.play import _adsr_envelope
+    env = _adsr_envelope(0.01, 0.1, 0.6, 0.2, 22050)
+    assert _adsr_envelope(0.01, 0.1, 0.6, 0.2, 22050) is env
+    assert not env.flags.writeable
+    wave = sine_wave(440.0, n_samples=22050).astype(np.float32)
+    copied = _apply_envelope(wave, 0.01, 0.1, 0.6, 0.2)
+    shaped = _apply_envelope(wave, 0.01, 0.1, 0.6, 0.2, out=wave)
+    assert shaped is wave
+    assert np.array_equal(shaped, copied)
+
+
 # ── Filters ────────────────────────────────────────────────────────────
 
 def test_lowpass_attenuates_highs_keeps_lows():
@@ -115,7 +146,8 @@ def test_delay_produces_an_echo_at_the_set_time():
     n = SAMPLE_RATE
     impulse = np.zeros(n, dtype=np.float32)
     impulse[0] = 1.0
-    out = _apply_delay(impulse, mix=0.5, time=0.25, feedback=0.5)
+    out = EffectChain({"delay_mix": 0.5, "delay_time": 0.25,
+                       "delay_feedback": 0.5}, n).process(impulse)
     echo_idx = int(0.25 * SAMPLE_RATE)
     # There should be a clear echo around the delay time, and near-silence
     # just before it.
@@ -134,6 +166,17 @@ def test_reverb_adds_a_tail_after_the_dry_signal():
     assert _rms(wet[5000:]) > 5 * (dry_tail + 1e-9)   # energy where dry had none
 
 
+def test_stream_reverb_blocks_match_offline_reverb():
+    from pytheory.play import _StreamReverb
+    rng = np.random.default_rng(2)
+    x = rng.uniform(-0.5, 0.5, SAMPLE_RATE).astype(np.float32)
+    whole = _apply_reverb(x, mix=1.0, decay=1.5)
+    r = _StreamReverb(decay=1.5)
+    blocks = np.concatenate([r.process(x[i:i + 1000])
+                             for i in range(0, len(x), 1000)])
+    assert np.allclose(blocks, whole, atol=1e-6)
+
+
 def test_stereo_convolution_reverb_has_real_width():
     # Regression guard: L and R IRs must differ, or the "stereo" reverb is
     # secretly mono (the seed bug).
@@ -172,6 +215,48 @@ def test_ir_decays_over_time():
     assert _rms(ir[-len(ir) // 4:]) < _rms(ir[: len(ir) // 4])
 
 
+def test_partitioned_convolver_matches_direct_convolution_in_any_blocks():
+    from scipy.signal import fftconvolve
+    rng = np.random.default_rng(3)
+    x = rng.standard_normal(SAMPLE_RATE * 3).astype(np.float32)
+    ref = fftconvolve(x, _generate_ir("hall", seed=4242))[:len(x)]
+    conv = _Convolver("hall", seed=4242, normalize=False)
+    out, i = [], 0
+    for size in rng.integers(1, 5000, size=len(x)):
+        out.append(conv.process(x[i:i + size]))
+        i += size
+        if i >= len(x):
+            break
+    out = np.concatenate(out)
+    assert np.abs(out - ref).max() < 1e-5 * np.abs(ref).max()
+    # Partition spectra are built once per (preset, rate, seed, size)
+    assert _Convolver("hall", seed=4242).rest is conv.rest
+    assert ("hall", SAMPLE_RATE, 4242, 1024) in _IR_SPECTRA
+
+
+def test_whole_buffer_ir_spectra_are_byte_budgeted():
+    from scipy.signal import fftconvolve
+    from pytheory.play import AudioCache, _IR_FULL_SPECTRA, _convolve_whole
+
+    assert isinstance(_IR_FULL_SPECTRA, AudioCache)
+    x = np.random.default_rng(4).standard_normal(SAMPLE_RATE)
+    x = x.astype(np.float32)
+    _IR_FULL_SPECTRA.clear()
+    _convolve_whole(x, "plate", (42,))
+    _convolve_whole(x[:-5000], "plate", (42,))
+    assert len(_IR_FULL_SPECTRA) == 2      # a new length doesn't evict
+    budget = _IR_FULL_SPECTRA.max_bytes
+    try:
+        _IR_FULL_SPECTRA.max_bytes = 64 * 1024
+        assert len(_IR_FULL_SPECTRA) == 0
+        wet, = _convolve_whole(x, "plate", (42,))
+        assert len(_IR_FULL_SPECTRA) == 0  # too big for the budget
+    finally:
+        _IR_FULL_SPECTRA.max_bytes = budget
+    ref = fftconvolve(x, _generate_ir("plate", seed=42))[:len(x)]
+    assert np.abs(wet - ref).max() < 1e-5 * np.abs(ref).max()
+
+
 # ── Panning ────────────────────────────────────────────────────────────
 
 def test_hard_pan_routes_to_one_channel():
@@ -234,6 +319,25 @@ def test_master_bus_soft_limits_and_stays_finite():
     assert np.abs(out).max() < 0.98           # soft-limited, never clips
 
 
+def test_streamed_sidechain_ducks_like_offline_in_any_blocks():
+    from pytheory.play import _apply_sidechain, _StreamSidechain
+    n = SAMPLE_RATE
+    pad = np.full(n, 0.5, dtype=np.float32)
+    kick = np.zeros(n, dtype=np.float32)
+    for start in (1000, 23050):                 # two kicks, 0.5 s apart
+        kick[start:start + 2000] = np.sin(np.arange(2000) * 0.05)
+    whole = _StreamSidechain(amount=0.8, release=0.1).process(pad, kick)
+    assert whole[1000:3000].min() < 0.15        # the first kick ducks fully
+    assert whole[20000] > 0.45                  # and lets go before the next
+    assert whole[500] == 0.5
+    offline = _apply_sidechain(pad, kick, amount=0.8, release=0.1)
+    assert abs(whole[1000:3000].min() - offline[1000:3000].min()) < 0.05
+    sc = _StreamSidechain(amount=0.8, release=0.1)
+    blocks = np.concatenate([sc.process(pad[i:i + 777], kick[i:i + 777])
+                             for i in range(0, n, 777)])
+    assert np.allclose(blocks, whole, atol=1e-6)
+
+
 def test_dc_block_removes_offset_but_keeps_bass():
     t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
     bass = np.sin(2 * np.pi * 60 * t).astype(np.float32)   # 60 Hz musical bass
@@ -276,3 +380,95 @@ def test_render_is_deterministic_without_humanize():
         return s
 
     assert np.array_equal(render_score(build()), render_score(build()))
+
+
+def test_effect_chain_blocks_match_whole_buffer_and_follow_changes():
+    from pytheory import EffectChain
+    from pytheory.play import _apply_effects_with_params
+
+    rng = np.random.default_rng(3)
+    x = rng.uniform(-0.5, 0.5, 20000).astype(np.float32)
+    params = {"saturation": 0.3, "tremolo_depth": 0.3, "distortion_mix": 0.4,
+              "cabinet": 0.5, "chorus_mix": 0.4, "phaser_mix": 0.5,
+              "highpass": 100, "lowpass": 3000, "delay_mix": 0.3,
+              "delay_time": 0.05, "reverb_mix": 0.3}
+    whole = _apply_effects_with_params(x, params)
+    chain = EffectChain(params, len(x))
+    assert chain.active and not EffectChain({"lowpass": 0}).active
+    blocks = np.concatenate([chain.process(x[i:i + 333])
+                             for i in range(0, len(x), 333)])
+    assert np.allclose(blocks, whole, atol=1e-5)
+
+    # A cutoff change mid-stream keeps the filter's memory
+    from scipy.signal import lfilter
+    from pytheory.play import _lowpass_coeffs
+    chain = EffectChain({"lowpass": 3000})
+    first = chain.process(x[:1000])
+    second = chain.set(lowpass=800).process(x[1000:1100])
+    b, a = _lowpass_coeffs(3000, 0.707, SAMPLE_RATE)
+    expected, zf = lfilter(b, a, x[:1000], zi=np.zeros(2))
+    assert np.allclose(first, expected, atol=1e-6)
+    b, a = _lowpass_coeffs(800, 0.707, SAMPLE_RATE)
+    expected, _ = lfilter(b, a, x[1000:1100], zi=zf)
+    assert np.allclose(second, expected, atol=1e-6)
+
+
+def _per_sample_phaser(x, mix, rate, sample_rate, stages=4):
+    """Reference phaser: direct-form allpass biquads, one sample at a time,
+    with the sweep set once per 64-sample cell."""
+    n = len(x)
+    wet = x.astype(np.float64)
+    for _stage in range(stages):
+        out = np.empty(n)
+        x1 = x2 = y1 = y2 = 0.0
+        for pos in range(0, n, 64):
+            end = min(pos + 64, n)
+            lfo = 0.5 + 0.5 * np.sin(2 * np.pi * rate * ((pos + end) // 2)
+                                     / sample_rate)
+            w0 = 2 * np.pi * 200.0 * 20.0 ** lfo / sample_rate
+            alpha = np.sin(w0) / 2.0
+            c0, c1 = (1 - alpha) / (1 + alpha), -2 * np.cos(w0) / (1 + alpha)
+            for i in range(pos, end):
+                y0 = c0 * wet[i] + c1 * x1 + x2 - c1 * y1 - c0 * y2
+                out[i] = y0
+                x2, x1, y2, y1 = x1, wet[i], y1, y0
+        wet = out
+    return x * (1 - mix) + wet.astype(np.float32) * mix
+
+
+def test_effect_chain_phaser_matches_per_sample_allpass(monkeypatch):
+    from pytheory.play import scipy
+
+    rng = np.random.default_rng(5)
+    x = rng.uniform(-0.5, 0.5, 20000).astype(np.float32)
+    # 8 kHz sweeps the allpass right up to Nyquist
+    expected = {rate: _per_sample_phaser(x, 0.5, 0.7, rate)
+                for rate in (SAMPLE_RATE, 8000)}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("phaser filtered a cell at a time")
+    monkeypatch.setattr(scipy.signal, "lfilter", fail)
+
+    for rate in (SAMPLE_RATE, 8000):
+        chain = EffectChain({"phaser_mix": 0.5, "phaser_rate": 0.7}, len(x),
+                            sample_rate=rate)
+        blocks = np.concatenate([chain.process(x[i:i + 100])
+                                 for i in range(0, len(x), 100)])
+        assert np.allclose(blocks, expected[rate], atol=1e-6)
+
+
+def test_rate_converter_blocks_match_resample_poly():
+    from scipy.signal import resample_poly
+    from pytheory.play import PREVIEW_RATE, _RateConverter
+
+    t = np.arange(PREVIEW_RATE // 2) / PREVIEW_RATE
+    x = np.stack([np.sin(2 * np.pi * 440 * t),
+                  np.sin(2 * np.pi * 1000 * t)], axis=1).astype(np.float32)
+    whole = _RateConverter(PREVIEW_RATE, 48_000).process(x, final=True)
+    assert np.allclose(whole, resample_poly(x, 320, 147, axis=0), atol=1e-6)
+    assert _dominant_freq(whole[:, 0], 48_000) == pytest.approx(440, abs=3)
+
+    conv = _RateConverter(PREVIEW_RATE, 48_000)
+    blocks = [conv.process(x[i:i + 333]) for i in range(0, len(x), 333)]
+    blocks.append(conv.process(x[:0], final=True, length=len(whole)))
+    assert np.array_equal(np.concatenate(blocks), whole)
@@ -48,11 +48,45 @@ def test_live_cc_does_not_clear_cache_for_bus_params():
     engine._apply_cc(1, 11, 64)
     assert len(ch._cache) == 1     # no re-render needed
     assert ch.lowpass > 200
+    assert ch.effects.params["lowpass"] == ch.lowpass   # pushed to the bus
     engine.cc(12, "detune", min_val=0, max_val=20)
     engine._apply_cc(1, 12, 64)
     assert len(ch._cache) == 0     # baked param → cache cleared
 
 
+@needs_portaudio
+def test_live_channel_rereads_effect_kwargs_every_block():
+    from pytheory.live import _Channel
+    ch = _Channel(synth_name="sine", delay=0.5, reverb=0.3)
+    ch.render_stereo(512)
+    assert ch.effects.params["delay_time"] == 0.375
+    ch.kwargs["delay_time"] = 0.25        # edited in place, mid-stream
+    ch.kwargs["reverb_decay"] = 2.5
+    ch.render_stereo(512)
+    assert ch.effects.params["delay_time"] == 0.25
+    assert ch.effects.params["reverb_decay"] == 2.5
+
+
+@needs_portaudio
+def test_live_engine_prerenders_only_the_drums_it_uses():
+    from pytheory.live import LiveEngine
+    from pytheory.play import _drum_cache
+    from pytheory.rhythm import DrumSound
+
+    engine = LiveEngine()
+    engine.drums("rock")
+    engine._prerender_drums(4321)
+    used = {hit.sound.value for hit in engine._drum_pattern.hits}
+    warm = {key[0] for key, _ in _drum_cache.items() if key[1] == 4321}
+    assert warm == used
+
+    engine.channel(10)                  # a General MIDI drum channel
+    engine._prerender_drums(4321)
+    warm = {key[0] for key, _ in _drum_cache.items() if key[1] == 4321}
+    assert DrumSound.RIDE_BELL.value in warm
+    assert DrumSound.TABLA_NA.value not in warm
+
+
 def test_live_engine_link_sync():
     pytest.importorskip("link")
     import time
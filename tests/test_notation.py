@@ -223,6 +223,42 @@ def test_from_midi_preserves_tempo_changes(tmp_path):
     assert imported.duration_ms == 6000.0
 
 
+def test_score_save_midi_writes_part_hits_to_drum_channel(tmp_path):
+    """Part.hit() notes export on channel 10, like pattern drum hits."""
+    from pytheory.rhythm import DrumSound
+    score = Score("4/4", bpm=120)
+    kit = score.part("kit")
+    kit.hit("kick", velocity=90)
+    kit.hit(DrumSound.SNARE, velocity=110)
+
+    midi_path = tmp_path / "hits.mid"
+    score.save_midi(str(midi_path))
+
+    data = midi_path.read_bytes()
+    assert bytes([0x99, DrumSound.KICK.value, 90]) in data
+    assert bytes([0x99, DrumSound.SNARE.value, 110]) in data
+    assert data.count(b"\x89") == 2
+
+
+def test_score_save_midi_writes_each_note_at_its_own_velocity(tmp_path):
+    """Notes and hits alike keep their velocity, scaled by velocity=."""
+    from pytheory.rhythm import DrumSound
+    score = Score("4/4", bpm=120)
+    score.part("lead").add("C4", Duration.QUARTER, velocity=64)
+    score.part("kit").hit("kick", velocity=90)
+
+    midi_path = tmp_path / "vel.mid"
+    score.save_midi(str(midi_path))
+    data = midi_path.read_bytes()
+    assert bytes([0x91, 60, 64]) in data
+    assert bytes([0x99, DrumSound.KICK.value, 90]) in data
+
+    score.save_midi(str(midi_path), velocity=50)
+    data = midi_path.read_bytes()
+    assert bytes([0x91, 60, 32]) in data
+    assert bytes([0x99, DrumSound.KICK.value, 45]) in data
+
+
 def test_pattern_midi_export(tmp_path):
     from pytheory import Pattern
     p = Pattern.preset("bossa nova")
@@ -418,6 +454,26 @@ def test_save_midi_includes_all_parts(tmp_path):
     assert sum(1 for t in sounding if isinstance(t, Chord)) == 2
 
 
+def test_midi_export_keeps_held_notes_and_triplet_timing(tmp_path):
+    from pytheory.rhythm import _parse_midi
+
+    score = Score("4/4", bpm=120)
+    p = score.part("piano")
+    p.hold("C3", Duration.WHOLE)
+    for name in ("E4", "F4", "G4"):
+        p.add(name, 1 / 3)
+    p.add("C5", 1)
+    path = tmp_path / "hold.mid"
+    score.save_midi(str(path))
+
+    events = [e for track in _parse_midi(str(path))["tracks"] for e in track
+              if e[1] in ("note_on", "note_off")]
+    on = {e[3]["pitch"]: e[0] for e in events if e[1] == "note_on"}
+    off = {e[3]["pitch"]: e[0] for e in events if e[1] == "note_off"}
+    assert off[48] - on[48] == 4 * 480          # the held C3 rings 4 beats
+    assert on[72] == 480                        # three triplets = one beat
+
+
 def test_notation_hold_keeps_bars_aligned():
     """Part.hold() (overlap) notes must not push barlines out of place;
     the held pitch is folded into the next note as a chord."""
@@ -192,19 +192,20 @@ def test_reverb_zero_mix():
 
 @needs_portaudio
 def test_delay_effect():
-    from pytheory.play import _apply_delay
+    from pytheory import EffectChain
     dry = numpy.zeros(44100, dtype=numpy.float32)
     dry[:100] = 1.0
-    wet = _apply_delay(dry, mix=0.5, time=0.1, feedback=0.3)
+    wet = EffectChain({"delay_mix": 0.5, "delay_time": 0.1,
+                       "delay_feedback": 0.3}, len(dry)).process(dry)
     echo_start = int(0.1 * 44100)
     assert numpy.max(numpy.abs(wet[echo_start:echo_start + 200])) > 0
 
 
 @needs_portaudio
 def test_delay_zero_mix():
-    from pytheory.play import _apply_delay
+    from pytheory import EffectChain
     dry = numpy.random.uniform(-1, 1, 1000).astype(numpy.float32)
-    result = _apply_delay(dry, mix=0.0)
+    result = EffectChain({"delay_mix": 0.0}).process(dry)
     assert numpy.allclose(result, dry)
 
 
@@ -318,18 +319,18 @@ def test_unknown_reverb_type_raises():
 
 @needs_portaudio
 def test_chorus_effect():
-    from pytheory.play import _apply_chorus
+    from pytheory import EffectChain
     t = numpy.arange(44100, dtype=numpy.float32) / 44100
     signal = numpy.sin(2 * numpy.pi * 440 * t).astype(numpy.float32)
-    wet = _apply_chorus(signal, mix=0.5)
+    wet = EffectChain({"chorus_mix": 0.5}).process(signal)
     assert not numpy.allclose(signal, wet, atol=0.01)
 
 
 @needs_portaudio
 def test_chorus_zero_mix():
-    from pytheory.play import _apply_chorus
+    from pytheory import EffectChain
     dry = numpy.random.uniform(-1, 1, 1000).astype(numpy.float32)
-    result = _apply_chorus(dry, mix=0.0)
+    result = EffectChain({"chorus_mix": 0.0}).process(dry)
     assert numpy.allclose(result, dry)
 
 
@@ -599,6 +600,67 @@ def test_legato_honors_basic_synth_waveform():
     assert numpy.max(numpy.abs(saw - sine)) > 0.05
 
 
+def test_legato_plays_any_synth_in_blocks():
+    import sys
+    import tracemalloc
+    from pytheory.play import render_score, render_score_iter
+
+    play = sys.modules["pytheory.play"]
+
+    def score(synth, repeats=1):
+        s = pytheory.Score("4/4", bpm=120)
+        part = s.part("lead", synth=synth, envelope="organ", legato=True,
+                      glide=0.05, volume=0.5)
+        for note in ("A3", "C4", "E4", "A4") * repeats:
+            part.add(note, Duration.WHOLE)
+        return s
+
+    strings = render_score(score("strings_synth"))[:, 0]
+    sine = render_score(score("sine"))[:, 0]
+    # The real instrument, not the old sine fallback, at the right pitches
+    assert numpy.max(numpy.abs(strings - sine)) > 0.05
+    for k, hz in enumerate((220.0, 261.6, 329.6, 440.0)):
+        seg = strings[(4 * k + 1) * 22050:(4 * k + 1) * 22050 + 16384]
+        spec = numpy.abs(numpy.fft.rfft(seg * numpy.hanning(len(seg))))
+        assert abs(numpy.argmax(spec) * 44100 / len(seg) - hz) < 4
+    # No click where the notes change
+    jumps = numpy.abs(numpy.diff(strings))
+    for k in (1, 2, 3):
+        assert jumps[88200 * k - 300:88200 * k + 300].max() < 0.3
+    streamed = numpy.concatenate(list(render_score_iter(
+        score("strings_synth"), block_size=1000)))[:, 0]
+    assert numpy.allclose(streamed, strings, atol=1e-6)
+
+    # Memory is a block and a source note, not the length of the Part
+    s = score("strings_synth", repeats=8)
+    part = s.parts["lead"]
+    total = int(s.total_beats * 22050)
+    buf = numpy.zeros(total, dtype=numpy.float32)
+    tracemalloc.start()
+    play._render_legato_to_buf(
+        part.notes, buf, 22050, total, play._resolve_synth("strings_synth"),
+        play._resolve_envelope("organ"), 0.5, 120, glide_time=0.05)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < buf.nbytes
+
+
+def test_legato_sustaining_synth_holds_past_its_source_note():
+    from pytheory.play import render_score
+
+    # The default piano envelope has a low sustain; the phrase envelope
+    # must not stop a sustaining source from looping.
+    s = pytheory.Score("4/4", bpm=120)
+    part = s.part("lead", synth="strings_synth", envelope="piano",
+                  legato=True, glide=0.05)
+    for note in ("A3", "C4", "E4", "A4"):
+        part.add(note, Duration.WHOLE)
+    buf = render_score(s)[:, 0]
+    rms = [numpy.sqrt(numpy.mean(buf[i * 44100:(i + 1) * 44100] ** 2))
+           for i in range(7)]
+    assert min(rms) > 0.5 * max(rms)
+
+
 def test_render_score_exported():
     assert "render_score" in pytheory.__all__
 
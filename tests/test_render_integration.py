@@ -11,7 +11,7 @@ Pure numpy; no audio device needed.
 import numpy as np
 import pytest
 
-from pytheory import Score, Duration
+from pytheory import Score, Duration, EffectChain
 from pytheory.play import render_score, _apply_sidechain
 
 
@@ -143,3 +143,415 @@ def test_score_to_wav_writes_a_valid_stereo_file(tmp_path):
         assert f.getframerate() == 44100
         assert f.getsampwidth() == 2          # 16-bit
         assert f.getnframes() == len(s.render())
+
+
+def test_render_with_workers_matches_sequential_render():
+    s = Score("4/4", bpm=120, drum_humanize=0.0)
+    s.drums("funk", repeats=1, split=True)
+    lead = s.part("lead", synth="saw", detune=8, spread=0.5, delay=0.3)
+    bass = s.part("bass", synth="sine", sidechain=0.6)
+    _four_notes(lead, "E4")
+    _four_notes(bass, "C2")
+    assert np.array_equal(s.render(workers=4), render_score(s))
+
+
+def test_part_fingerprint_tracks_sound_not_identity():
+    def build(lowpass):
+        s = Score("4/4", bpm=120)
+        p = s.part("lead", synth="saw", lowpass=lowpass)
+        _four_notes(p, "E4")
+        return s, p
+
+    s1, p1 = build(2000)
+    s2, p2 = build(2000)
+    s3, p3 = build(1500)
+    assert p1.fingerprint(s1) == p2.fingerprint(s2)
+    assert p1.fingerprint(s1) != p3.fingerprint(s3)
+    s2.set_tempo(90)
+    assert p1.fingerprint(s1) != p2.fingerprint(s2)
+
+
+def test_rerender_reuses_stems_of_unchanged_parts(monkeypatch):
+    import sys
+    from pytheory.play import _STEM_CACHE, _render_notes_to_buf
+
+    play_module = sys.modules["pytheory.play"]  # pytheory.play is the function
+
+    s = Score("4/4", bpm=120, drum_humanize=0.0)
+    s.drums("rock", repeats=1)
+    lead = s.part("lead", synth="saw", reverb=0.3)
+    pad = s.part("pad", synth="triangle", chorus=0.3)
+    _four_notes(lead, "E4")
+    _four_notes(pad, "C3")
+    render_score(s)
+
+    rendered = []
+    monkeypatch.setattr(play_module, "_render_notes_to_buf",
+                        lambda notes, *a, **kw: rendered.append(notes)
+                        or _render_notes_to_buf(notes, *a, **kw))
+    pad.volume = 0.3
+    edited = render_score(s)
+    assert rendered == [pad.notes]
+
+    _STEM_CACHE.clear()
+    assert np.array_equal(edited, render_score(s))
+
+
+# ── Streaming: render_score_iter() ─────────────────────────────────────
+
+def _quiet_band(drum_humanize=0.0):
+    # Quiet enough that the master's makeup gain sits at its 3x cap, which
+    # is the one master-bus stage the stream can only know in hindsight.
+    s = Score("4/4", bpm=120, drum_humanize=drum_humanize)
+    s.drums("rock", repeats=1)
+    s.parts["drums"].volume = 0.08
+    lead = s.part("lead", synth="saw", volume=0.08, lowpass=2000,
+                  delay=0.3, reverb=0.3, chorus=0.3, detune=8, spread=0.5)
+    pad = s.part("pad", synth="triangle", volume=0.06, ensemble=3, pan=-0.4)
+    _four_notes(lead, "E4")
+    _four_notes(pad, "C3")
+    return s
+
+
+def test_streamed_render_matches_offline_render():
+    from pytheory.play import render_score_iter
+
+    s = _quiet_band()
+    streamed = np.concatenate(list(render_score_iter(s, block_size=1024)))
+    assert streamed.shape == render_score(s).shape
+    assert np.allclose(streamed, render_score(s), atol=1e-5)
+
+
+def test_streamed_blocks_are_fixed_size_and_cover_the_render():
+    from pytheory.play import render_score_iter
+
+    s = _quiet_band()
+    blocks = list(render_score_iter(s, block_size=1000))
+    assert all(b.shape == (1000, 2) and b.dtype == np.float32
+               for b in blocks[:-1])
+    assert 0 < len(blocks[-1]) <= 1000
+    assert sum(len(b) for b in blocks) == len(render_score(s))
+
+
+def test_streamed_render_is_block_size_invariant():
+    from pytheory.play import render_score_iter
+
+    s = _quiet_band()
+    s.parts["lead"].reverb_mix = 0.0   # FFT reverb rounding varies by block
+    s.parts["drums"].volume = 0.8      # exercise the compressor and makeup
+    small = np.concatenate(list(render_score_iter(s, block_size=256)))
+    large = np.concatenate(list(render_score_iter(s, block_size=8192)))
+    assert np.allclose(small, large, atol=1e-6)
+
+
+def test_render_score_iter_rejects_bad_block_size():
+    from pytheory.play import render_score_iter
+
+    s = _quiet_band()
+    with pytest.raises(ValueError):
+        render_score_iter(s, block_size=0)
+    with pytest.raises(TypeError):
+        render_score_iter(s, block_size=512.0)
+
+
+# ── Quality tiers ──────────────────────────────────────────────────────
+
+def test_draft_render_skips_expensive_processing(monkeypatch):
+    import sys
+
+    play = sys.modules["pytheory.play"]
+    s = _quiet_band()
+    s.parts["lead"].reverb_type = "cathedral"
+    s.parts["pad"].phaser_mix = 0.5
+    final = render_score(s)
+    assert np.array_equal(render_score(s, quality="final"), final)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("draft ran a final-only stage")
+    monkeypatch.setattr(play, "_apply_convolution_reverb_stereo", fail)
+    monkeypatch.setattr(EffectChain, "_phase", fail)
+    draft = render_score(s, quality="draft", sample_rate=play.SAMPLE_RATE)
+    assert draft.shape == final.shape
+    assert not np.allclose(draft, final, atol=1e-3)
+    # Drafts render at half rate but come back at the output rate
+    assert render_score(s, quality="draft").shape == final.shape
+    assert len(render_score(s, quality="draft",
+                            sample_rate=play.PREVIEW_RATE)) == len(final) // 2
+    streamed = list(play.render_score_iter(s, block_size=4096,
+                                           quality="draft"))
+    assert all(len(b) == 4096 for b in streamed[:-1])
+    assert sum(map(len, streamed)) == len(final)
+    # The Score itself is untouched
+    assert s.parts["lead"].reverb_type == "cathedral"
+    assert s.parts["pad"].ensemble == 3
+    with pytest.raises(ValueError):
+        render_score(s, quality="best")
+
+
+# ── Aux buses ──────────────────────────────────────────────────────────
+
+def test_aux_bus_runs_one_reverb_for_every_sending_part(monkeypatch):
+    import sys
+    from pytheory.play import render_score_iter
+
+    play = sys.modules["pytheory.play"]
+
+    s = _quiet_band()
+    s.parts["lead"].reverb_mix = 0.0
+    dry = render_score(s)
+    s.bus("room", reverb=0.6, reverb_decay=1.5, delay=0.3, delay_time=0.25)
+    for name in ("lead", "pad", "drums"):
+        s.parts[name].sends = {"room": 0.5}
+
+    calls = []
+    real = play._apply_reverb_stereo
+    monkeypatch.setattr(play, "_apply_reverb_stereo",
+                        lambda *a, **kw: calls.append(1) or real(*a, **kw))
+    wet = render_score(s)
+    assert len(calls) == 1
+    assert not np.allclose(wet, dry, atol=1e-3)
+    streamed = np.concatenate(list(render_score_iter(s, block_size=1024)))
+    assert np.allclose(streamed, wet, atol=1e-5)
+
+
+def test_send_to_unknown_bus_raises():
+    s = _quiet_band()
+    s.part("keys", send={"nowhere": 0.3}).add("C4", 1)
+    with pytest.raises(ValueError, match="nowhere"):
+        render_score(s)
+
+
+# ── Sample rate ────────────────────────────────────────────────────────
+
+def test_render_runs_natively_at_any_sample_rate(tmp_path):
+    import wave
+    from pytheory.play import render_score_iter
+
+    s = Score("4/4", bpm=120)
+    s.part("lead", synth="sine", envelope="organ", reverb=0.3,
+           reverb_type="plate").add("A4", Duration.WHOLE)
+    default = render_score(s)
+    assert np.array_equal(render_score(s, sample_rate=44_100), default)
+    for rate in (22_050, 48_000):
+        buf = render_score(s, sample_rate=rate)
+        assert buf.shape == (2 * rate, 2)           # 4 beats at 120 BPM
+        spec = np.abs(np.fft.rfft(buf[:, 0]))
+        assert abs(np.argmax(spec) * rate / len(buf) - 440.0) < 4.4
+        streamed = np.concatenate(list(render_score_iter(
+            s, block_size=4096, sample_rate=rate)))
+        assert streamed.shape == buf.shape
+    # The default rate is untouched by renders at other rates
+    assert np.array_equal(render_score(s), default)
+
+    path = s.to_wav(tmp_path / "48k.wav", sample_rate=48_000)
+    with wave.open(str(path), "rb") as f:
+        assert f.getframerate() == 48_000
+        assert f.getnframes() == 96_000
+    with pytest.raises(ValueError):
+        render_score(s, sample_rate=100)
+
+
+# ── Automation ─────────────────────────────────────────────────────────
+
+def test_automation_runs_one_continuous_effect_pass(monkeypatch):
+    import sys
+    from pytheory.play import render_score_iter
+
+    play = sys.modules["pytheory.play"]
+
+    def part_with_lfo(resolution):
+        s = Score("4/4", bpm=120)
+        p = s.part("lead", synth="sine", volume=0.1, lowpass=800, delay=0.5,
+                   delay_time=0.25, delay_feedback=0.6, reverb=0.2)
+        p.lfo("lowpass", rate=1, min=400, max=4000, bars=2,
+              resolution=resolution)
+        p.ramp(over=4.0, resolution=resolution, volume=0.05, reverb=0.5)
+        p.add("C4", Duration.EIGHTH).rest(7.5)
+        return s
+
+    chains = []
+    real = EffectChain.__init__
+    monkeypatch.setattr(EffectChain, "__init__", lambda self, *a, **kw:
+                        chains.append(1) or real(self, *a, **kw))
+    for resolution in (1.0, 0.0625):
+        chains.clear()
+        buf = render_score(part_with_lfo(resolution))
+        assert len(chains) == 1     # one chain for the whole Part
+    # The delay's echoes ring on through every automation point
+    echoes = buf[int(1.0 * 44100):int(3.0 * 44100)]
+    assert _rms(echoes) > 1e-3
+    # Streaming reads the same control-rate curves
+    s = part_with_lfo(0.25)
+    streamed = np.concatenate(list(render_score_iter(s, block_size=1000)))
+    assert np.allclose(streamed, render_score(s), atol=1e-5)
+    assert play._CONTROL_BLOCK == 64
+
+
+def test_reverb_type_change_keeps_the_earlier_tail():
+    s = Score("4/4", bpm=120)
+    p = s.part("lead", synth="saw", volume=0.1, reverb=0.6, reverb_decay=2.0)
+    p.add("C4", Duration.QUARTER).set(reverb_type="plate").rest(3)
+    buf = render_score(s)
+    # Just past the change the algorithmic tail is still ringing
+    after = buf[int(0.55 * 44100):int(0.75 * 44100)]
+    assert _rms(after) > 1e-3
+
+
+# ── Ensemble ───────────────────────────────────────────────────────────
+
+def test_ensemble_is_a_multi_tap_delay_line():
+    import random
+    import sys
+    import tracemalloc
+    from pytheory.play import render_score_iter
+
+    play = sys.modules["pytheory.play"]
+    ref = np.random.default_rng(3).standard_normal(200_000).astype(np.float32)
+
+    # The same players as copying and shifting the whole voice for each
+    expected = ref * (1.0 / 6)
+    for i in range(1, 6):
+        rnd = random.Random(42 + i * 7)
+        shift = int(rnd.gauss(0, 0.018) * 22050)
+        voice = np.zeros_like(ref)
+        if shift >= 0:
+            voice[shift:] = ref[:len(ref) - shift]
+        else:
+            voice[:shift] = ref[-shift:]
+        expected += voice * (1.0 + rnd.gauss(0, 0.04)) / 6
+    buf = ref.copy()
+    tracemalloc.start()
+    play._Ensemble(6, 22050, len(buf)).process(buf, block=4096)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert np.array_equal(buf, expected)
+    assert peak < ref.nbytes // 4
+
+    # Micro-detune sweeps each player's tap; streaming agrees
+    s = Score("4/4", bpm=120)
+    p = s.part("strings", synth="saw", volume=0.2, ensemble=8,
+               ensemble_detune=6)
+    p.add("A3", Duration.WHOLE)
+    detuned = render_score(s)
+    streamed = np.concatenate(list(render_score_iter(s, block_size=777)))
+    assert np.allclose(streamed, detuned, atol=1e-6)
+    p.ensemble_detune = 0.0
+    assert not np.allclose(render_score(s), detuned, atol=1e-3)
+
+
+def test_score_to_wav_can_stream_to_disk(tmp_path):
+    import wave
+
+    s = _quiet_band()
+    path = tmp_path / "streamed.wav"
+    assert s.to_wav(path, block_size=2048) == path
+    with wave.open(str(path), "rb") as f:
+        assert f.getnchannels() == 2
+        assert f.getnframes() == len(s.render())
+
+
+def test_note_table_compiles_notes_to_columns():
+    from pytheory import Chord
+    from pytheory.play import NoteTable
+
+    s = Score("4/4", bpm=120)
+    p = s.part("keys")
+    p.add(Chord.from_symbol("C"), 1).add("E4", 1, articulation="staccato")
+    p.hold("C3", 4).add(None, 1).add("G4", 1, velocity=80)
+    table = NoteTable.compile(p.notes, bpm=120, samples_per_beat=22050,
+                              swing=0.5)
+    assert table.beat.tolist() == [0.0, 1.0, 2.0, 2.0, 3.0]
+    assert table.voices.tolist() == [3, 1, 1, 0, 1]
+    assert table.midi[0].tolist() == [60, 64, 67]
+    assert table.hz[4, 0] == pytest.approx(392.0, abs=0.01)
+    assert table.start.tolist() == [0, 27562, 44100, 49612, 66150]
+    assert table.n_samples[1] == int(0.4 * 22050)       # staccato
+    assert table.n_samples[2] == 4 * 22050              # held note, full length
+    assert table.sounding.tolist() == [True, True, True, False, True]
+    assert table.played_velocity[4] == 80
+
+
+def test_held_note_rings_under_the_notes_after_it():
+    s = Score("4/4", bpm=120)
+    p = s.part("keys", synth="sine", envelope="organ")
+    p.hold("C3", Duration.WHOLE)
+    p.add("E5", Duration.WHOLE)
+    buf = render_score(s)
+    # The held C3 (130.8 Hz) sounds alongside the E5 for the whole bar
+    assert _band_energy(buf[44100:66150], 120, 140) > 0.1 * _band_energy(
+        buf[44100:66150], 650, 670)
+
+
+def test_scratch_arena_notes_match_fresh_notes():
+    from pytheory.play import _ScratchArena, _iter_note_events, sawtooth_wave
+
+    arena = _ScratchArena()
+    big = arena.take("main", 1000)
+    assert np.shares_memory(arena.take("main", 400), big)  # reused, not grown
+
+    s = Score("4/4", bpm=120)
+    p = s.part("lead")
+    for n in ("C4", "E4", "G4", "C5"):
+        p.add(n, Duration.QUARTER, articulation="staccato")
+    p.hit("kick", 1)
+    kw = dict(notes=p.notes, samples_per_beat=22050, total_samples=132300,
+              synth_fn=sawtooth_wave, envelope_tuple=(0.01, 0.1, 0.6, 0.1),
+              volume=0.5, bpm=120, detune=8.0, spread=0.5, stereo=True,
+              sub_osc=0.3)
+    fresh = [(start, mono.copy(), spread)
+             for _, start, mono, spread in _iter_note_events(**kw)]
+    arena = _ScratchArena()
+    reused = [(start, mono.copy(), None if spread is None else spread.copy())
+              for _, start, mono, spread in _iter_note_events(
+                  scratch=arena, **kw)]
+    assert len(fresh) == len(reused) == 5
+    for (s1, m1, sp1), (s2, m2, sp2) in zip(fresh, reused):
+        assert s1 == s2
+        assert np.array_equal(m1, m2)
+        assert (sp1 is None) == (sp2 is None)
+        if sp1 is not None:
+            assert np.array_equal(sp1, sp2)
+
+
+def test_repeated_phrases_render_once_and_tile():
+    from pytheory.play import (_periodic_runs, _mix_tiled, _iter_note_events,
+                               _render_notes_to_buf, sawtooth_wave)
+
+    # Two bars of the same three events, then something else
+    starts = np.array([0, 10, 25, 40, 50, 65, 80])
+    keys = np.array([[1], [2], [1], [1], [2], [1], [3]])
+    assert _periodic_runs(starts, keys) == [(0, 3, 2, 40)]
+    # A ringing block tiled three times is the sum of three copies
+    block = np.arange(1, 26, dtype=np.float32)
+    out = np.zeros(60, dtype=np.float32)
+    _mix_tiled(out, block, 5, 10, 3)
+    expected = np.zeros(60, dtype=np.float32)
+    for k in range(3):
+        expected[5 + 10 * k:30 + 10 * k] += block
+    assert np.array_equal(out, expected)
+
+    # A section repeated four times renders the same tiled or note by note
+    s = Score("4/4", bpm=120)
+    p = s.part("lead")
+    s.section("riff")
+    for n in ("C4", "E4", "G4"):
+        p.add(n, Duration.QUARTER, articulation="staccato")
+    p.hit("kick", 1)
+    s.end_section()
+    s.repeat("riff", times=3)
+    total = 22050 * 17
+    kw = dict(samples_per_beat=22050, total_samples=total,
+              synth_fn=sawtooth_wave, envelope_tuple=(0.01, 0.1, 0.6, 0.3),
+              volume=0.5, bpm=120, detune=8.0, spread=0.5, filter_amount=2000)
+    tiled = np.zeros(total, dtype=np.float32)
+    tiled_spread = np.zeros((total, 2), dtype=np.float32)
+    _render_notes_to_buf(p.notes, tiled, stereo_buf=tiled_spread, **kw)
+    mono = np.zeros(total, dtype=np.float32)
+    spread = np.zeros((total, 2), dtype=np.float32)
+    for _, start, note, block in _iter_note_events(p.notes, stereo=True, **kw):
+        mono[start:start + len(note)] += note
+        if block is not None:
+            spread[start:start + len(block)] += block
+    assert np.abs(mono).max() > 0.1
+    assert np.allclose(tiled, mono, atol=1e-6)
+    assert np.allclose(tiled_spread, spread, atol=1e-6)
@@ -375,6 +375,49 @@ def test_set_tempo_bpm_must_be_positive():
         score.set_tempo(-10)
 
 
+def test_tempo_map_matches_stepwise_conversion_without_drift():
+    from pytheory.play import TempoMap, SAMPLE_RATE
+    changes = [(i * 0.5, 90 + (i * 37) % 60) for i in range(1, 400)]
+    tempo_map = TempoMap(120, changes)
+    beats = numpy.array([0.0, 0.25, 7.3, 100.0, 199.5, 250.0])
+    # Exact float accumulation — one segment at a time
+    expected = []
+    for beat in beats:
+        pos, prev, bpm = 0.0, 0.0, 120
+        for b, new in changes:
+            if b >= beat:
+                break
+            pos += (b - prev) * SAMPLE_RATE * 60 / bpm
+            prev, bpm = b, new
+        pos += (beat - prev) * SAMPLE_RATE * 60 / bpm
+        expected.append(int(pos + 1e-6))
+    assert tempo_map.beat_to_sample(beats).tolist() == expected
+    assert tempo_map.beat_to_sample(7.3) == expected[2]
+    assert numpy.allclose(tempo_map.sample_to_beat(expected), beats, atol=1e-4)
+
+
+def test_set_tempo_ramp_glides_between_tempos():
+    from pytheory import Score
+    from pytheory.play import TempoMap
+    score = Score("4/4", bpm=60)
+    lead = score.part("lead")
+    lead.add("C4", 4)
+    score.set_tempo(120, ramp=4)
+    lead.add("C4", 8)
+    assert score._tempo_changes == [(4.0, 120, 4.0)]
+    tempo_map = TempoMap.from_score(score)
+    assert tempo_map.bpm_at(6) == pytest.approx(90)
+    assert tempo_map.bpm_at(10) == 120
+    # 4s at 60, 4 beats ramping 60→120 (4·ln2 s), 4 beats at 120
+    assert score.duration_ms == pytest.approx(
+        4000 + 4000 * numpy.log(2) + 2000)
+    samples = tempo_map.beat_to_sample(numpy.arange(0, 12, 0.5))
+    gaps = numpy.diff(samples)
+    assert (numpy.diff(gaps[8:16]) < 0).all()  # accelerating
+    with pytest.raises(ValueError, match="ramp"):
+        score.set_tempo(100, ramp=-1)
+
+
 def test_section_basic():
     from pytheory import Score, Duration
     score = Score("4/4", bpm=120)